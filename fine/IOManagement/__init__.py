@@ -10,3 +10,4 @@ from .exploitOutput import *
 from .dictIO import *
 from .xarrayIO import *
 from .utilsIO import *
+from .resultSnapshot import *
@@ -0,0 +1,332 @@
+import json
+import types
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+
+class ResultSnapshot:
+    """
+    Compact and immutable snapshot of the optimization results of an EnergySystemModel instance
+    (cf. EnergySystemModel.snapshotResults). In contrast to a deep copy of the EnergySystemModel instance, the
+    snapshot only holds the optimal values of the variables, the optimization summaries, the solver specifications and
+    the time series aggregation metadata. The input data (e.g. time series) is not stored. The optimal values are
+    stored as read-only numpy arrays, so snapshots are cheap to pickle and can be sent between processes.
+
+    Snapshots can be written to and read from NetCDF files. When read from a NetCDF file, the optimal values are only
+    loaded when they are accessed.
+    """
+
+    def __init__(
+        self,
+        objectiveValue,
+        solverSpecs,
+        tsaMetadata,
+        componentNames,
+        investmentPeriodNames,
+        frames,
+        dataset=None,
+    ):
+        """
+        Constructor for creating a ResultSnapshot class instance. Snapshots are usually created with
+        EnergySystemModel.snapshotResults or ResultSnapshot.readFromNetCDF.
+
+        :param frames: optimization summaries and optimal values. The keys are tuples of the modeling class name, the
+            name of the optimal values (or 'optSummary') and the investment period name. The values are tuples of a
+            read-only numpy array, the index and the columns. If a dataset is given, the values can be names of
+            variables in the dataset which are loaded on access.
+        :type frames: dict
+
+        :param dataset: dataset from which the frames are loaded lazily
+        :type dataset: xarray Dataset or None
+        """
+        object.__setattr__(self, "_objectiveValue", objectiveValue)
+        object.__setattr__(self, "_solverSpecs", dict(solverSpecs))
+        object.__setattr__(self, "_tsaMetadata", dict(tsaMetadata))
+        object.__setattr__(self, "_componentNames", dict(componentNames))
+        object.__setattr__(self, "_investmentPeriodNames", tuple(investmentPeriodNames))
+        object.__setattr__(self, "_frames", dict(frames))
+        object.__setattr__(self, "_dataset", dataset)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ResultSnapshot instances are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("ResultSnapshot instances are immutable.")
+
+    def __getstate__(self):
+        # Lazily loaded frames are loaded before pickling since the dataset holds an open file
+        state = self.__dict__.copy()
+        state["_frames"] = {key: self._getFrame(key) for key in self._frames}
+        state["_dataset"] = None
+        return state
+
+    @property
+    def objectiveValue(self):
+        """Optimal objective value."""
+        return self._objectiveValue
+
+    @property
+    def solverSpecs(self):
+        """Solver specifications of the optimization (read-only mapping)."""
+        return types.MappingProxyType(self._solverSpecs)
+
+    @property
+    def tsaMetadata(self):
+        """Metadata of the time series aggregation (read-only mapping)."""
+        return types.MappingProxyType(self._tsaMetadata)
+
+    @property
+    def componentNames(self):
+        """Names of the components and their modeling classes (read-only mapping)."""
+        return types.MappingProxyType(self._componentNames)
+
+    @property
+    def investmentPeriodNames(self):
+        """Names of the investment periods."""
+        return self._investmentPeriodNames
+
+    @classmethod
+    def fromEnergySystemModel(cls, esM):
+        """
+        Create a snapshot of the optimization results of an EnergySystemModel instance.
+
+        :param esM: optimized EnergySystemModel instance
+        :type esM: EnergySystemModel instance
+
+        :returns: snapshot of the optimization results
+        :rtype: ResultSnapshot
+        """
+        if esM.objectiveValue is None:
+            raise ValueError(
+                "The EnergySystemModel instance has no optimization results."
+            )
+
+        frames = {}
+        for mdlName, mdl in esM.componentModelingDict.items():
+            for ip in esM.investmentPeriodNames:
+                if ip in mdl._optSummary:
+                    frames[mdlName, "optSummary", ip] = _toFrame(mdl._optSummary[ip])
+                for name, data in mdl.getOptimalValues(ip=ip).items():
+                    if data["values"] is not None:
+                        frames[mdlName, name, ip] = _toFrame(data["values"])
+
+        return cls(
+            objectiveValue=esM.objectiveValue,
+            solverSpecs=esM.solverSpecs,
+            tsaMetadata=_getTSAMetadata(esM),
+            componentNames=esM.componentNames,
+            investmentPeriodNames=esM.investmentPeriodNames,
+            frames=frames,
+        )
+
+    def getOptimizationSummary(self, modelingClass, ip=0, outputLevel=0):
+        """
+        Return the optimization summary of a modeling class (cf. EnergySystemModel.getOptimizationSummary).
+        The returned DataFrame is read-only.
+
+        :param modelingClass: name of the modeling class from which the optimization summary should be obtained
+        :type modelingClass: string
+
+        :param ip: investment period name
+            |br| * the default value is 0
+        :type ip: int
+
+        :param outputLevel: states the level of detail of the output summary:
+
+            - 0: full optimization summary is returned
+            - 1: full optimization summary is returned but rows in which all values are NaN (not a number) are dropped
+            - 2: full optimization summary is returned but rows in which all values are NaN or 0 are dropped
+
+            |br| * the default value is 0
+        :type outputLevel: integer (0, 1 or 2)
+
+        :returns: the optimization summary of the requested modeling class
+        :rtype: pandas DataFrame
+        """
+        if ip not in self._investmentPeriodNames:
+            raise ValueError(
+                f"No optimization summary exists for passed ip {ip}. "
+                + "Please define a valid investment period  "
+                + f"(from '{self._investmentPeriodNames}')"
+            )
+        if (modelingClass, "optSummary", ip) not in self._frames:
+            raise ValueError(
+                "No optimization summary exists for the modeling class "
+                + str(modelingClass)
+                + "."
+            )
+        df = self._getDataFrame((modelingClass, "optSummary", ip))
+        if outputLevel == 0:
+            return df
+        df = df.dropna(how="all")
+        if outputLevel == 1:
+            return df
+        return df.loc[((df != 0) & (~df.isnull())).any(axis=1)]
+
+    def getOptimalValues(self, modelingClass, name, ip=0):
+        """
+        Return the optimal values of the components of a modeling class (cf. ComponentModel.getOptimalValues).
+        The returned DataFrame is read-only.
+
+        :param modelingClass: name of the modeling class
+        :type modelingClass: string
+
+        :param name: name of the optimal values, e.g. 'capacityVariablesOptimum' or 'operationVariablesOptimum'
+        :type name: string
+
+        :param ip: investment period name
+            |br| * the default value is 0
+        :type ip: int
+
+        :returns: optimal values or None if the modeling class has no such values
+        :rtype: pandas DataFrame or None
+        """
+        if (modelingClass, name, ip) not in self._frames:
+            return None
+        return self._getDataFrame((modelingClass, name, ip))
+
+    def writeToNetCDF(self, filePath):
+        """
+        Write the snapshot to a NetCDF file.
+
+        :param filePath: path of the NetCDF file
+        :type filePath: string
+        """
+        variables, coords = {}, {}
+        for i, key in enumerate(self._frames):
+            values, index, columns = self._getFrame(key)
+            varName = "frame_" + str(i)
+            dims = (varName + "_row", varName + "_col")
+            for dim, labels in zip(dims, (index, columns)):
+                for level in range(labels.nlevels):
+                    coords[dim + "_" + str(level)] = (
+                        dim,
+                        _toNetCDFLabels(labels.get_level_values(level)),
+                    )
+            variables[varName] = xr.Variable(
+                dims,
+                values,
+                attrs={
+                    "key": json.dumps(key),
+                    "indexNames": json.dumps(list(index.names)),
+                    "columnNames": json.dumps(list(columns.names)),
+                },
+            )
+        ds = xr.Dataset(
+            variables,
+            coords=coords,
+            attrs={
+                "objectiveValue": self._objectiveValue,
+                "solverSpecs": json.dumps(self._solverSpecs, default=str),
+                "tsaMetadata": json.dumps(self._tsaMetadata),
+                "componentNames": json.dumps(self._componentNames),
+                "investmentPeriodNames": json.dumps(self._investmentPeriodNames),
+            },
+        )
+        ds.to_netcdf(filePath)
+
+    @classmethod
+    def readFromNetCDF(cls, filePath):
+        """
+        Read a snapshot from a NetCDF file (cf. ResultSnapshot.writeToNetCDF). The optimal values and optimization
+        summaries are only loaded when they are accessed.
+
+        :param filePath: path of the NetCDF file
+        :type filePath: string
+
+        :returns: snapshot of the optimization results
+        :rtype: ResultSnapshot
+        """
+        ds = xr.open_dataset(filePath)
+        frames = {
+            tuple(json.loads(ds[varName].attrs["key"])): varName
+            for varName in ds.data_vars
+        }
+        tsaMetadata = json.loads(ds.attrs["tsaMetadata"])
+        for name in ["periodsOrder", "periodOccurrences"]:
+            # JSON converts the investment periods to strings
+            tsaMetadata[name] = {int(ip): v for ip, v in tsaMetadata[name].items()}
+        return cls(
+            objectiveValue=ds.attrs["objectiveValue"],
+            solverSpecs=json.loads(ds.attrs["solverSpecs"]),
+            tsaMetadata=tsaMetadata,
+            componentNames=json.loads(ds.attrs["componentNames"]),
+            investmentPeriodNames=json.loads(ds.attrs["investmentPeriodNames"]),
+            frames=frames,
+            dataset=ds,
+        )
+
+    def _getFrame(self, key):
+        frame = self._frames[key]
+        if isinstance(frame, str):
+            # Load the frame from the dataset and cache it
+            da = self._dataset[frame]
+            labels = []
+            for dim, names in zip(da.dims, ["indexNames", "columnNames"]):
+                levels = [
+                    da[coord].values
+                    for coord in sorted(
+                        (c for c in da.coords if da[c].dims == (dim,)),
+                        key=lambda c: int(c.rsplit("_", 1)[1]),
+                    )
+                ]
+                names = json.loads(da.attrs[names])
+                if len(levels) == 1:
+                    labels.append(pd.Index(levels[0], name=names[0]))
+                else:
+                    labels.append(pd.MultiIndex.from_arrays(levels, names=names))
+            values = da.values
+            values.setflags(write=False)
+            frame = (values, labels[0], labels[1])
+            self._frames[key] = frame
+        return frame
+
+    def _getDataFrame(self, key):
+        values, index, columns = self._getFrame(key)
+        return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+
+def _toFrame(df):
+    values = df.to_numpy(dtype=float, copy=True)
+    values.setflags(write=False)
+    return values, df.index, df.columns
+
+
+def _toNetCDFLabels(labels):
+    # NetCDF does not support object arrays with mixed types
+    if labels.dtype == object:
+        return np.asarray(labels.astype(str))
+    return np.asarray(labels)
+
+
+def _getTSAMetadata(esM):
+    def toJSON(values):
+        # Convert numpy types and arrays to JSON serializable types
+        return np.asarray(values).tolist()
+
+    def perInvestmentPeriod(values):
+        if not isinstance(values, dict):
+            values = {ip: values for ip in esM.investmentPeriods}
+        return {int(ip): toJSON(v) for ip, v in values.items()}
+
+    tsaMetadata = {
+        "isTimeSeriesDataClustered": bool(esM.isTimeSeriesDataClustered),
+        "hasTSA": bool(esM.solverSpecs.get("hasTSA", False)),
+        "segmentation": bool(getattr(esM, "segmentation", False)),
+        "typicalPeriods": toJSON(esM.typicalPeriods),
+        "timeStepsPerPeriod": toJSON(esM.timeStepsPerPeriod),
+        "periodsOrder": perInvestmentPeriod(esM.periodsOrder),
+        "periodOccurrences": perInvestmentPeriod(esM.periodOccurrences),
+    }
+    if esM.isTimeSeriesDataClustered and esM.tsaInstance is not None:
+        # The TimeSeriesAggregation instance is only available if it is stored during clustering
+        for name in [
+            "clusterMethod",
+            "noTypicalPeriods",
+            "hoursPerPeriod",
+            "noSegments",
+        ]:
+            tsaMetadata[name] = toJSON(getattr(esM.tsaInstance, name))
+    return tsaMetadata
@@ -1,6 +1,7 @@
 import fine as fn
 import fine.utils as utils
 import pandas as pd
+from pyomo.core.expr.visitor import identify_variables
 import ast
 import inspect
 import time
@@ -433,9 +434,19 @@ def getShadowPrices(
     if dualValues is None:
         dualValues = getDualValues(esM.pyM)
 
-    SP = pd.Series(
+    constraints = pd.Series(
         list(constraint.values()), index=pd.Index(list(constraint.keys()))
-    ).map(dualValues)
+    )
+    SP = constraints.map(dualValues)
+    if esM.pyM.sparseOperation:
+        # In the sparse mode, constraints which only contain eliminated (fixed) operation variables are not passed
+        # to the solver (cf. EnergySystemModel.declareOptimizationProblem) and have no dual values. They are not
+        # binding and their shadow prices are zero.
+        isTrivial = constraints.map(
+            lambda con: next(identify_variables(con.body, include_fixed=False), None)
+            is None
+        )
+        SP = SP.mask(isTrivial & SP.isna(), 0)
     # Select rows where ip is equal to investigated ip
     SP = SP.iloc[SP.index.get_level_values(2) == ip]
     # Delete ip from multiindex
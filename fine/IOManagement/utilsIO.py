@@ -729,7 +729,7 @@ def addTimeSeriesVariableToDict(
     elif drop_component:
         df = comp_var_xr.drop("component").to_dataframe().unstack(level=1)
     elif "space_2" in comp_var_xr.dims:
-        df = comp_var_xr.to_dataframe().squeeze()
+        df = comp_var_xr.reset_coords(drop=True).to_dataframe().squeeze()
         # merge space and space_2 levels
         space_index = df.index.get_level_values("space")
         space_2_index = df.index.get_level_values("space_2")
@@ -746,7 +746,8 @@ def addTimeSeriesVariableToDict(
         df = df.unstack()
         df = df.dropna(axis=1, how="all")
     else:
-        df = comp_var_xr.to_dataframe().unstack(level=1)
+        # Non-dimension coordinates (e.g. the Period of the time series) would be added as columns
+        df = comp_var_xr.reset_coords(drop=True).to_dataframe().unstack(level=1)
 
     if isinstance(df, pd.DataFrame) and "space_2" not in comp_var_xr.dims:
         if len(df.columns) > 1:
@@ -790,7 +791,8 @@ def add2dVariableToDict(
     if drop_component:
         series = comp_var_xr.drop("component").to_dataframe().stack(level=0)
     else:
-        series = comp_var_xr.to_dataframe().stack(level=0)
+        # Non-dimension coordinates (e.g. the Period of the time series) would be added as columns
+        series = comp_var_xr.reset_coords(drop=True).to_dataframe().stack(level=0)
     series.index = series.index.droplevel(level=2).map("_".join)
 
     # NOTE: In FINE, a check is made to make sure that locationalEligibility indices matches indices of other
@@ -838,7 +840,8 @@ def add1dVariableToDict(
         series = comp_var_xr.drop("component").to_dataframe().unstack(level=0)
         series.index = series.index.droplevel(level=0)
     else:
-        series = comp_var_xr.to_dataframe().unstack(level=0)
+        # Non-dimension coordinates (e.g. the Period of the time series) would be added as columns
+        series = comp_var_xr.reset_coords(drop=True).to_dataframe().unstack(level=0)
         series.index = series.index.droplevel(level=0)
 
     class_name = component.split("; ")[0]
@@ -1,11 +1,13 @@
 """
-Last edited: February 06, 2020
+Last edited: October 19, 2026
 
 |br| @author: FINE Developer Team (FZJ IEK-3)
 """
 
 # ruff: noqa
 
+import importlib
+
 from .energySystemModel import EnergySystemModel
 from .sourceSink import Source, Sink
 from .conversion import Conversion
@@ -13,6 +15,137 @@ from .storage import Storage
 from .transmission import Transmission
 from .component import Component, ComponentModel
 from .subclasses import *
-from .IOManagement import *
-from .expansionModules import *
-from .aggregations import *
+
+# The subpackages IOManagement (matplotlib, geopandas, xarray, netCDF4), expansionModules and aggregations
+# (scikit-learn, rasterio, shapely, tsam) depend on heavy packages. They are only imported when one of their
+# attributes is accessed, e.g. fine.writeOptimizationOutputToExcel or fine.aggregations.
+_lazySubpackages = {
+    "IOManagement": [
+        "PowerDict",
+        "ResultSnapshot",
+        "add0dVariableToDict",
+        "add1dVariableToDict",
+        "add2dVariableToDict",
+        "addConstantsToXarray",
+        "addDFVariablesToXarray",
+        "addSeriesVariablesToXarray",
+        "addTimeSeriesVariableToDict",
+        "convertDatasetsToEnergySystemModel",
+        "convertOptimizationInputToDatasets",
+        "convertOptimizationOutputToDatasets",
+        "energySystemModelRunFromExcel",
+        "exportToDict",
+        "generateIterationDicts",
+        "getDualValues",
+        "getFromDict",
+        "getKeyHierarchyOfNestedDict",
+        "getListsOfKeyPathsInNestedDict",
+        "getShadowPrices",
+        "getSimultaneosChargeDischarge",
+        "importFromDict",
+        "plotLocationalColorMap",
+        "plotLocations",
+        "plotOperation",
+        "plotOperationColorMap",
+        "plotPieChart",
+        "plotTransmission",
+        "processXarrayAttributes",
+        "readEnergySystemModelFromExcel",
+        "readNetCDFToDatasets",
+        "readNetCDFtoEnergySystemModel",
+        "readOptimizationOutputFromExcel",
+        "setInDict",
+        "timer",
+        "transform1dSeriesto2dDataFrame",
+        "writeDatasetsToNetCDF",
+        "writeEnergySystemModelToDatasets",
+        "writeEnergySystemModelToNetCDF",
+        "writeOptimizationOutputToExcel",
+    ],
+    "expansionModules": [
+        "addStockComponents",
+        "fixBinaryVariables",
+        "getStock",
+        "getStockCapacities",
+        "getWarmStartValues",
+        "optimizeBenders",
+        "optimizeProgressiveHedging",
+        "optimizeSimpleMyopic",
+        "optimizeSolverPortfolio",
+        "optimizeTSAadaptive",
+        "optimizeTSAmultiStage",
+        "setWarmStartValues",
+        "updateStockCapacities",
+        "updateYearlyLimitation",
+    ],
+    "aggregations": [
+        "aggregate_RE_technology",
+        "aggregate_based_on_sub_to_sup_region_id_dict",
+        "aggregate_connections",
+        "aggregate_esm_parameters_spatially",
+        "aggregate_geometries",
+        "aggregate_time_series_spatially",
+        "aggregate_values_spatially",
+        "combine_parallel_lines",
+        "combine_series_lines",
+        "create_gdf",
+        "create_geom_xarray",
+        "get_centroid_coordinates",
+        "get_connectivity_matrix",
+        "get_custom_distance",
+        "get_custom_distance_matrix",
+        "get_k_medoids_objective",
+        "get_normalized_array",
+        "get_parameter_name",
+        "get_region_growing_clusters",
+        "get_region_list",
+        "is_network_reducible",
+        "perform_distance_based_grouping",
+        "perform_parameter_based_grouping",
+        "perform_spatial_aggregation",
+        "perform_string_based_grouping",
+        "preprocess_1d_variables",
+        "preprocess_2d_variables",
+        "preprocess_dataset",
+        "preprocess_time_series",
+        "rasterize_geometry",
+        "rasterize_xr_ds",
+        "reduce_node",
+        "reduce_transmission_network",
+        "save_shapefile_from_xarray",
+    ],
+}
+_lazyAttributes = {
+    name: subpackage for subpackage, names in _lazySubpackages.items() for name in names
+}
+
+__all__ = [
+    name for name in globals() if not name.startswith("_") and name != "importlib"
+]
+__all__ += list(_lazySubpackages) + list(_lazyAttributes)
+
+
+def __getattr__(name):
+    if name in _lazySubpackages:
+        return importlib.import_module("." + name, __name__)
+    if name in _lazyAttributes:
+        subpackage = importlib.import_module("." + _lazyAttributes[name], __name__)
+    elif not name.startswith("_"):
+        # Other names of the subpackages (e.g. modules which are imported in the subpackages) are looked up in
+        # the same order in which the subpackages were imported before
+        for subpackage in reversed(
+            [importlib.import_module("." + s, __name__) for s in _lazySubpackages]
+        ):
+            if hasattr(subpackage, name):
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(subpackage, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,5 +4,6 @@ Last edited: February 2, 2022
 |br| @author: FINE Developer Team (FZJ IEK-3)
 """
 
+from .networkReduction import *
 from .spatialAggregation import *
 from .technologyAggregation import *
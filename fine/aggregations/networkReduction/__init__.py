@@ -0,0 +1,7 @@
+"""
+Last edited: October 19, 2026
+
+|br| @author: FINE Developer Team (FZJ IEK-3)
+"""
+
+from .networkReduction import *
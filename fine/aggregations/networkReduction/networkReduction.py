@@ -0,0 +1,445 @@
+"""Reduction of the network graphs of Transmission components before the optimization.
+
+Locations which do not hold any component except for the lines of one Transmission component are removed from
+the energy system model: the two lines of a location with two neighbors are contracted to one line (series lines),
+a line which results from the contraction is merged with an existing line between the same locations (parallel
+lines) and the lines of a location with only one neighbor are dropped (dangling lines). A mapping of the
+original lines to the reduced lines allows to recover the flows on the original network after the optimization.
+"""
+
+import logging
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+
+logger_network_reduction = logging.getLogger("network_reduction")
+
+# Parameters which can not be represented on contracted or merged lines. The networks of Transmission components
+# with these parameters are not reduced.
+NON_REDUCIBLE_PARAMETERS = [
+    "operationRateMax",
+    "operationRateFix",
+    "partLoadMin",
+    "isBuiltFix",
+    "commissioningMin",
+    "commissioningMax",
+    "commissioningFix",
+    "stockCommissioning",
+    "balanceLimitID",
+    "pathwayBalanceLimitID",
+    "linkedQuantityID",
+    "sharedPotentialID",
+    "yearlyFullLoadHoursMin",
+    "yearlyFullLoadHoursMax",
+]
+
+# Design cost parameters which are given per length unit of a line
+DISTANCE_RELATED_COST_PARAMETERS = [
+    "investPerCapacity",
+    "investIfBuilt",
+    "opexPerCapacity",
+    "opexIfBuilt",
+]
+
+
+def get_parameter_name(varname):
+    """
+    Get the name of the component parameter of a dataset variable, e.g. 'capacityMax' for '2d_capacityMax.0'.
+    """
+    return varname[3:].split(".")[0]
+
+
+def is_network_reducible(comp_ds):
+    """
+    Check if the network of a Transmission component can be reduced, i.e. if the component does not have
+    operation time series or parameters which can not be represented on contracted or merged lines.
+
+    :param comp_ds: The xarray dataset holding the input data of the Transmission component
+    :type comp_ds: xr.Dataset
+
+    :return: True if the network of the component can be reduced, False otherwise
+    :rtype: bool
+    """
+    for varname, da in comp_ds.data_vars.items():
+        if pd.isnull(da.values).all():
+            continue
+        name = get_parameter_name(varname)
+        if varname[:3] == "ts_" or name in NON_REDUCIBLE_PARAMETERS:
+            return False
+        if name == "QPcostScale" and (da.values != 0).any():
+            return False
+    return True
+
+
+def _get_total_loss(line):
+    return line["2d_losses"] * line["2d_distances"]
+
+
+def combine_series_lines(first, second):
+    """
+    Combine two lines in series, i.e. the line from location a to location n (first) and the line from location n
+    to location b (second), to one line from location a to location b.
+
+    The distances are added, the losses are combined such that the relative loss of the combined line equals the
+    relative loss of the two lines in series and the design cost parameters per length unit are averaged by the
+    distances. The capacity of the combined line is bounded by the capacity bounds of both lines. All other
+    parameters have to be equal.
+
+    .. note::
+        The capacity of the second line is designed for the inflow of the first line, i.e. the losses of the first
+        line are not deducted from the capacity (and design costs) of the second line.
+
+    :param first: parameter values of the line from location a to location n
+    :type first: dict
+
+    :param second: parameter values of the line from location n to location b
+    :type second: dict
+
+    :return: parameter values of the combined line, None if the lines can not be combined
+    :rtype: dict or None
+    """
+    distance = first["2d_distances"] + second["2d_distances"]
+    loss1, loss2 = _get_total_loss(first), _get_total_loss(second)
+
+    combined = {}
+    for varname, value1 in first.items():
+        name, value2 = get_parameter_name(varname), second[varname]
+        if name == "distances":
+            combined[varname] = distance
+        elif name == "losses":
+            combined[varname] = (
+                (1 - (1 - loss1) * (1 - loss2)) / distance if distance > 0 else 0
+            )
+        elif name == "locationalEligibility":
+            combined[varname] = 1
+        elif name == "capacityMax":
+            combined[varname] = np.nanmin([value1, value2])
+        elif name == "capacityMin":
+            combined[varname] = np.nanmax([value1, value2])
+        elif name in DISTANCE_RELATED_COST_PARAMETERS:
+            combined[varname] = (
+                (value1 * first["2d_distances"] + value2 * second["2d_distances"])
+                / distance
+                if distance > 0
+                else 0
+            )
+        elif name == "opexPerOperation":
+            # The flow on the second line is reduced by the losses of the first line
+            combined[varname] = value1 + value2 * (1 - loss1)
+        elif np.isclose(value1, value2, equal_nan=True):
+            combined[varname] = value1
+        else:
+            return None
+    return combined
+
+
+def combine_parallel_lines(first, second):
+    """
+    Combine two parallel lines between the same locations to one line. The lines can only be combined if they have
+    the same relative losses, the same operation costs and the same design costs. The capacity bounds of the
+    combined line are the sums of the capacity bounds of both lines. All other parameters have to be equal.
+
+    :param first: parameter values of the first line
+    :type first: dict
+
+    :param second: parameter values of the second line
+    :type second: dict
+
+    :return: parameter values of the combined line, None if the lines can not be combined
+    :rtype: dict or None
+    """
+    distance = first["2d_distances"]
+    loss = _get_total_loss(first)
+    if not np.isclose(loss, _get_total_loss(second)):
+        return None
+
+    combined = {}
+    for varname, value1 in first.items():
+        name, value2 = get_parameter_name(varname), second[varname]
+        if name == "distances":
+            combined[varname] = distance
+        elif name == "losses":
+            combined[varname] = loss / distance if distance > 0 else 0
+        elif name == "locationalEligibility":
+            combined[varname] = 1
+        elif name == "capacityMax":
+            # An unbounded capacity (nan) remains unbounded
+            combined[varname] = value1 + value2
+        elif name == "capacityMin":
+            combined[varname] = np.nansum([value1, value2])
+        elif name == "capacityFix" and not (pd.isnull(value1) or pd.isnull(value2)):
+            combined[varname] = value1 + value2
+        elif name in DISTANCE_RELATED_COST_PARAMETERS:
+            total = value1 * distance
+            if not np.isclose(total, value2 * second["2d_distances"]):
+                return None
+            combined[varname] = total / distance if distance > 0 else 0
+        elif np.isclose(value1, value2, equal_nan=True):
+            combined[varname] = value1
+        else:
+            return None
+    return combined
+
+
+def _get_parallel_shares(first, second):
+    # The flow of merged parallel lines is split in proportion to their capacities
+    for varname in ["2d_capacityFix", "2d_capacityMax"]:
+        if varname in first:
+            capacities = np.array([first[varname], second[varname]], dtype=float)
+            if not np.isnan(capacities).any() and capacities.sum() > 0:
+                return capacities / capacities.sum()
+    return np.array([0.5, 0.5])
+
+
+def reduce_node(node, lines, operation, merge_parallel_lines=True):
+    """
+    Remove a location from the network of a Transmission component if it is the end of a dangling line or if its two
+    lines can be contracted to one line. The lines and the operation mapping are only modified if the location is
+    removed.
+
+    :param node: The location which is removed
+    :type node: str
+
+    :param lines: parameter values of the (directed) lines of the network with the keys (location 1, location 2)
+    :type lines: dict
+
+    :param operation: factors of the flows on the original lines per unit of flow on each line of the network
+        with the keys (location 1, location 2)
+    :type operation: dict
+
+    **Default arguments:**
+
+    :param merge_parallel_lines: states if a contracted line can be merged with an existing parallel line.
+        |br| * the default value is True
+    :type merge_parallel_lines: bool
+
+    :return: True if the location was removed, False otherwise
+    :rtype: bool
+    """
+    node_lines = [line for line in lines if node in line]
+    if any((loc2, loc1) not in lines for loc1, loc2 in node_lines):
+        return False
+    neighbors = sorted({loc for line in node_lines for loc in line if loc != node})
+
+    new_lines = {}
+    if len(neighbors) == 1:
+        # A dangling line does not carry any flow unless its capacity is enforced
+        for line in node_lines:
+            for varname in ["2d_capacityMin", "2d_capacityFix"]:
+                if varname in lines[line] and np.nansum([lines[line][varname]]) > 0:
+                    return False
+    elif len(neighbors) == 2:
+        a, b = neighbors
+        for loc1, loc2 in [(a, b), (b, a)]:
+            first, second = lines[loc1, node], lines[node, loc2]
+            combined = combine_series_lines(first, second)
+            if combined is None:
+                return False
+            combined_operation = dict(operation[loc1, node])
+            for line, factor in operation[node, loc2].items():
+                combined_operation[line] = factor * (1 - _get_total_loss(first))
+
+            if (loc1, loc2) in lines:
+                if not merge_parallel_lines:
+                    return False
+                parallel = combine_parallel_lines(lines[loc1, loc2], combined)
+                if parallel is None:
+                    return False
+                shares = _get_parallel_shares(lines[loc1, loc2], combined)
+                combined_operation = {
+                    **{
+                        line: factor * shares[0]
+                        for line, factor in operation[loc1, loc2].items()
+                    },
+                    **{
+                        line: factor * shares[1]
+                        for line, factor in combined_operation.items()
+                    },
+                }
+                combined = parallel
+            new_lines[loc1, loc2] = (combined, combined_operation)
+    elif len(neighbors) > 2:
+        return False
+
+    for line in node_lines:
+        del lines[line], operation[line]
+    for line, (combined, combined_operation) in new_lines.items():
+        lines[line], operation[line] = combined, combined_operation
+    return True
+
+
+def _get_eligible_locations(comp_ds):
+    if "2d_locationalEligibility" in comp_ds:
+        eligibility = comp_ds["2d_locationalEligibility"].to_pandas()
+        return set(eligibility.index[(eligibility > 0).any(axis=1)]) | set(
+            eligibility.columns[(eligibility > 0).any(axis=0)]
+        )
+    eligibility = comp_ds["1d_locationalEligibility"].to_pandas()
+    return set(eligibility.index[eligibility > 0])
+
+
+def _get_location_dataframes(vardata, locations):
+    # Parameters of the esM (e.g. the balanceLimit) which are given per location
+    if isinstance(vardata, pd.DataFrame) and any(
+        loc in vardata.columns for loc in locations
+    ):
+        return [vardata]
+    if isinstance(vardata, dict):
+        return [
+            frame
+            for value in vardata.values()
+            for frame in _get_location_dataframes(value, locations)
+        ]
+    return []
+
+
+def _drop_locations(vardata, removed):
+    if isinstance(vardata, pd.DataFrame):
+        return vardata.drop(columns=removed, errors="ignore")
+    if isinstance(vardata, dict):
+        return {key: _drop_locations(value, removed) for key, value in vardata.items()}
+    return vardata
+
+
+def reduce_transmission_network(xr_datasets):
+    """
+    Reduce the networks of the Transmission components of an energy system model. Locations which do not hold
+    any component except for the lines of one Transmission component and which are not referenced by parameters of
+    the energy system model (e.g. the balanceLimit) are removed if
+
+        * they are the end of a dangling line (without enforced capacity) or
+        * their two lines can be contracted to one line and, if a line between the neighboring locations already
+          exists, the contracted line can be merged with it.
+
+    The reduction is repeated until no further location can be removed. Only the networks of components of the
+    Transmission class without operation time series, commissioning or stock parameters and quadratic costs are
+    reduced (see NON_REDUCIBLE_PARAMETERS).
+
+    :param xr_datasets: The xarray datasets holding the input data of the energy system model (see
+        xarrayIO.convertOptimizationInputToDatasets with useProcessedValues=True)
+    :type xr_datasets: Dict[str, xr.Dataset]
+
+    :return: The reduced xarray datasets and, for each Transmission component with a reduced network, the
+        mapping of the original (directed) lines (location 1, location 2) to the line of the reduced network
+        and the factor of the flow on the original line per unit of flow on the reduced line. Dropped dangling
+        lines are mapped to None.
+    :rtype: Tuple[Dict[str, xr.Dataset], dict]
+    """
+    reduced_xr_datasets = deepcopy(xr_datasets)
+    parameters_dict = reduced_xr_datasets["Parameters"].attrs
+    locations = sorted(parameters_dict["locations"])
+
+    # Locations which hold components other than reducible Transmission components or which are referenced by
+    # parameters of the esM are kept
+    fixed_locations = {
+        loc
+        for vardata in parameters_dict.values()
+        for frame in _get_location_dataframes(vardata, locations)
+        for loc in locations
+        if loc in frame.columns and frame[loc].notnull().any()
+    }
+    networks = {}
+    for model, comps in reduced_xr_datasets["Input"].items():
+        for comp, comp_ds in comps.items():
+            if model == "Transmission" and is_network_reducible(comp_ds):
+                networks[comp] = comp_ds
+            else:
+                fixed_locations |= _get_eligible_locations(comp_ds)
+
+    lines, operation, original_lines, merge_parallel_lines = {}, {}, {}, {}
+    for comp, comp_ds in networks.items():
+        # Design cost parameters which are given as a single value are set per line
+        for varname in list(comp_ds.data_vars):
+            value = comp_ds[varname].values
+            if (
+                varname[:3] == "0d_"
+                and get_parameter_name(varname) in DISTANCE_RELATED_COST_PARAMETERS
+                and isinstance(value.item(), (int, float))
+            ):
+                comp_ds["2d_" + varname[3:]] = (
+                    comp_ds["2d_locationalEligibility"] * value.item()
+                )
+                comp_ds = comp_ds.drop_vars(varname)
+        networks[comp] = comp_ds
+
+        frames = {
+            varname: comp_ds[varname].to_pandas()
+            for varname in comp_ds.data_vars
+            if varname[:3] == "2d_"
+        }
+        eligibility = frames["2d_locationalEligibility"]
+        lines[comp] = {
+            (loc1, loc2): {
+                varname: frame.loc[loc1, loc2] for varname, frame in frames.items()
+            }
+            for loc1 in eligibility.index
+            for loc2 in eligibility.columns
+            if eligibility.loc[loc1, loc2] > 0
+        }
+        operation[comp] = {line: {line: 1.0} for line in lines[comp]}
+        original_lines[comp] = list(lines[comp])
+        merge_parallel_lines[comp] = not (
+            "0d_hasIsBuiltBinaryVariable" in comp_ds
+            and comp_ds["0d_hasIsBuiltBinaryVariable"].item()
+        )
+
+    removed = []
+    changed = True
+    while changed and len(removed) < len(locations) - 1:
+        changed = False
+        for node in locations:
+            if node in fixed_locations or node in removed:
+                continue
+            comps = [
+                comp for comp in networks if any(node in line for line in lines[comp])
+            ]
+            if len(comps) > 1:
+                continue
+            if len(comps) == 0 or reduce_node(
+                node,
+                lines[comps[0]],
+                operation[comps[0]],
+                merge_parallel_lines[comps[0]],
+            ):
+                removed.append(node)
+                changed = True
+                if len(removed) == len(locations) - 1:
+                    break
+    logger_network_reduction.info(
+        f"Removed {len(removed)} of {len(locations)} locations from the network"
+    )
+
+    # Update the esM parameters and the input data
+    kept = [loc for loc in locations if loc not in removed]
+    for varname, vardata in parameters_dict.items():
+        if varname == "locations":
+            parameters_dict[varname] = set(kept)
+        else:
+            parameters_dict[varname] = _drop_locations(vardata, removed)
+
+    for model, comps in reduced_xr_datasets["Input"].items():
+        for comp, comp_ds in comps.items():
+            comp_ds = networks.get(comp, comp_ds)
+            comp_ds = comp_ds.sel(
+                {dim: kept for dim in ["space", "space_2"] if dim in comp_ds.dims}
+            )
+            if comp in networks:
+                for varname in comp_ds.data_vars:
+                    if varname[:3] != "2d_":
+                        continue
+                    frame = pd.DataFrame(0.0, index=kept, columns=kept)
+                    for (loc1, loc2), line in lines[comp].items():
+                        frame.loc[loc1, loc2] = line[varname]
+                    comp_ds[varname] = (("space", "space_2"), frame.to_numpy())
+            comps[comp] = comp_ds
+
+    mapping = {}
+    for comp, comp_lines in original_lines.items():
+        reduced_lines = {
+            line: (reduced_line, factor)
+            for reduced_line, factors in operation[comp].items()
+            for line, factor in factors.items()
+        }
+        mapping[comp] = {line: reduced_lines.get(line) for line in comp_lines}
+    return reduced_xr_datasets, mapping
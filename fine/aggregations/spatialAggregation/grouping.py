@@ -136,10 +136,9 @@ def perform_distance_based_grouping(
 
         # reduce ds
         geom_xr = geom_xr.sel(space=regions_list)
-        centroids = geom_xr["centroids"].values
 
         centroids_x_y_points = (
-            np.asarray([[point.x, point.y] for point in centroids]) / 1000
+            gprUtils.get_centroid_coordinates(geom_xr) / 1000
         )  # km
 
         # STEP 1. Compute hierarchical clustering
@@ -227,6 +226,10 @@ def perform_parameter_based_grouping(
             * 'hierarchical': \n
                 sklearn's agglomerative clustering with complete linkage, with a connetivity matrix to ensure contiguity\n
                 Refer to Sklearn docs for more info: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.AgglomerativeClustering.html
+            * 'region_growing': \n
+                heuristic for kmedoids clustering with contiguity constraint (region growing with local refinement
+                on the connectivity graph). No MILP solver is required and it scales to thousands of regions.\n
+                Refer to `groupingUtils.get_region_growing_clusters` for more info.
 
         |br| * the default value is 'kmedoids_contiguity'
     :type aggregation_method: str
@@ -312,10 +315,27 @@ def perform_parameter_based_grouping(
             sup_region_id = "_".join(sub_regions_list)
             aggregation_dict[sup_region_id] = sub_regions_list.copy()
 
+        logger_grouping.info(f"Objective value of {aggregation_method}: {r_obj}")
+
+    elif aggregation_method == "region_growing":
+        labels, obj = gprUtils.get_region_growing_clusters(
+            precomputed_dist_matrix, connectivity_matrix, n_groups
+        )
+
+        # Aggregated regions dict
+        aggregation_dict = {}
+        for label in np.unique(labels):
+            # Group the regions of this regions label
+            sub_regions_list = list(regions_list[labels == label])
+            sup_region_id = "_".join(sub_regions_list)
+            aggregation_dict[sup_region_id] = sub_regions_list.copy()
+
+        logger_grouping.info(f"Objective value of {aggregation_method}: {obj}")
+
     else:
         raise ValueError(
             f"The aggregation method {aggregation_method} is not valid. Please choose either \
-        kmedoids_contiguity or hierarchical"
+        kmedoids_contiguity, hierarchical or region_growing"
         )
 
     return aggregation_dict
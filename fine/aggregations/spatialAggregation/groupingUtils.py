@@ -1,9 +1,15 @@
 """Functions to assist spatial grouping algorithms. 
 """
 
+import collections
+import heapq
 import warnings
 import numpy as np
+import shapely
+from scipy import sparse
 from scipy.cluster import hierarchy
+from scipy.sparse import csgraph
+from scipy.spatial import cKDTree
 from fine.IOManagement.utilsIO import PowerDict
 
 # ruff: noqa
@@ -432,22 +438,25 @@ def get_connectivity_matrix(xarray_datasets):
         neighbors = geometries[~geometries.disjoint(geom)].index.tolist()
         connectivity_matrix[ix, neighbors] = 1
 
-    # STEP 2: Find nearest neighbor for island regions
-    for row in range(len(connectivity_matrix)):
-        if (
-            np.count_nonzero(connectivity_matrix[row, :] == 1) == 1
-        ):  # if a region is connected only to itself
-            # get the nearest neighbor based on regions centroids
-            centroid_distances = geom_xr["centroid_distances"].values[row, :]
-            nearest_neighbor_idx = np.argmin(
-                centroid_distances[np.nonzero(centroid_distances)]
-            )
-
-            # make the connection between the regions (both ways to keep it symmetric)
-            (
-                connectivity_matrix[row, nearest_neighbor_idx],
-                connectivity_matrix[nearest_neighbor_idx, row],
-            ) = (1, 1)
+    # STEP 2: Find nearest neighbor for island regions (i.e. regions which are connected only to themselves)
+    islands = np.flatnonzero(np.count_nonzero(connectivity_matrix == 1, axis=1) == 1)
+    if len(islands) > 0:
+        # get the two nearest neighbors based on regions centroids (one of them is the island itself)
+        centroid_coordinates = get_centroid_coordinates(geom_xr)
+        _, nearest_neighbors = cKDTree(centroid_coordinates).query(
+            centroid_coordinates[islands], k=2
+        )
+        for row, neighbors in zip(islands, nearest_neighbors):
+            if np.count_nonzero(connectivity_matrix[row, :] == 1) == 1:
+                nearest_neighbor_idx = (
+                    neighbors[1] if neighbors[0] == row else neighbors[0]
+                )
+
+                # make the connection between the regions (both ways to keep it symmetric)
+                (
+                    connectivity_matrix[row, nearest_neighbor_idx],
+                    connectivity_matrix[nearest_neighbor_idx, row],
+                ) = (1, 1)
 
     # STEP 3: Additionally, check if there are transmission between regions that are not yet connected in the
     # connectivity matrix
@@ -462,6 +471,216 @@ def get_connectivity_matrix(xarray_datasets):
     return connectivity_matrix
 
 
+def get_k_medoids_objective(distance_matrix, labels):
+    """
+    Computes the k-medoids objective value of a clustering, i.e., the sum of the distances of all regions
+    to the medoids of their clusters.
+
+    :param distance_matrix: A n_regions by n_regions hollow, symmetric distance matrix
+    :type distance_matrix: np.ndarray
+
+    :param labels: The cluster label of each region
+    :type labels: np.ndarray
+
+    :returns: objective - The k-medoids objective value
+    :rtype: float
+    """
+    objective = 0
+    for label in np.unique(labels):
+        members = np.flatnonzero(labels == label)
+        objective += distance_matrix[np.ix_(members, members)].sum(axis=1).min()
+
+    return float(objective)
+
+
+def get_region_growing_clusters(
+    distance_matrix, connectivity_matrix, n_groups, max_iter=100
+):
+    """
+    Clusters the regions into `n_groups` contiguous groups with a heuristic for the k-medoids problem with
+    contiguity constraints. In contrast to the exact method (cf. `k_medoids_contiguity` in tsam), no MILP solver is
+    required. The region growing and the local refinement work on the sparse connectivity graph:
+
+        1. Seeding: The medoid of each connected part of the connectivity graph is chosen as seed. Further seeds are
+           chosen as the regions that are farthest from the existing seeds.
+        2. Region growing: Starting from the seeds, the unassigned neighbors of the clusters are assigned in the
+           order of their distance to the seed of the cluster (priority queue). Thereby, each cluster is contiguous.
+        3. Local refinement: The medoids of the clusters are updated and regions at the border of a cluster are
+           moved to a neighboring cluster if they are closer to its medoid and their original cluster remains
+           contiguous. This is repeated until no region is moved anymore.
+
+    Apart from the seeding and the initial distance sums of the refinement (O(n_regions²) each, i.e. linear in the
+    size of the distance matrix), the effort of a refinement iteration is O(n_regions log(n_regions) + n_edges) for
+    the medoid update and the border scan plus O(n_regions) per moved region for the update of the distance sums. The
+    contiguity check of a move only searches the surroundings of the moved region, unless the region is a cut
+    vertex of its cluster.
+
+    :param distance_matrix: A n_regions by n_regions hollow, symmetric distance matrix
+    :type distance_matrix: np.ndarray
+
+    :param connectivity_matrix: A n_regions by n_regions symmetric matrix indicating if two regions are connected
+        (cf. `get_connectivity_matrix`)
+    :type connectivity_matrix: np.ndarray
+
+    :param n_groups: The number of region groups to be formed
+    :type n_groups: strictly positive int
+
+    **Default arguments:**
+
+    :param max_iter: The maximum number of local refinement iterations (0 skips the local refinement)
+        |br| * the default value is 100
+    :type max_iter: positive int
+
+    :returns: labels - The cluster label of each region, objective - the k-medoids objective value
+        (cf. `get_k_medoids_objective`)
+    :rtype: Tuple[np.ndarray, float]
+    """
+    n_regions = len(distance_matrix)
+    if not 0 < n_groups <= n_regions:
+        raise ValueError(
+            f"The number of groups has to be between 1 and the number of regions ({n_regions})."
+        )
+
+    adjacency = sparse.csr_matrix(connectivity_matrix, dtype=bool)
+    adjacency.setdiag(False)
+    adjacency.eliminate_zeros()
+
+    def _neighbors(region):
+        return adjacency.indices[
+            adjacency.indptr[region] : adjacency.indptr[region + 1]
+        ]
+
+    def _medoid(members):
+        return members[distance_matrix[np.ix_(members, members)].sum(axis=1).argmin()]
+
+    # STEP 1. Seeding
+    n_components, component_labels = csgraph.connected_components(
+        adjacency, directed=False
+    )
+    if n_components > n_groups:
+        raise ValueError(
+            f"The connectivity graph consists of {n_components} separate parts. At least as many groups are required."
+        )
+    seeds = [
+        _medoid(np.flatnonzero(component_labels == component))
+        for component in range(n_components)
+    ]
+    min_distances = distance_matrix[seeds].min(axis=0)
+    min_distances[seeds] = -1
+    while len(seeds) < n_groups:
+        seed = int(min_distances.argmax())
+        seeds.append(seed)
+        min_distances = np.minimum(min_distances, distance_matrix[seed])
+        min_distances[seeds] = -1
+    medoids = np.array(seeds)
+
+    # STEP 2. Region growing
+    labels = np.full(n_regions, -1)
+    labels[medoids] = np.arange(n_groups)
+    queue = []
+    for label, seed in enumerate(medoids):
+        for neighbor in _neighbors(seed):
+            heapq.heappush(queue, (distance_matrix[seed, neighbor], neighbor, label))
+    while queue:
+        _, region, label = heapq.heappop(queue)
+        if labels[region] >= 0:
+            continue
+        labels[region] = label
+        for neighbor in _neighbors(region):
+            if labels[neighbor] < 0:
+                heapq.heappush(
+                    queue, (distance_matrix[medoids[label], neighbor], neighbor, label)
+                )
+
+    # STEP 3. Local refinement
+    # The distance sums of all regions to the members of each cluster are updated incrementally when a region is
+    # moved, such that the medoids are obtained without recomputing the distances within the clusters
+    distance_sums = np.zeros((n_regions, n_groups))
+    for label in range(n_groups):
+        distance_sums[:, label] = distance_matrix[:, labels == label].sum(axis=1)
+
+    def _remains_contiguous(region, label):
+        # the cluster remains contiguous without the region if the neighbors of the region within the cluster are
+        # still connected. The breadth-first search stops as soon as all of them are reached, which is usually close
+        # to the region, and only traverses the whole cluster if the region is a cut vertex of the cluster
+        cluster_neighbors = [n for n in _neighbors(region) if labels[n] == label]
+        if len(cluster_neighbors) <= 1:
+            return True
+        missing = set(cluster_neighbors[1:])
+        visited = {region, cluster_neighbors[0]}
+        queue = collections.deque([cluster_neighbors[0]])
+        while queue:
+            for neighbor in _neighbors(queue.popleft()):
+                if labels[neighbor] == label and neighbor not in visited:
+                    visited.add(neighbor)
+                    missing.discard(neighbor)
+                    if not missing:
+                        return True
+                    queue.append(neighbor)
+        return False
+
+    for _ in range(max_iter):
+        # medoid of each cluster: the member with the smallest distance sum (the first one in case of ties)
+        order = np.lexsort((distance_sums[np.arange(n_regions), labels], labels))
+        first = np.flatnonzero(np.diff(labels[order], prepend=-1))
+        medoids = order[first]
+
+        moved = False
+        for region in range(n_regions):
+            own_label = labels[region]
+            if region == medoids[own_label]:
+                continue
+            neighbor_labels = set(labels[_neighbors(region)]) - {own_label}
+            if not neighbor_labels:
+                continue
+            best_label = min(
+                neighbor_labels,
+                key=lambda label: distance_matrix[medoids[label], region],
+            )
+            if (
+                distance_matrix[medoids[best_label], region]
+                >= distance_matrix[medoids[own_label], region]
+            ):
+                continue
+            # check that the original cluster remains contiguous
+            if not _remains_contiguous(region, own_label):
+                continue
+            labels[region] = best_label
+            distance_sums[:, own_label] -= distance_matrix[:, region]
+            distance_sums[:, best_label] += distance_matrix[:, region]
+            moved = True
+
+        if not moved:
+            break
+
+    return labels, get_k_medoids_objective(distance_matrix, labels)
+
+
+def get_centroid_coordinates(geom_xr):
+    """
+    Returns the x and y coordinates of the region centroids in `geom_xr`.
+
+    :param geom_xr: The xarray dataset holding the geom info
+    :type geom_xr: xr.Dataset
+
+    :returns: centroid_coordinates - A n_regions by 2 array with the x and y coordinates of the region centroids
+    :rtype: np.ndarray
+
+    .. note::
+        The coordinates are taken from 'centroid_coordinates' if present (cf. `create_geom_xarray`). Otherwise, they
+        are extracted from 'centroids' or, if not present either, from the centroids of 'geometries'.
+    """
+    if "centroid_coordinates" in geom_xr:
+        return geom_xr["centroid_coordinates"].values
+
+    if "centroids" in geom_xr:
+        centroids = np.asarray(geom_xr["centroids"].values)
+    else:
+        centroids = shapely.centroid(np.asarray(geom_xr["geometries"].values))
+
+    return np.column_stack([shapely.get_x(centroids), shapely.get_y(centroids)])
+
+
 def get_region_list(geom_xr, skip_regions, enforced_group):
     """
     Generates a modified region list that is to be used during region grouping.
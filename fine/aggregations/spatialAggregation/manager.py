@@ -127,9 +127,12 @@ def perform_spatial_aggregation(
             * 'hierarchical':
                 sklearn's agglomerative clustering with complete linkage, with a connetivity matrix to ensure contiguity.
                 Refer to Sklearn docs for more info: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.AgglomerativeClustering.html
+            * 'region_growing':
+                heuristic for kmedoids clustering with contiguity constraint that does not require a MILP solver
+                and scales to thousands of regions.
 
         |br| * the default value is 'kmedoids_contiguity'
-    :type aggregation_method: str, one of {'kmedoids_contiguity', 'hierarchical'}
+    :type aggregation_method: str, one of {'kmedoids_contiguity', 'hierarchical', 'region_growing'}
 
     :param skip_regions: The region IDs to be skipped while aggregating regions
 
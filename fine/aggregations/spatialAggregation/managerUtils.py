@@ -4,8 +4,9 @@ Functions to assist spatial aggregation
 
 import warnings
 import numpy as np
-import pandas as pd
+import shapely
 import xarray as xr
+from scipy.spatial.distance import cdist
 
 try:
     import geopandas as gpd
@@ -78,7 +79,8 @@ def create_geom_xarray(
         |br| * the default value is True
     :type add_centroids: bool
 
-    :returns: xr_ds - The xarray dataset holding 'geometries', 'centroids', 'centroid_distances'
+    :returns: xr_ds - The xarray dataset holding 'geometries', 'centroids', 'centroid_coordinates',
+        'centroid_distances'
     :rtype: xr.Dataset
     """
 
@@ -96,31 +98,34 @@ def create_geom_xarray(
 
     if add_centroids:
         # centroids
-        centroids = pd.Series([geom.centroid for geom in geometries_da.values])
+        centroids = shapely.centroid(np.asarray(geometries_da.values))
         centroids_da = xr.DataArray(
             centroids,
             coords=[geom_ids],
             dims=["space"],
         )
 
+        # centroid coordinates, extracted once as (n_regions, 2) array
+        centroid_coordinates = np.column_stack(
+            [shapely.get_x(centroids), shapely.get_y(centroids)]
+        )
+        centroid_coordinates_da = xr.DataArray(
+            centroid_coordinates,
+            coords=[geom_ids, ["x", "y"]],
+            dims=["space", "coordinate"],
+        )
+
         # centroid distances
         centroid_dist_da = xr.DataArray(
-            np.zeros((len(geom_ids), len(geom_ids))),
+            cdist(centroid_coordinates, centroid_coordinates) / 1e3,  # distances in km
             coords=[geom_ids, geom_ids],
             dims=["space", "space_2"],
         )
 
-        for region_id_1 in centroids_da["space"]:
-            for region_id_2 in centroids_da["space"]:
-                centroid_1 = centroids_da.sel(space=region_id_1).item(0)
-                centroid_2 = centroids_da.sel(space=region_id_2).item(0)
-                centroid_dist_da.loc[dict(space=region_id_1, space_2=region_id_2)] = (
-                    centroid_1.distance(centroid_2) / 1e3
-                )  # distances in km
-
         xr_ds.update(
             {
                 "centroids": centroids_da,
+                "centroid_coordinates": centroid_coordinates_da,
                 "centroid_distances": centroid_dist_da,
             }
         )
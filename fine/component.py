@@ -5,6 +5,27 @@ import pyomo.environ as pyomo
 import pandas as pd
 import numpy as np
 import math
+from pyomo.core.base.var import IndexedVar
+
+
+class SparseOperationVar(IndexedVar):
+    """
+    Operation variables of the sparse mode (cf. EnergySystemModel.declareOptimizationProblem). Only the variables
+    which are not forced to zero are declared. The eliminated indices (eliminatedIndices) refer to a single variable
+    which is fixed to zero (pyM.zeroOperation). Therefore, the constraints and the objective function are declared
+    in the same way as for the dense operation variables.
+    """
+
+    def _getitem_when_not_present(self, index):
+        if index in self.eliminatedIndices:
+            return self.model().zeroOperation
+        return super()._getitem_when_not_present(index)
+
+    def get_values(self, include_fixed_values=True):
+        # The optimal values of the eliminated variables are zero
+        values = super().get_values(include_fixed_values)
+        values.update(dict.fromkeys(self.eliminatedIndices, 0))
+        return values
 
 
 class Component(metaclass=ABCMeta):
@@ -705,6 +726,78 @@ class Component(metaclass=ABCMeta):
             self.floorTechnicalLifetime,
         )
 
+    def getUpdateDependencyGroups(self, esM):
+        """
+        Return the dependency groups of the component which are used for incremental updates
+        (cf. EnergySystemModel.updateComponent). Each group maps a tuple of input parameters to a function which
+        recomputes the derived/processed attributes depending on these parameters. Input parameters which are not
+        part of any group require a full reconstruction of the component.
+
+        :param esM: EnergySystemModel instance representing the energy system in which the component is modeled.
+        :type esM: EnergySystemModel instance
+
+        :return: dependency groups
+        :rtype: dict with tuples of parameter names as keys and functions without arguments as values
+        """
+        designYears = self.processedStockYears + esM.investmentPeriods
+        return {
+            ("investPerCapacity",): lambda: self.setInvestmentPeriodCostParameter(
+                esM, "investPerCapacity", designYears
+            ),
+            ("investIfBuilt",): lambda: self.setInvestmentPeriodCostParameter(
+                esM, "investIfBuilt", designYears
+            ),
+            ("opexPerCapacity",): lambda: self.setInvestmentPeriodCostParameter(
+                esM, "opexPerCapacity", designYears
+            ),
+            ("opexIfBuilt",): lambda: self.setInvestmentPeriodCostParameter(
+                esM, "opexIfBuilt", designYears
+            ),
+            ("interestRate",): lambda: self.setInterestRate(esM),
+        }
+
+    def setInvestmentPeriodCostParameter(self, esM, paramName, years):
+        """
+        Recompute the processed, investment period dependent values of a cost parameter from its input value.
+
+        :param esM: EnergySystemModel instance representing the energy system in which the component is modeled.
+        :type esM: EnergySystemModel instance
+
+        :param paramName: name of the cost parameter, e.g. 'investPerCapacity'
+        :type paramName: string
+
+        :param years: (internal) investment periods for which the parameter is processed
+        :type years: list of integers
+        """
+        setattr(
+            self,
+            "processed" + paramName[0].upper() + paramName[1:],
+            utils.checkAndSetInvestmentPeriodCostParameter(
+                esM,
+                self.name,
+                getattr(self, paramName),
+                self.dimension,
+                self.locationalEligibility,
+                years,
+            ),
+        )
+
+    def setInterestRate(self, esM):
+        """
+        Process the interest rate and recompute the capital charge factor which depends on it.
+
+        :param esM: EnergySystemModel instance representing the energy system in which the component is modeled.
+        :type esM: EnergySystemModel instance
+        """
+        self.interestRate = utils.checkAndSetCostParameter(
+            esM, self.name, self.interestRate, self.dimension, self.locationalEligibility
+        )
+        self.CCF = utils.getCapitalChargeFactor(
+            self.interestRate,
+            self.economicLifetime,
+            self.processedStockYears + esM.investmentPeriods,
+        )
+
     def addToEnergySystemModel(self, esM):
         """
         Add the component to an EnergySystemModel instance (esM). If the respective component class is not already in
@@ -714,6 +807,7 @@ class Component(metaclass=ABCMeta):
         :type esM: EnergySystemModel instance
         """
         esM.isTimeSeriesDataClustered = False
+        esM.timeSeriesStore, esM.timeSeriesRegistry = None, {}
         if self.name in esM.componentNames:
             if (
                 esM.componentNames[self.name] == self.modelingClass.__name__
@@ -736,7 +830,8 @@ class Component(metaclass=ABCMeta):
     def prepareTSAInput(self, rate, rateName, rateWeight, weightDict, data, ip):
         """
         Format the time series data of a component to fit the requirements of the time series aggregation package and
-        return a list of formatted data.
+        return a list of formatted data. The time series data is not copied: a tuple of the unique identifiers of the
+        columns (name + rateName + location) and the time series data is added to the list.
 
         :param rate: a fixed/maximum/minimum operation time series or None
         :type rate: Pandas DataFrame or None
@@ -751,37 +846,30 @@ class Component(metaclass=ABCMeta):
         :type weightDict: dict
 
         :param data: list to which the formatted data is added
-        :type data: list of Pandas DataFrames
+        :type data: list of tuples (list of strings, Pandas DataFrame)
 
         :param ip: investment period of transformation path analysis.
         :type ip: int
 
-        :return: data
-        :rtype: Pandas DataFrame
+        :return: weightDict, data
+        :rtype: dict, list
         """
         # rate can be passed as a dict with investment periods
         if isinstance(rate, dict):
             rate = rate[ip]
-        else:
-            pass
-
-        data_ = rate
-        if data_ is not None:
-            data_ = data_.copy()
-            uniqueIdentifiers = [self.name + rateName + loc for loc in data_.columns]
-            data_.rename(
-                columns={loc: self.name + rateName + loc for loc in data_.columns},
-                inplace=True,
-            )
-            weightDict.update(
-                {id: rateWeight for id in uniqueIdentifiers}
-            ), data.append(data_)
+
+        if rate is not None:
+            uniqueIdentifiers = [self.name + rateName + loc for loc in rate.columns]
+            weightDict.update({id: rateWeight for id in uniqueIdentifiers})
+            data.append((uniqueIdentifiers, rate))
         return weightDict, data
 
     def getTSAOutput(self, rate, rateName, data, ip):
         """
         Return a reformatted time series data after applying time series aggregation, if the original time series
-        data is not None.
+        data is not None. The columns of a time series are stored contiguously in the clustered time series data
+        (cf. aggregateTemporally), such that the returned data is a view of the respective columns. The clustered time
+        series data is read-only, i.e. the returned data has to be copied before it is modified in place.
 
         :param rate: Full (unclustered) time series data or None
         :type rate: Pandas DataFrame or None
@@ -795,33 +883,22 @@ class Component(metaclass=ABCMeta):
         :param ip: investment period of transformation path analysis.
         :type ip: int
 
-        :return: reformatted data or None
+        :return: reformatted data (read-only view) or None
         :rtype: Pandas DataFrame
         """
-        if rate is not None:
-            if isinstance(rate, dict):
-                uniqueIdentifiers = [
-                    self.name + rateName + loc for loc in rate[ip].columns
-                ]
-                data_ = data[uniqueIdentifiers].copy(deep=True)
-                data_.rename(
-                    columns={
-                        self.name + rateName + loc: loc for loc in rate[ip].columns
-                    },
-                    inplace=True,
-                )
-            elif isinstance(rate, pd.DataFrame):
-                uniqueIdentifiers = [self.name + rateName + loc for loc in rate.columns]
-                data_ = data[uniqueIdentifiers].copy(deep=True)
-                data_.rename(
-                    columns={self.name + rateName + loc: loc for loc in rate.columns},
-                    inplace=True,
-                )
-            else:
-                raise ValueError(f"Wrong type for rate of '{self.name}': {type(rate)}")
-            return data_
-        else:
+        if isinstance(rate, dict):
+            rate = rate[ip]
+        elif rate is not None and not isinstance(rate, pd.DataFrame):
+            raise ValueError(f"Wrong type for rate of '{self.name}': {type(rate)}")
+        if rate is None:
             return None
+        start = data.columns.get_loc(self.name + rateName + rate.columns[0])
+        return pd.DataFrame(
+            data.values[:, start : start + len(rate.columns)],
+            index=data.index,
+            columns=rate.columns,
+            copy=False,
+        )
 
     @abstractmethod
     def setTimeSeriesData(self, hasTSA):
@@ -843,6 +920,11 @@ class Component(metaclass=ABCMeta):
 
         :param ip: investment period of transformation path analysis.
         :type ip: int
+
+        :return: time series data as a list of tuples of the unique column identifiers and the (not copied) time
+            series data (cf. prepareTSAInput) or None if the component has no time series data, and the weights of
+            the time series. A Pandas DataFrame with unique column names is accepted as time series data as well.
+        :rtype: tuple (list of tuples (list of strings, Pandas DataFrame) or None, dict)
         """
         raise NotImplementedError
 
@@ -1667,7 +1749,7 @@ class ComponentModel(metaclass=ABCMeta):
                             return (
                                 0,
                                 rate[loc][p, t]
-                                * esM.timeStepsPerSegment[ip].to_dict()[p, t],
+                                * esM.timeStepsPerSegmentTable[ip][p, t],
                             )
                     elif getattr(compDict[compName], opRateFixName) is not None:
                         rate = getattr(compDict[compName], opRateFixName)[ip]
@@ -1680,9 +1762,9 @@ class ComponentModel(metaclass=ABCMeta):
                                     return (0, 0)
                             return (
                                 rate[loc][p, t]
-                                * esM.timeStepsPerSegment[ip].to_dict()[p, t],
+                                * esM.timeStepsPerSegmentTable[ip][p, t],
                                 rate[loc][p, t]
-                                * esM.timeStepsPerSegment[ip].to_dict()[p, t],
+                                * esM.timeStepsPerSegmentTable[ip][p, t],
                             )
                     else:
                         return (0, None)
@@ -1695,27 +1777,118 @@ class ComponentModel(metaclass=ABCMeta):
             def opBounds_commisDepending(pyM, loc, compName, commis, ip, p, t):
                 return opBounds(pyM, loc, compName, ip, p, t)
 
+            varSet = getattr(pyM, "operationCommisVarSet_" + abbrvName)
+            bounds = opBounds_commisDepending
+        else:
+            varSet = getattr(pyM, "operationVarSet_" + abbrvName)
+            bounds = opBounds
+
+        pyM.operationVarBounds[opVarName + "_" + abbrvName] = bounds
+        if not pyM.sparseOperation:
             setattr(
                 pyM,
                 opVarName + "_" + abbrvName,
                 pyomo.Var(
-                    getattr(pyM, "operationCommisVarSet_" + abbrvName),
+                    varSet,
                     pyM.intraYearTimeSet,
                     domain=pyomo.NonNegativeReals,
-                    bounds=opBounds_commisDepending,
+                    bounds=bounds,
                 ),
             )
         else:
-            setattr(
+            # Only the operation variables which are not forced to zero are declared (sparse mode)
+            opVar = SparseOperationVar(
+                varSet,
+                pyM.intraYearTimeSet,
+                domain=pyomo.NonNegativeReals,
+                bounds=bounds,
+                dense=False,
+            )
+            opVar.eliminatedIndices = self.getZeroOperationIndices(
                 pyM,
-                opVarName + "_" + abbrvName,
-                pyomo.Var(
-                    getattr(pyM, "operationVarSet_" + abbrvName),
-                    pyM.intraYearTimeSet,
-                    domain=pyomo.NonNegativeReals,
-                    bounds=opBounds,
-                ),
+                varSet,
+                opRateFixName,
+                opRateMaxName,
+                relevanceThreshold,
+            )
+            setattr(pyM, opVarName + "_" + abbrvName, opVar)
+            for index in varSet:
+                for p, t in pyM.intraYearTimeSet:
+                    if index + (p, t) not in opVar.eliminatedIndices:
+                        opVar[index + (p, t)]
+
+    def getMergedCommissioning(self, pyM, loc, compName, commis, ip):
+        """
+        Get the commissioning which limits the commissioning year depending operation of a component. If several
+        commissioning years share one operation variable in the investment period (vintage merging, cf.
+        ConversionModel.declareOpCommisVarSet), the sum of their commissionings is returned.
+        """
+        commisVar = getattr(pyM, "commis_" + self.abbrvName)
+        mergedCommisYearsDict = getattr(
+            pyM, "mergedCommisYearsDict_" + self.abbrvName, {}
+        )
+        mergedCommisYears = mergedCommisYearsDict.get((compName, ip), {})
+        return sum(
+            commisVar[loc, compName, _commis]
+            for _commis in mergedCommisYears.get(commis, [commis])
+        )
+
+    def getZeroOperationIndices(
+        self,
+        pyM,
+        varSet,
+        opRateFixName="processedOperationRateFix",
+        opRateMaxName="processedOperationRateMax",
+        relevanceThreshold=None,
+    ):
+        """
+        Get the indices of the operation variables which are forced to zero by the maximum or fixed operation rate,
+        i.e. if the operation rate is zero or (if specified) below the relevance threshold. These variables are not
+        declared in the sparse mode (cf. declareOptimizationProblem and SparseOperationVar).
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo ConcreteModel
+
+        :param varSet: set of the operation variables without the time steps
+        :type varSet: pyomo Set
+
+        :param relevanceThreshold: Force operation parameters to be 0 if values are below the relevance threshold.
+            |br| * the default value is None
+        :type relevanceThreshold: float (>=0) or None
+
+        :return: indices of the operation variables which are forced to zero
+        :rtype: set
+        """
+        compDict = self.componentsDict
+        validThreshold = relevanceThreshold is not None and 0 < relevanceThreshold
+
+        zeroTimeSteps, zeroIndices = {}, set()
+        for index in varSet:
+            loc, compName, ip = index[0], index[1], index[-1]
+            if (loc, compName, ip) not in zeroTimeSteps:
+                comp = compDict[compName]
+                rate = getattr(comp, opRateMaxName)
+                if rate is None:
+                    rate = getattr(comp, opRateFixName)
+                rate = rate[ip] if rate is not None else None
+                if rate is None:
+                    zeroTimeSteps[loc, compName, ip] = []
+                    continue
+                rate = rate[loc]
+                isZero = rate == 0
+                if validThreshold:
+                    # Same comparison as in the variable bounds (without capacity variable) or in the operation
+                    # constraints (with capacity variable)
+                    isZero |= (
+                        rate <= relevanceThreshold
+                        if comp.hasCapacityVariable
+                        else rate < relevanceThreshold
+                    )
+                zeroTimeSteps[loc, compName, ip] = rate.index[isZero].tolist()
+            zeroIndices.update(
+                index + (p, t) for p, t in zeroTimeSteps[loc, compName, ip]
             )
+        return zeroIndices
 
     def declareOperationBinaryVars(self, pyM, opVarBinName):
         """
@@ -2193,7 +2366,6 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar = getattr(pyM, opVarName + "_" + abbrvName)
         capVar = getattr(pyM, "cap_" + abbrvName)
-        commisVar = getattr(pyM, "commis_" + abbrvName)
         constrSet1 = getattr(pyM, constrSetName + "1_" + abbrvName)
 
         if not pyM.hasSegmentation:
@@ -2206,9 +2378,11 @@ class ComponentModel(metaclass=ABCMeta):
                         if factorName is None
                         else getattr(compDict[compName], factorName)
                     )
-                    return (
-                        opVar[loc, compName, commis, ip, p, t]
-                        <= factor1 * factor2 * commisVar[loc, compName, commis]
+                    commis_ = self.getMergedCommissioning(
+                        pyM, loc, compName, commis, ip
+                    )
+                    return opVar[loc, compName, commis, ip, p, t] <= (
+                        factor1 * factor2 * commis_
                     )
 
             else:
@@ -2234,27 +2408,25 @@ class ComponentModel(metaclass=ABCMeta):
 
                 def op1(pyM, loc, compName, commis, ip, p, t):
                     factor1 = (
-                        (esM.hoursPerSegment[ip] / esM.hoursPerSegment[ip]).to_dict()
-                        if isStateOfCharge
-                        else esM.hoursPerSegment[ip].to_dict()
+                        1 if isStateOfCharge else esM.hoursPerSegmentTable[ip][p, t]
                     )
                     factor2 = (
                         1
                         if factorName is None
                         else getattr(compDict[compName], factorName)
                     )
-                    return (
-                        opVar[loc, compName, commis, ip, p, t]
-                        <= factor1[p, t] * factor2 * commisVar[loc, compName, commis]
+                    commis_ = self.getMergedCommissioning(
+                        pyM, loc, compName, commis, ip
+                    )
+                    return opVar[loc, compName, commis, ip, p, t] <= (
+                        factor1 * factor2 * commis_
                     )  # factor not dependent on ip
 
             else:
 
                 def op1(pyM, loc, compName, ip, p, t):
                     factor1 = (
-                        (esM.hoursPerSegment[ip] / esM.hoursPerSegment[ip]).to_dict()
-                        if isStateOfCharge
-                        else esM.hoursPerSegment[ip].to_dict()
+                        1 if isStateOfCharge else esM.hoursPerSegmentTable[ip][p, t]
                     )
                     factor2 = (
                         1
@@ -2263,7 +2435,7 @@ class ComponentModel(metaclass=ABCMeta):
                     )
                     return (
                         opVar[loc, compName, ip, p, t]
-                        <= factor1[p, t] * factor2 * capVar[loc, compName, ip]
+                        <= factor1 * factor2 * capVar[loc, compName, ip]
                     )  # factor not dependent on ip
 
             setattr(
@@ -2299,7 +2471,6 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar = getattr(pyM, opVarName + "_" + abbrvName)
         capVar = getattr(pyM, "cap_" + abbrvName)
-        commisVar = getattr(pyM, "commis_" + abbrvName)
         constrSet2 = getattr(pyM, constrSetName + "2_" + abbrvName)
 
         if not pyM.hasSegmentation:
@@ -2310,7 +2481,9 @@ class ComponentModel(metaclass=ABCMeta):
                     rate = getattr(compDict[compName], opRateName)[ip]
                     return (
                         opVar[loc, compName, commis, ip, p, t]
-                        == commisVar[loc, compName, commis] * rate[loc][p, t] * factor
+                        == self.getMergedCommissioning(pyM, loc, compName, commis, ip)
+                        * rate[loc][p, t]
+                        * factor
                     )  # rate independent from ip
 
             else:
@@ -2332,30 +2505,26 @@ class ComponentModel(metaclass=ABCMeta):
 
                 def op2(pyM, loc, compName, commis, ip, p, t):
                     factor = (
-                        (esM.hoursPerSegment[ip] / esM.hoursPerSegment[ip]).to_dict()
-                        if isStateOfCharge
-                        else esM.hoursPerSegment[ip].to_dict()
+                        1 if isStateOfCharge else esM.hoursPerSegmentTable[ip][p, t]
                     )
                     rate = getattr(compDict[compName], opRateName)[ip]
                     return (
                         opVar[loc, compName, commis, ip, p, t]
-                        == commisVar[loc, compName, commis]
+                        == self.getMergedCommissioning(pyM, loc, compName, commis, ip)
                         * rate[loc][p, t]
-                        * factor[p, t]
+                        * factor
                     )
 
             else:
 
                 def op2(pyM, loc, compName, ip, p, t):
                     factor = (
-                        (esM.hoursPerSegment[ip] / esM.hoursPerSegment[ip]).to_dict()
-                        if isStateOfCharge
-                        else esM.hoursPerSegment[ip].to_dict()
+                        1 if isStateOfCharge else esM.hoursPerSegmentTable[ip][p, t]
                     )
                     rate = getattr(compDict[compName], opRateName)[ip]
                     return (
                         opVar[loc, compName, ip, p, t]
-                        == capVar[loc, compName, ip] * rate[loc][p, t] * factor[p, t]
+                        == capVar[loc, compName, ip] * rate[loc][p, t] * factor
                     )
 
             setattr(
@@ -2394,7 +2563,6 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar = getattr(pyM, opVarName + "_" + abbrvName)
         capVar = getattr(pyM, "cap_" + abbrvName)
-        commisVar = getattr(pyM, "commis_" + abbrvName)
         constrSet3 = getattr(pyM, constrSetName + "3_" + abbrvName)
 
         if not pyM.hasSegmentation:
@@ -2410,7 +2578,9 @@ class ComponentModel(metaclass=ABCMeta):
                             return opVar[loc, compName, commis, ip, p, t] == 0
                     return (
                         opVar[loc, compName, commis, ip, p, t]
-                        <= commisVar[loc, compName, commis] * rate[loc][p, t] * factor
+                        <= self.getMergedCommissioning(pyM, loc, compName, commis, ip)
+                        * rate[loc][p, t]
+                        * factor
                     )
 
             else:
@@ -2437,9 +2607,7 @@ class ComponentModel(metaclass=ABCMeta):
 
                 def op3(pyM, loc, compName, commis, ip, p, t):
                     factor = (
-                        (esM.hoursPerSegment[ip] / esM.hoursPerSegment[ip]).to_dict()
-                        if isStateOfCharge
-                        else esM.hoursPerSegment[ip].to_dict()
+                        1 if isStateOfCharge else esM.hoursPerSegmentTable[ip][p, t]
                     )
                     rate = getattr(compDict[compName], opRateName)[ip]
                     if relevanceThreshold is not None:
@@ -2449,18 +2617,16 @@ class ComponentModel(metaclass=ABCMeta):
                             return opVar[loc, compName, commis, ip, p, t] == 0
                     return (
                         opVar[loc, compName, commis, ip, p, t]
-                        <= commisVar[loc, compName, commis]
+                        <= self.getMergedCommissioning(pyM, loc, compName, commis, ip)
                         * rate[loc][p, t]
-                        * factor[p, t]
+                        * factor
                     )  # rate and factor independent from ip
 
             else:
 
                 def op3(pyM, loc, compName, ip, p, t):
                     factor = (
-                        (esM.hoursPerSegment[ip] / esM.hoursPerSegment[ip]).to_dict()
-                        if isStateOfCharge
-                        else esM.hoursPerSegment[ip].to_dict()
+                        1 if isStateOfCharge else esM.hoursPerSegmentTable[ip][p, t]
                     )
                     rate = getattr(compDict[compName], opRateName)[ip]
                     if relevanceThreshold is not None:
@@ -2470,7 +2636,7 @@ class ComponentModel(metaclass=ABCMeta):
                             return opVar[loc, compName, ip, p, t] == 0
                     return (
                         opVar[loc, compName, ip, p, t]
-                        <= capVar[loc, compName, ip] * rate[loc][p, t] * factor[p, t]
+                        <= capVar[loc, compName, ip] * rate[loc][p, t] * factor
                     )  # rate and factor independent from ip
 
             setattr(
@@ -2509,7 +2675,6 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar = getattr(pyM, opVarName + "_" + abbrvName)
         capVar = getattr(pyM, "cap_" + abbrvName)
-        commisVar = getattr(pyM, "commis_" + abbrvName)
         constrSet4 = getattr(pyM, constrSetName + "4_" + abbrvName)
 
         if not pyM.hasSegmentation:
@@ -2525,7 +2690,9 @@ class ComponentModel(metaclass=ABCMeta):
                             return opVar[loc, compName, commis, ip, p, t] == 0
                     return (
                         opVar[loc, compName, commis, ip, p, t]
-                        >= commisVar[loc, compName, commis] * rate[loc][p, t] * factor
+                        >= self.getMergedCommissioning(pyM, loc, compName, commis, ip)
+                        * rate[loc][p, t]
+                        * factor
                     )
 
             else:
@@ -2552,9 +2719,7 @@ class ComponentModel(metaclass=ABCMeta):
 
                 def op4(pyM, loc, compName, commis, ip, p, t):
                     factor = (
-                        (esM.hoursPerSegment[ip] / esM.hoursPerSegment[ip]).to_dict()
-                        if isStateOfCharge
-                        else esM.hoursPerSegment[ip].to_dict()
+                        1 if isStateOfCharge else esM.hoursPerSegmentTable[ip][p, t]
                     )
                     rate = getattr(compDict[compName], opRateName)[ip]
                     if relevanceThreshold is not None:
@@ -2564,18 +2729,16 @@ class ComponentModel(metaclass=ABCMeta):
                             return opVar[loc, compName, commis, ip, p, t] == 0
                     return (
                         opVar[loc, compName, commis, ip, p, t]
-                        >= commisVar[loc, compName, commis]
+                        >= self.getMergedCommissioning(pyM, loc, compName, commis, ip)
                         * rate[loc][p, t]
-                        * factor[p, t]
+                        * factor
                     )  # rate and factor independent from ip
 
             else:
 
                 def op4(pyM, loc, compName, ip, p, t):
                     factor = (
-                        (esM.hoursPerSegment[ip] / esM.hoursPerSegment[ip]).to_dict()
-                        if isStateOfCharge
-                        else esM.hoursPerSegment[ip].to_dict()
+                        1 if isStateOfCharge else esM.hoursPerSegmentTable[ip][p, t]
                     )
                     rate = getattr(compDict[compName], opRateName)[ip]
                     if relevanceThreshold is not None:
@@ -2585,7 +2748,7 @@ class ComponentModel(metaclass=ABCMeta):
                             return opVar[loc, compName, ip, p, t] == 0
                     return (
                         opVar[loc, compName, ip, p, t]
-                        >= capVar[loc, compName, ip] * rate[loc][p, t] * factor[p, t]
+                        >= capVar[loc, compName, ip] * rate[loc][p, t] * factor
                     )  # rate and factor independent from ip
 
             setattr(
@@ -2616,7 +2779,6 @@ class ComponentModel(metaclass=ABCMeta):
         opVar = getattr(pyM, opVarName + "_" + abbrvName)
         opVarBin = getattr(pyM, opVarBinName + "_" + abbrvName)
         capVar = getattr(pyM, capVarName + "_" + abbrvName)
-        commisVar = getattr(pyM, "commis_" + abbrvName)
         constrSetMinPartLoad = getattr(pyM, constrSetName + "partLoadMin_" + abbrvName)
 
         if isOperationCommisYearDepending:
@@ -2653,7 +2815,8 @@ class ComponentModel(metaclass=ABCMeta):
                 bigM = getattr(compDict[compName], "bigM")
                 return (
                     opVar[loc, compName, commis, ip, p, t]
-                    >= processedPartLoadMin * commisVar[loc, compName, commis]
+                    >= processedPartLoadMin
+                    * self.getMergedCommissioning(pyM, loc, compName, commis, ip)
                     - (1 - opVarBin[loc, compName, commis, ip, p, t]) * bigM
                 )
 
@@ -2712,7 +2875,6 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar = getattr(pyM, opVarName + "_" + abbrvName)
         capVar = getattr(pyM, "cap_" + abbrvName)
-        commisVar = getattr(pyM, "commis_" + abbrvName)
         yearlyFullLoadHoursMinSet = getattr(pyM, constrSetName + "_" + abbrvName)
         if isOperationCommisYearDepending:
             # for technologies which have operations depending on the commissioning year, e.g. by variable commodity conversion factors
@@ -2727,7 +2889,7 @@ class ComponentModel(metaclass=ABCMeta):
                 )
                 return (
                     full_load_hours
-                    >= commisVar[loc, compName, commis]
+                    >= self.getMergedCommissioning(pyM, loc, compName, commis, ip)
                     * compDict[compName].processedYearlyFullLoadHoursMin[ip][loc]
                 )
 
@@ -2788,7 +2950,6 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar = getattr(pyM, opVarName + "_" + abbrvName)
         capVar = getattr(pyM, "cap_" + abbrvName)
-        commisVar = getattr(pyM, "commis_" + abbrvName)
         yearlyFullLoadHoursMaxSet = getattr(pyM, constrSetName + "_" + abbrvName)
         if isOperationCommisYearDepending:
 
@@ -2803,7 +2964,7 @@ class ComponentModel(metaclass=ABCMeta):
                 )
                 return (
                     full_load_hours
-                    <= commisVar[loc, compName, commis]
+                    <= self.getMergedCommissioning(pyM, loc, compName, commis, ip)
                     * compDict[compName].processedYearlyFullLoadHoursMax[ip][loc]
                 )
 
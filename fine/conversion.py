@@ -327,6 +327,18 @@ class Conversion(Component):
             operationTimeSeries,
         )
 
+    def getUpdateDependencyGroups(self, esM):
+        """
+        Return the dependency groups of the component which are used for incremental updates (cf.
+        Component.getUpdateDependencyGroups). Additionally to the general groups, the operation cost parameter of the
+        Conversion component is considered.
+        """
+        groups = super().getUpdateDependencyGroups(esM)
+        groups[("opexPerOperation",)] = lambda: self.setInvestmentPeriodCostParameter(
+            esM, "opexPerOperation", esM.investmentPeriods
+        )
+        return groups
+
     def setTimeSeriesData(self, hasTSA):
         """
         Function for setting the maximum operation rate and fixed operation rate depending on whether a time series
@@ -363,6 +375,9 @@ class Conversion(Component):
 
         :param ip: investment period of transformation path analysis.
         :type ip: int
+
+        :return: time series data and weights of the time series (cf. Component.getDataForTimeSeriesAggregation)
+        :rtype: tuple (list or None, dict)
         """
         weightDict, data = {}, []
         if self.fullOperationRateFix:
@@ -424,7 +439,7 @@ class Conversion(Component):
                         data,
                         ip,
                     )
-        return (pd.concat(data, axis=1), weightDict) if data else (None, {})
+        return (data, weightDict) if data else (None, {})
 
     def setAggregatedTimeSeriesData(self, data, ip):
         """
@@ -517,6 +532,7 @@ class ConversionModel(ComponentModel):
         self.abbrvName = "conv"
         self.dimension = "1dim"
         self._operationVariablesOptimum = {}
+        self._operationCommisVariablesOptimum = {}
 
     ####################################################################################################################
     #                                            Declare sparse index sets                                             #
@@ -583,15 +599,46 @@ class ConversionModel(ComponentModel):
             compName for (compName, comp) in compDict.items() if comp.isCommisDepending
         ]
 
+        # Vintage merging: commissioning years with identical commodity conversion factors in an investment period
+        # share one operation variable (of the earliest of these commissioning years) which is limited by the sum
+        # of their commissionings. Components with per-vintage operation constraints (minimum part load, yearly
+        # full load hours) are not merged.
+        mergedCommisYearsDict = {}
+        for compName in commisDependingComp:
+            comp = compDict[compName]
+            isMergeable = (
+                pyM.mergeVintages
+                and comp.processedPartLoadMin is None
+                and comp.processedYearlyFullLoadHoursMin is None
+                and comp.processedYearlyFullLoadHoursMax is None
+            )
+            for commis, ip in sorted(comp.processedCommodityConversionFactors.keys()):
+                mergedCommisYears = mergedCommisYearsDict.setdefault((compName, ip), {})
+                factors = comp.processedCommodityConversionFactors[commis, ip]
+                representative = next(
+                    (
+                        _commis
+                        for _commis in mergedCommisYears
+                        if isMergeable
+                        and utils.areConversionFactorsEqual(
+                            factors,
+                            comp.processedCommodityConversionFactors[_commis, ip],
+                        )
+                    ),
+                    commis,
+                )
+                mergedCommisYears.setdefault(representative, []).append(commis)
+        setattr(pyM, "mergedCommisYearsDict_" + abbrvName, mergedCommisYearsDict)
+
         # Set for operation variables
         def declareOpCommisVarSet(pyM):
             return (
                 (loc, compName, commis, ip)
                 for compName in commisDependingComp
                 for loc in compDict[compName].processedLocationalEligibility.index
-                for (commis, ip) in compDict[
-                    compName
-                ].processedCommodityConversionFactors.keys()
+                for (compName_, ip), mergedCommisYears in mergedCommisYearsDict.items()
+                if compName_ == compName
+                for commis in mergedCommisYears
                 if compDict[compName].processedLocationalEligibility[loc] == 1
             )
 
@@ -1035,17 +1082,15 @@ class ConversionModel(ComponentModel):
         opCommisVar = getattr(pyM, "op_commis_" + abbrvName)
         opVarSet = getattr(pyM, "operationVarSet_" + abbrvName)
 
+        mergedCommisYearsDict = getattr(pyM, "mergedCommisYearsDict_" + abbrvName)
+
         def combinedOperation(pyM, loc, compName, ip, p, t):
             if not compDict[compName].isCommisDepending:
                 return pyomo.Constraint.Skip
             else:
-                commisYearsWithOperationInIp = [
-                    _commis
-                    for (_commis, _ip) in compDict[
-                        compName
-                    ].processedCommodityConversionFactors
-                    if _ip == ip
-                ]
+                commisYearsWithOperationInIp = list(
+                    mergedCommisYearsDict[compName, ip].keys()
+                )
                 sumOpCommisVar = sum(
                     opCommisVar[loc, compName, commis, ip, p, t]
                     for commis in commisYearsWithOperationInIp
@@ -1105,6 +1150,7 @@ class ConversionModel(ComponentModel):
         opVar = getattr(pyM, "op_" + abbrvName)
         opCommisVar = getattr(pyM, "op_commis_" + abbrvName)
         opVarDict = getattr(pyM, "operationVarDict_" + abbrvName)
+        mergedCommisYearsDict = getattr(pyM, "mergedCommisYearsDict_" + abbrvName)
 
         def getFactor(commodCommodityConversionFactors, loc, p, t):
             if isinstance(commodCommodityConversionFactors, (int, float)):
@@ -1134,10 +1180,8 @@ class ConversionModel(ComponentModel):
             # TODO implement dataframe similar to cost consideration
             for compName in opVarDict[ip][loc]:
                 if compDict[compName].isCommisDepending:
-                    commodConv = compDict[compName].processedCommodityConversionFactors
-                    relevantCommissioningYears = [
-                        x for (x, y) in commodConv.keys() if y == ip
-                    ]
+                    # merged commissioning years are represented by the earliest commissioning year
+                    relevantCommissioningYears = mergedCommisYearsDict[compName, ip]
                     for _commis in relevantCommissioningYears:
                         if (
                             commod
@@ -1219,6 +1263,14 @@ class ConversionModel(ComponentModel):
             getOptValueCostType="NPV",
         )
 
+        opCommisValues = {}
+        for (loc, compName, commis, ip, p, t), value in self.getOperationCommisValues(
+            pyM
+        ).items():
+            opCommisValues.setdefault(ip, {}).setdefault(commis, {})[
+                loc, compName, ip, p, t
+            ] = value
+
         for ip in esM.investmentPeriods:
             # Set optimal operation variables and append optimization summary
             optVal = utils.formatOptimizationOutput(
@@ -1231,6 +1283,27 @@ class ConversionModel(ComponentModel):
             )
             self._operationVariablesOptimum[esM.investmentPeriodNames[ip]] = optVal
 
+            # Set optimal operation variables of the commissioning years (index: component, commissioning year,
+            # location)
+            optValCommis = {
+                commis: utils.formatOptimizationOutput(
+                    data,
+                    "operationVariables",
+                    "1dim",
+                    ip,
+                    esM.periodsOrder[ip],
+                    esM=esM,
+                )
+                for commis, data in opCommisValues.get(ip, {}).items()
+            }
+            self._operationCommisVariablesOptimum[esM.investmentPeriodNames[ip]] = (
+                pd.concat(optValCommis, names=["Commissioning"])
+                .swaplevel(0, 1)
+                .sort_index()
+                if len(optValCommis) > 0
+                else None
+            )
+
             props = ["operation", "opexOp", "NPV_opexOp"]
             # Unit dict: Specify units for props
             units = {
@@ -1348,6 +1421,40 @@ class ConversionModel(ComponentModel):
             # save the optimization summary
             self._optSummary[esM.investmentPeriodNames[ip]] = optSummary
 
+    def getOperationCommisValues(self, pyM):
+        """
+        Get the optimal values of the commissioning year depending operation variables for each commissioning
+        year. The operation of merged commissioning years (cf. declareOpCommisVarSet) is split between them in
+        proportion to their commissionings.
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo ConcreteModel
+
+        :returns: optimal values with the keys (location, component, commissioning year, investment period,
+            period, time step)
+        :rtype: dict
+        """
+        commisValues = getattr(pyM, "commis_" + self.abbrvName).get_values()
+        opCommisVar = getattr(pyM, "op_commis_" + self.abbrvName)
+        mergedCommisYearsDict = getattr(pyM, "mergedCommisYearsDict_" + self.abbrvName)
+
+        values = {}
+        for key, value in opCommisVar.get_values().items():
+            loc, compName, commis, ip, p, t = key
+            mergedCommisYears = mergedCommisYearsDict[compName, ip][commis]
+            commissionings = [
+                commisValues.get((loc, compName, _commis)) or 0
+                for _commis in mergedCommisYears
+            ]
+            for _commis, commissioning in zip(mergedCommisYears, commissionings):
+                share = (
+                    commissioning / sum(commissionings)
+                    if sum(commissionings) > 0
+                    else 1 / len(mergedCommisYears)
+                )
+                values[loc, compName, _commis, ip, p, t] = (value or 0) * share
+        return values
+
     def getOptimalValues(self, name="all", ip=0):
         """
         Return optimal values of the components.
@@ -1357,6 +1464,8 @@ class ConversionModel(ComponentModel):
             * 'capacityVariables',
             * 'isBuiltVariables',
             * 'operationVariablesOptimum',
+            * 'operationCommisVariablesOptimum' (operation of the commissioning years of components with
+              commissioning year depending commodity conversion factors),
             * 'all' or another input: all variables are returned.
 
         |br| * the default value is 'all'
@@ -1369,4 +1478,10 @@ class ConversionModel(ComponentModel):
         :returns: a dictionary with the optimal values of the components
         :rtype: dict
         """
+        if name == "operationCommisVariablesOptimum":
+            return {
+                "values": self._operationCommisVariablesOptimum[ip],
+                "timeDependent": True,
+                "dimension": self.dimension,
+            }
         return super().getOptimalValues(name, ip=ip)
@@ -1,20 +1,20 @@
 import inspect
+import math
 import os
 import time
 import warnings
 import importlib.util
 
-import gurobi_logtools as glt
+import numpy as np
 import pandas as pd
 import psutil
 import pyomo.environ as pyomo
 import pyomo.opt as opt
-from tsam.timeseriesaggregation import TimeSeriesAggregation
+from pyomo.core.expr import identify_variables
+from pyomo.repn import generate_standard_repn
 
 from fine import utils
-from fine.aggregations.spatialAggregation import manager as spagat
 from fine.component import Component, ComponentModel
-from fine.IOManagement import xarrayIO as xrIO
 
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -292,6 +292,27 @@ class EnergySystemModel:
         self.numberOfTimeSteps = numberOfTimeSteps
         self.numberOfYears = numberOfTimeSteps * hoursPerTimeStep / 8760.0
 
+        # The _timeSeriesIndex parameter is the (Period, TimeStep) MultiIndex of the full temporal resolution. It is
+        # built once and shared by the processed time series data of all components instead of being rebuilt for every
+        # component. The _preValidatedTimeSeries parameter (dict, id(raw data): (raw data, processed data)) holds time
+        # series which were already validated in bulk (cf. addMany) and is only filled while such a bulk call runs. The
+        # same holds for the _preValidatedCostParameters parameter (dict, (component name, id(raw data)): (raw data,
+        # processed data)) for economic parameters.
+        self._timeSeriesIndex = pd.MultiIndex.from_product(
+            [[0], self.totalTimeSteps], names=["Period", "TimeStep"]
+        )
+        self._preValidatedTimeSeries, self._preValidatedCostParameters = {}, {}
+        # The timeSeriesStore parameter is None when the EnergySystemModel is initialized. After calling the
+        # consolidateTimeSeries function, it is a contiguous float array (time series x time steps) which holds the
+        # full temporal resolution time series data of all components. The timeSeriesRegistry parameter (dict,
+        # (component name, parameter name, ip, location): row) stores the row of each time series in the array.
+        # Both are reset when components are added or removed.
+        self.timeSeriesStore = None
+        self.timeSeriesRegistry = {}
+        # The _fullTimeSeriesGatherIndex parameter (dict, ip: gather index) caches the mapping of the time steps of
+        # the full temporal resolution to the clustered time steps or segments (cf. utils.buildFullTimeSeries).
+        self._fullTimeSeriesGatherIndex = {}
+
         # The periods parameter (list, [0] when considering a full temporal resolution, range of [0, ...,
         # totalNumberOfTimeSteps/numberOfTimeStepsPerPeriod] when applying time series aggregation) represents
         # the periods considered when modeling the energy system. Only one period exists when considering the full
@@ -320,6 +341,9 @@ class EnergySystemModel:
             None,
             None,
         )
+        # The time series data which is prepared for the tsam package can be stored to be reused in subsequent
+        # clustering calls (cf. the reuseTimeSeriesData parameter of the aggregateTemporally function).
+        self._timeSeriesDataForAggregation = None
         self.timeUnit = "h"
 
         ################################################################################################################
@@ -380,6 +404,9 @@ class EnergySystemModel:
         self.componentNames = {}
         self.componentModelingDict = {}
         self.costUnit = costUnit
+        # The _modifiedComponents parameter is a set of the names of the components which were updated after the
+        # optimization problem was declared the last time (cf. updateComponent).
+        self._modifiedComponents = set()
 
         ################################################################################################################
         #                                           Optimization parameters                                            #
@@ -444,6 +471,77 @@ class EnergySystemModel:
             )
         component.addToEnergySystemModel(self)
 
+    def addMany(self, componentClass, componentParameters, timeSeriesData=None):
+        """
+        Function for adding many components of the same class to the EnergySystemModel instance at once.
+        In contrast to calling the add function for each component, the time series data and the economic
+        parameters (given as numbers) of all components are validated with vectorized checks and stored in shared
+        float blocks. The time series and economic parameters of the components are views into these blocks and
+        the time series share the same (Period, TimeStep) index.
+
+        .. note::
+            The time series data passed via timeSeriesData is used for all investment periods. Investment period
+            dependent time series have to be passed as dictionaries in componentParameters or via the add function.
+
+        :param componentClass: class of the components to be added, e.g. fn.Source. Components connecting
+            locations (dimension 2dim, e.g. fn.Transmission) are not supported.
+        :type componentClass: a class which inherits from the FINE Component class
+
+        :param componentParameters: parameters of the components. The index contains the component names and the
+            columns contain the names of the constructor arguments of the componentClass. Missing values (NaN or None)
+            are not passed to the constructor, i.e. the default value is used.
+        :type componentParameters: pandas DataFrame
+
+        **Default arguments:**
+
+        :param timeSeriesData: time series parameters of the components (e.g. operationRateMax). The index has to
+            match the time steps of the energy system model and the columns have three levels: the component name,
+            the parameter name and the location.
+            |br| * the default value is None
+        :type timeSeriesData: pandas DataFrame or None
+        """
+        if not (
+            isinstance(componentClass, type) and issubclass(componentClass, Component)
+        ):
+            raise TypeError(
+                "The added components have to inherit from the FINE class Component."
+            )
+        utils.checkComponentParameterTable(componentParameters)
+        costParameters = utils.checkAndSetCostParameterTable(self, componentParameters)
+        timeSeriesDict = utils.checkAndSetTimeSeriesTable(
+            self, componentParameters, timeSeriesData
+        )
+
+        compTimeSeries = {}
+        for (compName, param), (raw, processed) in timeSeriesDict.items():
+            compTimeSeries.setdefault(compName, {})[param] = raw
+
+        # Register the validated time series such that the component constructors skip their per-component checks
+        self._preValidatedTimeSeries = {
+            id(raw): (raw, processed) for raw, processed in timeSeriesDict.values()
+        }
+        try:
+            for compName, params in componentParameters.to_dict(orient="index").items():
+                kwargs = {
+                    key: val
+                    for key, val in params.items()
+                    if not (val is None or (isinstance(val, float) and math.isnan(val)))
+                }
+                kwargs.update(compTimeSeries.get(compName, {}))
+                self._preValidatedCostParameters = {
+                    (compName, id(val)): (val, costParameters[compName, key])
+                    for key, val in kwargs.items()
+                    if (compName, key) in costParameters
+                }
+                component = componentClass(self, name=compName, **kwargs)
+                if component.dimension != "1dim":
+                    raise ValueError(
+                        "addMany only supports components which are modeled in one location (1dim)."
+                    )
+                self.add(component)
+        finally:
+            self._preValidatedTimeSeries, self._preValidatedCostParameters = {}, {}
+
     def removeComponent(self, componentName, track=False):
         """
         Function which removes a component from the energy system.
@@ -470,6 +568,7 @@ class EnergySystemModel:
             )
         modelingClass = self.componentNames[componentName]
         removedComp = dict()
+        self.timeSeriesStore, self.timeSeriesRegistry = None, {}
         # If track: Return a dictionary including the name of the removed component and the component instance
         if track:
             removedComp = dict(
@@ -537,6 +636,12 @@ class EnergySystemModel:
 
         :param updateAttrs: A dict of component attributes as keys and values that shall be set as dict values.
         :type updateAttrs: dict
+
+        If all updated attributes are part of the dependency groups of the component (cf.
+        Component.getUpdateDependencyGroups), e.g. cost parameters like investPerCapacity, the component is updated
+        incrementally: only the processed attributes which depend on the updated attributes are recomputed and the
+        remaining data (e.g. the time series and their aggregation) is kept. Otherwise, the component is
+        reconstructed with the updated attributes.
         """
         if componentName not in self.componentNames.keys():
             raise AttributeError(
@@ -563,6 +668,28 @@ class EnergySystemModel:
                     + "The old component will still exist with the old attributes."
                 )
 
+        # incremental update if all updated attributes are covered by the dependency groups of the component
+        component = self.getComponent(componentName)
+        dependencyGroups = component.getUpdateDependencyGroups(self)
+        if all(
+            any(k in group for group in dependencyGroups) for k in updateAttrs.keys()
+        ):
+            old_attrs = component.__dict__.copy()
+            try:
+                for _arg, _val in updateAttrs.items():
+                    setattr(component, _arg, _val)
+                for group, recompute in dependencyGroups.items():
+                    if any(k in group for k in updateAttrs.keys()):
+                        recompute()
+            except Exception:
+                # restore the original state of the component if the new values are invalid
+                component.__dict__.clear()
+                component.__dict__.update(old_attrs)
+                raise
+            # mark the component as modified for the next model build
+            self._modifiedComponents.add(componentName)
+            return
+
         # get attributes of original component
         old_attrs = self.getComponent(componentName).__dict__
 
@@ -573,8 +700,83 @@ class EnergySystemModel:
         for _arg, _val in updateAttrs.items():
             new_args[_arg] = _val
 
-        # overwrite the existing component with the new data
+        # overwrite the existing component with the new data and mark it as modified for the next model build
         self.add(_class(self, **new_args))
+        self._modifiedComponents.add(new_args["name"])
+
+    def consolidateTimeSeries(self, filePath=None):
+        """
+        Function for storing the full temporal resolution time series data of all components (e.g.
+        fullOperationRateMax) in one contiguous float array with one row per time series and location and one column
+        per time step (timeSeriesStore). The time series data of the components is replaced by views into this
+        array, i.e. the data is held only once and is read without copying by the time series aggregation, the
+        spatial aggregation and the model declaration. Time series of a component which are identical for
+        consecutive investment periods share the same rows. The row of each time series is stored in the
+        timeSeriesRegistry (dict, (component name, parameter name, ip, location): row).
+
+        .. note::
+            Adding or removing components resets the timeSeriesStore and the timeSeriesRegistry (the time series
+            data of the components stays valid). The function can be called again in this case.
+
+        **Default arguments:**
+
+        :param filePath: path of a file to which the array is memory-mapped. If None, the array is held in memory.
+            |br| * the default value is None
+        :type filePath: string or None
+        """
+        # Collect the time series data of all components and assign rows to them
+        entries, numberOfRows = [], 0
+        for mdl in self.componentModelingDict.values():
+            for compName, comp in mdl.componentsDict.items():
+                for attrName, attr in vars(comp).items():
+                    if not (attrName.startswith("full") and isinstance(attr, dict)):
+                        continue
+                    paramName = attrName[4].lower() + attrName[5:]
+                    previous = None
+                    for ip, data in attr.items():
+                        if not (
+                            isinstance(data, pd.DataFrame)
+                            and len(data) == self.numberOfTimeSteps
+                        ):
+                            continue
+                        if (
+                            previous is not None
+                            and previous[1].columns.equals(data.columns)
+                            and np.array_equal(previous[1].values, data.values)
+                        ):
+                            row, isNew = previous[0], False
+                        else:
+                            row, isNew = numberOfRows, True
+                            numberOfRows += data.shape[1]
+                        entries.append(
+                            (compName, attr, paramName, ip, data, row, isNew)
+                        )
+                        previous = (row, data)
+
+        # Allocate the array (in memory or memory-mapped to a file)
+        shape = (numberOfRows, self.numberOfTimeSteps)
+        if filePath is None or numberOfRows == 0:
+            store = np.empty(shape)
+        else:
+            store = np.memmap(filePath, dtype=float, mode="w+", shape=shape)
+
+        # Copy the data into the array and replace the time series of the components by views
+        registry = {}
+        for compName, attr, paramName, ip, data, row, isNew in entries:
+            rows = slice(row, row + data.shape[1])
+            if isNew:
+                store[rows] = data.values.T
+            attr[ip] = pd.DataFrame(
+                store[rows].T, index=data.index, columns=data.columns, copy=False
+            )
+            registry.update(
+                {
+                    (compName, paramName, ip, loc): row + i
+                    for i, loc in enumerate(data.columns)
+                }
+            )
+
+        self.timeSeriesStore, self.timeSeriesRegistry = store, registry
 
     def getComponentAttribute(self, componentName, attributeName):
         """
@@ -645,6 +847,20 @@ class EnergySystemModel:
             )
             return df.loc[((df != 0) & (~df.isnull())).any(axis=1)]
 
+    def snapshotResults(self):
+        """
+        Function which returns a compact and immutable snapshot of the optimization results (optimal values,
+        optimization summaries, solver specifications and time series aggregation metadata). In contrast to a deep
+        copy of the EnergySystemModel instance, the input data is not copied. Snapshots are cheap to pickle and can be
+        written to NetCDF files (cf. ResultSnapshot).
+
+        :returns: snapshot of the optimization results
+        :rtype: ResultSnapshot
+        """
+        from fine.IOManagement.resultSnapshot import ResultSnapshot
+
+        return ResultSnapshot.fromEnergySystemModel(self)
+
     def aggregateSpatially(
         self,
         shapefile,
@@ -742,9 +958,12 @@ class EnergySystemModel:
                 - 'hierarchical':
                     sklearn's agglomerative clustering with complete linkage, with a connetivity matrix to ensure contiguity.
                     Refer to Sklearn docs for more info: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.AgglomerativeClustering.html
+                - 'region_growing':
+                    heuristic for kmedoids clustering with contiguity constraint that does not require a MILP solver
+                    and scales to thousands of regions.
 
             |br| * the default value is 'kmedoids_contiguity'
-        :type aggregation_method: string, Options: 'kmedoids_contiguity', 'hierarchical'
+        :type aggregation_method: string, Options: 'kmedoids_contiguity', 'hierarchical', 'region_growing'
 
         :param solver: Relevant only if `grouping_mode` is 'parameter_based' and `aggregation_method` is 'kmedoids_contiguity'
             The optimization solver to be chosen.
@@ -807,6 +1026,10 @@ class EnergySystemModel:
         :returns: Aggregated esM instance
         """
 
+        # The spatial aggregation requires the geo stack which is only imported when needed
+        from fine.aggregations.spatialAggregation import manager as spagat
+        from fine.IOManagement import xarrayIO as xrIO
+
         # STEP 1. Obtain xr dataset from esM
         xr_dataset = xrIO.convertOptimizationInputToDatasets(
             self, useProcessedValues=True
@@ -828,6 +1051,86 @@ class EnergySystemModel:
 
         return aggregated_esM
 
+    def reduceTransmissionNetwork(self):
+        """
+        Reduce the networks of the Transmission components and return a new esM instance with the reduced networks.
+        Locations which do not hold any component except for the lines of one Transmission component are removed:
+        series lines through these locations are contracted to one line (with the combined distances, losses and
+        capacity bounds), contracted lines are merged with parallel lines of the same component and dangling lines
+        are dropped. The flows on the lines of the original networks can be recovered after the optimization of the
+        reduced esM with its getOriginalTransmissionOperation function.
+
+        .. note::
+            Only the networks of components of the Transmission class (not of its subclasses) without operation time
+            series, commissioning or stock parameters and quadratic costs are reduced (cf.
+            networkReduction.NON_REDUCIBLE_PARAMETERS). Lines are only merged if they have equal relative losses
+            and costs.
+
+        :returns: reduced esM instance
+        """
+        from fine.aggregations.networkReduction import networkReduction as netred
+        from fine.IOManagement import xarrayIO as xrIO
+
+        xr_dataset = xrIO.convertOptimizationInputToDatasets(
+            self, useProcessedValues=True
+        )
+        reduced_xr_dataset, mapping = netred.reduce_transmission_network(xr_dataset)
+
+        reducedEsM = xrIO.convertDatasetsToEnergySystemModel(reduced_xr_dataset)
+        reducedEsM.transmissionNetworkMapping = mapping
+
+        return reducedEsM
+
+    def getOriginalTransmissionOperation(self, compName, ip=0):
+        """
+        Get the optimal operation of a Transmission component on the lines of its original network if the esM
+        instance was obtained by reducing the networks of another esM instance (cf. reduceTransmissionNetwork). The
+        flow on each original line is the flow on the line of the reduced network into which it was contracted or
+        merged multiplied by the share of the flow on the original line (which accounts for the losses of preceding
+        lines in series and for the split of the flow between parallel lines). Dropped dangling lines do not carry
+        any flow.
+
+        :param compName: name of the Transmission component
+        :type compName: string
+
+        **Default arguments:**
+
+        :param ip: investment period
+            |br| * the default value is 0
+        :type ip: int
+
+        :returns: optimal operation on the original lines with the index (component, location 1, location 2)
+        :rtype: pandas DataFrame
+        """
+        if getattr(self, "transmissionNetworkMapping", None) is None:
+            raise ValueError(
+                "The esM instance was not obtained by reducing the transmission networks."
+            )
+        if compName not in self.transmissionNetworkMapping:
+            raise ValueError(
+                "The network of the component " + compName + " was not reduced."
+            )
+        mdl = self.componentModelingDict[self.componentNames[compName]]
+        operation = mdl.getOptimalValues("operationVariablesOptimum", ip=ip)["values"]
+        operation = operation.loc[compName]
+
+        originalOperation = pd.DataFrame(
+            0.0,
+            index=pd.MultiIndex.from_tuples(
+                [
+                    (compName, loc1, loc2)
+                    for loc1, loc2 in self.transmissionNetworkMapping[compName]
+                ]
+            ),
+            columns=operation.columns,
+        )
+        for (loc1, loc2), line in self.transmissionNetworkMapping[compName].items():
+            if line is not None and line[0] in operation.index:
+                originalOperation.loc[(compName, loc1, loc2)] = (
+                    operation.loc[line[0]] * line[1]
+                )
+        return originalOperation
+
     def cluster(self, *args, **kwargs):
         warnings.warn(
             "EnergySystemModel.cluster() is deprecated and will be removed in a future release. \
@@ -847,6 +1150,7 @@ class EnergySystemModel:
         sortValues=False,
         storeTSAinstance=False,
         rescaleClusterPeriods=False,
+        reuseTimeSeriesData=False,
         **kwargs,
     ):
         """
@@ -933,6 +1237,13 @@ class EnergySystemModel:
             stored in the EnergySystemModel instance.
             |br| * the default value is False
         :type storeTSAinstance: boolean
+
+        :param reuseTimeSeriesData: states if the time series data which is collected from the components and
+            prepared for the tsam package should be stored and reused in subsequent calls with reuseTimeSeriesData=True
+            (e.g. if the same time series data is clustered with an increasing number of typical periods). The stored
+            data is not updated if the components are modified in between. If False, the stored data is discarded.
+            |br| * the default value is False
+        :type reuseTimeSeriesData: boolean
         """
 
         # Check input arguments which have to fit the temporal representation of the energy system
@@ -975,8 +1286,9 @@ class EnergySystemModel:
             )
 
         # Format data to fit the input requirements of the tsam package:
-        # (a) append the time series data from all components stored in all initialized modeling classes to a pandas
-        #     DataFrame with unique column names
+        # (a) write the time series data from all components stored in all initialized modeling classes to one
+        #     preallocated matrix with unique column names. The columns of each time series are stored contiguously
+        #     such that the clustered data can be handed back to the components as slices (cf. getTSAOutput).
         # (b) thereby collect the weights which should be considered for each time series as well in a dictionary
 
         #############################################################################################################
@@ -984,37 +1296,44 @@ class EnergySystemModel:
         # periodsOrder and Occurrences now dictionaries
         self.periodsOrder = {}
         self.periodOccurrences = {}
+        self._fullTimeSeriesGatherIndex = {}
         self.timeStepsPerSegment = {}
         self.hoursPerSegment = {}
         self.segmentStartTime = {}
+        # NumPy lookup tables (index: [typical period, segment]) of the segment durations and start times which are
+        # used while declaring the constraints
+        self.timeStepsPerSegmentTable = {}
+        self.hoursPerSegmentTable = {}
+        self.segmentStartTimeTable = {}
+
+        if not reuseTimeSeriesData or self._timeSeriesDataForAggregation is None:
+            self._timeSeriesDataForAggregation = {} if reuseTimeSeriesData else None
+
+        from tsam.timeseriesaggregation import TimeSeriesAggregation
 
         # clustering of the time series data per investment period individually
         for ip in self.investmentPeriods:
-            timeSeriesData, weightDict = [], {}
-            for mdlName, mdl in self.componentModelingDict.items():
-                for compName, comp in mdl.componentsDict.items():
-                    (
-                        compTimeSeriesData,
-                        compWeightDict,
-                    ) = comp.getDataForTimeSeriesAggregation(ip)
-                    if compTimeSeriesData is not None:
-                        timeSeriesData.append(compTimeSeriesData), weightDict.update(
-                            compWeightDict
-                        )
-            timeSeriesData = pd.concat(timeSeriesData, axis=1)
-            # Note: Sets index for the time series data. The index is of no further relevance in the energy system model.
-            timeSeriesData.index = pd.date_range(
-                "2050-01-01 00:30:00",
-                periods=len(self.totalTimeSteps),
-                freq=(str(self.hoursPerTimeStep) + "h"),
-                tz="Europe/Berlin",
-            )
+            if (
+                self._timeSeriesDataForAggregation is not None
+                and ip in self._timeSeriesDataForAggregation
+            ):
+                (
+                    timeSeriesData,
+                    weightDict,
+                    columns,
+                ) = self._timeSeriesDataForAggregation[ip]
+            else:
+                timeSeriesData, weightDict, columns = (
+                    self._getTimeSeriesDataForAggregation(ip)
+                )
+                if self._timeSeriesDataForAggregation is not None:
+                    self._timeSeriesDataForAggregation[ip] = (
+                        timeSeriesData,
+                        weightDict,
+                        columns,
+                    )
 
-            # Cluster data with tsam package (the reindex call is here for reproducibility of TimeSeriesAggregation
-            # call) depending on whether segmentation is activated or not
-            timeSeriesData = timeSeriesData.reindex(
-                sorted(timeSeriesData.columns), axis=1
-            )
+            # Cluster data with tsam package depending on whether segmentation is activated or not
             if segmentation:
                 clusterClass = TimeSeriesAggregation(
                     timeSeries=timeSeriesData,
@@ -1029,11 +1348,11 @@ class EnergySystemModel:
                     representationMethod=representationMethod,
                     **kwargs,
                 )
-                # Convert the clustered data to a pandas DataFrame with the first index as typical period number and the
-                # second index as segment number per typical period.
-                data = pd.DataFrame.from_dict(
-                    clusterClass.clusterPeriodDict
-                ).reset_index(level=2, drop=True)
+                # Get the clustered data with the first index as typical period number and the second index as
+                # segment number per typical period.
+                typicalPeriods = clusterClass.createTypicalPeriods().reset_index(
+                    level=2, drop=True
+                )
                 # Get the length of each segment in each typical period with the first index as typical period number and
                 # the second index as segment number per typical period.
                 timeStepsPerSegment = pd.DataFrame.from_dict(
@@ -1051,9 +1370,24 @@ class EnergySystemModel:
                     representationMethod=representationMethod,
                     **kwargs,
                 )
-                # Convert the clustered data to a pandas DataFrame with the first index as typical period number and the
-                # second index as time step number per typical period.
-                data = pd.DataFrame.from_dict(clusterClass.clusterPeriodDict)
+                # Get the clustered data with the first index as typical period number and the second index as time
+                # step number per typical period.
+                typicalPeriods = clusterClass.createTypicalPeriods()
+
+            # Restore the column order of the time series matrix such that the clustered data of each time series is
+            # a contiguous slice. The components hold read-only views of this matrix (cf. getTSAOutput).
+            clusteredMatrix = np.asfortranarray(
+                typicalPeriods.to_numpy(dtype=float)[
+                    :, typicalPeriods.columns.get_indexer(columns)
+                ]
+            )
+            clusteredMatrix.setflags(write=False)
+            data = pd.DataFrame(
+                clusteredMatrix,
+                index=typicalPeriods.index,
+                columns=columns,
+                copy=False,
+            )
 
             # Store the respective clustered time series data in the associated components
             for mdlName, mdl in self.componentModelingDict.items():
@@ -1084,11 +1418,30 @@ class EnergySystemModel:
                 )
                 segmentStartTime[segmentStartTime.index.get_level_values(1) == 0] = 0
                 self.segmentStartTime[ip] = segmentStartTime  # ip-dependent
+                self.timeStepsPerSegmentTable[ip] = (
+                    self.timeStepsPerSegment[ip].unstack().to_numpy()
+                )
+                self.hoursPerSegmentTable[ip] = (
+                    self.hoursPerSegment[ip].unstack().to_numpy()
+                )
+                self.segmentStartTimeTable[ip] = (
+                    self.segmentStartTime[ip].unstack().to_numpy()
+                )
 
             self.periodsOrder[ip] = clusterClass.clusterOrder
             self.periodOccurrences[ip] = [
                 (self.periodsOrder[ip] == tp).sum() for tp in self.typicalPeriods
             ]
+            utils.getFullTimeSeriesGatherIndex(
+                self,
+                self.periodsOrder[ip],
+                ip,
+                (
+                    numberOfSegmentsPerPeriod
+                    if segmentation
+                    else numberOfTimeStepsPerPeriod
+                ),
+            )
 
         self.periods = list(
             range(int(len(self.totalTimeSteps) / len(self.timeStepsPerPeriod)))
@@ -1110,6 +1463,54 @@ class EnergySystemModel:
             self.tsaInstance = clusterClass
         utils.output("\t\t(%.4f" % (timeEnd - timeStart) + " sec)\n", self.verbose, 0)
 
+    def _getTimeSeriesDataForAggregation(self, ip):
+        """
+        Collect the time series data and the weights of all components for the clustering of an investment period.
+
+        :param ip: investment period for which the time series data is collected.
+        :type ip: int
+
+        :return: time series data (one column per time series), weights of the time series and column names
+        :rtype: tuple (pandas DataFrame, dict, list)
+        """
+        timeSeriesData, weightDict = [], {}
+        for mdlName, mdl in self.componentModelingDict.items():
+            for compName, comp in mdl.componentsDict.items():
+                (
+                    compTimeSeriesData,
+                    compWeightDict,
+                ) = comp.getDataForTimeSeriesAggregation(ip)
+                if isinstance(compTimeSeriesData, pd.DataFrame):
+                    # Components may also return their time series data as one DataFrame with unique column names
+                    compTimeSeriesData = [
+                        (list(compTimeSeriesData.columns), compTimeSeriesData)
+                    ]
+                if compTimeSeriesData is not None:
+                    timeSeriesData.extend(compTimeSeriesData), weightDict.update(
+                        compWeightDict
+                    )
+        columns = [id for ids, _ in timeSeriesData for id in ids]
+        timeSeriesMatrix = np.empty((len(self.totalTimeSteps), len(columns)), order="F")
+        start = 0
+        for ids, rate in timeSeriesData:
+            timeSeriesMatrix[:, start : start + len(ids)] = rate.values
+            start += len(ids)
+        # Note: Sets index for the time series data. The index is of no further relevance in the energy system model.
+        # The columns are sorted by the tsam package (for reproducibility of the TimeSeriesAggregation call).
+        timeSeriesData = pd.DataFrame(
+            timeSeriesMatrix,
+            index=pd.date_range(
+                "2050-01-01 00:30:00",
+                periods=len(self.totalTimeSteps),
+                freq=(str(self.hoursPerTimeStep) + "h"),
+                tz="Europe/Berlin",
+            ),
+            columns=columns,
+            copy=False,
+        )
+
+        return timeSeriesData, weightDict, columns
+
     def declareTimeSets(self, pyM, timeSeriesAggregation, segmentation):
         """
         Set and initialize basic time parameters and sets.
@@ -1712,6 +2113,8 @@ class EnergySystemModel:
         timeSeriesAggregation=False,
         relaxIsBuiltBinary=False,
         relevanceThreshold=None,
+        sparseOperation=False,
+        mergeVintages=True,
     ):
         """
         Declare the optimization problem belonging to the specified energy system for which a pyomo concrete model
@@ -1740,6 +2143,21 @@ class EnergySystemModel:
         :param relevanceThreshold: Force operation parameters to be 0 if values are below the relevance threshold.
             |br| * the default value is None
         :type relevanceThreshold: float (>=0) or None
+
+        :param sparseOperation: states if the operation variables which are forced to zero by their maximum or
+            fixed operation rate (operation rate of zero, e.g. photovoltaics at night, or below the relevance
+            threshold) are eliminated, i.e. they are not declared and replaced by a constant zero. The constraints
+            which only contain eliminated or fixed variables are not passed to the solver and have no dual values
+            (sparse mode). The results are the same as without the sparse mode.
+            |br| * the default value is False
+        :type sparseOperation: boolean
+
+        :param mergeVintages: states if the commissioning years of a conversion component with identical commodity
+            conversion factors in an investment period share one operation variable (vintage merging). The operation
+            of the merged commissioning years is split between them in proportion to their commissionings after the
+            optimization. The results are the same as without vintage merging.
+            |br| * the default value is True
+        :type mergeVintages: boolean
         """
         # Get starting time of the optimization to, later on, obtain the total run time of the optimize function call
         timeStart = time.time()
@@ -1766,6 +2184,15 @@ class EnergySystemModel:
         self.pyM = pyomo.ConcreteModel()
         pyM = self.pyM
         pyM.dual = pyomo.Suffix(direction=pyomo.Suffix.IMPORT)
+        pyM.sparseOperation = sparseOperation
+        if sparseOperation:
+            # The eliminated operation variables refer to this variable (cf. SparseOperationVar)
+            pyM.zeroOperation = pyomo.Var()
+            pyM.zeroOperation.fix(0)
+        pyM.mergeVintages = mergeVintages
+        # Time-dependent bounds of the operation variables (cf. ComponentModel.declareOperationVars)
+        pyM.operationVarBounds = {}
+        self._modifiedComponents = set()
 
         # Set time sets for the model instance
         self.declareTimeSets(pyM, timeSeriesAggregation, segmentation)
@@ -1839,6 +2266,10 @@ class EnergySystemModel:
         warmstart=False,
         relevanceThreshold=None,
         includePerformanceSummary=False,
+        mode="monolithic",
+        window=None,
+        overlap=0,
+        sparseOperation=False,
     ):
         """
         Optimize the specified energy system for which a pyomo ConcreteModel instance is built or called upon.
@@ -1878,7 +2309,7 @@ class EnergySystemModel:
         :type segmentation: boolean
 
         :param logFileName: logFileName is used for naming the log file of the optimization solver output
-            if gurobi is used as the optimization solver.
+            if gurobi or highs is used as the optimization solver.
             If the logFileName is given as an absolute path (e.g. logFileName = os.path.join(os.getcwd(),
             'Results', 'logFileName.txt')) the log file will be stored in the specified directory. Otherwise,
             it will be stored by default in the directory where the executing python script is called.
@@ -1886,14 +2317,15 @@ class EnergySystemModel:
         :type logFileName: string
 
         :param threads: number of computational threads used for solving the optimization (solver dependent
-            input) if gurobi is used as the solver. A value of 0 results in using all available threads. If
+            input) if gurobi or highs is used as the solver. A value of 0 results in using all available threads. If
             a value larger than the available number of threads are chosen, the value will reset to the maximum
             number of threads.
             |br| * the default value is 3
         :type threads: positive integer
 
         :param solver: specifies which solver should solve the optimization problem (which of course has to be
-            installed on the machine on which the model is run).
+            installed on the machine on which the model is run). The solver 'highs' is called via its Python API
+            (highspy) without writing problem and solution files.
             |br| * the default value is 'gurobi'
         :type solver: string
 
@@ -1926,10 +2358,68 @@ class EnergySystemModel:
             |br| * the default value is False
         :type includePerformanceSummary: boolean
 
+        :param mode: states if the optimization problem is solved
+
+            (a) as one model covering the whole time horizon ('monolithic') or
+            (b) in consecutive, overlapping time windows of the full temporal resolution ('rollingHorizon').
+                This mode is only available for dispatch problems, i.e. the capacities (and, if existing, the
+                binary design decisions) of all components have to be fixed and no constraints which refer to the
+                whole time horizon (balanceLimit, yearly full load hours, yearly commodity limits) may be
+                specified. The windows are solved in sequence. The states of charge of the storage components
+                and the operation of dynamic conversion components (on/off states, ramping) at the end of a
+                window are carried over to the next window. The states at the start of the first window are not
+                restricted and the states of charge at the end of the last window are fixed to them (only a
+                window which covers the whole time horizon is modeled cyclic like the monolithic model). The
+                operation results of all windows are stitched to the usual operation variable DataFrames (e.g.
+                operationVariablesOptimum) and the objective value is the sum of the contributions of the kept
+                time steps of the windows. The optimization summaries and the pyomo model (pyM) refer to the
+                last window.
+
+            |br| * the default value is 'monolithic'
+        :type mode: string ('monolithic' or 'rollingHorizon')
+
+        :param window: number of time steps of which the optimized operation is kept in each window (only
+            required if mode='rollingHorizon').
+            |br| * the default value is None
+        :type window: strictly positive integer or None
+
+        :param overlap: number of additional time steps which are optimized in each window beyond the kept time
+            steps (look-ahead) but are overwritten by the next window (only considered if mode='rollingHorizon').
+            |br| * the default value is 0
+        :type overlap: positive integer
+
+        :param sparseOperation: states if the operation variables which are forced to zero by their maximum or
+            fixed operation rate are eliminated from the problem which is passed to the solver (cf.
+            declareOptimizationProblem, only considered if the optimization problem is declared and not available
+            for mode='rollingHorizon').
+            |br| * the default value is False
+        :type sparseOperation: boolean
+
         Last edited: November 16, 2023
         |br| @author: FINE Developer Team (FZJ IEK-3)
         """
 
+        if mode == "rollingHorizon":
+            self._optimizeRollingHorizon(
+                window=window,
+                overlap=overlap,
+                relaxIsBuiltBinary=relaxIsBuiltBinary,
+                timeSeriesAggregation=timeSeriesAggregation,
+                logFileName=logFileName,
+                threads=threads,
+                solver=solver,
+                timeLimit=timeLimit,
+                optimizationSpecs=optimizationSpecs,
+                warmstart=warmstart,
+                relevanceThreshold=relevanceThreshold,
+                sparseOperation=sparseOperation,
+            )
+            return
+        elif mode != "monolithic":
+            raise ValueError(
+                "The mode parameter has to be either 'monolithic' or 'rollingHorizon'."
+            )
+
         if not timeSeriesAggregation:
             self.segmentation = False
 
@@ -1938,6 +2428,7 @@ class EnergySystemModel:
                 timeSeriesAggregation=timeSeriesAggregation,
                 relaxIsBuiltBinary=relaxIsBuiltBinary,
                 relevanceThreshold=relevanceThreshold,
+                sparseOperation=sparseOperation,
             )
         else:
             if self.pyM is None:
@@ -1945,6 +2436,13 @@ class EnergySystemModel:
                     "The optimization problem is not declared yet. Set the argument declaresOptimization"
                     " problem to True or call the declareOptimizationProblem function first."
                 )
+            if self._modifiedComponents and self.verbose < 2:
+                warnings.warn(
+                    "The components "
+                    + str(sorted(self._modifiedComponents))
+                    + " were updated after the optimization problem was declared. Set the argument"
+                    + " declaresOptimizationProblem to True to consider the updates."
+                )
 
         if includePerformanceSummary:
             """
@@ -1996,7 +2494,7 @@ class EnergySystemModel:
 
         # Check which solvers are available and choose default solver if no solver is specified explicitely
         # Order of possible solvers in solverList defines the priority of chosen default solver.
-        solverList = ["gurobi", "glpk", "cbc"]
+        solverList = ["gurobi", "glpk", "cbc", "highs"]
 
         if solver != "None":
             try:
@@ -2035,6 +2533,9 @@ class EnergySystemModel:
         if solver == "gurobi" and importlib.util.find_spec('gurobipy'):
             # Use the direct gurobi solver that uses the Python API.
             optimizer = opt.SolverFactory(solver, solver_io="python")
+        elif solver == "highs":
+            # The HiGHS solver is called via its Python API (highspy) and set up in _solveHighs
+            optimizer = None
         else:
             optimizer = opt.SolverFactory(solver)
 
@@ -2061,12 +2562,33 @@ class EnergySystemModel:
                 self.pyM,
                 warmstart=warmstart,
                 tee=True,
+                skip_trivial_constraints=self.pyM.sparseOperation,
             )
         elif solver == "glpk":
             optimizer.set_options(optimizationSpecs)
-            solver_info = optimizer.solve(self.pyM, tee=True)
+            solver_info = optimizer.solve(
+                self.pyM,
+                tee=True,
+                skip_trivial_constraints=self.pyM.sparseOperation,
+            )
+        elif solver == "highs":
+            solver_info = self._solveHighs(
+                logFileName, threads, timeLimit, optimizationSpecs, warmstart
+            )
+        elif warmstart and optimizer.warm_start_capable():
+            # Other solvers which accept a start solution (e.g. cbc) are warm-started with the current variable values
+            solver_info = optimizer.solve(
+                self.pyM,
+                warmstart=True,
+                tee=True,
+                skip_trivial_constraints=self.pyM.sparseOperation,
+            )
         else:
-            solver_info = optimizer.solve(self.pyM, tee=True)
+            solver_info = optimizer.solve(
+                self.pyM,
+                tee=True,
+                skip_trivial_constraints=self.pyM.sparseOperation,
+            )
         self.solverSpecs["solvetime"] = time.time() - timeStart
         utils.output(solver_info.solver(), self.verbose, 0), utils.output(
             solver_info.problem(), self.verbose, 0
@@ -2131,65 +2653,7 @@ class EnergySystemModel:
                 and self.verbose < 2
             ):
                 warnings.warn("Output is generated for a non-optimal solution.")
-            utils.output("\nProcessing optimization output...", self.verbose, 0)
-            # Declare component specific sets, variables and constraints
-            w = str(len(max(self.componentModelingDict.keys())) + 6)
-
-            # iterate over investment periods, to get yearly results
-            for key, mdl in self.componentModelingDict.items():
-                if not isinstance(mdl._capacityVariablesOptimum, dict):
-                    mdl._capacityVariablesOptimum = {}
-                __t = time.time()
-                # if _capacityVariablesOptimum is not a dict, convert to dict
-                # (if single year system is optimized several times)
-
-                mdl.setOptimalValues(self, self.pyM)
-                outputString = (
-                    ("for {:" + w + "}").format(key + " ...")
-                    + "(%.4f" % (time.time() - __t)
-                    + "sec)"
-                )
-                utils.output(outputString, self.verbose, 0)
-
-                # convert optimal values from internal name to external name
-                # e.g. from _capacityVariablesOptimum to capacityVariablesOptimum
-                # For perfectForesight the data stays the same, for a single year optimization
-                # the data is converted from a dict with a single entry to a dataframe
-                # By this, old models will not fail.
-                def convertOptimalValues(esM, mdl, key):
-                    if key in mdl.__dict__.keys():
-                        if esM.numberOfInvestmentPeriods == 1:
-                            setattr(
-                                mdl,
-                                key.replace("_", ""),
-                                getattr(mdl, key)[esM.investmentPeriodNames[0]],
-                            )
-                        else:
-                            setattr(mdl, key.replace("_", ""), getattr(mdl, key))
-                    else:
-                        pass
-
-                optimalValueParameters = [
-                    "_optSummary",
-                    "_stateOfChargeOperationVSariablesOptimum",
-                    "_chargeOperationVariablesOptimum",
-                    "_dischargeOperationVariablesOptimum",
-                    "_phaseAngleVariablesOptimum",
-                    "_operationVariablesOptimum",
-                    "_discretizationPointVariablesOptimun",
-                    "_discretizationSegmentConVariablesOptimun",
-                    "_discretizationSegmentBinVariablesOptimun",
-                    "_capacityVariablesOptimum",
-                    "_isBuiltVariablesOptimum",
-                    "_commissioningVariablesOptimum",
-                    "_decommissioningVariablesOptimum",
-                ]
-
-                for optParam in optimalValueParameters:
-                    convertOptimalValues(self, mdl, optParam)
-
-            # Store the objective value in the EnergySystemModel instance.
-            self.objectiveValue = self.pyM.Obj()
+            self.setOptimalValues()
 
         utils.output("\t\t(%.4f" % (time.time() - _t) + " sec)\n", self.verbose, 0)
 
@@ -2247,6 +2711,8 @@ class EnergySystemModel:
             }
 
             if solver == "gurobi":
+                import gurobi_logtools as glt
+
                 # Create DataFrame from gurobi log file
                 if logFileName == "":
                     gurobi_summary_dict = {}
@@ -2283,3 +2749,487 @@ class EnergySystemModel:
 
             # Save perfromance summary in the EnergySystemModel instance
             self.performanceSummary = PerformanceSummary_df
+
+    def _solveHighs(
+        self, logFileName, threads, timeLimit, optimizationSpecs, warmstart
+    ):
+        """
+        Solve the declared optimization problem (pyM) with the Python API of HiGHS. The model matrix is passed to
+        HiGHS in memory and the solution is loaded directly into pyM. The dual values are loaded as well (for
+        mixed-integer programs, they are obtained from the linear program with fixed integer variables).
+
+        :return: solver information with the same structure as the one returned by the pyomo solver interfaces
+        :rtype: pyomo SolverResults
+        """
+        # The appsi interface of pyomo is only imported if HiGHS is used
+        from pyomo.contrib.appsi.base import (
+            TerminationCondition,
+            legacy_solver_status_map,
+            legacy_termination_condition_map,
+        )
+        from pyomo.contrib.appsi.solvers import Highs
+
+        optimizer = Highs()
+
+        # Set the solver options, the optimizationSpecs are given as 'option=value' pairs separated by spaces
+        highsOptions = {"threads": threads}
+        if logFileName != "":
+            highsOptions["log_file"] = logFileName
+        for spec in optimizationSpecs.split():
+            if "=" not in spec:
+                raise ValueError(
+                    "The optimizationSpecs for HiGHS have to be given as 'option=value' pairs but '"
+                    + spec
+                    + "' was specified."
+                )
+            option, value = spec.split("=", 1)
+            for valueType in (int, float):
+                try:
+                    value = valueType(value)
+                    break
+                except ValueError:
+                    pass
+            highsOptions[option] = {"true": True, "false": False}.get(value, value)
+        optimizer.highs_options = highsOptions
+        optimizer.config.stream_solver = True
+        optimizer.config.load_solution = False
+        optimizer.config.time_limit = timeLimit
+        optimizer.config.warmstart = warmstart
+
+        results = optimizer.solve(self.pyM)
+
+        # Translate the results to the structure of the pyomo solver interfaces
+        solver_info = opt.SolverResults()
+        solver_info.solver.name = "HiGHS"
+        solver_info.solver.termination_condition = legacy_termination_condition_map[
+            results.termination_condition
+        ]
+        solver_info.solver.status = legacy_solver_status_map[
+            results.termination_condition
+        ]
+        solver_info.problem.lower_bound = results.best_objective_bound
+        solver_info.problem.upper_bound = results.best_feasible_objective
+        if results.best_feasible_objective is not None:
+            results.solution_loader.load_vars()
+            if results.termination_condition != TerminationCondition.optimal:
+                # A feasible, non-optimal solution (e.g. if the time limit is reached) is processed
+                solver_info.solver.status = opt.SolverStatus.warning
+            # For mixed-integer programs, the dual values are obtained from the linear program with fixed integer
+            # variables
+            integerVariables = [
+                var
+                for var in self.pyM.component_data_objects(pyomo.Var, active=True)
+                if not var.is_continuous() and not var.fixed and var.value is not None
+            ]
+            if integerVariables:
+                for var in integerVariables:
+                    var.fix(round(var.value))
+                optimizer.config.stream_solver = False
+                optimizer.config.warmstart = False
+                dualResults = optimizer.solve(self.pyM)
+                for var in integerVariables:
+                    var.unfix()
+            else:
+                dualResults = results
+            if dualResults.termination_condition == TerminationCondition.optimal:
+                self.pyM.dual.update(dualResults.solution_loader.get_duals())
+        return solver_info
+
+    def setOptimalValues(self):
+        """
+        Process the optimal values of the pyomo model instance (pyM) after a successful optimization: set the
+        optimal values (e.g. capacityVariablesOptimum, operationVariablesOptimum) and optimization summaries of
+        all modeling classes and store the objective value in the EnergySystemModel instance.
+        """
+        utils.output("\nProcessing optimization output...", self.verbose, 0)
+        # Declare component specific sets, variables and constraints
+        w = str(len(max(self.componentModelingDict.keys())) + 6)
+
+        # iterate over investment periods, to get yearly results
+        for key, mdl in self.componentModelingDict.items():
+            if not isinstance(mdl._capacityVariablesOptimum, dict):
+                mdl._capacityVariablesOptimum = {}
+            __t = time.time()
+            # if _capacityVariablesOptimum is not a dict, convert to dict
+            # (if single year system is optimized several times)
+
+            mdl.setOptimalValues(self, self.pyM)
+            outputString = (
+                ("for {:" + w + "}").format(key + " ...")
+                + "(%.4f" % (time.time() - __t)
+                + "sec)"
+            )
+            utils.output(outputString, self.verbose, 0)
+
+            # convert optimal values from internal name to external name
+            # e.g. from _capacityVariablesOptimum to capacityVariablesOptimum
+            # For perfectForesight the data stays the same, for a single year optimization
+            # the data is converted from a dict with a single entry to a dataframe
+            # By this, old models will not fail.
+            def convertOptimalValues(esM, mdl, key):
+                if key in mdl.__dict__.keys():
+                    if esM.numberOfInvestmentPeriods == 1:
+                        setattr(
+                            mdl,
+                            key.replace("_", ""),
+                            getattr(mdl, key)[esM.investmentPeriodNames[0]],
+                        )
+                    else:
+                        setattr(mdl, key.replace("_", ""), getattr(mdl, key))
+                else:
+                    pass
+
+            optimalValueParameters = [
+                "_optSummary",
+                "_stateOfChargeOperationVSariablesOptimum",
+                "_chargeOperationVariablesOptimum",
+                "_dischargeOperationVariablesOptimum",
+                "_phaseAngleVariablesOptimum",
+                "_operationVariablesOptimum",
+                "_operationCommisVariablesOptimum",
+                "_discretizationPointVariablesOptimun",
+                "_discretizationSegmentConVariablesOptimun",
+                "_discretizationSegmentBinVariablesOptimun",
+                "_capacityVariablesOptimum",
+                "_isBuiltVariablesOptimum",
+                "_commissioningVariablesOptimum",
+                "_decommissioningVariablesOptimum",
+            ]
+
+            for optParam in optimalValueParameters:
+                convertOptimalValues(self, mdl, optParam)
+
+        # Store the objective value in the EnergySystemModel instance.
+        self.objectiveValue = self.pyM.Obj()
+
+    def _optimizeRollingHorizon(
+        self,
+        window,
+        overlap,
+        relaxIsBuiltBinary,
+        timeSeriesAggregation,
+        relevanceThreshold,
+        sparseOperation,
+        **solverKwargs,
+    ):
+        """
+        Optimize the operation of the energy system in consecutive, overlapping time windows of the full temporal
+        resolution (cf. optimize with mode='rollingHorizon').
+
+        The kept time steps of a window are [start, start + window). The window model additionally covers the
+        lookback time steps before the start, whose operation is fixed to the results of the previous window, and
+        the overlap time steps after the kept time steps. By fixing the lookback time steps and the state of charge
+        at the start of the window, the states of the storage and dynamic conversion components are carried over.
+        For each window, the time series data of the components is replaced by views of the window's time steps.
+        The window model is declared once and, for the following windows, the time-dependent bounds, the
+        time-indexed constraints and the objective function are updated in place with the data of the window.
+        """
+        utils.checkRollingHorizonInput(
+            self, timeSeriesAggregation, window, overlap, sparseOperation
+        )
+        self.segmentation = False
+
+        # The lookback has to cover the time steps before the start of a window which are referenced by the minimum
+        # up and down time and the ramping constraints of the dynamic conversion components
+        lookback = 0
+        if "ConversionDynamicModel" in self.componentModelingDict:
+            mdl = self.componentModelingDict["ConversionDynamicModel"]
+            for comp in mdl.componentsDict.values():
+                lookback = max(lookback, 1, comp.downTimeMin or 0, comp.upTimeMin or 0)
+        if window < lookback:
+            raise ValueError(
+                "The window parameter has to be at least as large as the maximum minimum up or down time"
+                + " of the dynamic conversion components ("
+                + str(lookback)
+                + ")."
+            )
+
+        numberOfTimeSteps = self.numberOfTimeSteps
+        ipName = self.investmentPeriodNames[0]
+        fullTimeSeries = [
+            (comp, attrName, attr)
+            for mdl in self.componentModelingDict.values()
+            for comp in mdl.componentsDict.values()
+            for attrName, attr in vars(comp).items()
+            if attrName.startswith("full") and isinstance(attr, dict)
+        ]
+        original = (
+            self.totalTimeSteps,
+            self.numberOfTimeSteps,
+            self.numberOfYears,
+            self._timeSeriesIndex,
+        )
+
+        # All windows are modeled with the same number of time steps, so the window model is only declared once. The
+        # window model starts lookback time steps before the kept time steps. At the end of the time horizon, it is
+        # shifted to the front, i.e. more time steps before the kept time steps are fixed.
+        n = min(numberOfTimeSteps, lookback + window + overlap)
+        windowStarts = list(range(0, numberOfTimeSteps, window))
+        # Only a window which covers the whole time horizon is cyclic (like the monolithic model). Otherwise, the
+        # states at the start of the first window are free and the states at the end of the last window are fixed to
+        # them.
+        isCyclic = len(windowStarts) == 1
+
+        def getModelStart(start):
+            return min(max(0, start - lookback), numberOfTimeSteps - n)
+
+        def sliceTimeSeries(data, start, end):
+            # Replace the time series (also in nested dictionaries) by views of the time steps of the window
+            if isinstance(data, dict):
+                return {
+                    key: sliceTimeSeries(val, start, end) for key, val in data.items()
+                }
+            if (
+                isinstance(data, (pd.DataFrame, pd.Series))
+                and len(data) == numberOfTimeSteps
+                and isinstance(data.index, pd.MultiIndex)
+            ):
+                if isinstance(data, pd.Series):
+                    return pd.Series(
+                        data.values[start:end],
+                        index=self._timeSeriesIndex,
+                        name=data.name,
+                        copy=False,
+                    )
+                return pd.DataFrame(
+                    data.values[start:end],
+                    index=self._timeSeriesIndex,
+                    columns=data.columns,
+                    copy=False,
+                )
+            return data
+
+        def getTimeIndexedObjects(pyM, ctype):
+            # Yield the time-indexed variables or constraints and state if they are defined on the inter time steps
+            # (states of charge, defined at the start of each time step and at the end of the time horizon)
+            timeSets = [pyM.intraYearTimeSet, pyM.timeSet]
+            for obj in pyM.component_objects(ctype, active=True):
+                if not obj.is_indexed():
+                    continue
+                subsets = list(obj.index_set().subsets())
+                if any(s is pyM.interTimeStepsSet for s in subsets):
+                    yield obj, True
+                elif any(s is ts for s in subsets for ts in timeSets):
+                    yield obj, False
+
+        def wrapsAround(conData, t):
+            # Check if a constraint refers to time steps at the end of the window (cyclic time steps, e.g. the minimum
+            # up and down times and the ramping of the dynamic conversion components at the start of the window)
+            return any(
+                var.parent_component().name in timeVarNames and var.index()[-1] > t + 1
+                for var in identify_variables(conData.body)
+            )
+
+        def updateWindowModel(fixedSteps, isFirst):
+            # Update the time-dependent bounds of the operation variables, the time-indexed constraints and the
+            # objective function to the time series data of the window (the first window is declared with it).
+            # Constraints of the time steps before the kept time steps (which only contain fixed variables or wrap
+            # around to the end of the window) and, in the first window, the constraints which wrap around are
+            # deactivated.
+            if not isFirst:
+                for varName, bounds in pyM.operationVarBounds.items():
+                    for index, varData in getattr(pyM, varName).items():
+                        lower, upper = bounds(pyM, *index)
+                        varData.setlb(lower)
+                        varData.setub(upper)
+            for con in timeConstraints:
+                for index in con.index_set():
+                    if con.rule is not None and not isFirst:
+                        expr = con.rule(pyM, index)
+                        if expr is pyomo.Constraint.Skip:
+                            if index in con:
+                                con[index].deactivate()
+                            continue
+                        if index in con:
+                            con[index].set_value(expr)
+                        else:
+                            con.add(index, expr)
+                    elif index not in con:
+                        continue
+                    t = index[-1]
+                    if t < fixedSteps or (
+                        isFirst
+                        and not isCyclic
+                        and t < lookback
+                        and wrapsAround(con[index], t)
+                    ):
+                        con[index].deactivate()
+                    else:
+                        con[index].activate()
+            if not isFirst:
+                pyM.Obj.set_value(pyM.Obj.rule(pyM, None))
+
+        fixedValues, initialStates, results = {}, {}, {}
+        objectiveValue, fixedVars = 0, []
+        try:
+            # Set the time parameters of the windows
+            self.totalTimeSteps, self.numberOfTimeSteps = list(range(n)), n
+            self.numberOfYears = n * self.hoursPerTimeStep / 8760.0
+            self._timeSeriesIndex = pd.MultiIndex.from_product(
+                [[0], self.totalTimeSteps], names=["Period", "TimeStep"]
+            )
+            for count, start in enumerate(windowStarts):
+                end = min(start + window, numberOfTimeSteps)
+                modelStart = getModelStart(start)
+                fixedSteps = start - modelStart
+                isLast = count == len(windowStarts) - 1
+                utils.output(
+                    "\nRolling horizon: optimizing time steps "
+                    + str(start)
+                    + " to "
+                    + str(end - 1)
+                    + " (window "
+                    + str(count + 1)
+                    + " of "
+                    + str(len(windowStarts))
+                    + ")",
+                    self.verbose,
+                    0,
+                )
+
+                # Set the time series data of the window. The window model is declared for the first window and
+                # updated in place for the following windows.
+                for comp, attrName, attr in fullTimeSeries:
+                    setattr(
+                        comp,
+                        attrName,
+                        sliceTimeSeries(attr, modelStart, modelStart + n),
+                    )
+                if count == 0:
+                    self.declareOptimizationProblem(
+                        timeSeriesAggregation=False,
+                        relaxIsBuiltBinary=relaxIsBuiltBinary,
+                        relevanceThreshold=relevanceThreshold,
+                    )
+                    pyM = self.pyM
+                    timeVars = list(getTimeIndexedObjects(pyM, pyomo.Var))
+                    timeVarNames = {var.name for var, _ in timeVars}
+                    timeConstraints = [
+                        con for con, _ in getTimeIndexedObjects(pyM, pyomo.Constraint)
+                    ]
+                    if not isCyclic:
+                        for mdl in self.componentModelingDict.values():
+                            cyclicState = getattr(
+                                pyM, "ConstrCyclicState_" + mdl.abbrvName, None
+                            )
+                            if cyclicState is not None:
+                                cyclicState.deactivate()
+                    if lookback > 0 and not isCyclic:
+                        updateWindowModel(fixedSteps, isFirst=True)
+                else:
+                    for mdl in self.componentModelingDict.values():
+                        for comp in mdl.componentsDict.values():
+                            comp.setTimeSeriesData(False)
+                            comp.checkProcessedDataSets()
+                    for varData in fixedVars:
+                        varData.unfix()
+                    updateWindowModel(fixedSteps, isFirst=False)
+
+                # Fix the operation in the time steps before the kept time steps and the states at the start of the
+                # kept time steps to the results of the previous windows. In the last window, the states at the end
+                # of the time horizon are fixed to the states at its start.
+                fixedVars = []
+                for var, isState in timeVars:
+                    for index, varData in var.items():
+                        t = index[-1]
+                        if count > 0 and (
+                            t < fixedSteps or (isState and t == fixedSteps)
+                        ):
+                            value = fixedValues.get(
+                                (var.name, index[:-1], modelStart + t)
+                            )
+                        elif isState and isLast and not isCyclic and t == n:
+                            value = initialStates.get((var.name, index[:-1]))
+                        else:
+                            continue
+                        if value is not None:
+                            varData.fix(value)
+                            fixedVars.append(varData)
+
+                self.objectiveValue = None
+                self.optimize(
+                    declaresOptimizationProblem=False,
+                    timeSeriesAggregation=False,
+                    **solverKwargs,
+                )
+                if self.objectiveValue is None:
+                    warnings.warn(
+                        "The optimization of the time steps "
+                        + str(start)
+                        + " to "
+                        + str(end - 1)
+                        + " did not yield a solution. The rolling horizon optimization is stopped."
+                    )
+                    results, objectiveValue = {}, None
+                    break
+
+                # Add the contribution of the kept time steps to the objective function value. The costs of the
+                # operation refer to the number of years of the window and are scaled to the whole time horizon. The
+                # contribution of the other variables (design variables) is the same in all windows.
+                repn = generate_standard_repn(pyM.Obj.expr, compute_values=True)
+                if count == 0:
+                    objectiveValue += repn.constant
+                for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+                    if var.parent_component().name not in timeVarNames:
+                        if count == 0:
+                            objectiveValue += coef * var.value
+                    elif fixedSteps <= var.index()[-1] < fixedSteps + end - start:
+                        objectiveValue += coef * var.value * n / numberOfTimeSteps
+
+                # Store the values which are fixed in the next window and the states at the start of the time horizon
+                nextStart = end
+                nextModelStart = getModelStart(nextStart)
+                for var, isState in timeVars:
+                    for index, varData in var.items():
+                        t = modelStart + index[-1]
+                        if nextModelStart <= t < nextStart or (
+                            isState and t == nextStart
+                        ):
+                            fixedValues[(var.name, index[:-1], t)] = varData.value
+                        if count == 0 and isState and t == 0:
+                            initialStates[(var.name, index[:-1])] = varData.value
+
+                # Keep the operation results of the time steps [start, end)
+                for mdlName, mdl in self.componentModelingDict.items():
+                    for attrName, attr in vars(mdl).items():
+                        if not (
+                            attrName.startswith("_")
+                            and attrName.endswith("VariablesOptimum")
+                            and isinstance(attr, dict)
+                        ):
+                            continue
+                        data = attr.get(ipName)
+                        if isinstance(data, pd.DataFrame) and data.columns.equals(
+                            pd.RangeIndex(n)
+                        ):
+                            data = data.iloc[:, fixedSteps : fixedSteps + end - start]
+                            data.columns = range(start, end)
+                            results.setdefault((mdlName, attrName), []).append(data)
+        finally:
+            # Restore the time parameters and time series data of the full time horizon
+            (
+                self.totalTimeSteps,
+                self.numberOfTimeSteps,
+                self.numberOfYears,
+                self._timeSeriesIndex,
+            ) = original
+            self.timeStepsPerPeriod = self.totalTimeSteps
+            for comp, attrName, attr in fullTimeSeries:
+                setattr(comp, attrName, attr)
+            for mdl in self.componentModelingDict.values():
+                for comp in mdl.componentsDict.values():
+                    comp.setTimeSeriesData(False)
+                    comp.checkProcessedDataSets()
+
+        # Stitch the results of the windows to the results of the full time horizon
+        for (mdlName, attrName), data in results.items():
+            mdl = self.componentModelingDict[mdlName]
+            data = pd.concat(data, axis=1)
+            getattr(mdl, attrName)[ipName] = data
+            if hasattr(mdl, attrName[1:]):
+                setattr(mdl, attrName[1:], data)
+            if attrName == "_stateOfChargeOperationVariablesOptimum":
+                utils.setOptimalComponentVariables(
+                    data, "_stateOfChargeVariablesOptimum", mdl.componentsDict
+                )
+        self.objectiveValue = objectiveValue
@@ -5,3 +5,6 @@ Last edited: January 13, 2023
 
 from .transformationPath import *
 from .optimizeTSAmultiStage import *
+from .optimizeBenders import *
+from .optimizeProgressiveHedging import *
+from .optimizeSolverPortfolio import *
@@ -0,0 +1,582 @@
+import concurrent.futures
+import time
+
+import numpy as np
+import pyomo.environ as pyomo
+import pyomo.opt as opt
+from pyomo.repn import generate_standard_repn
+from scipy import sparse
+from scipy.sparse import csgraph
+
+from fine import utils
+
+# Subproblems of the worker process (dict, subproblem index: pyomo ConcreteModel) and solver settings
+_workerSubproblems, _workerData, _workerSolver = {}, [], {}
+
+
+def optimizeBenders(
+    esM,
+    relaxIsBuiltBinary=False,
+    timeSeriesAggregation=False,
+    relevanceThreshold=None,
+    gap=1e-4,
+    maxIterations=100,
+    processes=1,
+    penalty=None,
+    threads=3,
+    solver="gurobi",
+    optimizationSpecs="",
+):
+    """
+    Optimize the energy system with a Benders decomposition. The master problem contains the design variables
+    (capacities, commissioning, decommissioning and binary design decisions) of all investment periods. The
+    operation of the energy system is optimized in independent linear subproblems for fixed designs. The
+    subproblems are given by the constraints which are linked by the operation variables, i.e. at least one
+    subproblem is set up for each investment period (and thereby for each scenario of a stochastic model).
+    The subproblems can be solved in parallel worker processes. In each iteration, an optimality cut is added
+    to the master problem for each subproblem until the relative gap between the lower bound (master problem)
+    and the upper bound (best feasible design) falls below the specified gap.
+
+    To keep the subproblems feasible for every design, the fixed design values can be violated in the
+    subproblems at the cost of the penalty factor per unit. Designs which violate the fixed design values are
+    not considered as feasible solutions.
+
+    After convergence, the optimal values of the best design and its operation are set in the pyomo model
+    (esM.pyM) and processed like in esM.optimize. The lower bound, upper bound and the gap are stored in
+    esM.lowerBound, esM.upperBound and esM.gap.
+
+    .. note::
+        The decomposition requires a linear objective function and continuous operation variables (i.e. no
+        quadratic investment costs, no dynamic or part load conversion components with binary operation
+        variables).
+
+    **Required arguments:**
+
+    :param esM: energy system model which is optimized.
+    :type esM: EnergySystemModel instance from the FINE package
+
+    **Default arguments:**
+
+    :param relaxIsBuiltBinary: states if the binary design variables should be relaxed.
+        |br| * the default value is False
+    :type relaxIsBuiltBinary: boolean
+
+    :param timeSeriesAggregation: states if the optimization of the energy system model should be done with
+
+        (a) the full time series (False) or
+        (b) clustered time series data (True).
+
+        |br| * the default value is False
+    :type timeSeriesAggregation: boolean
+
+    :param relevanceThreshold: Force operation parameters to be 0 if values are below the relevance threshold.
+        |br| * the default value is None
+    :type relevanceThreshold: float (>=0) or None
+
+    :param gap: relative gap between the lower and the upper bound at which the iterations are stopped.
+        |br| * the default value is 1e-4
+    :type gap: strictly positive float
+
+    :param maxIterations: maximum number of iterations.
+        |br| * the default value is 100
+    :type maxIterations: strictly positive integer
+
+    :param processes: number of worker processes in which the subproblems are solved. If 1, the subproblems are
+        solved in the main process.
+        |br| * the default value is 1
+    :type processes: strictly positive integer
+
+    :param penalty: costs per unit by which the fixed design values are violated in the subproblems. If None,
+        1e3 times the largest absolute objective function coefficient is used.
+        |br| * the default value is None
+    :type penalty: strictly positive float or None
+
+    :param threads: number of computational threads used for solving the master problem and the subproblems
+        (solver dependent input) if gurobi is used as the solver.
+        |br| * the default value is 3
+    :type threads: positive integer
+
+    :param solver: specifies which solver should solve the master problem and the subproblems.
+        |br| * the default value is 'gurobi'
+    :type solver: string
+
+    :param optimizationSpecs: specifies parameters for the optimization solver (see the respective solver
+        documentation for more information). Example: 'LogToConsole=1 OptimalityTol=1e-6'
+        |br| * the default value is an empty string ('')
+    :type optimizationSpecs: string
+    """
+    utils.isStrictlyPositiveNumber(gap)
+    utils.isStrictlyPositiveInt(maxIterations)
+    utils.isStrictlyPositiveInt(processes)
+    if penalty is not None:
+        utils.isStrictlyPositiveNumber(penalty)
+    if not opt.SolverFactory(solver).available():
+        raise TypeError("The solver " + str(solver) + " is not available.")
+    solverSpecs = {
+        "solver": solver,
+        "threads": threads,
+        "optimizationSpecs": optimizationSpecs,
+    }
+
+    timeStart = time.time()
+    esM.declareOptimizationProblem(
+        timeSeriesAggregation=timeSeriesAggregation,
+        relaxIsBuiltBinary=relaxIsBuiltBinary,
+        relevanceThreshold=relevanceThreshold,
+    )
+    pyM = esM.pyM
+
+    ####################################################################################################################
+    #                                Split the model into master and subproblems                                      #
+    ####################################################################################################################
+
+    (
+        variables,
+        constraints,
+        rows,
+        rowLower,
+        rowUpper,
+        lowerBounds,
+        upperBounds,
+        objective,
+        objectiveConstant,
+    ) = _getLinearProblem(pyM, "Benders decomposition")
+    numberOfColumns = len(variables)
+    isDesign, investmentPeriods = _getVariableTypes(pyM, variables)
+    for j in np.flatnonzero(~isDesign):
+        if not variables[j].is_continuous():
+            raise ValueError(
+                "The Benders decomposition requires continuous operation variables ("
+                + variables[j].name
+                + ")."
+            )
+    if penalty is None:
+        penalty = 1e3 * max(np.abs(objective).max(initial=0), 1)
+
+    # The constraints which are linked by operation variables form independent blocks (connected components).
+    # The blocks are gathered in one subproblem per investment period (blocks which couple investment periods are
+    # assigned to one of them, blocks without time-indexed operation variables form an additional subproblem).
+    designColumns = np.flatnonzero(isDesign)
+    operationColumns = np.flatnonzero(~isDesign)
+    operationRows = rows[:, operationColumns]
+    numberOfRows = rows.shape[0]
+    adjacency = sparse.bmat(
+        [[None, operationRows], [operationRows.T, None]], format="csr"
+    )
+    numberOfBlocks, labels = csgraph.connected_components(adjacency, directed=False)
+    rowLabels, columnLabels = labels[:numberOfRows], labels[numberOfRows:]
+    isMasterRow = np.diff(operationRows.indptr) == 0
+    blockInvestmentPeriods = np.full(numberOfBlocks, -1)
+    np.maximum.at(
+        blockInvestmentPeriods, columnLabels, investmentPeriods[operationColumns]
+    )
+    rowGroups = blockInvestmentPeriods[rowLabels]
+    columnGroups = blockInvestmentPeriods[columnLabels]
+
+    subproblems = []
+    for group in np.unique(columnGroups):
+        subRows = np.flatnonzero((rowGroups == group) & ~isMasterRow)
+        subOperationColumns = operationColumns[columnGroups == group]
+        subDesignColumns = designColumns[
+            np.unique(rows[subRows][:, designColumns].indices)
+        ]
+        subColumns = np.concatenate([subOperationColumns, subDesignColumns])
+        subproblems.append(
+            {
+                "rows": subRows,
+                "columns": subColumns,
+                "designColumns": subDesignColumns,
+                "A": rows[subRows][:, subColumns].tocsr(),
+                "rowLower": rowLower[subRows],
+                "rowUpper": rowUpper[subRows],
+                "lb": np.concatenate(
+                    [
+                        lowerBounds[subOperationColumns],
+                        np.full(len(subDesignColumns), -np.inf),
+                    ]
+                ),
+                "ub": np.concatenate(
+                    [
+                        upperBounds[subOperationColumns],
+                        np.full(len(subDesignColumns), np.inf),
+                    ]
+                ),
+                "designLb": lowerBounds[subDesignColumns],
+                "designUb": upperBounds[subDesignColumns],
+                "c": np.concatenate(
+                    [objective[subOperationColumns], np.zeros(len(subDesignColumns))]
+                ),
+                "penalty": penalty,
+            }
+        )
+    utils.output(
+        "Benders decomposition: "
+        + str(len(designColumns))
+        + " design variables, "
+        + str(len(subproblems))
+        + " subproblems",
+        esM.verbose,
+        0,
+    )
+    esM.solverSpecs["buildtime"] = time.time() - timeStart
+
+    ####################################################################################################################
+    #                                           Benders iterations                                                    #
+    ####################################################################################################################
+
+    timeStart = time.time()
+    if processes > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_initializeWorker,
+            initargs=(subproblems, solverSpecs),
+        )
+
+        def solveSubproblems(xHat, relax=False):
+            return list(
+                executor.map(
+                    _solveSubproblem,
+                    range(len(subproblems)),
+                    [xHat[sub["designColumns"]] for sub in subproblems],
+                    [relax] * len(subproblems),
+                )
+            )
+
+    else:
+        executor = None
+        _initializeWorker(subproblems, solverSpecs)
+
+        def solveSubproblems(xHat, relax=False):
+            return [
+                _solveSubproblem(k, xHat[sub["designColumns"]], relax)
+                for k, sub in enumerate(subproblems)
+            ]
+
+    try:
+        # Lower bounds of the subproblems for arbitrary designs (design values only limited by their bounds)
+        xHat = np.zeros(numberOfColumns)
+        subproblemLowerBounds = [
+            result["objective"] for result in solveSubproblems(xHat, relax=True)
+        ]
+
+        # Set up the master problem
+        master = pyomo.ConcreteModel()
+        master.x = pyomo.Var(range(len(designColumns)))
+        for i, j in enumerate(designColumns):
+            var = variables[j]
+            master.x[i].domain = var.domain
+            master.x[i].setlb(var.lb)
+            master.x[i].setub(var.ub)
+        master.eta = pyomo.Var(range(len(subproblems)))
+        for k, bound in enumerate(subproblemLowerBounds):
+            master.eta[k].setlb(bound)
+        designPosition = {j: i for i, j in enumerate(designColumns)}
+        master.rows = pyomo.ConstraintList()
+        for i in np.flatnonzero(isMasterRow):
+            start, end = rows.indptr[i], rows.indptr[i + 1]
+            body = pyomo.quicksum(
+                coef * master.x[designPosition[j]]
+                for coef, j in zip(rows.data[start:end], rows.indices[start:end])
+            )
+            _addConstraint(master.rows, body, rowLower[i], rowUpper[i])
+        master.cuts = pyomo.ConstraintList()
+        master.obj = pyomo.Objective(
+            expr=pyomo.quicksum(
+                objective[j] * master.x[i] for i, j in enumerate(designColumns)
+            )
+            + pyomo.quicksum(master.eta[k] for k in range(len(subproblems)))
+            + objectiveConstant
+        )
+
+        lowerBound, upperBound, incumbent, esM.bendersIterations = (
+            -np.inf,
+            np.inf,
+            None,
+            [],
+        )
+        for iteration in range(maxIterations):
+            _solve(master, solverSpecs)
+            lowerBound = pyomo.value(master.obj)
+            xHat = np.zeros(numberOfColumns)
+            xHat[designColumns] = [pyomo.value(master.x[i]) for i in master.x]
+
+            results = solveSubproblems(xHat)
+            isFeasible = all(result["violation"] <= 1e-6 for result in results)
+            designCosts = objective[designColumns] @ xHat[designColumns]
+            operationCosts = sum(result["objective"] for result in results)
+            if (
+                isFeasible
+                and designCosts + operationCosts + objectiveConstant < upperBound
+            ):
+                upperBound = designCosts + operationCosts + objectiveConstant
+                incumbent = (xHat, results)
+
+            esM.bendersIterations.append((lowerBound, upperBound))
+            utils.output(
+                "Benders iteration "
+                + str(iteration + 1)
+                + ": lower bound "
+                + str(lowerBound)
+                + ", upper bound "
+                + str(upperBound),
+                esM.verbose,
+                0,
+            )
+            if incumbent is not None and upperBound - lowerBound <= gap * max(
+                abs(upperBound), 1e-10
+            ):
+                break
+
+            # Add the optimality cuts
+            for k, (sub, result) in enumerate(zip(subproblems, results)):
+                positions = [designPosition[j] for j in sub["designColumns"]]
+                master.cuts.add(
+                    master.eta[k]
+                    >= result["objective"]
+                    + pyomo.quicksum(
+                        dual * (master.x[i] - xHat[j])
+                        for dual, i, j in zip(
+                            result["designDuals"], positions, sub["designColumns"]
+                        )
+                    )
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    esM.solverSpecs["solvetime"] = time.time() - timeStart
+    esM.solverSpecs["runtime"] = (
+        esM.solverSpecs["buildtime"] + esM.solverSpecs["solvetime"]
+    )
+    esM.lowerBound, esM.upperBound = lowerBound, upperBound
+    if incumbent is None:
+        esM.gap = None
+        utils.output(
+            "No feasible design was found. No output is generated.", esM.verbose, 0
+        )
+        return
+    esM.gap = (upperBound - lowerBound) / max(abs(upperBound), 1e-10)
+
+    # Set the values of the best design and its operation in the pyomo model and process the results
+    xHat, results = incumbent
+    for j in designColumns:
+        value = xHat[j]
+        if not variables[j].is_continuous():
+            value = round(value)
+        variables[j].set_value(value, skip_validation=True)
+    for sub, result in zip(subproblems, results):
+        numberOfOperationColumns = len(sub["columns"]) - len(sub["designColumns"])
+        for j, value in zip(
+            sub["columns"][:numberOfOperationColumns],
+            result["values"][:numberOfOperationColumns],
+        ):
+            variables[j].set_value(value, skip_validation=True)
+        for i, dual in zip(sub["rows"], result["rowDuals"]):
+            pyM.dual[constraints[i]] = dual
+    esM.setOptimalValues()
+
+
+def _getLinearProblem(pyM, methodName):
+    # Get the linear representation rowLower <= rows * x <= rowUpper, lowerBounds <= x <= upperBounds of the active
+    # constraints and the objective function objective * x + objectiveConstant of a pyomo model
+    variables, columns = [], {}
+
+    def getColumns(repnVars):
+        cols = []
+        for var in repnVars:
+            if id(var) not in columns:
+                columns[id(var)] = len(variables)
+                variables.append(var)
+            cols.append(columns[id(var)])
+        return cols
+
+    constraints, rowIndptr, rowColumns, rowCoefs, rowLower, rowUpper = (
+        [],
+        [0],
+        [],
+        [],
+        [],
+        [],
+    )
+    for con in pyM.component_data_objects(pyomo.Constraint, active=True):
+        repn = generate_standard_repn(con.body, compute_values=True)
+        if not repn.is_linear():
+            raise ValueError(
+                "The " + methodName + " requires linear constraints (" + con.name + ")."
+            )
+        if not repn.linear_vars:
+            continue
+        constraints.append(con)
+        rowColumns.extend(getColumns(repn.linear_vars))
+        rowCoefs.extend(repn.linear_coefs)
+        rowIndptr.append(len(rowColumns))
+        lower, upper = pyomo.value(con.lower), pyomo.value(con.upper)
+        rowLower.append(-np.inf if lower is None else lower - repn.constant)
+        rowUpper.append(np.inf if upper is None else upper - repn.constant)
+
+    repn = generate_standard_repn(pyM.Obj.expr, compute_values=True)
+    if not repn.is_linear():
+        raise ValueError("The " + methodName + " requires a linear objective function.")
+    objectiveColumns = getColumns(repn.linear_vars)
+
+    objective = np.zeros(len(variables))
+    np.add.at(objective, objectiveColumns, repn.linear_coefs)
+    rows = sparse.csr_matrix(
+        (rowCoefs, rowColumns, rowIndptr), shape=(len(constraints), len(variables))
+    )
+    lowerBounds = np.array(
+        [-np.inf if var.lb is None else var.lb for var in variables], dtype=float
+    )
+    upperBounds = np.array(
+        [np.inf if var.ub is None else var.ub for var in variables], dtype=float
+    )
+    return (
+        variables,
+        constraints,
+        rows,
+        np.array(rowLower),
+        np.array(rowUpper),
+        lowerBounds,
+        upperBounds,
+        objective,
+        repn.constant,
+    )
+
+
+def _getVariableTypes(pyM, variables):
+    # Get the type of the variables (design or operation) and their investment period. The index of the design
+    # variables is (location, component, ip), the index of time-indexed operation variables (..., ip, period, time
+    # step). The investment period of other operation variables is set to -1.
+    timeSets = [pyM.timeSet, pyM.intraYearTimeSet, pyM.interTimeStepsSet]
+    isTimeIndexed = {}
+    isDesign = np.zeros(len(variables), dtype=bool)
+    investmentPeriods = np.full(len(variables), -1)
+    for j, var in enumerate(variables):
+        parent = var.parent_component()
+        if utils.isDesignVariable(parent):
+            isDesign[j] = True
+            investmentPeriods[j] = var.index()[-1]
+            continue
+        if parent.name not in isTimeIndexed:
+            isTimeIndexed[parent.name] = parent.is_indexed() and any(
+                s is ts for s in parent.index_set().subsets() for ts in timeSets
+            )
+        if isTimeIndexed[parent.name]:
+            investmentPeriods[j] = var.index()[-3]
+    return isDesign, investmentPeriods
+
+
+def _addConstraint(constraintList, body, lower, upper):
+    # Add a (ranged) linear constraint to a pyomo ConstraintList
+    if lower == upper:
+        constraintList.add(body == lower)
+    else:
+        constraintList.add(
+            (
+                None if np.isinf(lower) else lower,
+                body,
+                None if np.isinf(upper) else upper,
+            )
+        )
+
+
+def _solve(model, solverSpecs, warmstart=False):
+    # Solve a pyomo model and check if an optimal solution was found. A warm start from the current variable values
+    # is only passed to gurobi (as in esM.optimize).
+    optimizer = opt.SolverFactory(solverSpecs["solver"])
+    if solverSpecs["solver"] == "gurobi":
+        optimizer.set_options(
+            "Threads="
+            + str(solverSpecs["threads"])
+            + " "
+            + solverSpecs["optimizationSpecs"]
+        )
+        solverInfo = optimizer.solve(model, warmstart=warmstart)
+    else:
+        if solverSpecs["optimizationSpecs"]:
+            optimizer.set_options(solverSpecs["optimizationSpecs"])
+        solverInfo = optimizer.solve(model)
+    if solverInfo.solver.termination_condition != opt.TerminationCondition.optimal:
+        raise ValueError(
+            "The decomposition failed since a master problem or subproblem terminated with "
+            + str(solverInfo.solver.termination_condition)
+            + "."
+        )
+
+
+def _initializeWorker(subproblems, solverSpecs):
+    # Store the subproblem data in the worker process, the pyomo models are built on first use
+    global _workerData, _workerSolver
+    _workerSubproblems.clear()
+    _workerData, _workerSolver = subproblems, solverSpecs
+
+
+def _buildSubproblem(sub):
+    # Build the linear subproblem: min c*x + penalty * (sPlus + sMinus) s.t. rowLower <= A*x <= rowUpper and
+    # xDesign - sPlus + sMinus = xHat, where the xDesign are copies of the design variables of the subproblem
+    A = sub["A"]
+    numberOfDesignColumns = len(sub["designColumns"])
+    numberOfOperationColumns = A.shape[1] - numberOfDesignColumns
+    model = pyomo.ConcreteModel()
+    model.x = pyomo.Var(range(A.shape[1]))
+    for j in range(A.shape[1]):
+        model.x[j].setlb(None if np.isinf(sub["lb"][j]) else sub["lb"][j])
+        model.x[j].setub(None if np.isinf(sub["ub"][j]) else sub["ub"][j])
+    model.sPlus = pyomo.Var(range(numberOfDesignColumns), domain=pyomo.NonNegativeReals)
+    model.sMinus = pyomo.Var(
+        range(numberOfDesignColumns), domain=pyomo.NonNegativeReals
+    )
+    model.xHat = pyomo.Param(range(numberOfDesignColumns), mutable=True, initialize=0)
+    model.rows = pyomo.ConstraintList()
+    for i in range(A.shape[0]):
+        start, end = A.indptr[i], A.indptr[i + 1]
+        body = pyomo.quicksum(
+            coef * model.x[j]
+            for coef, j in zip(A.data[start:end], A.indices[start:end])
+        )
+        _addConstraint(model.rows, body, sub["rowLower"][i], sub["rowUpper"][i])
+    model.link = pyomo.Constraint(
+        range(numberOfDesignColumns),
+        rule=lambda m, d: m.x[numberOfOperationColumns + d] - m.sPlus[d] + m.sMinus[d]
+        == m.xHat[d],
+    )
+    model.obj = pyomo.Objective(
+        expr=pyomo.quicksum(sub["c"][j] * model.x[j] for j in np.flatnonzero(sub["c"]))
+        + sub["penalty"]
+        * pyomo.quicksum(
+            model.sPlus[d] + model.sMinus[d] for d in range(numberOfDesignColumns)
+        )
+    )
+    model.dual = pyomo.Suffix(direction=pyomo.Suffix.IMPORT)
+    return model
+
+
+def _solveSubproblem(k, xHat, relax=False):
+    # Solve subproblem k for the design values xHat. If relax is True, the design values are only limited by the
+    # bounds of the design variables (lower bound of the subproblem).
+    if k not in _workerSubproblems:
+        _workerSubproblems[k] = _buildSubproblem(_workerData[k])
+    sub, model = _workerData[k], _workerSubproblems[k]
+    numberOfOperationColumns = len(sub["columns"]) - len(sub["designColumns"])
+    for d, value in enumerate(xHat):
+        model.xHat[d] = value
+        x = model.x[numberOfOperationColumns + d]
+        if relax:
+            model.link[d].deactivate()
+            x.setlb(None if np.isinf(sub["designLb"][d]) else sub["designLb"][d])
+            x.setub(None if np.isinf(sub["designUb"][d]) else sub["designUb"][d])
+        else:
+            model.link[d].activate()
+            x.setlb(None)
+            x.setub(None)
+    _solve(model, _workerSolver)
+    return {
+        "objective": pyomo.value(model.obj),
+        "values": np.array([model.x[j].value or 0 for j in model.x]),
+        "designDuals": np.array([model.dual.get(model.link[d], 0) for d in model.link]),
+        "rowDuals": np.array([model.dual.get(con, 0) for con in model.rows.values()]),
+        "violation": sum(
+            (model.sPlus[d].value or 0) + (model.sMinus[d].value or 0)
+            for d in model.link
+        ),
+    }
@@ -0,0 +1,474 @@
+import concurrent.futures
+import time
+
+import numpy as np
+import pyomo.environ as pyomo
+import pyomo.opt as opt
+from scipy import sparse
+from scipy.sparse import csgraph
+
+from fine import utils
+from fine.expansionModules.optimizeBenders import (
+    _addConstraint,
+    _getLinearProblem,
+    _getVariableTypes,
+    _solve,
+)
+
+# Scenario subproblems of the worker process (dict, scenario index: pyomo ConcreteModel) and solver settings
+_workerScenarios, _workerData, _workerSolver = {}, [], {}
+
+
+def optimizeProgressiveHedging(
+    esM,
+    relaxIsBuiltBinary=False,
+    timeSeriesAggregation=False,
+    relevanceThreshold=None,
+    rho=None,
+    tolerance=1e-4,
+    maxIterations=100,
+    processes=1,
+    linearizeProximalTerms=False,
+    threads=3,
+    solver="gurobi",
+    optimizationSpecs="",
+):
+    """
+    Optimize a stochastic energy system model (stochasticModel=True) with progressive hedging. The extensive form
+    of the stochastic model is split into one subproblem per scenario (investment period). Variables which are part
+    of several scenario subproblems (the shared design decisions) are copied to each of these subproblems and are
+    driven to a common consensus value: in each iteration, the scenario subproblems are solved (in parallel worker
+    processes if specified), the consensus values are set to the average of the scenario values and the deviations
+    from the consensus are penalized in the next iteration by the updated multipliers W and the proximal term
+    rho / 2 * (x - consensus)^2. Each iteration is warm-started from the solution of the previous iteration.
+
+    The iterations are stopped if the largest (relative) deviation of a scenario value from the consensus value
+    falls below the tolerance. Finally, the consensus values of the shared variables are fixed (integer variables
+    are rounded) and the scenario subproblems are solved again. The resulting solution is set in the pyomo model
+    (esM.pyM) and processed like in esM.optimize. The deviations of all iterations are stored in
+    esM.progressiveHedgingIterations.
+
+    .. note::
+        Progressive hedging requires a linear objective function and linear constraints. For models with integer
+        variables (e.g. binary design variables), the consensus is not guaranteed to be optimal.
+
+    **Required arguments:**
+
+    :param esM: stochastic energy system model which is optimized.
+    :type esM: EnergySystemModel instance from the FINE package
+
+    **Default arguments:**
+
+    :param relaxIsBuiltBinary: states if the binary design variables should be relaxed.
+        |br| * the default value is False
+    :type relaxIsBuiltBinary: boolean
+
+    :param timeSeriesAggregation: states if the optimization of the energy system model should be done with
+
+        (a) the full time series (False) or
+        (b) clustered time series data (True).
+
+        |br| * the default value is False
+    :type timeSeriesAggregation: boolean
+
+    :param relevanceThreshold: Force operation parameters to be 0 if values are below the relevance threshold.
+        |br| * the default value is None
+    :type relevanceThreshold: float (>=0) or None
+
+    :param rho: penalty factor of the proximal terms. If None, the penalty factor of each shared variable is set
+        to the absolute value of its cost coefficient in the objective function (variables without costs get the
+        average absolute cost coefficient of the objective function) divided by the mean absolute deviation of the
+        scenario values from the consensus value in the first iteration.
+        |br| * the default value is None
+    :type rho: strictly positive float or None
+
+    :param tolerance: largest deviation of a scenario value from the consensus value (relative to the consensus
+        value if its absolute value is larger than 1) at which the iterations are stopped.
+        |br| * the default value is 1e-4
+    :type tolerance: strictly positive float
+
+    :param maxIterations: maximum number of iterations.
+        |br| * the default value is 100
+    :type maxIterations: strictly positive integer
+
+    :param processes: number of worker processes in which the scenario subproblems are solved. If 1, the
+        subproblems are solved in the main process.
+        |br| * the default value is 1
+    :type processes: strictly positive integer
+
+    :param linearizeProximalTerms: states if the quadratic proximal terms are approximated by tangents, which are
+        added at the scenario values of each iteration. This keeps the subproblems linear for solvers which cannot
+        solve quadratic problems (e.g. glpk).
+        |br| * the default value is False
+    :type linearizeProximalTerms: boolean
+
+    :param threads: number of computational threads used for solving the scenario subproblems (solver dependent
+        input) if gurobi is used as the solver.
+        |br| * the default value is 3
+    :type threads: positive integer
+
+    :param solver: specifies which solver should solve the scenario subproblems.
+        |br| * the default value is 'gurobi'
+    :type solver: string
+
+    :param optimizationSpecs: specifies parameters for the optimization solver (see the respective solver
+        documentation for more information). Example: 'LogToConsole=1 OptimalityTol=1e-6'
+        |br| * the default value is an empty string ('')
+    :type optimizationSpecs: string
+    """
+    if not esM.stochasticModel:
+        raise ValueError(
+            "The progressive hedging requires a stochastic model (stochasticModel=True)."
+        )
+    if rho is not None:
+        utils.isStrictlyPositiveNumber(rho)
+    utils.isStrictlyPositiveNumber(tolerance)
+    utils.isStrictlyPositiveInt(maxIterations)
+    utils.isStrictlyPositiveInt(processes)
+    if not isinstance(linearizeProximalTerms, bool):
+        raise TypeError("linearizeProximalTerms must be a boolean.")
+    if not opt.SolverFactory(solver).available():
+        raise TypeError("The solver " + str(solver) + " is not available.")
+    solverSpecs = {
+        "solver": solver,
+        "threads": threads,
+        "optimizationSpecs": optimizationSpecs,
+    }
+
+    timeStart = time.time()
+    esM.declareOptimizationProblem(
+        timeSeriesAggregation=timeSeriesAggregation,
+        relaxIsBuiltBinary=relaxIsBuiltBinary,
+        relevanceThreshold=relevanceThreshold,
+    )
+    pyM = esM.pyM
+
+    ####################################################################################################################
+    #                                      Split the model into scenarios                                            #
+    ####################################################################################################################
+
+    (
+        variables,
+        constraints,
+        rows,
+        rowLower,
+        rowUpper,
+        lowerBounds,
+        upperBounds,
+        objective,
+        _,
+    ) = _getLinearProblem(pyM, "progressive hedging")
+    numberOfColumns = len(variables)
+    isDesign, investmentPeriods = _getVariableTypes(pyM, variables)
+
+    # The constraints which are linked by operation variables are assigned to the scenario (investment period) of
+    # their time-indexed operation variables. Constraints which only contain design variables (e.g. the equality of
+    # the capacities of all scenarios) are assigned to the latest scenario of their design variables.
+    operationColumns = np.flatnonzero(~isDesign)
+    operationRows = rows[:, operationColumns]
+    numberOfRows = rows.shape[0]
+    adjacency = sparse.bmat(
+        [[None, operationRows], [operationRows.T, None]], format="csr"
+    )
+    numberOfBlocks, labels = csgraph.connected_components(adjacency, directed=False)
+    blockScenarios = np.full(numberOfBlocks, -1)
+    np.maximum.at(
+        blockScenarios,
+        labels[numberOfRows:],
+        investmentPeriods[operationColumns],
+    )
+    rowScenarios = blockScenarios[labels[:numberOfRows]]
+    if numberOfRows > 0:
+        rowDesignScenarios = np.maximum.reduceat(
+            np.where(isDesign, investmentPeriods, -1)[rows.indices], rows.indptr[:-1]
+        )
+        rowScenarios = np.where(rowScenarios >= 0, rowScenarios, rowDesignScenarios)
+    rowScenarios = np.maximum(rowScenarios, 0)
+
+    # Each scenario subproblem contains the variables of its constraints. Variables which are not part of any
+    # constraint are assigned to their own investment period.
+    scenarios = esM.investmentPeriods
+    incidence = (
+        sparse.csr_matrix(
+            (np.ones(numberOfRows), (rowScenarios, np.arange(numberOfRows))),
+            shape=(len(scenarios), numberOfRows),
+        )
+        @ abs(rows)
+    ).tolil()
+    for j in np.flatnonzero(np.diff(rows.tocsc().indptr) == 0):
+        incidence[max(investmentPeriods[j], 0), j] = 1
+    incidence = incidence.tocsr()
+    numberOfCopies = np.diff(incidence.tocsc().indptr)
+    isShared = numberOfCopies > 1
+    sharedColumns = np.flatnonzero(isShared)
+    sharedPosition = np.full(numberOfColumns, -1)
+    sharedPosition[sharedColumns] = np.arange(len(sharedColumns))
+
+    subproblems = []
+    for s in range(len(scenarios)):
+        subRows = np.flatnonzero(rowScenarios == s)
+        subColumns = incidence[s].indices
+        subShared = np.flatnonzero(isShared[subColumns])
+        subproblems.append(
+            {
+                "rows": subRows,
+                "columns": subColumns,
+                "A": rows[subRows][:, subColumns].tocsr(),
+                "rowLower": rowLower[subRows],
+                "rowUpper": rowUpper[subRows],
+                "lb": lowerBounds[subColumns],
+                "ub": upperBounds[subColumns],
+                "isInteger": np.array(
+                    [not variables[j].is_continuous() for j in subColumns], dtype=bool
+                ),
+                # the costs of shared variables are divided among their copies
+                "c": objective[subColumns] / numberOfCopies[subColumns],
+                "sharedLocal": subShared,
+                "sharedGlobal": sharedPosition[subColumns[subShared]],
+                "linearizeProximalTerms": linearizeProximalTerms,
+            }
+        )
+    utils.output(
+        "Progressive hedging: "
+        + str(len(subproblems))
+        + " scenarios, "
+        + str(len(sharedColumns))
+        + " shared variables",
+        esM.verbose,
+        0,
+    )
+    esM.solverSpecs["buildtime"] = time.time() - timeStart
+
+    ####################################################################################################################
+    #                                      Progressive hedging iterations                                           #
+    ####################################################################################################################
+
+    timeStart = time.time()
+    if processes > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_initializeWorker,
+            initargs=(subproblems, solverSpecs),
+        )
+
+        def solveScenarios(*args):
+            return list(executor.map(_solveScenario, range(len(subproblems)), *args))
+
+    else:
+        executor = None
+        _initializeWorker(subproblems, solverSpecs)
+
+        def solveScenarios(*args):
+            return list(map(_solveScenario, range(len(subproblems)), *args))
+
+
+    try:
+        W = [np.zeros(len(sub["sharedLocal"])) for sub in subproblems]
+        noPenalties = [np.zeros(len(sub["sharedLocal"])) for sub in subproblems]
+        consensus = [np.zeros(len(sub["sharedLocal"])) for sub in subproblems]
+        tangents = [[] for sub in subproblems]
+        values = [None] * len(subproblems)
+        xBar = np.zeros(len(sharedColumns))
+        # In the first iteration, the scenario subproblems are solved without penalties
+        rhoValues = np.zeros(len(sharedColumns))
+        esM.progressiveHedgingIterations = []
+        for iteration in range(maxIterations):
+            results = solveScenarios(
+                W,
+                consensus,
+                [rhoValues[sub["sharedGlobal"]] for sub in subproblems],
+                tangents,
+                values,
+                [None] * len(subproblems),
+            )
+            values = [result["values"] for result in results]
+
+            # Update the consensus values and the multipliers
+            xBar = np.zeros(len(sharedColumns))
+            for sub, result in zip(subproblems, results):
+                np.add.at(
+                    xBar, sub["sharedGlobal"], result["values"][sub["sharedLocal"]]
+                )
+            xBar /= numberOfCopies[sharedColumns]
+            offsets = [
+                result["values"][sub["sharedLocal"]] - xBar[sub["sharedGlobal"]]
+                for sub, result in zip(subproblems, results)
+            ]
+            if iteration == 0:
+                rhoValues = _getPenaltyFactors(
+                    rho, objective, sharedColumns, subproblems, offsets
+                )
+            deviation = 0
+            for k, sub in enumerate(subproblems):
+                consensus[k] = xBar[sub["sharedGlobal"]]
+                W[k] = W[k] + rhoValues[sub["sharedGlobal"]] * offsets[k]
+                if linearizeProximalTerms:
+                    # Tangents at the deviations of this iteration and, to keep the subproblems bounded, at twice
+                    # the minimizer -W/rho of the penalty terms
+                    bound = np.maximum(
+                        np.abs(offsets[k]),
+                        2 * np.abs(W[k]) / rhoValues[sub["sharedGlobal"]],
+                    )
+                    tangents[k] = tangents[k] + [offsets[k], -bound, bound]
+                deviation = max(
+                    deviation,
+                    np.max(
+                        np.abs(offsets[k]) / np.maximum(np.abs(consensus[k]), 1),
+                        initial=0,
+                    ),
+                )
+
+            esM.progressiveHedgingIterations.append(deviation)
+            utils.output(
+                "Progressive hedging iteration "
+                + str(iteration + 1)
+                + ": largest deviation from the consensus "
+                + str(deviation),
+                esM.verbose,
+                0,
+            )
+            if deviation <= tolerance:
+                break
+
+        # Fix the shared variables to their (rounded) consensus values and solve the scenario subproblems again
+        isSharedInteger = np.array(
+            [not variables[j].is_continuous() for j in sharedColumns], dtype=bool
+        )
+        xBar[isSharedInteger] = np.round(xBar[isSharedInteger])
+        results = solveScenarios(
+            noPenalties,
+            consensus,
+            noPenalties,
+            tangents,
+            values,
+            [xBar[sub["sharedGlobal"]] for sub in subproblems],
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    esM.solverSpecs["solvetime"] = time.time() - timeStart
+    esM.solverSpecs["runtime"] = (
+        esM.solverSpecs["buildtime"] + esM.solverSpecs["solvetime"]
+    )
+
+    # Set the values of the solution in the pyomo model and process the results
+    for sub, result in zip(subproblems, results):
+        for j, value in zip(sub["columns"], result["values"]):
+            variables[j].set_value(value, skip_validation=True)
+        for i, dual in zip(sub["rows"], result["rowDuals"]):
+            pyM.dual[constraints[i]] = dual
+    for j, value in zip(sharedColumns, xBar):
+        variables[j].set_value(value, skip_validation=True)
+    esM.setOptimalValues()
+
+
+def _getPenaltyFactors(rho, objective, sharedColumns, subproblems, offsets):
+    # Get the penalty factors of the shared variables. If rho is None, the penalty factors are set to the absolute
+    # cost coefficients (or the average absolute cost coefficient for variables without costs) divided by the mean
+    # absolute deviation from the consensus in the first iteration (if the scenario values deviate).
+    if rho is not None:
+        return np.full(len(sharedColumns), float(rho))
+    costs = np.abs(objective)
+    averageCosts = costs[costs > 0].mean() if (costs > 0).any() else 1
+    costs = np.where(costs[sharedColumns] > 0, costs[sharedColumns], averageCosts)
+    deviations, numberOfCopies = np.zeros(len(sharedColumns)), np.zeros(
+        len(sharedColumns)
+    )
+    for sub, subOffsets in zip(subproblems, offsets):
+        np.add.at(deviations, sub["sharedGlobal"], np.abs(subOffsets))
+        np.add.at(numberOfCopies, sub["sharedGlobal"], 1)
+    deviations /= numberOfCopies
+    return costs / np.where(deviations > 0, deviations, 1)
+
+
+def _initializeWorker(subproblems, solverSpecs):
+    # Store the scenario data in the worker process, the pyomo models are built on first use
+    global _workerData, _workerSolver
+    _workerScenarios.clear()
+    _workerData, _workerSolver = subproblems, solverSpecs
+
+
+def _buildScenario(sub):
+    # Build the scenario subproblem: min c*x + W*xShared + rho/2 * (xShared - consensus)^2 s.t.
+    # rowLower <= A*x <= rowUpper. If the proximal terms are linearized, (xShared - consensus)^2 is replaced by
+    # auxiliary variables which are bounded from below by the tangents 2*a*(xShared - consensus) - a^2.
+    A = sub["A"]
+    numberOfShared = len(sub["sharedLocal"])
+    model = pyomo.ConcreteModel()
+    model.x = pyomo.Var(range(A.shape[1]))
+    for j in range(A.shape[1]):
+        if sub["isInteger"][j]:
+            model.x[j].domain = pyomo.Integers
+        model.x[j].setlb(None if np.isinf(sub["lb"][j]) else sub["lb"][j])
+        model.x[j].setub(None if np.isinf(sub["ub"][j]) else sub["ub"][j])
+    model.W = pyomo.Param(range(numberOfShared), mutable=True, initialize=0)
+    model.consensus = pyomo.Param(range(numberOfShared), mutable=True, initialize=0)
+    model.rho = pyomo.Param(range(numberOfShared), mutable=True, initialize=0)
+    model.rows = pyomo.ConstraintList()
+    for i in range(A.shape[0]):
+        start, end = A.indptr[i], A.indptr[i + 1]
+        body = pyomo.quicksum(
+            coef * model.x[j]
+            for coef, j in zip(A.data[start:end], A.indices[start:end])
+        )
+        _addConstraint(model.rows, body, sub["rowLower"][i], sub["rowUpper"][i])
+    shared = [model.x[j] for j in sub["sharedLocal"]]
+    if sub["linearizeProximalTerms"]:
+        model.proximal = pyomo.Var(range(numberOfShared), domain=pyomo.NonNegativeReals)
+        model.tangents = pyomo.ConstraintList()
+        proximalTerms = [model.proximal[d] for d in range(numberOfShared)]
+    else:
+        proximalTerms = [
+            (shared[d] - model.consensus[d]) ** 2 for d in range(numberOfShared)
+        ]
+    model.obj = pyomo.Objective(
+        expr=pyomo.quicksum(sub["c"][j] * model.x[j] for j in np.flatnonzero(sub["c"]))
+        + pyomo.quicksum(model.W[d] * shared[d] for d in range(numberOfShared))
+        + pyomo.quicksum(
+            model.rho[d] / 2 * proximalTerms[d] for d in range(numberOfShared)
+        )
+    )
+    if not sub["isInteger"].any():
+        model.dual = pyomo.Suffix(direction=pyomo.Suffix.IMPORT)
+    return model
+
+
+def _solveScenario(k, W, consensus, rho, tangents, values, fixedValues):
+    # Solve scenario subproblem k for the multipliers W, the consensus values and the penalty factors rho. The
+    # variables are initialized with the values of the previous iteration (warm start). If fixedValues is not None,
+    # the shared variables are fixed to these values.
+    if k not in _workerScenarios:
+        _workerScenarios[k] = _buildScenario(_workerData[k])
+    sub, model = _workerData[k], _workerScenarios[k]
+    shared = [model.x[j] for j in sub["sharedLocal"]]
+    for d in range(len(shared)):
+        model.W[d] = W[d]
+        model.consensus[d] = consensus[d]
+        model.rho[d] = rho[d]
+    if sub["linearizeProximalTerms"]:
+        # Add the tangents of the previous iterations which are not yet part of the model
+        for offsets in tangents[len(model.tangents) // max(len(shared), 1) :]:
+            for d, a in enumerate(offsets):
+                model.tangents.add(
+                    model.proximal[d] >= 2 * a * (shared[d] - model.consensus[d]) - a**2
+                )
+    if values is not None:
+        for j, value in enumerate(values):
+            model.x[j].set_value(value, skip_validation=True)
+    if fixedValues is not None:
+        for var, value in zip(shared, fixedValues):
+            var.fix(value)
+    try:
+        _solve(model, _workerSolver, warmstart=values is not None)
+    finally:
+        for var in shared:
+            var.unfix()
+    return {
+        "values": np.array([model.x[j].value or 0 for j in model.x]),
+        "rowDuals": np.array(
+            [model.dual.get(con, 0) for con in model.rows.values()]
+            if hasattr(model, "dual")
+            else []
+        ),
+    }
@@ -0,0 +1,318 @@
+import logging
+import multiprocessing
+import os
+import queue
+import shutil
+import signal
+import tempfile
+import time
+
+import pandas as pd
+import pyomo.opt as opt
+from pyomo.common.errors import ApplicationError
+from pyomo.opt.solver import SystemCallSolver
+
+from fine import utils
+
+logger_portfolio = logging.getLogger("solver_portfolio")
+
+# Names of the solver options which limit the number of threads and the solve time
+_threadsOptions = {"gurobi": "Threads", "cbc": "threads", "cplex": "threads"}
+_timeLimitOptions = {
+    "gurobi": "TimeLimit",
+    "cbc": "sec",
+    "glpk": "tmlim",
+    "cplex": "timelimit",
+}
+
+
+def optimizeSolverPortfolio(
+    esM,
+    portfolio,
+    declaresOptimizationProblem=True,
+    relaxIsBuiltBinary=False,
+    timeSeriesAggregation=False,
+    relevanceThreshold=None,
+    threads=3,
+    timeLimit=None,
+):
+    """
+    Optimize the specified energy system with a portfolio of solvers and solver settings which race against each
+    other. The optimization problem is written once to an LP file and solved concurrently by one solver process per
+    portfolio entry. At most as many solver processes as threads run at the same time, the remaining portfolio entries
+    are started (in the order of the portfolio) when a solver process finishes without an optimal solution. The result of the first solver which finds an optimal solution is kept and the other solver
+    processes are terminated. If no solver finds an optimal solution (e.g. if all solvers reach the time limit),
+    the best feasible solution is kept. The solution is loaded into the pyomo model (esM.pyM) and processed like
+    in esM.optimize. The termination condition, objective value and solve time of each portfolio entry are
+    stored in esM.solverPortfolioResults.
+
+    .. note::
+        Only solvers with a file interface (e.g. gurobi, cplex, glpk, cbc) can be part of the portfolio. The solver
+        processes of the terminated portfolio entries are stopped as a process group, which is not supported on
+        Windows (where only the worker processes are terminated).
+
+    **Required arguments:**
+
+    :param esM: energy system model which is optimized.
+    :type esM: EnergySystemModel instance from the FINE package
+
+    :param portfolio: solvers and solver settings which race against each other. Each entry is either the name of
+        a solver or a tuple with the name of a solver and the optimizationSpecs of the solver (see esM.optimize).
+        Example: ['glpk', ('cbc', 'presolve=on'), ('cbc', 'presolve=off')]
+    :type portfolio: list of strings or tuples (string, string)
+
+    **Default arguments:**
+
+    :param declaresOptimizationProblem: states if the optimization problem should be declared (True) or if a
+        previously declared pyomo ConcreteModel instance is used (False).
+        |br| * the default value is True
+    :type declaresOptimizationProblem: boolean
+
+    :param relaxIsBuiltBinary: states if the optimization problem should be solved as a relaxed LP to get the lower
+        bound of the problem.
+        |br| * the default value is False
+    :type relaxIsBuiltBinary: boolean
+
+    :param timeSeriesAggregation: states if the optimization of the energy system model should be done with
+        (a) the full time series (False) or (b) clustered time series data (True).
+        |br| * the default value is False
+    :type timeSeriesAggregation: boolean
+
+    :param relevanceThreshold: Force operation parameters to be 0 if values are below the relevance threshold.
+        |br| * the default value is None
+    :type relevanceThreshold: float (>=0) or None
+
+    :param threads: number of computational threads which are shared by the portfolio entries. It limits the
+        number of solver processes which run at the same time and each multi-threaded solver of the portfolio gets an
+        equal share of the threads.
+        |br| * the default value is 3
+    :type threads: strictly positive integer
+
+    :param timeLimit: if not specified as None, indicates the maximum solve time of each solver of the portfolio in
+        seconds. If no solver finds an optimal solution within the time limit, the best feasible solution is kept.
+        |br| * the default value is None
+    :type timeLimit: strictly positive integer or None
+    """
+    # Check the portfolio
+    if not isinstance(portfolio, list) or len(portfolio) == 0:
+        raise TypeError("The portfolio has to be a non-empty list.")
+    entries = []
+    for entry in portfolio:
+        solver, optimizationSpecs = (entry, "") if isinstance(entry, str) else entry
+        if not isinstance(solver, str) or not isinstance(optimizationSpecs, str):
+            raise TypeError(
+                "The entries of the portfolio have to be solver names or tuples of a solver name and the"
+                " optimizationSpecs of the solver."
+            )
+        optimizer = opt.SolverFactory(solver)
+        if not isinstance(optimizer, SystemCallSolver):
+            raise TypeError(
+                "The solver "
+                + solver
+                + " does not have a file interface and cannot be part of a portfolio."
+            )
+        if not optimizer.available(exception_flag=False):
+            raise ValueError("The solver " + solver + " is not available.")
+        entries.append((solver, optimizationSpecs))
+    utils.isStrictlyPositiveInt(threads)
+    if timeLimit is not None:
+        utils.isStrictlyPositiveNumber(timeLimit)
+
+    # Declare the optimization problem
+    if declaresOptimizationProblem:
+        esM.declareOptimizationProblem(
+            timeSeriesAggregation=timeSeriesAggregation,
+            relaxIsBuiltBinary=relaxIsBuiltBinary,
+            relevanceThreshold=relevanceThreshold,
+        )
+    elif esM.pyM is None:
+        raise TypeError(
+            "The optimization problem is not declared yet. Set the argument declaresOptimization"
+            " problem to True or call the declareOptimizationProblem function first."
+        )
+    pyM = esM.pyM
+
+    timeStart = time.time()
+    directory, processes = tempfile.mkdtemp(), []
+    try:
+        # Write the optimization problem once, the symbol map translates the solver results to the pyomo model
+        problemFile, symbolMapId = pyM.write(
+            os.path.join(directory, "problem.lp"),
+            io_options={"symbolic_solver_labels": False},
+        )
+
+        # Start the solver processes of the portfolio entries such that at most as many solvers as threads run at
+        # the same time
+        concurrentSolvers = min(threads, len(entries))
+        threadsPerSolver = threads // concurrentSolvers
+        results = multiprocessing.Queue()
+
+        def startSolver(k):
+            solver, optimizationSpecs = entries[k]
+            options = {}
+            if solver in _threadsOptions:
+                options[_threadsOptions[solver]] = threadsPerSolver
+            if timeLimit is not None and solver in _timeLimitOptions:
+                options[_timeLimitOptions[solver]] = timeLimit
+            process = multiprocessing.Process(
+                target=_solveProblemFile,
+                args=(k, problemFile, solver, optimizationSpecs, options, results),
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
+
+        for k in range(concurrentSolvers):
+            startSolver(k)
+        utils.output(
+            "Started " + str(concurrentSolvers) + " solver processes.", esM.verbose, 0
+        )
+
+        # Collect the results until the first optimal solution is found or all solvers are finished
+        solverResults, solveTimes = {}, {}
+        winner = None
+        while winner is None and len(solverResults) < len(entries):
+            try:
+                k, result = results.get(timeout=1)
+            except queue.Empty:
+                # The worker processes put their result before they exit, a worker process which ended with an
+                # error code (e.g. as it ran out of memory) does not deliver a result
+                for k, process in enumerate(processes):
+                    if k not in solverResults and process.exitcode not in (None, 0):
+                        solverResults[k], solveTimes[k] = None, None
+            else:
+                solverResults[k], solveTimes[k] = result, time.time() - timeStart
+                if (
+                    result is not None
+                    and result.solver.termination_condition
+                    == opt.TerminationCondition.optimal
+                ):
+                    winner = k
+            # Start the next portfolio entries for the finished solvers
+            while (
+                winner is None
+                and len(processes) < len(entries)
+                and len(processes) - len(solverResults) < concurrentSolvers
+            ):
+                startSolver(len(processes))
+    finally:
+        for process in processes:
+            _terminate(process)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    # Keep the best feasible solution if no solver found an optimal solution
+    objectiveValues = {
+        k: _getObjectiveValue(result) for k, result in solverResults.items()
+    }
+    if winner is None:
+        feasible = [k for k, value in objectiveValues.items() if value is not None]
+        if len(feasible) == 0:
+            pyM.solutions.delete_symbol_map(symbolMapId)
+            raise ValueError(
+                "None of the solvers of the portfolio found a feasible solution."
+            )
+        winner = min(feasible, key=lambda k: objectiveValues[k])
+
+    esM.solverPortfolioResults = pd.DataFrame(
+        [
+            {
+                "solver": solver,
+                "optimizationSpecs": optimizationSpecs,
+                "terminationCondition": (
+                    str(solverResults[k].solver.termination_condition)
+                    if solverResults.get(k) is not None
+                    else None
+                ),
+                "objectiveValue": objectiveValues.get(k),
+                "solvetime": solveTimes.get(k),
+                "selected": k == winner,
+            }
+            for k, (solver, optimizationSpecs) in enumerate(entries)
+        ]
+    )
+
+    # Load the selected solution into the pyomo model and process it like in esM.optimize
+    result = solverResults[winner]
+    pyM.solutions.clear(clear_symbol_maps=False)
+    pyM.solutions.add_solution(result.solution(0), symbolMapId)
+    pyM.solutions.select(0)
+    solver, optimizationSpecs = entries[winner]
+    esM.solverSpecs["logFileName"], esM.solverSpecs["threads"] = "", threads
+    esM.solverSpecs["solver"], esM.solverSpecs["timeLimit"] = solver, timeLimit
+    esM.solverSpecs["optimizationSpecs"], esM.solverSpecs["hasTSA"] = (
+        optimizationSpecs,
+        timeSeriesAggregation if declaresOptimizationProblem else pyM.hasTSA,
+    )
+    esM.solverSpecs["solvetime"] = solveTimes[winner]
+    esM.solverSpecs["status"] = str(result.solver.status)
+    esM.solverSpecs["terminationCondition"] = str(result.solver.termination_condition)
+    utils.output(
+        "The solver "
+        + solver
+        + " ("
+        + optimizationSpecs
+        + ") won the race after "
+        + str(solveTimes[winner])
+        + " sec.",
+        esM.verbose,
+        0,
+    )
+    esM.setOptimalValues()
+    esM.solverSpecs["runtime"] = esM.solverSpecs["buildtime"] + time.time() - timeStart
+
+
+def _solveProblemFile(k, problemFile, solver, optimizationSpecs, options, results):
+    """
+    Solve the problem file with the specified solver in a worker process and put the solver results (or None if the
+    solver failed) to the results queue.
+    """
+    # Start a new process group such that the solver process can be terminated together with the worker process
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    try:
+        optimizer = opt.SolverFactory(solver)
+        optimizer.set_options(optimizationSpecs)
+        optimizer.options.update(options)
+        result = optimizer.solve(problemFile, load_solutions=False, suffixes=["dual"])
+    except (ApplicationError, OSError, ValueError) as error:
+        # The solver failed (e.g. invalid optimizationSpecs), the other solvers of the portfolio continue the race
+        logger_portfolio.warning("The solver " + solver + " failed: " + str(error))
+        result = None
+    except Exception:
+        logger_portfolio.exception("Unexpected error of the solver " + solver + ".")
+        results.put((k, None))
+        raise
+    results.put((k, result))
+
+
+def _terminate(process):
+    """
+    Terminate a worker process and the solver process started by it.
+    """
+    if process.is_alive() and hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    process.join(timeout=5)
+    if process.is_alive():
+        process.terminate()
+
+
+def _getObjectiveValue(result):
+    """
+    Get the objective value of a solver result, None if the result does not contain a feasible solution.
+    """
+    if result is None or len(result.solution) == 0:
+        return None
+    if result.solver.termination_condition in (
+        opt.TerminationCondition.infeasible,
+        opt.TerminationCondition.unbounded,
+        opt.TerminationCondition.infeasibleOrUnbounded,
+    ):
+        return None
+    objective = result.solution(0).objective
+    if len(objective) == 0:
+        return None
+    value = next(iter(objective.values())).get("Value")
+    return value
@@ -1,6 +1,11 @@
 from fine import utils
 import fine as fn
 import numpy as np
+import pandas as pd
+import pyomo.environ as pyomo
+import pyomo.opt as opt
+import time
+from scipy.cluster import hierarchy
 
 
 def optimizeTSAmultiStage(
@@ -144,11 +149,21 @@ def optimizeTSAmultiStage(
         warmstart=warmstart,
     )
 
-    # Set the binary variables to the values resulting from the first optimization step
+    # Map the solution of the first optimization step to the full temporal resolution (if the solver supports warm
+    # starts) and set the binary variables to the values resulting from the first optimization step
+    isWarmStartCapable = _isWarmStartCapable(solver)
+    if isWarmStartCapable:
+        warmStartValues = getWarmStartValues(esM)
     fn.fixBinaryVariables(esM)
 
+    # Warm-start the second optimization step with the mapped solution of the first optimization step
+    esM.declareOptimizationProblem(
+        timeSeriesAggregation=False, relaxIsBuiltBinary=False
+    )
+    if isWarmStartCapable:
+        setWarmStartValues(esM, warmStartValues)
     esM.optimize(
-        declaresOptimizationProblem=True,
+        declaresOptimizationProblem=False,
         timeSeriesAggregation=False,
         relaxIsBuiltBinary=False,
         logFileName="secondStage",
@@ -156,7 +171,7 @@ def optimizeTSAmultiStage(
         solver=solver,
         timeLimit=timeLimit,
         optimizationSpecs=optimizationSpecs,
-        warmstart=False,
+        warmstart=isWarmStartCapable,
     )
     upperBound = esM.objectiveValue
 
@@ -197,3 +212,474 @@ def fixBinaryVariables(esM):
                     discard=False,
                 )
                 esM.componentModelingDict[mdl].componentsDict[comp].isBuiltFix = values
+
+
+def getWarmStartValues(esM):
+    """
+    Map the solution of an optimization with aggregated time series data to the full temporal resolution, e.g. to
+    warm-start the optimization of the fully resolved model (cf. setWarmStartValues). The design variables
+    (capacities, commissioning, binary design decisions) are mapped one to one. The time-dependent variables
+    are expanded to the full time horizon with the order of the typical periods (esM.periodsOrder) and, if the
+    typical periods are segmented, the number of time steps per segment (esM.timeStepsPerSegment), where the
+    operation of a segment is distributed evenly to its time steps. The state of charge of storage components is
+    composed of the state of charge between and within the periods (like the stateOfChargeOperationVariablesOptimum).
+
+    :param esM: energy system model which was optimized with time series aggregation.
+    :type esM: EnergySystemModel instance from the FINE package
+
+    :return: values of the variables of the fully resolved model (dict, variable name: dict with index: value)
+    :rtype: dict
+    """
+    pyM = esM.pyM
+    if pyM is None or not pyM.hasTSA:
+        raise ValueError(
+            "The warm start values can only be obtained from an optimization with time series aggregation."
+        )
+    timeSets = [pyM.timeSet, pyM.intraYearTimeSet, pyM.interTimeStepsSet]
+
+    # Get the typical period and the (segmented) time step of each time step of the full time horizon
+    numberOfTimeStepsPerPeriod = len(esM.timeStepsPerPeriod)
+    timeStepMapping = {}
+    for ip in esM.investmentPeriods:
+        periodsOrder = np.asarray(esM.periodsOrder[ip])
+        if esM.segmentation:
+            timeSteps = np.concatenate(
+                [
+                    np.repeat(
+                        esM.segmentsPerPeriod,
+                        esM.timeStepsPerSegment[ip].loc[p].values.astype(int),
+                    )
+                    for p in periodsOrder
+                ]
+            )
+            # The operation of a segment is distributed evenly to the time steps of the segment
+            segmentLengths = np.concatenate(
+                [
+                    np.repeat(
+                        esM.timeStepsPerSegment[ip].loc[p].values,
+                        esM.timeStepsPerSegment[ip].loc[p].values.astype(int),
+                    )
+                    for p in periodsOrder
+                ]
+            ).astype(float)
+            lastTimeStep = len(esM.segmentsPerPeriod)
+        else:
+            timeSteps = np.tile(esM.timeStepsPerPeriod, len(periodsOrder))
+            segmentLengths = np.ones(len(timeSteps))
+            lastTimeStep = numberOfTimeStepsPerPeriod
+        timeStepMapping[ip] = (
+            np.repeat(periodsOrder, numberOfTimeStepsPerPeriod).tolist(),
+            timeSteps.tolist(),
+            segmentLengths.tolist(),
+            lastTimeStep,
+        )
+
+    warmStartValues = {}
+    for var in pyM.component_objects(pyomo.Var, descend_into=True):
+        if utils.isDesignVariable(var):
+            warmStartValues[var.name] = var.extract_values()
+            continue
+        if not var.is_indexed() or not any(
+            s is timeSet for s in var.index_set().subsets() for timeSet in timeSets
+        ):
+            # Variables which are not time-dependent (e.g. the state of charge between the periods) do not exist
+            # in the fully resolved model
+            continue
+        isInterTimeSteps = any(
+            s is pyM.interTimeStepsSet for s in var.index_set().subsets()
+        )
+        isContinuous = all(v.is_continuous() for v in var.values())
+        stateOfChargeInter = None
+        if var.name.startswith("stateOfCharge_"):
+            SOCInter = getattr(
+                pyM,
+                "stateOfChargeInterPeriods_" + var.name[len("stateOfCharge_") :],
+                None,
+            )
+            if SOCInter is not None:
+                stateOfChargeInter = SOCInter.extract_values()
+
+        # Group the values by the index without the period and the time step (..., ip)
+        groupedValues = {}
+        for index, value in var.extract_values().items():
+            groupedValues.setdefault(index[:-2], {})[index[-2:]] = value
+        values = {}
+        for prefix, prefixValues in groupedValues.items():
+            periods, timeSteps, segmentLengths, lastTimeStep = timeStepMapping[
+                prefix[-1]
+            ]
+            series = [prefixValues.get(key) for key in zip(periods, timeSteps)]
+            if isInterTimeSteps:
+                series.append(prefixValues.get((periods[-1], lastTimeStep)))
+            elif isContinuous:
+                series = [
+                    value / length if value is not None else None
+                    for value, length in zip(series, segmentLengths)
+                ]
+            numberOfPeriods = len(periods) // numberOfTimeStepsPerPeriod
+            for t, value in enumerate(series):
+                if value is not None and stateOfChargeInter is not None:
+                    period = min(t // numberOfTimeStepsPerPeriod, numberOfPeriods - 1)
+                    value += stateOfChargeInter.get(prefix + (period,), 0)
+                values[prefix + (0, t)] = value
+        warmStartValues[var.name] = values
+    return warmStartValues
+
+
+def setWarmStartValues(esM, warmStartValues):
+    """
+    Set the values of the variables of the declared optimization problem (esM.pyM) as starting point for the
+    solver (considered if the optimize function is called with warmstart=True and the solver supports warm
+    starts).
+
+    :param esM: energy system model with a declared optimization problem.
+    :type esM: EnergySystemModel instance from the FINE package
+
+    :param warmStartValues: values of the variables (dict, variable name: dict with index: value), e.g. obtained
+        with getWarmStartValues.
+    :type warmStartValues: dict
+    """
+    if esM.pyM is None:
+        raise TypeError(
+            "The optimization problem is not declared yet. Call the declareOptimizationProblem function first."
+        )
+    _setVariableValues(esM.pyM, warmStartValues)
+
+
+def optimizeTSAadaptive(
+    esM,
+    numberOfTypicalPeriods=2,
+    numberOfTimeStepsPerPeriod=24,
+    numberOfSegmentsPerPeriod=None,
+    refinementFactor=2,
+    maxStages=10,
+    tolerance=1e-2,
+    fullResolutionCheck=False,
+    relaxIsBuiltBinary=False,
+    clusterMethod="hierarchical",
+    threads=3,
+    solver="gurobi",
+    timeLimit=None,
+    optimizationSpecs="",
+):
+    """
+    Optimize the energy system model with an adaptively refined temporal resolution. The optimization starts with
+    few typical periods (and, if specified, few segments per period). In each stage, the number of typical periods
+    and segments is multiplied by the refinement factor until
+
+        (a) the relative change of the objective value compared to the previous stage or,
+            if fullResolutionCheck is True,
+        (b) the relative difference between the objective value of the stage and the objective value of the
+            fully resolved model with the design (capacities and binary design decisions) of the stage fixed
+
+    falls below the tolerance, or the full temporal resolution is reached. Each stage is warm-started with the
+    design of the previous stage and the time series data prepared for the clustering is reused in all stages.
+    Since the clusters of the hierarchical clustering are nested, the periods are only clustered once in the first
+    stage and the clusters of the following stages are obtained by cutting the cluster hierarchy of the first
+    stage (if the model has one investment period; otherwise, the periods are clustered in each stage).
+    The results of the last optimization (the full resolution check, if specified) are stored in the
+    EnergySystemModel instance. The convergence log of all stages is stored in esM.refinementLog.
+
+    **Required arguments:**
+
+    :param esM: energy system model which is optimized.
+    :type esM: EnergySystemModel instance from the FINE package
+
+    **Default arguments:**
+
+    :param numberOfTypicalPeriods: number of typical periods of the first stage.
+        |br| * the default value is 2
+    :type numberOfTypicalPeriods: strictly positive integer
+
+    :param numberOfTimeStepsPerPeriod: states the number of time steps per period
+        |br| * the default value is 24
+    :type numberOfTimeStepsPerPeriod: strictly positive integer
+
+    :param numberOfSegmentsPerPeriod: number of segments per period of the first stage. If None, the typical
+        periods are not segmented.
+        |br| * the default value is None
+    :type numberOfSegmentsPerPeriod: strictly positive integer or None
+
+    :param refinementFactor: factor by which the number of typical periods and segments per period is
+        multiplied in each stage.
+        |br| * the default value is 2
+    :type refinementFactor: integer (>1)
+
+    :param maxStages: maximum number of stages.
+        |br| * the default value is 10
+    :type maxStages: strictly positive integer
+
+    :param tolerance: relative objective change (or difference to the fully resolved model) at which the
+        refinement is stopped.
+        |br| * the default value is 1e-2
+    :type tolerance: strictly positive float
+
+    :param fullResolutionCheck: states if the design of each stage is checked with the fully resolved model
+        (True) or if the refinement is stopped based on the objective change between two stages (False).
+        |br| * the default value is False
+    :type fullResolutionCheck: boolean
+
+    :param relaxIsBuiltBinary: states if the binary design variables should be relaxed.
+        |br| * the default value is False
+    :type relaxIsBuiltBinary: boolean
+
+    :param clusterMethod: states the method which is used in the tsam package for clustering the time series
+        data. Options are for example 'averaging','k_means','exact k_medoid' or 'hierarchical'.
+        |br| * the default value is 'hierarchical'
+    :type clusterMethod: string
+
+    :param threads: number of computational threads used for solving the optimization (solver dependent
+        input) if gurobi is used as the solver.
+        |br| * the default value is 3
+    :type threads: positive integer
+
+    :param solver: specifies which solver should solve the optimization problem (which of course has to be
+        installed on the machine on which the model is run).
+        |br| * the default value is 'gurobi'
+    :type solver: string
+
+    :param timeLimit: if not specified as None, indicates the maximum solve time of each optimization in
+        seconds (solver dependent input).
+        |br| * the default value is None
+    :type timeLimit: strictly positive integer or None
+
+    :param optimizationSpecs: specifies parameters for the optimization solver (see the respective solver
+        documentation for more information). Example: 'LogToConsole=1 OptimalityTol=1e-6'
+        |br| * the default value is an empty string ('')
+    :type optimizationSpecs: string
+    """
+    utils.checkClusteringInput(
+        numberOfTypicalPeriods, numberOfTimeStepsPerPeriod, len(esM.totalTimeSteps)
+    )
+    if numberOfSegmentsPerPeriod is not None:
+        utils.isStrictlyPositiveInt(numberOfSegmentsPerPeriod)
+    utils.isStrictlyPositiveInt(refinementFactor)
+    if refinementFactor < 2:
+        raise ValueError("The refinementFactor has to be larger than 1.")
+    utils.isStrictlyPositiveInt(maxStages)
+    utils.isStrictlyPositiveNumber(tolerance)
+    if not isinstance(fullResolutionCheck, bool):
+        raise TypeError("fullResolutionCheck must be a boolean.")
+
+    numberOfPeriods = len(esM.totalTimeSteps) // numberOfTimeStepsPerPeriod
+    optimizeKwargs = {
+        "relaxIsBuiltBinary": relaxIsBuiltBinary,
+        "threads": threads,
+        "solver": solver,
+        "timeLimit": timeLimit,
+        "optimizationSpecs": optimizationSpecs,
+    }
+    reusesClustering = (
+        clusterMethod == "hierarchical" and len(esM.investmentPeriods) == 1
+    )
+    isWarmStartCapable = _isWarmStartCapable(solver)
+    log, designValues, previousObjectiveValue = [], None, None
+    clusterHierarchy, tsaInstance = None, esM.tsaInstance
+    try:
+        for stage in range(maxStages):
+            timeStart = time.time()
+            segmentation = numberOfSegmentsPerPeriod is not None
+            clusterKwargs = {}
+            if clusterHierarchy is not None:
+                clusterKwargs = _getPredefinedClusters(
+                    clusterHierarchy, numberOfTypicalPeriods
+                )
+            esM.aggregateTemporally(
+                numberOfTypicalPeriods=numberOfTypicalPeriods,
+                numberOfTimeStepsPerPeriod=numberOfTimeStepsPerPeriod,
+                segmentation=segmentation,
+                numberOfSegmentsPerPeriod=numberOfSegmentsPerPeriod or 1,
+                clusterMethod=clusterMethod,
+                sortValues=True,
+                rescaleClusterPeriods=True,
+                representationMethod=None,
+                storeTSAinstance=reusesClustering and clusterHierarchy is None,
+                reuseTimeSeriesData=True,
+                **clusterKwargs,
+            )
+            if reusesClustering and clusterHierarchy is None:
+                clusterHierarchy = _getClusterHierarchy(esM.tsaInstance)
+                esM.tsaInstance = tsaInstance
+
+            # Warm start from the design of the previous stage
+            esM.declareOptimizationProblem(
+                timeSeriesAggregation=True, relaxIsBuiltBinary=relaxIsBuiltBinary
+            )
+            if designValues is not None:
+                _setVariableValues(esM.pyM, designValues)
+            esM.optimize(
+                declaresOptimizationProblem=False,
+                timeSeriesAggregation=True,
+                logFileName="stage" + str(stage),
+                warmstart=designValues is not None and isWarmStartCapable,
+                **optimizeKwargs,
+            )
+            if not _isOptimal(esM):
+                raise ValueError(
+                    "The optimization of stage "
+                    + str(stage)
+                    + " terminated with "
+                    + esM.solverSpecs["terminationCondition"]
+                    + "."
+                )
+            objectiveValue = esM.objectiveValue
+            designValues = _getDesignValues(esM.pyM)
+            isFullResolution = numberOfTypicalPeriods == numberOfPeriods and (
+                not segmentation
+                or numberOfSegmentsPerPeriod == numberOfTimeStepsPerPeriod
+            )
+
+            # Check the convergence
+            fullResolutionObjectiveValue = None
+            if fullResolutionCheck and not isFullResolution:
+                esM.declareOptimizationProblem(
+                    timeSeriesAggregation=False, relaxIsBuiltBinary=relaxIsBuiltBinary
+                )
+                _setVariableValues(esM.pyM, designValues, fix=True)
+                esM.optimize(
+                    declaresOptimizationProblem=False,
+                    timeSeriesAggregation=False,
+                    logFileName="stage" + str(stage) + "FullResolution",
+                    **optimizeKwargs,
+                )
+                if _isOptimal(esM):
+                    fullResolutionObjectiveValue = esM.objectiveValue
+                    change = abs(fullResolutionObjectiveValue - objectiveValue) / max(
+                        abs(fullResolutionObjectiveValue), 1e-10
+                    )
+                else:
+                    change = np.inf
+            elif previousObjectiveValue is not None:
+                change = abs(objectiveValue - previousObjectiveValue) / max(
+                    abs(objectiveValue), 1e-10
+                )
+            else:
+                change = np.inf
+            if isFullResolution:
+                change = 0
+
+            log.append(
+                {
+                    "numberOfTypicalPeriods": numberOfTypicalPeriods,
+                    "numberOfSegmentsPerPeriod": numberOfSegmentsPerPeriod,
+                    "objectiveValue": objectiveValue,
+                    "fullResolutionObjectiveValue": fullResolutionObjectiveValue,
+                    "relativeChange": change,
+                    "runtime": time.time() - timeStart,
+                }
+            )
+            utils.output(
+                "Stage "
+                + str(stage)
+                + " ("
+                + str(numberOfTypicalPeriods)
+                + " typical periods"
+                + (
+                    ", " + str(numberOfSegmentsPerPeriod) + " segments per period"
+                    if segmentation
+                    else ""
+                )
+                + "): objective value "
+                + str(objectiveValue)
+                + ", relative change "
+                + str(change),
+                esM.verbose,
+                0,
+            )
+            if change <= tolerance:
+                break
+
+            # Refine the temporal resolution
+            previousObjectiveValue = objectiveValue
+            numberOfTypicalPeriods = min(
+                numberOfTypicalPeriods * refinementFactor, numberOfPeriods
+            )
+            if segmentation:
+                numberOfSegmentsPerPeriod = min(
+                    numberOfSegmentsPerPeriod * refinementFactor,
+                    numberOfTimeStepsPerPeriod,
+                )
+    finally:
+        # Discard the time series data which was stored for the clustering of the stages
+        esM._timeSeriesDataForAggregation = None
+        esM.refinementLog = pd.DataFrame(log)
+
+
+def _getClusterHierarchy(tsaInstance):
+    # Get the cluster hierarchy (linkage matrix) of the periods which are clustered by the tsam package with the
+    # hierarchical clustering (ward linkage) and sorted values, i.e. the values of each time series are sorted
+    # within the periods (duration curve clustering), and the sorted values of the periods.
+    profiles = tsaInstance.normalizedPeriodlyProfiles
+    sortedValues = np.concatenate(
+        [
+            -np.sort(-profiles[column].values, axis=1)
+            for column in tsaInstance.timeSeries.columns
+        ],
+        axis=1,
+    )
+    return hierarchy.linkage(sortedValues, method="ward"), sortedValues
+
+
+def _getPredefinedClusters(clusterHierarchy, numberOfTypicalPeriods):
+    # Cut the cluster hierarchy into the number of typical periods and get the cluster order and the representative
+    # period of each cluster (the period closest to the mean of the sorted values of the cluster, cf. tsam) as input
+    # for the tsam package (predefClusterOrder, predefClusterCenterIndices)
+    linkage, sortedValues = clusterHierarchy
+    clusterOrder = hierarchy.cut_tree(
+        linkage, n_clusters=numberOfTypicalPeriods
+    ).ravel()
+    clusterCenterIndices = []
+    for cluster in np.unique(clusterOrder):
+        periods = np.flatnonzero(clusterOrder == cluster)
+        distances = np.square(
+            sortedValues[periods] - sortedValues[periods].mean(axis=0)
+        ).sum(axis=1)
+        clusterCenterIndices.append(periods[np.argmin(distances)])
+    return {
+        "predefClusterOrder": clusterOrder,
+        "predefClusterCenterIndices": clusterCenterIndices,
+    }
+
+
+def _isWarmStartCapable(solver):
+    # Check if the solver accepts a start solution (cf. the optimize function of the EnergySystemModel class)
+    if solver == "highs":
+        return True
+    optimizer = opt.SolverFactory(solver)
+    return optimizer.available(exception_flag=False) and optimizer.warm_start_capable()
+
+
+def _isOptimal(esM):
+    # Check if the last optimization of the energy system model found a solution
+    return esM.solverSpecs["terminationCondition"] not in [
+        "infeasible",
+        "infeasibleOrUnbounded",
+        "unbounded",
+    ] and esM.solverSpecs["status"] not in ["error", "aborted", "unknown"]
+
+
+def _getDesignValues(pyM):
+    # Get the values of the design variables (dict, variable name: dict with index: value)
+    return {
+        var.name: {index: var[index].value for index in var}
+        for var in pyM.component_objects(pyomo.Var, descend_into=True)
+        if utils.isDesignVariable(var)
+    }
+
+
+def _setVariableValues(pyM, variableValues, fix=False):
+    # Set (and, if specified, fix) the values of variables (dict, variable name: dict with index: value), e.g. to
+    # warm-start an optimization. Variables and indices which are not part of the pyomo model are skipped.
+    for name, values in variableValues.items():
+        var = getattr(pyM, name, None)
+        if var is None:
+            continue
+        for index, value in values.items():
+            if value is None or index not in var:
+                continue
+            if not var[index].is_continuous():
+                value = round(value)
+            if fix:
+                var[index].fix(value)
+            else:
+                var[index].set_value(value, skip_validation=True)
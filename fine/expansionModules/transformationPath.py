@@ -1,5 +1,5 @@
 from fine import utils
-from fine.IOManagement import standardIO
+from fine.IOManagement import standardIO, xarrayIO as xrIO
 import pandas as pd
 import copy
 
@@ -24,6 +24,7 @@ def optimizeSimpleMyopic(
     CO2ReductionTargets=None,
     saveResults=True,
     trackESMs=True,
+    reuseOptimizationProblem=False,
 ):
     """
     Optimization function for myopic approach. For each optimization run, the newly installed capacities
@@ -99,9 +100,21 @@ def optimizeSimpleMyopic(
         |br| * the default value is True
     :type trackESMs: boolean
 
+    :param reuseOptimizationProblem: states if the optimization problem is declared once and updated for each
+        optimization run (True) or if it is declared anew for each optimization run (False). If True, the stock
+        components of all milestone years are added to the energy system model beforehand with zero capacities. After
+        each optimization run, the fixed capacities of the stock components and the CO2 limit are updated in the
+        declared optimization problem. The time series aggregation is only performed once (including the time series
+        of the stock components), so the typical periods can slightly differ from the ones obtained with
+        reuseOptimizationProblem=False. If trackESMs is True, the optimization outputs of the runs are stored as xarray
+        datasets (cf. xarrayIO.convertOptimizationOutputToDatasets) instead of copies of the EnergySystemModel instance.
+        |br| * the default value is False
+    :type reuseOptimizationProblem: boolean
+
     :returns: myopicResults: Store all optimization outputs in a dictionary for further analyses. If trackESMs is set to false,
         nothing is returned.
-    :rtype: dict of all optimized instances of the EnergySystemModel class or None.
+    :rtype: dict of all optimized instances of the EnergySystemModel class (or of their optimization outputs as
+        xarray datasets if reuseOptimizationProblem is True) or None.
     """
     if esM.numberOfInvestmentPeriods != 1:
         raise ValueError(
@@ -113,19 +126,34 @@ def optimizeSimpleMyopic(
     )
     utils.checkSinkCompCO2toEnvironment(esM, CO2ReductionTargets)
     utils.checkCO2ReductionTargets(CO2ReductionTargets, nbOfSteps)
+    if not isinstance(reuseOptimizationProblem, bool):
+        raise TypeError("The reuseOptimizationProblem parameter has to be a boolean.")
     print("Number of optimization runs: ", nbOfSteps + 1)
     print("Number of years represented by one optimization: ", nbOfRepresentedYears)
     mileStoneYear = startYear
     if trackESMs:
         myopicResults = dict()
+    if reuseOptimizationProblem:
+        mileStoneYears = [
+            startYear + step * nbOfRepresentedYears for step in range(nbOfSteps + 1)
+        ]
+        stockComponents = addStockComponents(esM, mileStoneYears, nbOfRepresentedYears)
+        stockCapacities = {}
 
     for step in range(0, nbOfSteps + 1):
         mileStoneYear = startYear + step * nbOfRepresentedYears
         logFileName = "log_" + str(mileStoneYear)
         utils.setNewCO2ReductionTarget(esM, CO2Reference, CO2ReductionTargets, step)
 
+        # The declared optimization problem is updated for the new milestone year
+        declaresOptimizationProblem = step == 0 or not reuseOptimizationProblem
+        if not declaresOptimizationProblem:
+            updateStockCapacities(esM, stockComponents, stockCapacities, mileStoneYear)
+            if CO2ReductionTargets is not None:
+                updateYearlyLimitation(esM)
+
         # Optimization
-        if timeSeriesAggregation:
+        if timeSeriesAggregation and declaresOptimizationProblem:
             esM.aggregateTemporally(
                 numberOfTypicalPeriods=numberOfTypicalPeriods,
                 numberOfTimeStepsPerPeriod=numberOfTimeStepsPerPeriod,
@@ -138,7 +166,7 @@ def optimizeSimpleMyopic(
             )
 
         esM.optimize(
-            declaresOptimizationProblem=True,
+            declaresOptimizationProblem=declaresOptimizationProblem,
             timeSeriesAggregation=timeSeriesAggregation,
             logFileName=logFileName,
             threads=threads,
@@ -156,6 +184,21 @@ def optimizeSimpleMyopic(
                 optValOutputLevel=1,
             )
 
+        if reuseOptimizationProblem:
+            if trackESMs:
+                myopicResults.update(
+                    {
+                        "ESM_"
+                        + str(mileStoneYear): xrIO.convertOptimizationOutputToDatasets(
+                            esM
+                        )
+                    }
+                )
+            stockCapacities.update(
+                getStockCapacities(esM, stockComponents, mileStoneYear)
+            )
+            continue
+
         if trackESMs:
             tmp = esM
             del (
@@ -244,3 +287,119 @@ def getStock(esM, mileStoneYear, nbOfRepresentedYears):
                         esM.removeComponent(comp)
 
     return esM
+
+
+def addStockComponents(esM, mileStoneYears, nbOfRepresentedYears):
+    """
+    Function for adding the stock components of all milestone years (except the last one) to the energy system model
+    before the optimization problem is declared. The capacities of the stock components are fixed to zero and are
+    updated in the declared optimization problem after each optimization run (cf. updateStockCapacities).
+    Components whose technical lifetime is shorter than the number of represented years do not get stock components.
+
+    :param esM: EnergySystemModel instance
+    :type esM: EnergySystemModel instance
+
+    :param mileStoneYears: milestone years of the optimization runs
+    :type mileStoneYears: list of int
+
+    :param nbOfRepresentedYears: Number of years within one optimization period.
+    :type nbOfRepresentedYears: int
+
+    :return: names of the original components and milestone years of the stock components
+    :rtype: dict with the names of the stock components as keys and tuples (name, milestone year) as values
+    """
+    stockComponents = {}
+    for mdl in esM.componentModelingDict.values():
+        for compName, comp in list(mdl.componentsDict.items()):
+            if (
+                not comp.hasCapacityVariable
+                or "stock" in compName
+                or any(comp.technicalLifetime - nbOfRepresentedYears <= 0)
+            ):
+                continue
+            for mileStoneYear in mileStoneYears[:-1]:
+                stockComp = copy.deepcopy(comp)
+                stockComp.name = compName + "_stock" + "_" + str(mileStoneYear)
+                stockComp.processedCapacityFix = {
+                    0: pd.Series(0.0, index=comp.processedLocationalEligibility.index)
+                }
+                esM.add(stockComp)
+                stockComponents[stockComp.name] = (compName, mileStoneYear)
+    return stockComponents
+
+
+def getStockCapacities(esM, stockComponents, mileStoneYear):
+    """
+    Function for getting the optimized capacities of the components which become the stock of the given milestone
+    year.
+
+    :return: capacities of the stock components of the milestone year
+    :rtype: dict with the names of the stock components as keys and pandas Series as values
+    """
+    stockNames = {
+        compName: stockName
+        for stockName, (compName, stockYear) in stockComponents.items()
+        if stockYear == mileStoneYear
+    }
+    stockCapacities = {}
+    for mdl in esM.componentModelingDict.values():
+        if not hasattr(esM.pyM, "cap_" + mdl.abbrvName):
+            continue
+        for (loc, compName, ip), capVar in getattr(
+            esM.pyM, "cap_" + mdl.abbrvName
+        ).items():
+            if compName in stockNames:
+                stockCapacities.setdefault(stockNames[compName], {})[loc] = max(
+                    capVar.value if capVar.value is not None else 0, 0
+                )
+    return {
+        stockName: pd.Series(capacities)
+        for stockName, capacities in stockCapacities.items()
+    }
+
+
+def updateStockCapacities(esM, stockComponents, stockCapacities, mileStoneYear):
+    """
+    Function for updating the fixed capacities of the stock components in the declared optimization problem for the
+    given milestone year. If the technical lifetime of a stock component is exceeded, its capacity is set to zero.
+
+    :return: None
+    """
+    for stockName, (compName, stockYear) in stockComponents.items():
+        mdl = esM.componentModelingDict[esM.componentNames[stockName]]
+        stockComp = mdl.componentsDict[stockName]
+        capVar = getattr(esM.pyM, "cap_" + mdl.abbrvName)
+        capFixConstr = getattr(esM.pyM, "ConstrCapacityFix_" + mdl.abbrvName)
+        commisBinVar = getattr(esM.pyM, "commisBin_" + mdl.abbrvName)
+
+        capacities = stockComp.processedCapacityFix[0] * 0
+        if stockName in stockCapacities and all(
+            stockComp.technicalLifetime - (mileStoneYear - stockYear) > 0
+        ):
+            capacities = capacities.add(stockCapacities[stockName], fill_value=0)
+        stockComp.processedCapacityFix[0] = capacities
+
+        for loc, capacity in capacities.items():
+            if (loc, stockName, 0) not in capVar:
+                continue
+            capVar[loc, stockName, 0].setlb(capacity)
+            capVar[loc, stockName, 0].setub(capacity)
+            capFixConstr[loc, stockName, 0].set_value(
+                capVar[loc, stockName, 0] == capacity
+            )
+            if (loc, stockName, 0) in commisBinVar:
+                commisBinVar[loc, stockName, 0].setlb(int(capacity > 0))
+                commisBinVar[loc, stockName, 0].setub(int(capacity > 0))
+
+
+def updateYearlyLimitation(esM):
+    """
+    Function for updating the yearly commodity limitation constraints of the source and sink components in the
+    declared optimization problem (e.g. after setting a new CO2 reduction target).
+
+    :return: None
+    """
+    mdl = esM.componentModelingDict["SourceSinkModel"]
+    esM.pyM.del_component("ConstrYearlyLimitation_" + mdl.abbrvName)
+    mdl.declareYearlyCommodityLimitationDict(esM.pyM, esM)
+    mdl.yearlyLimitationConstraint(esM.pyM, esM)
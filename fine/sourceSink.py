@@ -458,6 +458,21 @@ class Source(Component):
             operationTimeSeries,
         )
 
+    def getUpdateDependencyGroups(self, esM):
+        """
+        Return the dependency groups of the component which are used for incremental updates (cf.
+        Component.getUpdateDependencyGroups). Additionally to the general groups, the operation cost parameters of the
+        Source/Sink component are considered.
+        """
+        groups = super().getUpdateDependencyGroups(esM)
+        for paramName in ["opexPerOperation", "commodityCost", "commodityRevenue"]:
+            groups[(paramName,)] = (
+                lambda paramName=paramName: self.setInvestmentPeriodCostParameter(
+                    esM, paramName, esM.investmentPeriods
+                )
+            )
+        return groups
+
     def setTimeSeriesData(self, hasTSA):
         """
         Function for setting the maximum operation rate, fixed operation rate and cost or revenue time series depending
@@ -495,6 +510,9 @@ class Source(Component):
 
         :param ip: investment period of transformation path analysis.
         :type ip: int
+
+        :return: time series data and weights of the time series (cf. Component.getDataForTimeSeriesAggregation)
+        :rtype: tuple (list or None, dict)
         """
 
         weightDict, data = {}, []
@@ -541,7 +559,7 @@ class Source(Component):
             data,
             ip,
         )
-        return (pd.concat(data, axis=1), weightDict) if data else (None, {})
+        return (data, weightDict) if data else (None, {})
 
     def setAggregatedTimeSeriesData(self, data, ip):
         """
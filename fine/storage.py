@@ -431,6 +431,21 @@ class Storage(Component):
             self.fullDischargeOpRateMax
         )
 
+    def getUpdateDependencyGroups(self, esM):
+        """
+        Return the dependency groups of the component which are used for incremental updates (cf.
+        Component.getUpdateDependencyGroups). Additionally to the general groups, the charge and discharge operation
+        cost parameters of the Storage component are considered.
+        """
+        groups = super().getUpdateDependencyGroups(esM)
+        for paramName in ["opexPerChargeOperation", "opexPerDischargeOperation"]:
+            groups[(paramName,)] = (
+                lambda paramName=paramName: self.setInvestmentPeriodCostParameter(
+                    esM, paramName, esM.investmentPeriods
+                )
+            )
+        return groups
+
     def setTimeSeriesData(self, hasTSA):
         """
         Function for setting the maximum operation rate and fixed operation rate for charging and discharging
@@ -458,6 +473,8 @@ class Storage(Component):
         :param ip: investment period of transformation path analysis.
         :type ip: int
 
+        :return: time series data and weights of the time series (cf. Component.getDataForTimeSeriesAggregation)
+        :rtype: tuple (list or None, dict)
         """
         weightDict, data = {}, []
         tsa_input = [
@@ -484,7 +501,7 @@ class Storage(Component):
                 weightDict, data = self.prepareTSAInput(
                     rateMax, rateName, rateWeight, weightDict, data, ip
                 )
-        return (pd.concat(data, axis=1), weightDict) if data else (None, {})
+        return (data, weightDict) if data else (None, {})
 
     def setAggregatedTimeSeriesData(self, data, ip):
         """
@@ -821,6 +838,44 @@ class StorageModel(ComponentModel):
     #                                          Declare component constraints                                           #
     ####################################################################################################################
 
+    def declareSelfDischargeFactors(self, esM, pyM):
+        """
+        Precompute the self-discharge factors (1 - selfDischarge) ** hours of the storage components once per
+        investment period:
+
+        * 'step': over a time step (number) or over each segment (array, index: [typical period, segment]),
+        * 'start': from the start of a typical period until each time step (array, index: [time step]) or
+          segment (array, index: [typical period, segment]), only with time series aggregation,
+        * 'period': over a full typical period (number).
+
+        :param esM: EnergySystemModel instance representing the energy system in which the component should be modeled.
+        :type esM: esM - EnergySystemModel class instance
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo ConcreteModel
+        """
+        self._selfDischargeFactors = {}
+        for compName, comp in self.componentsDict.items():
+            retention = 1 - comp.selfDischarge
+            for ip in esM.investmentPeriods:
+                factors = {
+                    "period": retention
+                    ** ((esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep)
+                }
+                if pyM.hasSegmentation:
+                    factors["step"] = retention ** esM.hoursPerSegmentTable[ip]
+                    factors["start"] = retention ** (
+                        esM.segmentStartTimeTable[ip] * esM.hoursPerTimeStep
+                    )
+                else:
+                    factors["step"] = retention**esM.hoursPerTimeStep
+                    if pyM.hasTSA:
+                        factors["start"] = retention ** (
+                            np.arange(len(esM.timeStepsPerPeriod) + 1)
+                            * esM.hoursPerTimeStep
+                        )
+                self._selfDischargeFactors[compName, ip] = factors
+
     def connectSOCs(self, pyM, esM):
         """
         Declare the constraint for connecting the state of charge with the charge and discharge operation:
@@ -854,7 +909,7 @@ class StorageModel(ComponentModel):
                 return (
                     SOC[loc, compName, ip, p, t + 1]
                     - SOC[loc, compName, ip, p, t]
-                    * (1 - compDict[compName].selfDischarge) ** esM.hoursPerTimeStep
+                    * self._selfDischargeFactors[compName, ip]["step"]
                     == chargeOp[loc, compName, ip, p, t]
                     * compDict[compName].chargeEfficiency
                     - dischargeOp[loc, compName, ip, p, t]
@@ -864,8 +919,7 @@ class StorageModel(ComponentModel):
                 return (
                     SOC[loc, compName, ip, p, t + 1]
                     - SOC[loc, compName, ip, p, t]
-                    * (1 - compDict[compName].selfDischarge)
-                    ** esM.hoursPerSegment[ip].to_dict()[p, t]
+                    * self._selfDischargeFactors[compName, ip]["step"][p, t]
                     == chargeOp[loc, compName, ip, p, t]
                     * compDict[compName].chargeEfficiency
                     - dischargeOp[loc, compName, ip, p, t]
@@ -1019,7 +1073,7 @@ class StorageModel(ComponentModel):
         :param esM: EnergySystemModel instance representing the energy system in which the component should be modeled.
         :type esM: esM - EnergySystemModel class instance
         """
-        compDict, abbrvName = self.componentsDict, self.abbrvName
+        abbrvName = self.abbrvName
         opVarSet = getattr(pyM, "operationVarSet_" + abbrvName)
         SOC = getattr(pyM, "stateOfCharge_" + abbrvName)
         SOCInter = getattr(pyM, "stateOfChargeInterPeriods_" + abbrvName)
@@ -1040,9 +1094,7 @@ class StorageModel(ComponentModel):
             if not esM.pyM.hasSegmentation:
                 return SOCInter[loc, compName, ip, pInter + 1] == SOCInter[
                     loc, compName, ip, pInter
-                ] * (1 - compDict[compName].selfDischarge) ** (
-                    (esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep
-                ) + SOC[
+                ] * self._selfDischargeFactors[compName, ip]["period"] + SOC[
                     loc,
                     compName,
                     ip,
@@ -1059,9 +1111,7 @@ class StorageModel(ComponentModel):
                 #     (offsetUp_ - offsetDown_)
                 return SOCInter[loc, compName, ip, pInter + 1] == SOCInter[
                     loc, compName, ip, pInter
-                ] * (1 - compDict[compName].selfDischarge) ** (
-                    (esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep
-                ) + SOC[
+                ] * self._selfDischargeFactors[compName, ip]["period"] + SOC[
                     loc,
                     compName,
                     ip,
@@ -1255,16 +1305,14 @@ class StorageModel(ComponentModel):
             if compDict[compName].hasCapacityVariable:
                 return (
                     SOCInter[loc, compName, ip, pInter]
-                    * (1 - compDict[compName].selfDischarge)
-                    ** ((esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep)
+                    * self._selfDischargeFactors[compName, ip]["period"]
                     + SOCmin[loc, compName, ip, esM.periodsOrder[ip][pInter]]
                     >= capVar[loc, compName, ip] * compDict[compName].stateOfChargeMin
                 )
             else:
                 return (
                     SOCInter[loc, compName, ip, pInter]
-                    * (1 - compDict[compName].selfDischarge)
-                    ** ((esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep)
+                    * self._selfDischargeFactors[compName, ip]["period"]
                     + SOCmin[loc, compName, ip, esM.periodsOrder[ip][pInter]]
                     >= compDict[compName].stateOfChargeMin
                 )
@@ -1339,10 +1387,7 @@ class StorageModel(ComponentModel):
                 if not pyM.hasSegmentation:
                     return (
                         SOCinter[loc, compName, ip, pInter]
-                        * (
-                            (1 - compDict[compName].selfDischarge)
-                            ** (t * esM.hoursPerTimeStep)
-                        )
+                        * self._selfDischargeFactors[compName, ip]["start"][t]
                         + SOC[loc, compName, ip, esM.periodsOrder[ip][pInter], t]
                         <= capVar[loc, compName, ip]
                         * compDict[compName].stateOfChargeMax
@@ -1350,15 +1395,9 @@ class StorageModel(ComponentModel):
                 else:
                     return (
                         SOCinter[loc, compName, ip, pInter]
-                        * (
-                            (1 - compDict[compName].selfDischarge)
-                            ** (
-                                esM.segmentStartTime[ip].to_dict()[
-                                    esM.periodsOrder[ip][pInter], t
-                                ]
-                                * esM.hoursPerTimeStep
-                            )
-                        )
+                        * self._selfDischargeFactors[compName, ip]["start"][
+                            esM.periodsOrder[ip][pInter], t
+                        ]
                         + SOC[loc, compName, ip, esM.periodsOrder[ip][pInter], t]
                         <= capVar[loc, compName, ip]
                         * compDict[compName].stateOfChargeMax
@@ -1404,10 +1443,7 @@ class StorageModel(ComponentModel):
                 if not pyM.hasSegmentation:
                     return (
                         SOCinter[loc, compName, ip, pInter]
-                        * (
-                            (1 - compDict[compName].selfDischarge)
-                            ** (t * esM.hoursPerTimeStep)
-                        )
+                        * self._selfDischargeFactors[compName, ip]["start"][t]
                         + SOC[loc, compName, ip, esM.periodsOrder[ip][pInter], t]
                         >= capVar[loc, compName, ip]
                         * compDict[compName].stateOfChargeMin
@@ -1415,15 +1451,9 @@ class StorageModel(ComponentModel):
                 else:
                     return (
                         SOCinter[loc, compName, ip, pInter]
-                        * (
-                            (1 - compDict[compName].selfDischarge)
-                            ** (
-                                esM.segmentStartTime[ip].to_dict()[
-                                    esM.periodsOrder[ip][pInter], t
-                                ]
-                                * esM.hoursPerTimeStep
-                            )
-                        )
+                        * self._selfDischargeFactors[compName, ip]["start"][
+                            esM.periodsOrder[ip][pInter], t
+                        ]
                         + SOC[loc, compName, ip, esM.periodsOrder[ip][pInter], t]
                         >= capVar[loc, compName, ip]
                         * compDict[compName].stateOfChargeMin
@@ -1432,25 +1462,16 @@ class StorageModel(ComponentModel):
                 if not pyM.hasSegmentation:
                     return (
                         SOCinter[loc, compName, ip, pInter]
-                        * (
-                            (1 - compDict[compName].selfDischarge)
-                            ** (t * esM.hoursPerTimeStep)
-                        )
+                        * self._selfDischargeFactors[compName, ip]["start"][t]
                         + SOC[loc, compName, ip, esM.periodsOrder[ip][pInter], t]
                         >= compDict[compName].stateOfChargeMin
                     )
                 else:
                     return (
                         SOCinter[loc, compName, ip, pInter]
-                        * (
-                            (1 - compDict[compName].selfDischarge)
-                            ** (
-                                esM.segmentStartTime[ip].to_dict()[
-                                    esM.periodsOrder[ip][pInter], t
-                                ]
-                                * esM.hoursPerTimeStep
-                            )
-                        )
+                        * self._selfDischargeFactors[compName, ip]["start"][
+                            esM.periodsOrder[ip][pInter], t
+                        ]
                         + SOC[loc, compName, ip, esM.periodsOrder[ip][pInter], t]
                         >= compDict[compName].stateOfChargeMin
                     )
@@ -1477,6 +1498,9 @@ class StorageModel(ComponentModel):
         :type pyM: pyomo ConcreteModel
         """
 
+        # Precompute the self-discharge factors of the state of charge constraints
+        self.declareSelfDischargeFactors(esM, pyM)
+
         ################################################################################################################
         #                                    Declare time independent constraints                                      #
         ################################################################################################################
@@ -2,11 +2,35 @@ from fine.conversion import Conversion, ConversionModel
 from fine import utils
 import pyomo.environ as pyomo
 import pandas as pd
+import numpy as np
 
 import warnings
 
 # ruff: noqa
 
+
+def getMinTimeWindows(numberOfTimeSteps, timeMin):
+    """
+    Get the time steps which are summed up in the minimum up/down time constraint of each time step of a period,
+    i.e. the time steps t-timeMin+1, ..., t-1 for t >= timeMin and the time steps 0, ..., t-1 and
+    numberOfTimeSteps-(timeMin-t), ..., numberOfTimeSteps-1 for t < timeMin (cyclic period).
+
+    :returns: intervals (first and last time step) of the time steps of each time step
+    :rtype: list of lists of tuples (int, int)
+    """
+    timeSteps = np.arange(numberOfTimeSteps)
+    wraps = timeSteps < timeMin
+    firsts = np.where(wraps, 0, timeSteps - timeMin + 1)
+    lasts = timeSteps - 1
+    wrapFirsts = numberOfTimeSteps - (timeMin - timeSteps)
+    return [
+        [(first, last)] + ([(wrapFirst, numberOfTimeSteps - 1)] if wrap else [])
+        for first, last, wrapFirst, wrap in zip(
+            firsts.tolist(), lasts.tolist(), wrapFirsts.tolist(), wraps.tolist()
+        )
+    ]
+
+
 class ConversionDynamic(Conversion):
     """
     Extension of the conversion class with more specific ramping behavior
@@ -22,6 +46,7 @@ class ConversionDynamic(Conversion):
         upTimeMin=None,
         rampUpMax=None,
         rampDownMax=None,
+        compactMinTimeFormulation=False,
         **kwargs,
     ):
         """
@@ -48,6 +73,14 @@ class ConversionDynamic(Conversion):
             |br| * the default value is None
         :type rampDownMax: None or float value in range \]0.0,1.0\]
 
+        :param compactMinTimeFormulation: states if the minimum up and down time constraints are formulated with
+            cumulative start/stop variables (True) instead of summing up the start/stop variables of the minimum
+            up/down time window in each constraint (False). The cumulative formulation has the same linear relaxation
+            but its number of nonzeros does not grow with the minimum up/down time. It is recommended for long
+            minimum up/down times.
+            |br| * the default value is False
+        :type compactMinTimeFormulation: boolean
+
         :param \*\*kwargs: All other keyword arguments of the conversion class can be defined as well.
         :type \*\*kwargs: Check Conversion Class documentation.
         """
@@ -60,6 +93,7 @@ class ConversionDynamic(Conversion):
         self.upTimeMin = upTimeMin
         self.rampUpMax = rampUpMax
         self.rampDownMax = rampDownMax
+        self.compactMinTimeFormulation = compactMinTimeFormulation
         utils.checkConversionDynamicSpecficDesignInputParams(self, esM)
 
     def setTimeSeriesData(self, hasTSA):
@@ -140,6 +174,31 @@ class ConversionDynamicModel(ConversionModel):
             pyomo.Set(dimen=3, initialize=declareOpConstrSetMinUpTime),
         )
 
+    def declareCompactMinTimeVarSet(self, pyM):
+        """
+        Declare set of locations and components with a minimum up or down time which use the compact minimum
+        up/down time formulation.
+        """
+        compDict, abbrvName = self.componentsDict, self.abbrvName
+        varSet = getattr(pyM, "operationVarSet_" + abbrvName)
+
+        def declareCompactMinTimeVarSet(pyM):
+            return (
+                (loc, compName, ip)
+                for loc, compName, ip in varSet
+                if compDict[compName].compactMinTimeFormulation
+                and (
+                    compDict[compName].downTimeMin is not None
+                    or compDict[compName].upTimeMin is not None
+                )
+            )
+
+        setattr(
+            pyM,
+            "compactMinTimeVarSet_" + abbrvName,
+            pyomo.Set(dimen=3, initialize=declareCompactMinTimeVarSet),
+        )
+
     def declareOpConstrSetMaxRampUp(self, pyM, constrSetName):
         """
         Declare set of locations and components for which rampUpMax is not None.
@@ -198,6 +257,7 @@ class ConversionDynamicModel(ConversionModel):
         self.declareOpConstrSetMinUpTime(pyM, "opConstrSet")
         self.declareOpConstrSetMaxRampUp(pyM, "opConstrSet")
         self.declareOpConstrSetMaxRampDown(pyM, "opConstrSet")
+        self.declareCompactMinTimeVarSet(pyM)
 
     ####################################################################################################################
     #                                                Declare variables                                                 #
@@ -230,6 +290,25 @@ class ConversionDynamicModel(ConversionModel):
             ),
         )
 
+    def declareCumulativeStartStopVariables(self, pyM):
+        """
+        Declare cumulative start/stop variables (number of starts/stops since the beginning of the period) for the
+        compact minimum up/down time formulation.
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo Concrete Model
+        """
+        for varName in ["cumulativeStartVariable_", "cumulativeStopVariable_"]:
+            setattr(
+                pyM,
+                varName + self.abbrvName,
+                pyomo.Var(
+                    getattr(pyM, "compactMinTimeVarSet_" + self.abbrvName),
+                    pyM.intraYearTimeSet,
+                    domain=pyomo.NonNegativeReals,
+                ),
+            )
+
     def declareVariables(self, esM, pyM, relaxIsBuiltBinary, relevanceThreshold):
         """
         Declare design and operation variables
@@ -252,11 +331,74 @@ class ConversionDynamicModel(ConversionModel):
         super().declareVariables(esM, pyM, relaxIsBuiltBinary, relevanceThreshold)
 
         self.declareStartStopVariables(pyM)
+        self.declareCumulativeStartStopVariables(pyM)
 
     ####################################################################################################################
     #                                          Declare component constraints                                           #
     ####################################################################################################################
 
+    def cumulativeStartStop(self, pyM):
+        """
+        Define the cumulative start/stop variables of the compact minimum up/down time formulation as the sum of the
+        start/stop variables since the beginning of the period.
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo Concrete Model
+        """
+        abbrvName = self.abbrvName
+        varSet = getattr(pyM, "compactMinTimeVarSet_" + abbrvName)
+
+        for varName in ["start", "stop"]:
+            opVar = getattr(pyM, varName + "Variable_" + abbrvName)
+            cumVar = getattr(
+                pyM, "cumulative" + varName.capitalize() + "Variable_" + abbrvName
+            )
+
+            def cumulativeStartStop(pyM, loc, compName, ip, p, t):
+                if t >= 1:
+                    return (
+                        cumVar[loc, compName, ip, p, t]
+                        == cumVar[loc, compName, ip, p, t - 1]
+                        + opVar[loc, compName, ip, p, t]
+                    )
+                else:
+                    return (
+                        cumVar[loc, compName, ip, p, t]
+                        == opVar[loc, compName, ip, p, t]
+                    )
+
+            setattr(
+                pyM,
+                "ConstrCumulative" + varName.capitalize() + "_" + abbrvName,
+                pyomo.Constraint(
+                    varSet, pyM.intraYearTimeSet, rule=cumulativeStartStop
+                ),
+            )
+
+    def getMinTimeWindowSum(self, pyM, varName, windows, loc, compName, ip, p, t):
+        """
+        Get the sum of the start/stop variables of the minimum up/down time window of a time step. With the compact
+        minimum up/down time formulation, each interval of the window is given by the difference of two cumulative
+        start/stop variables.
+        """
+        abbrvName = self.abbrvName
+        if self.componentsDict[compName].compactMinTimeFormulation:
+            cumVar = getattr(
+                pyM, "cumulative" + varName.capitalize() + "Variable_" + abbrvName
+            )
+            return sum(
+                cumVar[loc, compName, ip, p, last]
+                - (cumVar[loc, compName, ip, p, first - 1] if first >= 1 else 0)
+                for first, last in windows[t]
+                if first <= last
+            )
+        opVar = getattr(pyM, varName + "Variable_" + abbrvName)
+        return pyomo.quicksum(
+            opVar[loc, compName, ip, p, _t]
+            for first, last in windows[t]
+            for _t in range(first, last + 1)
+        )
+
     def minimumDownTime(self, pyM, esM):
         """
         Ensure that conversion unit is not ramping up and down too often by implementing a minimum down time after ramping down.
@@ -303,22 +445,20 @@ class ConversionDynamicModel(ConversionModel):
             ),
         )
 
+        # The minimum down time windows are computed once per minimum down time
+        windows = {
+            downTimeMin: getMinTimeWindows(numberOfTimeSteps, downTimeMin)
+            for downTimeMin in set(
+                compDict[compName].downTimeMin
+                for _, compName, _ in constrSetMinDownTime
+            )
+        }
+
         def minimumDownTime2(pyM, loc, compName, ip, p, t):
             downTimeMin = getattr(compDict[compName], "downTimeMin")
-            if t >= downTimeMin:
-                return opVarBin[loc, compName, ip, p, t] <= 1 - pyomo.quicksum(
-                    opVarStopBin[loc, compName, ip, p, t_down]
-                    for t_down in range(t - downTimeMin + 1, t)
-                )
-            else:
-                return opVarBin[loc, compName, ip, p, t] <= 1 - pyomo.quicksum(
-                    opVarStopBin[loc, compName, ip, p, t_down] for t_down in range(0, t)
-                ) - pyomo.quicksum(
-                    opVarStopBin[loc, compName, ip, p, t_down]
-                    for t_down in range(
-                        numberOfTimeSteps - (downTimeMin - t), numberOfTimeSteps
-                    )
-                )
+            return opVarBin[loc, compName, ip, p, t] <= 1 - self.getMinTimeWindowSum(
+                pyM, "stop", windows[downTimeMin], loc, compName, ip, p, t
+            )
 
         setattr(
             pyM,
@@ -376,22 +516,19 @@ class ConversionDynamicModel(ConversionModel):
             ),
         )
 
+        # The minimum up time windows are computed once per minimum up time
+        windows = {
+            upTimeMin: getMinTimeWindows(numberOfTimeSteps, upTimeMin)
+            for upTimeMin in set(
+                compDict[compName].upTimeMin for _, compName, _ in constrSetMinUpTime
+            )
+        }
+
         def minimumUpTime2(pyM, loc, compName, ip, p, t):
             upTimeMin = getattr(compDict[compName], "upTimeMin")
-            if t >= upTimeMin:
-                return opVarBin[loc, compName, ip, p, t] >= pyomo.quicksum(
-                    opVarStartBin[loc, compName, ip, p, t_up]
-                    for t_up in range(t - upTimeMin + 1, t)
-                )
-            else:
-                return opVarBin[loc, compName, ip, p, t] >= pyomo.quicksum(
-                    opVarStartBin[loc, compName, ip, p, t_up] for t_up in range(0, t)
-                ) + pyomo.quicksum(
-                    opVarStartBin[loc, compName, ip, p, t_up]
-                    for t_up in range(
-                        numberOfTimeSteps - (upTimeMin - t), numberOfTimeSteps
-                    )
-                )
+            return opVarBin[loc, compName, ip, p, t] >= self.getMinTimeWindowSum(
+                pyM, "start", windows[upTimeMin], loc, compName, ip, p, t
+            )
 
         setattr(
             pyM,
@@ -530,6 +667,7 @@ class ConversionDynamicModel(ConversionModel):
         ################################################################################################################
         #                                         Dynamic Constraints                                                  #
         ################################################################################################################
+        self.cumulativeStartStop(pyM)
         self.minimumDownTime(pyM, esM)
         self.minimumUpTime(pyM, esM)
         self.rampUpMax(pyM, esM)
@@ -4,17 +4,23 @@ from fine import utils
 import pyomo.environ as pyomo
 import pandas as pd
 import numpy as np
-import pwlf
+import copy
+import hashlib
+import multiprocessing
+import os
 
 # ruff: noqa
 
-def pieceWiseLinearization(functionOrRaw, xLowerBound, xUpperBound, nSegments):
+# Piecewise linearizations which have already been fitted (key: hash of the input data and the number of segments)
+_pieceWiseLinearizationCache = {}
+
+
+def getPieceWiseLinearizationInputData(functionOrRaw, xLowerBound, xUpperBound):
     """
-    Determine xSegments, ySegments.
-    If nSegments is not specified by the user it is either set (e.g. nSegments=5) or nSegements is determined by
-    a bayesian optimization algorithm.
+    Get the data points (x, y) which are fitted by the piecewise linearization. A callable is sampled at 1000 points
+    between xLowerBound and xUpperBound. Raw data which does not cover the part loads 0 and 1 is padded with the
+    conversion factor of the smallest and the largest part load, respectively.
     """
-
     if callable(functionOrRaw):
         nPointsForInputData = 1000
         x = np.linspace(xLowerBound, xUpperBound, nPointsForInputData)
@@ -27,32 +33,38 @@ def pieceWiseLinearization(functionOrRaw, xLowerBound, xUpperBound, nSegments):
             xMaxDefined = np.amax(x)
             lenIntervalDefined = xMaxDefined - xMinDefined
             lenIntervalUndefined = xMinDefined
-            nPointsUndefined = lenIntervalUndefined * (x.size / lenIntervalDefined)
-            xMinIndex = np.argmin(x)
-            for i in range(int(nPointsUndefined)):
-                x = np.append(x, [i / int(nPointsUndefined + 1) * lenIntervalUndefined])
-                y = np.append(y, y[xMinIndex])
+            nPointsUndefined = int(lenIntervalUndefined * (x.size / lenIntervalDefined))
+            xPadding = (
+                np.arange(nPointsUndefined)
+                / (nPointsUndefined + 1)
+                * lenIntervalUndefined
+            )
+            y = np.append(y, np.full(nPointsUndefined, y[np.argmin(x)]))
+            x = np.append(x, xPadding)
         if 1.0 not in x:
             xMinDefined = np.amin(x)
             xMaxDefined = np.amax(x)
             lenIntervalDefined = xMaxDefined - xMinDefined
             lenIntervalUndefined = 1.0 - xMaxDefined
-            nPointsUndefined = lenIntervalUndefined * (x.size / lenIntervalDefined)
-            xMaxIndex = np.argmax(x)
-            for i in range(int(nPointsUndefined)):
-                x = np.append(
-                    x,
-                    [
-                        xMaxDefined
-                        + (i + 1) / int(nPointsUndefined) * lenIntervalUndefined
-                    ],
-                )
-                y = np.append(y, y[xMaxIndex])
+            nPointsUndefined = int(lenIntervalUndefined * (x.size / lenIntervalDefined))
+            xPadding = xMaxDefined + (
+                np.arange(1, nPointsUndefined + 1)
+                / max(nPointsUndefined, 1)
+                * lenIntervalUndefined
+            )
+            y = np.append(y, np.full(nPointsUndefined, y[np.argmax(x)]))
+            x = np.append(x, xPadding)
+    return x, y
 
-    myPwlf = pwlf.PiecewiseLinFit(x, y)
 
-    if nSegments is None:
-        nSegments = 5
+def _fitPieceWiseLinearization(x, y, nSegments):
+    """
+    Fit a piecewise linear function with nSegments line segments to the data points (x, y).
+    """
+    # pwlf imports scipy and is therefore only imported when a linearization is computed
+    import pwlf
+
+    myPwlf = pwlf.PiecewiseLinFit(x, y)
 
     xSegments = myPwlf.fit(nSegments)
 
@@ -62,34 +74,16 @@ def pieceWiseLinearization(functionOrRaw, xLowerBound, xUpperBound, nSegments):
     # Calcualte the R^2 value
     Rsquared = myPwlf.r_squared()
 
-    # Calculate the piecewise R^2 value
-    R2values = np.zeros(nSegments)
-    for i in range(nSegments):
-        # Segregate the data based on break point locations
-        xMin = myPwlf.fit_breaks[i]
-        xMax = myPwlf.fit_breaks[i + 1]
-        xTemp = myPwlf.x_data
-        yTemp = myPwlf.y_data
-        indTemp = np.where(xTemp >= xMin)
-        xTemp = myPwlf.x_data[indTemp]
-        yTemp = myPwlf.y_data[indTemp]
-        indTemp = np.where(xTemp <= xMax)
-        xTemp = xTemp[indTemp]
-        yTemp = yTemp[indTemp]
-
-        # Predict for the new data
-        yHatTemp = myPwlf.predict(xTemp)
-
-        # Calcualte ssr
-        e = yHatTemp - yTemp
-        ssr = np.dot(e, e)
-
-        # Calculate sst
-        yBar = np.ones(yTemp.size) * np.mean(yTemp)
-        ydiff = yTemp - yBar
-        sst = np.dot(ydiff, ydiff)
-
-        R2values[i] = 1.0 - (ssr / sst)
+    # Calculate the piecewise R^2 value, the data points are assigned to all segments which include them (data
+    # points at the break points are assigned to both adjacent segments)
+    inSegment = (myPwlf.x_data >= myPwlf.fit_breaks[:-1, None]) & (
+        myPwlf.x_data <= myPwlf.fit_breaks[1:, None]
+    )
+    yData = np.where(inSegment, myPwlf.y_data, 0)
+    yBar = yData.sum(axis=1) / inSegment.sum(axis=1)
+    ssr = np.where(inSegment, myPwlf.predict(myPwlf.x_data) - myPwlf.y_data, 0) ** 2
+    sst = np.where(inSegment, myPwlf.y_data - yBar[:, None], 0) ** 2
+    R2values = 1.0 - ssr.sum(axis=1) / sst.sum(axis=1)
 
     return {
         "xSegments": xSegments,
@@ -100,7 +94,132 @@ def pieceWiseLinearization(functionOrRaw, xLowerBound, xUpperBound, nSegments):
     }
 
 
-def getDiscretizedPartLoad(commodityConversionFactorsPartLoad, nSegments):
+def _getPieceWiseLinearizationKey(x, y, nSegments):
+    """
+    Get the cache key of a piecewise linearization (hash of the data points and the number of segments).
+    """
+    key = hashlib.sha256()
+    for data in (x, y):
+        key.update(np.ascontiguousarray(data, dtype=float).tobytes())
+    key.update(str(nSegments).encode())
+    return key.hexdigest()
+
+
+def _getCachedPieceWiseLinearization(key, cacheDirectory):
+    """
+    Get a copy of a cached piecewise linearization from the memory or the cache directory (None if not cached).
+    """
+    if key not in _pieceWiseLinearizationCache and cacheDirectory is not None:
+        fileName = os.path.join(cacheDirectory, key + ".npz")
+        if os.path.isfile(fileName):
+            with np.load(fileName) as data:
+                _pieceWiseLinearizationCache[key] = {
+                    "xSegments": data["xSegments"],
+                    "ySegments": data["ySegments"],
+                    "nSegments": int(data["nSegments"]),
+                    "Rsquared": float(data["Rsquared"]),
+                    "R2values": data["R2values"],
+                }
+    if key not in _pieceWiseLinearizationCache:
+        return None
+    # The discretized part loads are corrected in place, the cached arrays must not be modified
+    return copy.deepcopy(_pieceWiseLinearizationCache[key])
+
+
+def _setCachedPieceWiseLinearization(key, linearization, cacheDirectory):
+    """
+    Store a piecewise linearization in the memory and, if specified, in the cache directory.
+    """
+    _pieceWiseLinearizationCache[key] = copy.deepcopy(linearization)
+    if cacheDirectory is not None:
+        os.makedirs(cacheDirectory, exist_ok=True)
+        np.savez(os.path.join(cacheDirectory, key + ".npz"), **linearization)
+
+
+def clearPieceWiseLinearizationCache():
+    """
+    Clear the piecewise linearizations which are cached in the memory.
+    """
+    _pieceWiseLinearizationCache.clear()
+
+
+def pieceWiseLinearization(
+    functionOrRaw, xLowerBound, xUpperBound, nSegments, cacheDirectory=None
+):
+    """
+    Determine xSegments, ySegments.
+    If nSegments is not specified by the user it is either set (e.g. nSegments=5) or nSegements is determined by
+    a bayesian optimization algorithm.
+    The linearizations are cached in the memory (and in the cacheDirectory if specified) with the data points and
+    the number of segments as key, such that the fit is not repeated for identical part load curves.
+    """
+    if nSegments is None:
+        nSegments = 5
+
+    x, y = getPieceWiseLinearizationInputData(functionOrRaw, xLowerBound, xUpperBound)
+    key = _getPieceWiseLinearizationKey(x, y, nSegments)
+    linearization = _getCachedPieceWiseLinearization(key, cacheDirectory)
+    if linearization is None:
+        linearization = _fitPieceWiseLinearization(x, y, nSegments)
+        _setCachedPieceWiseLinearization(key, linearization, cacheDirectory)
+    return linearization
+
+
+def precomputePieceWiseLinearizations(
+    functionsOrRaws,
+    nSegments=None,
+    xLowerBound=0,
+    xUpperBound=1,
+    cacheDirectory=None,
+    processes=None,
+):
+    """
+    Fit the piecewise linearizations of several part load curves in parallel and cache them, such that the
+    construction of ConversionPartLoad components with these part load curves does not repeat the fits.
+    Identical part load curves and curves which are already cached are only fitted once.
+
+    :param functionsOrRaws: part load curves (callables or DataFrames, cf. commodityConversionFactorsPartLoad of
+        the ConversionPartLoad class).
+    :type functionsOrRaws: list
+
+    :param nSegments: number of line segments of the piecewise linearizations (cf. ConversionPartLoad class).
+        |br| * the default value is None
+    :type nSegments: None or integer
+
+    :param cacheDirectory: directory in which the piecewise linearizations are cached on disk additionally.
+        |br| * the default value is None
+    :type cacheDirectory: string or None
+
+    :param processes: number of worker processes. If None, the number of CPUs is used.
+        |br| * the default value is None
+    :type processes: strictly positive integer or None
+    """
+    if nSegments is None:
+        nSegments = 5
+
+    # The callables are sampled in this process, only the data points are passed to the worker processes
+    fits = {}
+    for functionOrRaw in functionsOrRaws:
+        x, y = getPieceWiseLinearizationInputData(
+            functionOrRaw, xLowerBound, xUpperBound
+        )
+        key = _getPieceWiseLinearizationKey(x, y, nSegments)
+        if _getCachedPieceWiseLinearization(key, cacheDirectory) is None:
+            fits[key] = (x, y, nSegments)
+    if len(fits) == 0:
+        return
+
+    with multiprocessing.Pool(
+        processes=min(len(fits), processes or os.cpu_count())
+    ) as pool:
+        linearizations = pool.starmap(_fitPieceWiseLinearization, fits.values())
+    for key, linearization in zip(fits.keys(), linearizations):
+        _setCachedPieceWiseLinearization(key, linearization, cacheDirectory)
+
+
+def getDiscretizedPartLoad(
+    commodityConversionFactorsPartLoad, nSegments, cacheDirectory=None
+):
     """Preprocess the conversion factors passed by the user"""
     discretizedPartLoad = {
         commod: None for commod in commodityConversionFactorsPartLoad.keys()
@@ -114,6 +233,7 @@ def getDiscretizedPartLoad(commodityConversionFactorsPartLoad, nSegments):
                 xLowerBound=0,
                 xUpperBound=1,
                 nSegments=nSegments,
+                cacheDirectory=cacheDirectory,
             )
             functionOrRawCommod = commod
             nSegments = discretizedPartLoad[commod]["nSegments"]
@@ -278,6 +398,7 @@ class ConversionPartLoad(Conversion):
         commodityConversionFactors,
         commodityConversionFactorsPartLoad,
         nSegments=None,
+        linearizationCacheDirectory=None,
         **kwargs,
     ):
         """
@@ -327,6 +448,14 @@ class ConversionPartLoad(Conversion):
             |br| * the default value is None
         :type nSegments: None or integer or string
 
+        :param linearizationCacheDirectory: directory in which the piecewise linearizations are cached on disk.
+            The piecewise linearizations are always cached in the memory, such that part load curves which are used
+            by several components (or in several energy system models) are only fitted once. If a cache directory
+            is specified, the piecewise linearizations are also reused across Python sessions. The linearizations of
+            several part load curves can be fitted in parallel in advance with precomputePieceWiseLinearizations.
+            |br| * the default value is None
+        :type linearizationCacheDirectory: string or None
+
         :param **kwargs: All other keyword arguments of the conversion class can be defined as well.
         :type **kwargs:
             * Check Conversion Class documentation.
@@ -350,7 +479,9 @@ class ConversionPartLoad(Conversion):
             )
             self.commodityConversionFactorsPartLoad = commodityConversionFactorsPartLoad
             self.discretizedPartLoad, self.nSegments = getDiscretizedPartLoad(
-                commodityConversionFactorsPartLoad, nSegments
+                commodityConversionFactorsPartLoad,
+                nSegments,
+                cacheDirectory=linearizationCacheDirectory,
             )
 
         elif type(commodityConversionFactorsPartLoad) == tuple:
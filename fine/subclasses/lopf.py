@@ -1,9 +1,88 @@
 from fine.transmission import Transmission, TransmissionModel
 from fine import utils
+import collections
 import pyomo.environ as pyomo
 import pandas as pd
 
 
+def getSpanningForest(nodes, edges):
+    """
+    Get a spanning forest of a network graph with a breadth-first search starting at the (sorted) first node of each
+    connected component.
+
+    :param nodes: nodes of the network graph.
+    :type nodes: iterable
+
+    :param edges: edges of the network graph given as (edge name, node 1, node 2).
+    :type edges: list of tuples
+
+    :returns: the root node of the tree of each node and, for all other nodes, the parent node, the edge name and
+        the direction of the edge (1 if the edge is directed from the node to its parent, -1 otherwise)
+    :rtype: tuple of dicts
+    """
+    adjacency = {node: [] for node in nodes}
+    for edge, node1, node2 in edges:
+        adjacency[node1].append((node2, edge, 1))
+        adjacency[node2].append((node1, edge, -1))
+
+    roots, parents = {}, {}
+    for root in sorted(adjacency):
+        if root in roots:
+            continue
+        roots[root], queue = root, collections.deque([root])
+        while queue:
+            node = queue.popleft()
+            for neighbor, edge, direction in adjacency[node]:
+                if neighbor not in roots:
+                    roots[neighbor] = root
+                    # The edge is directed from the neighbor (child) to the node (parent) if direction is -1
+                    parents[neighbor] = (node, edge, -direction)
+                    queue.append(neighbor)
+    return roots, parents
+
+
+def getCycleBasis(nodes, edges):
+    """
+    Get a cycle basis (fundamental cycles of a spanning forest) of a network graph. Each edge which is not part of
+    the spanning forest closes one cycle with the path between its nodes in the spanning forest.
+
+    :param nodes: nodes of the network graph.
+    :type nodes: iterable
+
+    :param edges: edges of the network graph given as (edge name, node 1, node 2).
+    :type edges: list of tuples
+
+    :returns: cycles given as lists of (edge name, direction), where the direction is 1 if the cycle traverses
+        the edge from node 1 to node 2 and -1 otherwise
+    :rtype: list of lists
+    """
+    _, parents = getSpanningForest(nodes, edges)
+    treeEdges = {edge for _, edge, _ in parents.values()}
+
+    def getPathToRoot(node):
+        path = []
+        while node in parents:
+            parent, edge, direction = parents[node]
+            path.append((node, edge, direction))
+            node = parent
+        return path
+
+    cycles = []
+    for edge, node1, node2 in edges:
+        if edge in treeEdges:
+            continue
+        # The cycle traverses the edge from node 1 to node 2, goes up the tree from node 2 to the lowest common
+        # ancestor and down the tree to node 1
+        path1, path2 = getPathToRoot(node1), getPathToRoot(node2)
+        commonNodes = {node for node, _, _ in path1} & {node for node, _, _ in path2}
+        cycles.append(
+            [(edge, 1)]
+            + [(e, d) for node, e, d in path2 if node not in commonNodes]
+            + [(e, -d) for node, e, d in reversed(path1) if node not in commonNodes]
+        )
+    return cycles
+
+
 class LinearOptimalPowerFlow(Transmission):
     """
     A LinearOptimalPowerFlow component shows the behavior of a Transmission component but additionally models a
@@ -48,6 +127,7 @@ class LinearOptimalPowerFlow(Transmission):
         technicalLifetime=None,
         stockCommissioning=None,
         floorTechnicalLifetime=True,
+        cycleBasisFormulation=False,
     ):
         """
         Constructor for creating an LinearOptimalPowerFlow class instance.
@@ -60,6 +140,17 @@ class LinearOptimalPowerFlow(Transmission):
         :param reactances: reactances for DC power flow modeling (of AC lines) given as a Pandas DataFrame. The row and column indices of the DataFrame have to equal
             the in the energy system model specified locations.
         :type reactances: Pandas DataFrame.
+
+        **Default arguments:**
+
+        :param cycleBasisFormulation: states if the linearized power flow is modeled with Kirchhoff's voltage law
+            over a cycle basis of the network graph of the component (True) instead of phase angle variables at
+            each node (False). The cycle basis formulation does not require phase angle variables and has fewer
+            constraints, which reduces the solve time for large meshed grids. The optimal flows are the same. The
+            phase angles are determined from the optimal flows after the optimization (with a phase angle of zero
+            at the reference node of each connected part of the network).
+            |br| * the default value is False
+        :type cycleBasisFormulation: boolean
         """
         Transmission.__init__(
             self,
@@ -100,6 +191,9 @@ class LinearOptimalPowerFlow(Transmission):
         )
 
         self.modelingClass = LOPFModel
+        if not isinstance(cycleBasisFormulation, bool):
+            raise TypeError("cycleBasisFormulation has to be a boolean.")
+        self.cycleBasisFormulation = cycleBasisFormulation
 
         self.reactances2dim = reactances
 
@@ -144,6 +238,7 @@ class LOPFModel(TransmissionModel):
             return (
                 (loc, compName)
                 for compName, comp in compDict.items()
+                if not comp.cycleBasisFormulation
                 for loc in compDict[compName]._mapL.keys()
             )
 
@@ -153,6 +248,48 @@ class LOPFModel(TransmissionModel):
             pyomo.Set(dimen=2, initialize=initPhaseAngleVarSet),
         )
 
+    def getNetworkEdges(self, compName):
+        """
+        Get the edges (lines) of the network graph of a component given as (connection, node 1, node 2). Each line is
+        represented by the connection from the alphabetically smaller to the larger location.
+        """
+        comp = self.componentsDict[compName]
+        return [
+            (loc, *comp._mapC[loc])
+            for loc in comp.processedLocationalEligibility.index
+            if comp.processedLocationalEligibility[loc] == 1
+            and comp._mapC[loc][0] < comp._mapC[loc][1]
+        ]
+
+    def initCycleSet(self, pyM):
+        """
+        Declare the cycle set of the components with the cycle basis formulation. The cycle basis of the network graph
+        of each of these components is computed once and stored in the cycles dictionary of the modeling class.
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo Concrete Model
+        """
+        compDict, abbrvName = self.componentsDict, self.abbrvName
+
+        self.cycles = {
+            compName: getCycleBasis(comp._mapL.keys(), self.getNetworkEdges(compName))
+            for compName, comp in compDict.items()
+            if comp.cycleBasisFormulation
+        }
+
+        setattr(
+            pyM,
+            "cycleSet_" + abbrvName,
+            pyomo.Set(
+                dimen=2,
+                initialize=[
+                    (compName, cycle)
+                    for compName, cycles in self.cycles.items()
+                    for cycle in range(len(cycles))
+                ],
+            ),
+        )
+
     def declareSets(self, esM, pyM):
         """
         Declare sets and dictionaries: design variable sets, operation variable sets, operation mode sets and
@@ -178,7 +315,9 @@ class LOPFModel(TransmissionModel):
 
         # Declare operation variable sets
         self.declareOpVarSet(esM, pyM)
+        self.declareConnectionTable(esM, pyM)
         self.initPhaseAngleVarSet(pyM)
+        self.initCycleSet(pyM)
 
         # Declare operation variable set
         self.declareOperationModeSets(
@@ -265,6 +404,8 @@ class LOPFModel(TransmissionModel):
         )
 
         def powerFlowDC(pyM, loc, compName, ip, p, t):
+            if compDict[compName].cycleBasisFormulation:
+                return pyomo.Constraint.Skip
             node1, node2 = compDict[compName]._mapC[loc]
             return (
                 opVar[loc, compName, ip, p, t]
@@ -300,7 +441,55 @@ class LOPFModel(TransmissionModel):
         setattr(
             pyM,
             "ConstrBasePhaseAngle_" + abbrvName,
-            pyomo.Constraint(compDict.keys(), pyM.timeSet, rule=basePhaseAngle),
+            pyomo.Constraint(
+                [
+                    compName
+                    for compName, comp in compDict.items()
+                    if not comp.cycleBasisFormulation
+                ],
+                pyM.timeSet,
+                rule=basePhaseAngle,
+            ),
+        )
+
+    def kirchhoffVoltageLaw(self, pyM):
+        """
+        Declare the constraint that the sum of the voltage angle differences (flow times reactance) along each cycle
+        of the cycle basis of the network graph is zero (cycle basis formulation of the linearized power flow).
+
+        .. math::
+
+            \\sum_{(l, d) \\in cycle} d \\cdot x_{l} \\cdot \\left( op_{l,ip,p,t} - op_{\\bar{l},ip,p,t} \\right) = 0
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo Concrete Model
+        """
+        compDict, abbrvName = self.componentsDict, self.abbrvName
+        opVar = getattr(pyM, "op_" + abbrvName)
+
+        def kirchhoffVoltageLaw(pyM, compName, cycle, ip, p, t):
+            comp = compDict[compName]
+            return (
+                sum(
+                    direction
+                    * comp.reactances[loc]
+                    * (
+                        opVar[loc, compName, ip, p, t]
+                        - opVar[comp._mapI[loc], compName, ip, p, t]
+                    )
+                    for loc, direction in self.cycles[compName][cycle]
+                )
+                == 0
+            )
+
+        setattr(
+            pyM,
+            "ConstrKirchhoffVoltageLaw_" + abbrvName,
+            pyomo.Constraint(
+                getattr(pyM, "cycleSet_" + abbrvName),
+                pyM.timeSet,
+                rule=kirchhoffVoltageLaw,
+            ),
         )
 
     def declareComponentConstraints(self, esM, pyM):
@@ -321,6 +510,7 @@ class LOPFModel(TransmissionModel):
 
         self.powerFlowDC(pyM)
         self.basePhaseAngle(pyM)
+        self.kirchhoffVoltageLaw(pyM)
 
     ####################################################################################################################
     #        Declare component contributions to basic EnergySystemModel constraints and its objective function         #
@@ -337,12 +527,11 @@ class LOPFModel(TransmissionModel):
         :type pyM: pyomo Concrete Model
         """
         super().setOptimalValues(esM, pyM)
+        phaseAngleValues = getattr(pyM, "phaseAngle_" + self.abbrvName).get_values()
+        phaseAngleValues.update(self.getPhaseAnglesFromFlows(pyM))
         for ip in esM.investmentPeriods:
-            abbrvName = self.abbrvName
-            phaseAngleVar = getattr(pyM, "phaseAngle_" + abbrvName)
-
             optVal_ = utils.formatOptimizationOutput(
-                phaseAngleVar.get_values(),
+                phaseAngleValues,
                 "operationVariables",
                 "1dim",
                 ip,
@@ -351,6 +540,46 @@ class LOPFModel(TransmissionModel):
             )
             self._phaseAngleVariablesOptimum[esM.investmentPeriodNames[ip]] = optVal_
 
+    def getPhaseAnglesFromFlows(self, pyM):
+        """
+        Determine the phase angles of the components with the cycle basis formulation from the optimal flows. The
+        phase angles are propagated along a spanning forest of the network graph starting with a phase angle of zero
+        at the root node of each tree.
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo Concrete Model
+
+        :returns: phase angles with the keys (location, component, investment period, period, time step)
+        :rtype: dict
+        """
+        compDict = self.componentsDict
+        opValues = getattr(pyM, "op_" + self.abbrvName).get_values()
+
+        phaseAngleValues = {}
+        for compName in self.cycles:
+            comp = compDict[compName]
+            roots, parents = getSpanningForest(
+                comp._mapL.keys(), self.getNetworkEdges(compName)
+            )
+
+            # The nodes are ordered such that the parent node of each node precedes the node (breadth-first search)
+            for ip, p, t in pyM.timeSet:
+                for node in roots:
+                    if node not in parents:
+                        phaseAngleValues[node, compName, ip, p, t] = 0
+                        continue
+                    parent, loc, direction = parents[node]
+                    # The flow from node 1 to node 2 of a line equals the phase angle difference divided by the
+                    # reactance
+                    flow = (opValues[loc, compName, ip, p, t] or 0) - (
+                        opValues[comp._mapI[loc], compName, ip, p, t] or 0
+                    )
+                    phaseAngleValues[node, compName, ip, p, t] = (
+                        phaseAngleValues[parent, compName, ip, p, t]
+                        + direction * comp.reactances[loc] * flow
+                    )
+        return phaseAngleValues
+
     def getOptimalValues(self, name="all", ip=0):
         """
         Return optimal values of the components.
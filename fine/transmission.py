@@ -447,6 +447,72 @@ class Transmission(Component):
         # set processed location eligiblity # TODO implement check and set
         self.processedLocationalEligibility = self.locationalEligibility
 
+    def getUpdateDependencyGroups(self, esM):
+        """
+        Return the dependency groups of the component which are used for incremental updates (cf.
+        Component.getUpdateDependencyGroups). The design cost parameters of the Transmission component depend on the
+        distances of the connections and the economic parameters are given per connection.
+        """
+        groups = {
+            (paramName,): (
+                lambda paramName=paramName: self.setDistanceRelatedCostParameter(
+                    esM, paramName
+                )
+            )
+            for paramName in [
+                "investPerCapacity",
+                "investIfBuilt",
+                "opexPerCapacity",
+                "opexIfBuilt",
+            ]
+        }
+
+        def setOpexPerOperation():
+            self.opexPerOperation = utils.preprocess2dimData(
+                self.opexPerOperation, self._mapC
+            )
+            self.setInvestmentPeriodCostParameter(
+                esM, "opexPerOperation", esM.investmentPeriods
+            )
+
+        def setInterestRate():
+            self.interestRate = utils.preprocess2dimData(self.interestRate, self._mapC)
+            self.setInterestRate(esM)
+
+        groups[("opexPerOperation",)] = setOpexPerOperation
+        groups[("interestRate",)] = setInterestRate
+        return groups
+
+    def setDistanceRelatedCostParameter(self, esM, paramName):
+        """
+        Recompute the preprocessed and the processed (i.e. distance related) values of a design cost parameter from
+        its input value.
+
+        :param esM: EnergySystemModel instance representing the energy system in which the component is modeled.
+        :type esM: EnergySystemModel instance
+
+        :param paramName: name of the cost parameter, e.g. 'investPerCapacity'
+        :type paramName: string
+        """
+        _paramName = paramName[0].upper() + paramName[1:]
+        years = self.processedStockYears + esM.investmentPeriods
+        preprocessed = utils.preprocess2dimInvestmentPeriodData(
+            esM, paramName, getattr(self, paramName), years, mapC=self._mapC
+        )
+        setattr(self, "preprocessed" + _paramName, preprocessed)
+        setattr(
+            self,
+            "processed" + _paramName,
+            {
+                year: utils.preprocess2dimData(
+                    preprocessed[year], self._mapC, self.locationalEligibility
+                )
+                * self.distances
+                * 0.5
+                for year in years
+            },
+        )
+
     def setTimeSeriesData(self, hasTSA):
         """
         Function for setting the maximum operation rate and fixed operation rate depending on whether a time series
@@ -467,6 +533,9 @@ class Transmission(Component):
 
         :param ip: investment period of transformation path analysis.
         :type ip: int
+
+        :return: time series data and weights of the time series (cf. Component.getDataForTimeSeriesAggregation)
+        :rtype: tuple (list or None, dict)
         """
         weightDict, data = {}, []
         if self.fullOperationRateFix:
@@ -487,7 +556,7 @@ class Transmission(Component):
                 data,
                 ip,
             )
-        return (pd.concat(data, axis=1), weightDict) if data else (None, {})
+        return (data, weightDict) if data else (None, {})
 
     def setAggregatedTimeSeriesData(self, data, ip):
         """
@@ -564,12 +633,66 @@ class TransmissionModel(ComponentModel):
 
         # Declare operation variable set
         self.declareOpVarSet(esM, pyM)
+        self.declareConnectionTable(esM, pyM)
 
         # Declare operation mode sets
         self.declareOperationModeSets(
             pyM, "opConstrSet", "operationRateMax", "operationRateFix"
         )
 
+    def declareConnectionTable(self, esM, pyM):
+        """
+        Declare the table of the connections of the components. Each connection with operation variables gets an
+        integer id. For each id, the table stores the name of the connection, the component, the locations which
+        are connected, the commodity and the loss coefficient (1 - losses * distances) of the connection. The
+        incoming and outgoing connections of each location are listed per commodity and investment period, such
+        that the commodity balance contributions can be obtained without string operations or pandas lookups.
+
+        :param esM: EnergySystemModel instance representing the energy system in which the component should be modeled.
+        :type esM: esM - EnergySystemModel class instance
+
+        :param pyM: pyomo ConcreteModel which stores the mathematical formulation of the model.
+        :type pyM: pyomo ConcreteModel
+        """
+        compDict, abbrvName = self.componentsDict, self.abbrvName
+        opVarSet = getattr(pyM, "operationVarSet_" + abbrvName)
+
+        connections = sorted({(loc, compName) for loc, compName, ip in opVarSet})
+        self.connectionTable = pd.DataFrame(
+            [
+                (
+                    loc,
+                    compName,
+                    *compDict[compName]._mapC[loc],
+                    compDict[compName].commodity,
+                    1
+                    - compDict[compName].losses[loc]
+                    * compDict[compName].distances[loc],
+                )
+                for loc, compName in connections
+            ],
+            columns=[
+                "connection",
+                "component",
+                "locationFrom",
+                "locationTo",
+                "commodity",
+                "lossCoefficient",
+            ],
+        )
+        self._connections = connections
+        self._lossCoefficients = self.connectionTable["lossCoefficient"].tolist()
+
+        self._connectionsIn, self._connectionsOut = {}, {}
+        for connectionId, row in self.connectionTable.iterrows():
+            for ip in esM.investmentPeriods:
+                if (row["connection"], row["component"], ip) not in opVarSet:
+                    continue
+                keyIn = (row["locationTo"], row["commodity"], ip)
+                keyOut = (row["locationFrom"], row["commodity"], ip)
+                self._connectionsIn.setdefault(keyIn, []).append(connectionId)
+                self._connectionsOut.setdefault(keyOut, []).append(connectionId)
+
     ####################################################################################################################
     #                                                Declare variables                                                 #
     ####################################################################################################################
@@ -689,8 +812,7 @@ class TransmissionModel(ComponentModel):
                 return (
                     opVar[loc, compName, ip, p, t]
                     + opVar[compDict[compName]._mapI[loc], compName, ip, p, t]
-                    <= capVar[loc, compName, ip]
-                    * esM.hoursPerSegment[ip].to_dict()[p, t]
+                    <= capVar[loc, compName, ip] * esM.hoursPerSegmentTable[ip][p, t]
                 )
 
             setattr(
@@ -776,15 +898,9 @@ class TransmissionModel(ComponentModel):
         """
 
         return any(
-            [
-                comp.commodity == commod
-                and (
-                    loc + "_" + loc_ in comp.processedLocationalEligibility.index
-                    or loc_ + "_" + loc in comp.processedLocationalEligibility.index
-                )
-                for comp in self.componentsDict.values()
-                for loc_ in esM.locations
-            ]
+            (loc, commod, ip) in self._connectionsIn
+            or (loc, commod, ip) in self._connectionsOut
+            for ip in esM.investmentPeriods
         )
 
     def getCommodityBalanceContribution(self, pyM, commod, loc, ip, p, t):
@@ -799,27 +915,14 @@ class TransmissionModel(ComponentModel):
                 \\end{eqnarray*}
             
         """
-        compDict, abbrvName = self.componentsDict, self.abbrvName
-        opVar, opVarDictIn = (
-            getattr(pyM, "op_" + abbrvName),
-            getattr(pyM, "operationVarDictIn_" + abbrvName),
-        )
-        opVarDictOut = getattr(pyM, "operationVarDictOut_" + abbrvName)
+        opVar = getattr(pyM, "op_" + self.abbrvName)
+        connections, lossCoefficients = self._connections, self._lossCoefficients
         return sum(
-            opVar[loc_ + "_" + loc, compName, ip, p, t]
-            * (
-                1
-                - compDict[compName].losses[loc_ + "_" + loc]
-                * compDict[compName].distances[loc_ + "_" + loc]
-            )
-            for loc_ in opVarDictIn[ip][loc].keys()
-            for compName in opVarDictIn[ip][loc][loc_]
-            if commod == compDict[compName].commodity
+            opVar[connections[i][0], connections[i][1], ip, p, t] * lossCoefficients[i]
+            for i in self._connectionsIn.get((loc, commod, ip), [])
         ) - sum(
-            opVar[loc + "_" + loc_, compName, ip, p, t]
-            for loc_ in opVarDictOut[ip][loc].keys()
-            for compName in opVarDictOut[ip][loc][loc_]
-            if commod == compDict[compName].commodity
+            opVar[connections[i][0], connections[i][1], ip, p, t]
+            for i in self._connectionsOut.get((loc, commod, ip), [])
         )
 
     def getBalanceLimitContribution(
@@ -859,10 +962,20 @@ class TransmissionModel(ComponentModel):
         :param componentNames: Names of components which contribute to the balance limit
         :type componentNames: list
         """
-        compDict, abbrvName = self.componentsDict, self.abbrvName
-        opVar = getattr(pyM, "op_" + abbrvName)
-        opVarDictIn = getattr(pyM, "operationVarDictIn_" + abbrvName)
-        opVarDictOut = getattr(pyM, "operationVarDictOut_" + abbrvName)
+        opVar = getattr(pyM, "op_" + self.abbrvName)
+        connections, lossCoefficients = self._connections, self._lossCoefficients
+        connectionsIn = [
+            i
+            for commod in esM.commodities
+            for i in self._connectionsIn.get((loc, commod, ip), [])
+            if connections[i][1] in componentNames
+        ]
+        connectionsOut = [
+            i
+            for commod in esM.commodities
+            for i in self._connectionsOut.get((loc, commod, ip), [])
+            if connections[i][1] in componentNames
+        ]
 
         if timeSeriesAggregation:
             periods = esM.typicalPeriods
@@ -875,23 +988,16 @@ class TransmissionModel(ComponentModel):
             periods = esM.periods
             timeSteps = esM.totalTimeSteps
         aut = sum(
-            opVar[loc_ + "_" + loc, compName, ip, p, t]
-            * (
-                1
-                - compDict[compName].losses[loc_ + "_" + loc]
-                * compDict[compName].distances[loc_ + "_" + loc]
-            )
+            opVar[connections[i][0], connections[i][1], ip, p, t]
+            * lossCoefficients[i]
             * esM.periodOccurrences[ip][p]
-            for loc_ in opVarDictIn[ip][loc].keys()
-            for compName in opVarDictIn[ip][loc][loc_]
-            if compName in componentNames
+            for i in connectionsIn
             for p in periods
             for t in timeSteps
         ) - sum(
-            opVar[loc + "_" + loc_, compName, ip, p, t] * esM.periodOccurrences[ip][p]
-            for loc_ in opVarDictOut[ip][loc].keys()
-            for compName in opVarDictOut[ip][loc][loc_]
-            if compName in componentNames
+            opVar[connections[i][0], connections[i][1], ip, p, t]
+            * esM.periodOccurrences[ip][p]
+            for i in connectionsOut
             for p in periods
             for t in timeSteps
         )
@@ -1026,6 +1132,7 @@ class TransmissionModel(ComponentModel):
                 esM.periodsOrder[ip],
                 compDict=compDict,
                 esM=esM,
+                connectionTable=self.connectionTable,
             )
             self._operationVariablesOptimum[esM.investmentPeriodNames[ip]] = optVal_
 
@@ -1137,11 +1244,14 @@ class TransmissionModel(ComponentModel):
 
             # Split connection indices to two location indices
             optSummary = optSummary.stack()
-            indexNew = []
-            for tup in optSummary.index.tolist():
-                loc1, loc2 = mapC[tup[3]]
-                indexNew.append((tup[0], tup[1], tup[2], loc1, loc2))
-            optSummary.index = pd.MultiIndex.from_tuples(indexNew)
+            connections = optSummary.index.get_level_values(3)
+            optSummary.index = pd.MultiIndex.from_arrays(
+                [optSummary.index.get_level_values(level) for level in range(3)]
+                + [
+                    connections.map({conn: locs[0] for conn, locs in mapC.items()}),
+                    connections.map({conn: locs[1] for conn, locs in mapC.items()}),
+                ]
+            )
             optSummary = optSummary.unstack(level=-1)
             names = list(optSummaryBasic[esM.investmentPeriodNames[ip]].index.names)
             names.append("LocationIn")
@@ -840,6 +840,11 @@ def checkConversionDynamicSpecficDesignInputParams(compFancy, esM):
     rampUpMax = compFancy.rampUpMax
     rampDownMax = compFancy.rampDownMax
 
+    if not isinstance(compFancy.compactMinTimeFormulation, bool):
+        raise TypeError(
+            "compactMinTimeFormulation for " + name + " needs to be a boolean."
+        )
+
     if downTimeMin is not None:
         # Check if values are integers and in the intervall ]0,numberOfTimeSteps].
         if type(downTimeMin) != int:
@@ -1067,6 +1072,17 @@ def checkAndSetInvestmentPeriodTimeSeries(
 def checkAndSetTimeSeries(
     esM, name, operationTimeSeries, locationalEligibility, dimension="1dim"
 ):
+    # Time series which were already validated in bulk (cf. EnergySystemModel.addMany) are returned as they are
+    preValidated = getattr(esM, "_preValidatedTimeSeries", {}).get(
+        id(operationTimeSeries)
+    )
+    if (
+        preValidated is not None
+        and preValidated[0] is operationTimeSeries
+        and dimension == "1dim"
+    ):
+        return preValidated[1]
+
     if operationTimeSeries is not None:
         if not isinstance(operationTimeSeries, pd.DataFrame):
             if len(esM.locations) == 1:
@@ -1165,16 +1181,222 @@ def checkAndSetTimeSeries(
                 + "All entries in operationTimeSeries parameter series have to be positive."
             )
 
-        _operationTimeSeries = _operationTimeSeries.copy()
-        _operationTimeSeries["Period"], _operationTimeSeries["TimeStep"] = (
-            0,
-            _operationTimeSeries.index,
-        )
-        return _operationTimeSeries.set_index(["Period", "TimeStep"])
+        # astype already returns a copy, so the shared (Period, TimeStep) index can be set directly
+        _operationTimeSeries.index = esM._timeSeriesIndex
+        return _operationTimeSeries
 
     else:
         return None
 
+
+# Economic parameters of the components which are checked by checkAndSetCostParameter
+costParameterNames = [
+    "investPerCapacity",
+    "investIfBuilt",
+    "opexPerOperation",
+    "opexPerChargeOperation",
+    "opexPerDischargeOperation",
+    "opexPerCapacity",
+    "opexIfBuilt",
+    "QPcostScale",
+    "interestRate",
+    "economicLifetime",
+    "technicalLifetime",
+    "commodityCost",
+    "commodityRevenue",
+]
+
+
+def checkComponentParameterTable(componentParameters):
+    """
+    Check the component parameter table of a bulk component construction (cf. EnergySystemModel.addMany).
+    """
+    if not isinstance(componentParameters, pd.DataFrame):
+        raise TypeError(
+            "The componentParameters have to be a pandas DataFrame with the component names as index."
+        )
+    if not componentParameters.index.is_unique:
+        raise ValueError("The component names in componentParameters are not unique.")
+
+
+def checkAndSetCostParameterTable(esM, componentParameters):
+    """
+    Check the economic parameters of a bulk component construction (cf. EnergySystemModel.addMany) which are
+    given as numbers with vectorized checks and store them in one float block (one row per component and parameter,
+    one column per location). Economic parameters which are given as pandas Series are checked by the component
+    constructors.
+
+    :return: dictionary with (component name, parameter name) as keys and the processed economic parameters as
+        values (pandas Series with the locations as index). The Series are views into the shared block.
+    :rtype: dict
+    """
+    numbers = {}
+    for param in costParameterNames:
+        if param not in componentParameters.columns:
+            continue
+        values = componentParameters[param]
+        isNumber = values.map(
+            lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)
+        ).astype(bool)
+        values = values[isNumber].astype(float).dropna()
+        negative = values.index[values < 0]
+        if len(negative) > 0:
+            raise ValueError(
+                "Value error in "
+                + param
+                + " detected.\n Economic parameters have to be positive. Components: "
+                + str(list(negative))
+            )
+        numbers[param] = values
+
+    if "economicLifetime" in numbers and "technicalLifetime" in numbers:
+        economicLifetime, technicalLifetime = numbers["economicLifetime"].align(
+            numbers["technicalLifetime"], join="inner"
+        )
+        invalid = economicLifetime.index[economicLifetime > technicalLifetime]
+        if len(invalid) > 0:
+            raise ValueError(
+                "Economic Lifetime must be smaller than technical Lifetime. Components: "
+                + str(list(invalid))
+            )
+
+    if len(numbers) == 0:
+        return {}
+    locations = pd.Index(list(esM.locations))
+    values = pd.concat(numbers, names=["parameter", "component"])
+    block = np.repeat(values.to_numpy()[:, np.newaxis], len(locations), axis=1)
+    return {
+        (comp, param): pd.Series(block[i], index=locations, copy=False)
+        for i, (param, comp) in enumerate(values.index)
+    }
+
+
+def checkAndSetTimeSeriesTable(esM, componentParameters, timeSeriesData):
+    """
+    Check the time series data of a bulk component construction (cf. EnergySystemModel.addMany) with vectorized
+    checks and store it in one column-major float block.
+
+    :param timeSeriesData: time series data with the time steps of the energy system model as index and the
+        component name, the parameter name and the location as column levels
+    :type timeSeriesData: pandas DataFrame
+
+    :return: dictionary with (component name, parameter name) as keys and tuples of the raw and the processed time
+        series data as values. The processed time series data are views into the shared block, the raw time series
+        data are views into a copy of it.
+    :rtype: dict
+    """
+    if timeSeriesData is None:
+        return {}
+    if (
+        not isinstance(timeSeriesData, pd.DataFrame)
+        or not isinstance(timeSeriesData.columns, pd.MultiIndex)
+        or timeSeriesData.columns.nlevels != 3
+    ):
+        raise TypeError(
+            "The timeSeriesData has to be a pandas DataFrame with the column levels "
+            + "(component name, parameter name, location)."
+        )
+    checkTimeSeriesIndex(esM, timeSeriesData)
+
+    components = timeSeriesData.columns.get_level_values(0)
+    if not set(components) <= set(componentParameters.index):
+        raise ValueError(
+            "The timeSeriesData contains components which are not given in componentParameters: "
+            + str(sorted(set(components) - set(componentParameters.index)))
+        )
+    if not set(timeSeriesData.columns.get_level_values(2)) <= esM.locations:
+        raise ValueError(
+            "Location indices do not match the one of the specified energy system model.\n"
+            + "Data columns: "
+            + str(set(timeSeriesData.columns.get_level_values(2)))
+            + "\n"
+            + "Energy system model regions: "
+            + str(esM.locations)
+        )
+    if timeSeriesData.columns.has_duplicates:
+        raise ValueError("The timeSeriesData contains duplicate columns.")
+
+    # Reindex the columns such that every (component, parameter) pair covers all locations in the order of
+    # _locationsOrdered. Missing locations are filled with 0s (as done by checkRegionalColumnTitles).
+    pairs = timeSeriesData.columns.droplevel(2).unique().sort_values()
+    columns = pd.MultiIndex.from_tuples(
+        [(comp, param, loc) for comp, param in pairs for loc in esM._locationsOrdered]
+    )
+    data = timeSeriesData.reindex(columns=columns)
+    try:
+        block = np.asfortranarray(data.to_numpy(dtype=float))
+    except (TypeError, ValueError):
+        raise ValueError(
+            "Value error in timeSeriesData detected.\n"
+            + "The time series data contains values which are not numbers."
+        )
+
+    # Vectorized value checks over the whole block
+    nLocs = len(esM._locationsOrdered)
+    isMissing = np.isnan(block)
+    missingPairs = isMissing.all(axis=0).reshape(-1, nLocs).any(axis=1)
+    if (isMissing.any(axis=0) & ~isMissing.all(axis=0)).any():
+        raise ValueError(
+            "Value error in timeSeriesData detected.\n"
+            + "An operationTimeSeries parameter contains values which are not numbers."
+        )
+    if (block[~isMissing] < 0).any():
+        raise ValueError(
+            "Value error in timeSeriesData detected.\n"
+            + "All entries in operationTimeSeries parameter series have to be positive."
+        )
+    block[isMissing] = 0
+
+    # Eligibility checks: missing locations require a locationalEligibility, and time series must not indicate a
+    # different eligibility than the locationalEligibility
+    hasFlow = (block.sum(axis=0) > 0).reshape(-1, nLocs)
+    for i, (comp, param) in enumerate(pairs):
+        if "locationalEligibility" in componentParameters.columns:
+            elig = componentParameters.at[comp, "locationalEligibility"]
+        else:
+            elig = None
+        if not isinstance(elig, pd.Series):
+            if missingPairs[i]:
+                raise ValueError(
+                    "Location indices of "
+                    + param
+                    + " of "
+                    + comp
+                    + " do not match the one of the specified energy system model.\n"
+                    + "If this was intentional, please provide locationalEligibility to cross-check."
+                )
+        elif (
+            hasFlow[i] > elig.reindex(esM._locationsOrdered).fillna(0).to_numpy()
+        ).any():
+            raise ValueError(
+                "The locationalEligibility and "
+                + comp
+                + " parameters indicate different"
+                + " eligibilities."
+            )
+
+    # The raw time series data is held in a copy of the block such that the processed data is not changed with it
+    rawBlock, rawIndex = block.copy(order="F"), pd.Index(esM.totalTimeSteps)
+    timeSeriesDict = {}
+    for i, (comp, param) in enumerate(pairs):
+        columns = slice(i * nLocs, (i + 1) * nLocs)
+        timeSeriesDict[(comp, param)] = (
+            pd.DataFrame(
+                rawBlock[:, columns],
+                index=rawIndex,
+                columns=esM._locationsOrdered,
+                copy=False,
+            ),
+            pd.DataFrame(
+                block[:, columns],
+                index=esM._timeSeriesIndex,
+                columns=esM._locationsOrdered,
+                copy=False,
+            ),
+        )
+    return timeSeriesDict
+
+
 def checkDesignVariableModelingParameters(
     esM,
     capacityVariableDomain,
@@ -1238,6 +1460,12 @@ def checkFlooringParameter(floorTechnicalLifetime, technicalLifetime, interval):
 
 
 def checkAndSetCostParameter(esM, name, data, dimension, locationalEligibility):
+    # Economic parameters which were already checked in bulk (cf. EnergySystemModel.addMany) are returned as views
+    preValidated = getattr(esM, "_preValidatedCostParameters", {}).get((name, id(data)))
+    if preValidated is not None and preValidated[0] is data and dimension == "1dim":
+        processed = preValidated[1]
+        return pd.Series(processed.values, index=processed.index, copy=False)
+
     if dimension == "1dim":
         if not (
             isinstance(data, int)
@@ -1757,6 +1985,66 @@ def checkOptimizeInput(
         raise ValueError("The warmstart parameter has to be a boolean.")
 
 
+def checkRollingHorizonInput(
+    esM, timeSeriesAggregation, window, overlap, sparseOperation=False
+):
+    """
+    Check if the energy system model can be optimized in consecutive time windows (cf.
+    EnergySystemModel.optimize with mode="rollingHorizon"), i.e. if it is a pure dispatch problem without
+    constraints which couple the whole time horizon.
+    """
+    isStrictlyPositiveInt(window)
+    if not type(overlap) == int or overlap < 0:
+        raise ValueError("The overlap parameter has to be a nonnegative integer.")
+    if sparseOperation:
+        raise ValueError(
+            "The rolling horizon optimization does not support the sparseOperation parameter since the window"
+            + " model is declared once and updated with the time series data of the following windows."
+        )
+
+    if timeSeriesAggregation:
+        raise ValueError(
+            "The rolling horizon optimization requires the full temporal resolution"
+            + " (timeSeriesAggregation=False)."
+        )
+    if esM.numberOfInvestmentPeriods != 1 or esM.stochasticModel:
+        raise ValueError(
+            "The rolling horizon optimization is only available for models with a single investment period."
+        )
+    if esM.balanceLimit is not None:
+        raise ValueError(
+            "The rolling horizon optimization does not support balanceLimits since they refer to the whole"
+            + " time horizon."
+        )
+
+    for mdl in esM.componentModelingDict.values():
+        for compName, comp in mdl.componentsDict.items():
+            if comp.hasCapacityVariable and comp.processedCapacityFix is None:
+                raise ValueError(
+                    "The rolling horizon optimization requires fixed capacities. Set the capacityFix"
+                    + " parameter of component "
+                    + compName
+                    + "."
+                )
+            if comp.hasIsBuiltBinaryVariable and comp.isBuiltFix is None:
+                raise ValueError(
+                    "The rolling horizon optimization requires fixed binary design decisions. Set the"
+                    + " isBuiltFix parameter of component "
+                    + compName
+                    + "."
+                )
+            if (
+                getattr(comp, "processedYearlyFullLoadHoursMin", None) is not None
+                or getattr(comp, "processedYearlyFullLoadHoursMax", None) is not None
+                or getattr(comp, "commodityLimitID", None) is not None
+            ):
+                raise ValueError(
+                    "The rolling horizon optimization does not support yearly limits (component "
+                    + compName
+                    + ") since they refer to the whole time horizon."
+                )
+
+
 def setFormattedTimeSeries(timeSeries):
     if timeSeries is None:
         return timeSeries
@@ -1766,46 +2054,142 @@ def setFormattedTimeSeries(timeSeries):
         return data.set_index(["Period", "TimeStep"])
 
 
+def getFullTimeSeriesGatherIndex(esM, periodsOrder, ip, numberOfColumns):
+    """
+    Get the gather index which maps each time step of the full temporal resolution to a column of the typical period
+    data (typical period * numberOfColumns + time step or segment in the typical period). If segmentation is
+    considered, the number of time steps represented by the segment of each time step is returned as divisor as well.
+    The gather index is cached in the EnergySystemModel instance (cf. aggregateTemporally).
+
+    :param esM: EnergySystemModel instance or None
+    :type esM: EnergySystemModel instance or None
+
+    :param periodsOrder: order of the typical periods which cover the full time horizon
+    :type periodsOrder: list or numpy array
+
+    :param ip: investment period of transformation path analysis.
+    :type ip: int
+
+    :param numberOfColumns: number of time steps or segments per typical period
+    :type numberOfColumns: int
+
+    :return: gather index, divisor (None if segmentation is not considered)
+    :rtype: tuple (numpy array, numpy array or None)
+    """
+    periodsOrder = np.asarray(periodsOrder)
+    segmentation = esM is not None and bool(getattr(esM, "segmentation", False))
+    cache = getattr(esM, "_fullTimeSeriesGatherIndex", None)
+    if cache is not None and ip in cache:
+        _periodsOrder, _segmentation, _numberOfColumns, gather, divisor = cache[ip]
+        if (
+            _segmentation == segmentation
+            and _numberOfColumns == numberOfColumns
+            and np.array_equal(_periodsOrder, periodsOrder)
+        ):
+            return gather, divisor
+
+    if segmentation:
+        # Number of time steps per segment with the typical periods as rows and the segments as columns
+        timeStepsPerSegment = (
+            esM.timeStepsPerSegment[ip].unstack(level=1).to_numpy(dtype=int)
+        )
+        # Segment of each time step in each typical period
+        segmentOfTimeStep = np.array(
+            [np.repeat(np.arange(numberOfColumns), rep) for rep in timeStepsPerSegment]
+        )
+        gather = (
+            periodsOrder[:, None] * numberOfColumns + segmentOfTimeStep[periodsOrder]
+        ).ravel()
+        divisor = (
+            np.take_along_axis(timeStepsPerSegment, segmentOfTimeStep, axis=1)[
+                periodsOrder
+            ]
+            .ravel()
+            .astype(float)
+        )
+    else:
+        gather = (
+            periodsOrder[:, None] * numberOfColumns + np.arange(numberOfColumns)
+        ).ravel()
+        divisor = None
+
+    if cache is not None:
+        cache[ip] = (periodsOrder, segmentation, numberOfColumns, gather, divisor)
+    return gather, divisor
+
+
 def buildFullTimeSeries(df, periodsOrder, ip, axis=1, esM=None, divide=True):
-    # If segmentation is chosen, the segments of each period need to be unravelled to the original number of
-    # time steps first
-    if esM is not None and esM.segmentation:
-        dataAllPeriods = []
-        for p in esM.typicalPeriods:
-            # Repeat each segment in each period as often as time steps are represented by the corresponding
-            # segment
-            repList = (
-                esM.timeStepsPerSegment[ip].loc[p, :].tolist()
-            )  # timeStepsPerSegment now ip-dependent
-            # if divide is set to True, the values are divided when being unravelled, e.g. in order to fit provided
-            # energy per segment provided energy per time step
-            if divide:
-                dataPeriod = pd.DataFrame(
-                    np.repeat(np.divide(df.loc[p].values, repList), repList, axis=1),
-                    index=df.xs(p, level=0, drop_level=False).index,
-                )
+    """
+    Re-engineer the full time series from data given for the typical periods. The first index level of df contains
+    the typical periods and the columns contain the time steps (or segments) per typical period. The returned data
+    has the remaining index levels as index and the time steps of the full temporal resolution as columns. The full
+    time series is obtained with one gather operation over all rows (cf. getFullTimeSeriesGatherIndex).
 
-            # if divide is set to Frue, the values are not divided when being unravelled e.g. in case of time-
-            # independent costs
-            else:
-                dataPeriod = pd.DataFrame(
-                    np.repeat(df.loc[p].values, repList, axis=1),
-                    index=df.xs(p, level=0, drop_level=False).index,
-                )
-            dataAllPeriods.append(dataPeriod)
-        # Concat data to multiindex dataframe with periods, components and locations as indices and inner-
-        # period time steps as columns
-        df = pd.concat(dataAllPeriods, axis=0)
-    # Concat data according to periods order to cover the full time horizon
-    data = []
-    for p in periodsOrder:
-        data.append(df.loc[p])
+    :param df: data of the typical periods
+    :type df: pandas DataFrame
+
+    :param periodsOrder: order of the typical periods which cover the full time horizon
+    :type periodsOrder: list or numpy array
+
+    :param ip: investment period of transformation path analysis.
+    :type ip: int
+
+    **Default arguments:**
+
+    :param axis: axis along which the periods are concatenated. Only the default value 1 unravels segments.
+        |br| * the default value is 1
+    :type axis: int
+
+    :param esM: EnergySystemModel instance. Required if segmentation is considered.
+        |br| * the default value is None
+    :type esM: EnergySystemModel instance or None
+
+    :param divide: states if the values are divided by the number of time steps per segment when being unravelled,
+        e.g. in order to fit provided energy per segment to provided energy per time step. Time-independent values
+        (e.g. costs) are not divided.
+        |br| * the default value is True
+    :type divide: boolean
+
+    :return: full time series
+    :rtype: pandas DataFrame
+    """
+    if axis != 1:
+        return pd.concat(
+            [df.loc[p] for p in periodsOrder], axis=axis, ignore_index=True
+        )
+
+    numberOfColumns = df.shape[1]
+    gather, divisor = getFullTimeSeriesGatherIndex(
+        esM, periodsOrder, ip, numberOfColumns
+    )
+
+    # Write the data of all typical periods into one block with the rows of the remaining index levels and the
+    # columns (typical period, time step)
+    periods = df.index.get_level_values(0).to_numpy(dtype=int)
+    restIndex = df.index.droplevel(0)
+    rows, index = pd.factorize(restIndex, sort=True)
+    index = index.set_names(restIndex.names)
+    numberOfPeriods = max(periods.max(), np.max(periodsOrder)) + 1
+    block = np.full((len(index), numberOfPeriods * numberOfColumns), np.nan)
+    block[
+        rows[:, None], periods[:, None] * numberOfColumns + np.arange(numberOfColumns)
+    ] = df.to_numpy(dtype=float)
 
-    return pd.concat(data, axis=axis, ignore_index=True)
+    values = block.take(gather, axis=1)
+    if divisor is not None and divide:
+        values /= divisor
+    return pd.DataFrame(values, index=index)
 
 
 def formatOptimizationOutput(
-    data, varType, dimension, ip, periodsOrder=None, compDict=None, esM=None
+    data,
+    varType,
+    dimension,
+    ip,
+    periodsOrder=None,
+    compDict=None,
+    esM=None,
+    connectionTable=None,
 ):
     """
     Functionality for formatting the optimization output. The function is used in the
@@ -1850,6 +2234,12 @@ def formatOptimizationOutput(
         |br| * the default value is None
     :type esM: EnergySystemModel instance
 
+    :param connectionTable: table of the connections of the components with the columns 'connection',
+        'component', 'locationFrom' and 'locationTo' (cf. TransmissionModel.declareConnectionTable). If None, the
+        locations of the connections are obtained from the compDict.
+        |br| * the default value is None
+    :type connectionTable: pandas DataFrame
+
     :return: formatted version of data. If data is an empty dictionary, it returns None.
     :rtype: pandas DataFrame
     """
@@ -1877,11 +2267,8 @@ def formatOptimizationOutput(
         df = pd.DataFrame(data, index=[0]).T
         df = df[df.index.get_level_values(2) == ip]
         df = df.reset_index(level=2, drop=True)
-        indexNew = []
-        for tup in df.index.tolist():
-            loc1, loc2 = compDict[tup[1]]._mapC[tup[0]]
-            indexNew.append((loc1, loc2, tup[1]))
-        df.index = pd.MultiIndex.from_tuples(indexNew)
+        loc1, loc2 = getConnectionLocations(df.index, compDict, connectionTable)
+        df.index = pd.MultiIndex.from_arrays([loc1, loc2, df.index.get_level_values(1)])
         df = df.swaplevel(i=0, j=2, axis=0).swaplevel(i=1, j=2, axis=0).sort_index()
         # Unstack the regions (convert to a two dimensional DataFrame with the region indices being the columns)
         # and fill NaN values (i.e. when a component variable was not initiated for that region)
@@ -1912,12 +2299,10 @@ def formatOptimizationOutput(
         # regions and sort the index
         # Results in a one dimensional DataFrame
         df = pd.DataFrame(data, index=[0]).T
-        indexNew = []
-        for tup in df.index.tolist():
-            loc1, loc2 = compDict[tup[1]]._mapC[tup[0]]
-            indexNew.append((loc1, loc2, tup[1], tup[2], tup[3], tup[4]))
-            # indexNew.append((loc1, loc2, tup[1], tup[2], tup[3]))
-        df.index = pd.MultiIndex.from_tuples(indexNew)
+        loc1, loc2 = getConnectionLocations(df.index, compDict, connectionTable)
+        df.index = pd.MultiIndex.from_arrays(
+            [loc1, loc2] + [df.index.get_level_values(level) for level in range(1, 5)]
+        )
 
         # Select rows where ip is equal to investigated ip
         df = df.iloc[df.index.get_level_values(3) == ip]
@@ -1946,6 +2331,41 @@ def formatOptimizationOutput(
         )
 
 
+def getConnectionLocations(index, compDict, connectionTable=None):
+    """
+    Get the locations of the connections of the components for an index with the levels (connection, component, ...).
+
+    :param index: index with the connections in the first and the components in the second level
+    :type index: pandas MultiIndex
+
+    :param compDict: Dictionary of the component instances of interest.
+    :type compDict: dict
+
+    :param connectionTable: table of the connections of the components with the columns 'connection',
+        'component', 'locationFrom' and 'locationTo'. If None, the table is obtained from the compDict.
+        |br| * the default value is None
+    :type connectionTable: pandas DataFrame
+
+    :return: locations from which and to which the commodity is transferred
+    :rtype: tuple of numpy arrays
+    """
+    if connectionTable is None:
+        connectionTable = pd.DataFrame(
+            [
+                (loc, compName, *comp._mapC[loc])
+                for compName, comp in compDict.items()
+                for loc in comp._mapC
+            ],
+            columns=["connection", "component", "locationFrom", "locationTo"],
+        )
+    locations = connectionTable.set_index(["connection", "component"]).reindex(
+        pd.MultiIndex.from_arrays(
+            [index.get_level_values(0), index.get_level_values(1)]
+        )
+    )
+    return locations["locationFrom"].to_numpy(), locations["locationTo"].to_numpy()
+
+
 def setOptimalComponentVariables(optVal, varType, compDict):
     if optVal is not None:
         for compName, comp in compDict.items():
@@ -1955,6 +2375,32 @@ def setOptimalComponentVariables(optVal, varType, compDict):
                 setattr(comp, varType, None)
 
 
+# Prefixes of the names of the pyomo variables which describe the design of the components (capacities,
+# commissioning and binary design decisions)
+designVariablePrefixes = (
+    "cap_",
+    "commis_",
+    "decommis_",
+    "nbReal_",
+    "nbInt_",
+    "commisBin_",
+)
+
+
+def isDesignVariable(var):
+    """
+    Check if a pyomo variable (or an element of an indexed variable) is a design variable of the components,
+    i.e. if its name starts with one of the designVariablePrefixes.
+
+    :param var: pyomo variable
+    :type var: pyomo Var or VarData
+
+    :return: True if the variable is a design variable
+    :rtype: boolean
+    """
+    return var.parent_component().name.startswith(designVariablePrefixes)
+
+
 def process2dimCapacityData(esM, name, data, years):
     data = preprocess2dimInvestmentPeriodData(esM, name, data, years)
     for year in years:
@@ -2477,6 +2923,25 @@ def discountFactor(esM, ip, compName, loc):
     )
 
 
+def areConversionFactorsEqual(conversionFactors1, conversionFactors2):
+    """
+    Check if two sets of commodity conversion factors (dict, commodity: factor given as number, pandas Series or
+    pandas DataFrame) are identical.
+    """
+    if conversionFactors1.keys() != conversionFactors2.keys():
+        return False
+    for commod, factor in conversionFactors1.items():
+        otherFactor = conversionFactors2[commod]
+        if isinstance(factor, (pd.Series, pd.DataFrame)) or isinstance(
+            otherFactor, (pd.Series, pd.DataFrame)
+        ):
+            if type(factor) is not type(otherFactor) or not factor.equals(otherFactor):
+                return False
+        elif not factor == otherFactor:
+            return False
+    return True
+
+
 def checkAndSetCommodityConversionFactor(comp, esM):
     """Set up the full commodity conversion factor, if necessary depending on
     commissioning year and investment period.
@@ -0,0 +1,99 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fine as fn
+
+
+def _assertSnapshotsEqual(snapshot, expected):
+    assert snapshot.objectiveValue == pytest.approx(expected.objectiveValue)
+    assert dict(snapshot.componentNames) == dict(expected.componentNames)
+    assert dict(snapshot.tsaMetadata) == dict(expected.tsaMetadata)
+    for mdlName in set(expected.componentNames.values()):
+        pd.testing.assert_frame_equal(
+            snapshot.getOptimizationSummary(mdlName),
+            expected.getOptimizationSummary(mdlName),
+            check_index_type=False,
+            check_column_type=False,
+        )
+        for name in ["capacityVariablesOptimum", "operationVariablesOptimum"]:
+            values = expected.getOptimalValues(mdlName, name)
+            if values is None:
+                assert snapshot.getOptimalValues(mdlName, name) is None
+            else:
+                pd.testing.assert_frame_equal(
+                    snapshot.getOptimalValues(mdlName, name),
+                    values,
+                    check_index_type=False,
+                    check_column_type=False,
+                )
+
+
+def test_snapshotResults(minimal_test_esM, tmp_path):
+    esM = minimal_test_esM
+    esM.aggregateTemporally(numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=1)
+    esM.optimize(timeSeriesAggregation=True, solver="glpk")
+    snapshot = esM.snapshotResults()
+
+    # the snapshot holds the results of the optimization
+    assert snapshot.objectiveValue == esM.objectiveValue
+    assert snapshot.solverSpecs["solver"] == "glpk"
+    assert snapshot.tsaMetadata["isTimeSeriesDataClustered"]
+    assert snapshot.tsaMetadata["periodsOrder"][0] == list(esM.periodsOrder[0])
+    for mdlName in ["ConversionModel", "TransmissionModel"]:
+        pd.testing.assert_frame_equal(
+            snapshot.getOptimizationSummary(mdlName, outputLevel=2),
+            esM.getOptimizationSummary(mdlName, outputLevel=2).astype(float),
+        )
+        pd.testing.assert_frame_equal(
+            snapshot.getOptimalValues(mdlName, "operationVariablesOptimum"),
+            esM.componentModelingDict[mdlName].getOptimalValues(
+                "operationVariablesOptimum"
+            )["values"],
+        )
+
+    # the snapshot is immutable and independent of later changes of the energy system model
+    with pytest.raises(AttributeError, match="immutable"):
+        snapshot.objectiveValue = 0
+    with pytest.raises(TypeError):
+        snapshot.solverSpecs["solver"] = "gurobi"
+    with pytest.raises(ValueError, match="read-only"):
+        capacities = snapshot.getOptimalValues(
+            "ConversionModel", "capacityVariablesOptimum"
+        )
+        capacities.values[0, 0] = 0
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    assert snapshot.objectiveValue != esM.objectiveValue
+    assert snapshot.solverSpecs["hasTSA"]
+
+    # snapshots can be pickled and written to NetCDF
+    _assertSnapshotsEqual(pickle.loads(pickle.dumps(snapshot)), snapshot)
+
+    filePath = tmp_path / "snapshot.nc"
+    snapshot.writeToNetCDF(filePath)
+    snapshot_read = fn.ResultSnapshot.readFromNetCDF(filePath)
+    # the optimal values are loaded on access
+    assert all(isinstance(frame, str) for frame in snapshot_read._frames.values())
+    _assertSnapshotsEqual(snapshot_read, snapshot)
+    _assertSnapshotsEqual(pickle.loads(pickle.dumps(snapshot_read)), snapshot)
+    snapshot_read._dataset.close()
+
+
+def test_snapshotResultsWithoutOptimization(minimal_test_esM):
+    with pytest.raises(ValueError, match="no optimization results"):
+        minimal_test_esM.snapshotResults()
+
+
+def test_snapshotResultsMultipleInvestmentPeriods(perfectForesight_test_esM):
+    esM = perfectForesight_test_esM
+    esM.optimize(solver="glpk")
+    snapshot = esM.snapshotResults()
+
+    assert snapshot.investmentPeriodNames == tuple(esM.investmentPeriodNames)
+    for ip in esM.investmentPeriodNames:
+        np.testing.assert_allclose(
+            snapshot.getOptimizationSummary("SourceSinkModel", ip=ip).to_numpy(),
+            esM.getOptimizationSummary("SourceSinkModel", ip=ip).to_numpy(dtype=float),
+        )
@@ -158,7 +158,9 @@ def test_perform_distance_based_grouping(
 
 
 # %%
-@pytest.mark.parametrize("aggregation_method", ["kmedoids_contiguity", "hierarchical"])
+@pytest.mark.parametrize(
+    "aggregation_method", ["kmedoids_contiguity", "hierarchical", "region_growing"]
+)
 @pytest.mark.parametrize(
     "weights, expected_region_groups",
     [
@@ -1,9 +1,14 @@
 import pytest
 
 import numpy as np
+import pandas as pd
 import xarray as xr
+import geopandas as gpd
+from scipy.sparse import csgraph
+from shapely.geometry import Polygon
 
 import fine.aggregations.spatialAggregation.groupingUtils as gprUtils
+import fine.aggregations.spatialAggregation.managerUtils as manUtils
 
 
 @pytest.mark.parametrize(
@@ -238,3 +243,97 @@ def test_get_connectivity_matrix(xr_for_connectivity):
 
     # ASSERTION
     assert np.array_equal(output_matrix, expected_matrix)
+
+
+def test_get_connectivity_matrix_island():
+    # TEST DATA: '01_reg' is an island whose nearest neighbor is '03_reg'
+    geometries = [
+        Polygon([(10, 0), (11, 0), (11, 1), (10, 1)]),
+        Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+        Polygon([(1, 0), (2, 0), (2, 1), (1, 1)]),
+    ]
+    gdf = gpd.GeoDataFrame(
+        pd.DataFrame({"region_ids": ["01_reg", "02_reg", "03_reg"]}),
+        geometry=geometries,
+        crs="EPSG:3035",
+    )
+    geom_xr = manUtils.create_geom_xarray(gdf, geom_id_col_name="region_ids")
+
+    # EXPECTED
+    expected_matrix = np.array([[1, 0, 1], [0, 1, 1], [1, 1, 1]])
+
+    # FUNCTION CALL
+    output_matrix = gprUtils.get_connectivity_matrix({"Geometry": geom_xr, "Input": {}})
+
+    # ASSERTION
+    assert np.array_equal(output_matrix, expected_matrix)
+    assert np.array_equal(
+        gprUtils.get_centroid_coordinates(geom_xr.drop_vars("centroid_coordinates")),
+        geom_xr["centroid_coordinates"].values,
+    )
+
+
+def test_get_region_growing_clusters():
+    # TEST DATA: 10 x 10 grid of regions, with two distinct halves
+    n_side = 10
+    n_regions = n_side * n_side
+    rows, cols = np.divmod(np.arange(n_regions), n_side)
+    connectivity_matrix = (
+        np.abs(rows[:, None] - rows[None, :]) + np.abs(cols[:, None] - cols[None, :])
+        <= 1
+    ).astype(int)
+    np.random.seed(0)
+    features = (cols >= n_side / 2) + 0.1 * np.random.rand(n_regions)
+    distance_matrix = np.abs(features[:, None] - features[None, :])
+
+    # FUNCTION CALL
+    labels, objective = gprUtils.get_region_growing_clusters(
+        distance_matrix, connectivity_matrix, n_groups=4
+    )
+
+    # ASSERTION
+    assert len(np.unique(labels)) == 4
+    for label in np.unique(labels):
+        members = np.flatnonzero(labels == label)
+        sub_matrix = connectivity_matrix[np.ix_(members, members)]
+        assert csgraph.connected_components(sub_matrix, directed=False)[0] == 1
+        # the two halves are not mixed
+        assert len(np.unique(cols[members] >= n_side / 2)) == 1
+    assert objective == pytest.approx(
+        gprUtils.get_k_medoids_objective(distance_matrix, labels)
+    )
+
+    # the number of groups has to be at least the number of separate parts of the graph
+    with pytest.raises(ValueError):
+        gprUtils.get_region_growing_clusters(distance_matrix, np.eye(n_regions), 4)
+
+
+def test_get_region_growing_clusters_contiguity():
+    # TEST DATA: 30 x 30 grid of regions with random features, such that many regions are moved during the
+    # local refinement
+    n_side = 30
+    n_regions = n_side * n_side
+    rows, cols = np.divmod(np.arange(n_regions), n_side)
+    connectivity_matrix = (
+        np.abs(rows[:, None] - rows[None, :]) + np.abs(cols[:, None] - cols[None, :])
+        <= 1
+    ).astype(int)
+    features = np.random.default_rng(0).random((n_regions, 3))
+    distance_matrix = np.linalg.norm(features[:, None] - features[None, :], axis=2)
+
+    # FUNCTION CALL
+    labels, objective = gprUtils.get_region_growing_clusters(
+        distance_matrix, connectivity_matrix, n_groups=12
+    )
+
+    # ASSERTION
+    assert len(np.unique(labels)) == 12
+    for label in np.unique(labels):
+        members = np.flatnonzero(labels == label)
+        sub_matrix = connectivity_matrix[np.ix_(members, members)]
+        assert csgraph.connected_components(sub_matrix, directed=False)[0] == 1
+    # the local refinement improves the clustering of the region growing step
+    _, objective_growing = gprUtils.get_region_growing_clusters(
+        distance_matrix, connectivity_matrix, n_groups=12, max_iter=0
+    )
+    assert objective < objective_growing
@@ -55,6 +55,9 @@ def test_create_geom_xarray(sample_shapefile, add_centroids):
             assert output.coords[:] == expected.coords[:]
 
         assert np.array_equal(output_centroid_distances, expected_centroid_distances)
+        assert np.array_equal(
+            output_xr["centroid_coordinates"].values, [[2, 2], [5.5, 2]]
+        )
 
     else:
         with pytest.raises(KeyError):
@@ -2734,3 +2734,58 @@ def perfectForesight_test_esM(scope="session"):
     )
 
     return esM
+
+
+@pytest.fixture
+def stochastic_test_esM():
+    # Create a stochastic energy system model instance with two scenarios
+    esM = fn.EnergySystemModel(
+        locations={"RegionA", "RegionB"},
+        commodities={"electricity"},
+        numberOfTimeSteps=4,
+        commodityUnitsDict={"electricity": r"kW$_{el}$"},
+        hoursPerTimeStep=2190,
+        costUnit="1 Euro",
+        lengthUnit="km",
+        numberOfInvestmentPeriods=2,
+        investmentPeriodInterval=1,
+        stochasticModel=True,
+        verboseLogLevel=2,
+    )
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="PV",
+            commodity="electricity",
+            hasCapacityVariable=True,
+            operationRateMax=pd.DataFrame(
+                {"RegionA": [0.1, 0.8, 0.6, 0.0], "RegionB": [0.2, 0.5, 0.4, 0.1]}
+            ),
+            investPerCapacity=200,
+            interestRate=0.05,
+            economicLifetime=20,
+        )
+    )
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Grid",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            commodityCost=0.1,
+        )
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Demand",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            operationRateFix={
+                0: pd.DataFrame({"RegionA": [1.0] * 4, "RegionB": [2.0] * 4}),
+                1: pd.DataFrame({"RegionA": [3.0] * 4, "RegionB": [0.5] * 4}),
+            },
+        )
+    )
+
+    return esM
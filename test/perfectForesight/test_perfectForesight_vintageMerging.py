@@ -0,0 +1,136 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fine as fn
+
+
+def _addElectrolyzerAndDemand(esM):
+    # the commissioning years 2020 and 2025 (and 2030 and 2035) have identical conversion factors
+    esM.add(
+        fn.Conversion(
+            esM=esM,
+            name="Electrolyzer",
+            physicalUnit=r"kW$_{el}$",
+            commodityConversionFactors={
+                (2020, 2020): {"electricity": -1, "hydrogen": 0.7},
+                (2020, 2025): {"electricity": -1, "hydrogen": 0.7},
+                (2025, 2025): {"electricity": -1, "hydrogen": 0.7},
+                (2025, 2030): {"electricity": -1, "hydrogen": 0.7},
+                (2030, 2030): {"electricity": -1, "hydrogen": 0.8},
+                (2030, 2035): {"electricity": -1, "hydrogen": 0.8},
+                (2035, 2035): {"electricity": -1, "hydrogen": 0.8},
+                (2035, 2040): {"electricity": -1, "hydrogen": 0.8},
+                (2040, 2040): {"electricity": -1, "hydrogen": 0.9},
+            },
+            hasCapacityVariable=True,
+            investPerCapacity=500,  # euro/kW
+            opexPerCapacity=500 * 0.025,
+            interestRate=0.08,
+            economicLifetime=10,
+        )
+    )
+    _demand = pd.DataFrame(
+        columns=["PerfectLand", "ForesightLand"], data=[[1000, 2000], [2000, 1000]]
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="H2Demand",
+            commodity="hydrogen",
+            hasCapacityVariable=False,
+            operationRateFix={
+                2020: _demand,
+                2025: _demand * 1.5,
+                2030: _demand * 2,
+                2035: _demand * 2.5,
+                2040: _demand * 2.5,
+            },
+        )
+    )
+
+
+@pytest.mark.parametrize("use_tsa", [False, True])
+def test_perfectForesight_vintageMerging(use_tsa, perfectForesight_test_esM):
+    esM = copy.deepcopy(perfectForesight_test_esM)
+    _addElectrolyzerAndDemand(esM)
+    if use_tsa:
+        esM.aggregateTemporally(
+            numberOfTypicalPeriods=1,
+            numberOfTimeStepsPerPeriod=1,
+            segmentation=False,
+            sortValues=True,
+            representationMethod=None,
+            rescaleClusterPeriods=True,
+        )
+    esM_unmerged = copy.deepcopy(esM)
+
+    esM.declareOptimizationProblem(timeSeriesAggregation=use_tsa)
+    esM.optimize(declaresOptimizationProblem=False, solver="glpk")
+    esM_unmerged.declareOptimizationProblem(
+        timeSeriesAggregation=use_tsa, mergeVintages=False
+    )
+    esM_unmerged.optimize(declaresOptimizationProblem=False, solver="glpk")
+
+    # the merged commissioning years share one operation variable
+    assert esM.pyM.mergedCommisYearsDict_conv["Electrolyzer", 1] == {0: [0, 1]}
+    assert esM_unmerged.pyM.mergedCommisYearsDict_conv["Electrolyzer", 1] == {
+        0: [0],
+        1: [1],
+    }
+    assert len(esM.pyM.op_commis_conv) < len(esM_unmerged.pyM.op_commis_conv)
+
+    # vintage merging does not change the optimal solution
+    assert esM.objectiveValue == pytest.approx(esM_unmerged.objectiveValue)
+
+    comp = esM.getComponent("Electrolyzer")
+    mdl = esM.componentModelingDict["ConversionModel"]
+    mdl_unmerged = esM_unmerged.componentModelingDict["ConversionModel"]
+    for ip in esM.investmentPeriodNames:
+        operation = mdl.operationVariablesOptimum[ip].loc["Electrolyzer"]
+        operationCommis = mdl.getOptimalValues(
+            "operationCommisVariablesOptimum", ip=ip
+        )["values"].loc["Electrolyzer"]
+        operationCommis_unmerged = mdl_unmerged.getOptimalValues(
+            "operationCommisVariablesOptimum", ip=ip
+        )["values"].loc["Electrolyzer"]
+
+        # the per-vintage results cover the same commissioning years and add up to the operation
+        assert sorted(operationCommis.index.unique(level=0)) == sorted(
+            operationCommis_unmerged.index.unique(level=0)
+        )
+        pd.testing.assert_frame_equal(
+            operationCommis.groupby(level=1).sum().sort_index(),
+            operation.sort_index(),
+            check_names=False,
+        )
+
+        # the operation of each commissioning year is limited by its commissioning
+        commissioning = mdl.commissioningVariablesOptimum
+        for commis in operationCommis.index.unique(level=0):
+            commisName = esM.investmentPeriodNames[commis]
+            assert (
+                operationCommis.loc[commis].max(axis=1)
+                <= commissioning[commisName].loc["Electrolyzer"]
+                * esM.hoursPerTimeStep
+                + 1e-6
+            ).all()
+
+        # the hydrogen production is the same as without vintage merging
+        ipIx = esM.investmentPeriodNames.index(ip)
+        hydrogen = {
+            commis: comp.processedCommodityConversionFactors[commis, ipIx]["hydrogen"]
+            for commis in operationCommis.index.unique(level=0)
+        }
+        np.testing.assert_allclose(
+            sum(
+                operationCommis.loc[commis].sum().sum() * factor
+                for commis, factor in hydrogen.items()
+            ),
+            sum(
+                operationCommis_unmerged.loc[commis].sum().sum() * factor
+                for commis, factor in hydrogen.items()
+            ),
+        )
@@ -1,5 +1,6 @@
 import fine as fn
 import pandas as pd
+import pytest
 
 
 def test_TSAmultiStage(minimal_test_esM):
@@ -47,3 +48,168 @@ def test_TSAmultiStage(minimal_test_esM):
     gap = esM.gap
 
     assert gap > 0.1078 and gap < 0.1079
+
+
+@pytest.mark.parametrize("solver, warmstart", [("glpk", False), ("cbc", True)])
+def test_TSAmultiStage_warmStart(
+    minimal_test_esM, monkeypatch, capsys, solver, warmstart
+):
+    """
+    Only warm-start the second stage if the solver supports warm starts
+    """
+    esM = minimal_test_esM
+
+    # record the warmstart argument of the optimizations
+    warmstarts = []
+    optimize = esM.optimize
+
+    def recordWarmstart(**kwargs):
+        warmstarts.append(kwargs["warmstart"])
+        optimize(**kwargs)
+
+    monkeypatch.setattr(esM, "optimize", recordWarmstart)
+    fn.optimizeTSAmultiStage(
+        esM,
+        relaxIsBuiltBinary=True,
+        solver=solver,
+        numberOfTypicalPeriods=2,
+        numberOfTimeStepsPerPeriod=1,
+    )
+
+    assert warmstarts == [False, False, warmstart]
+    assert "with a gap of" in capsys.readouterr().out
+
+
+def test_TSAadaptive(minimal_test_esM, monkeypatch):
+    """
+    Refine the temporal resolution of the minimal test system until the full resolution is reached
+    """
+    esM = minimal_test_esM
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    objectiveValue = esM.objectiveValue
+
+    # count how often the time series data is prepared for the clustering
+    calls = []
+    getTimeSeriesData = esM._getTimeSeriesDataForAggregation
+    monkeypatch.setattr(
+        esM,
+        "_getTimeSeriesDataForAggregation",
+        lambda ip: calls.append(ip) or getTimeSeriesData(ip),
+    )
+
+    fn.optimizeTSAadaptive(
+        esM,
+        numberOfTypicalPeriods=1,
+        numberOfTimeStepsPerPeriod=1,
+        tolerance=1e-6,
+        solver="glpk",
+    )
+
+    assert list(esM.refinementLog["numberOfTypicalPeriods"]) == [1, 2, 4]
+    assert esM.objectiveValue == pytest.approx(objectiveValue, rel=1e-6)
+    assert calls == [0]
+    assert esM._timeSeriesDataForAggregation is None
+
+
+def test_TSAadaptive_fullResolutionCheck(minimal_test_esM):
+    """
+    Stop the refinement if the objective value of the clustered model matches the fully resolved model with fixed
+    capacities
+    """
+    esM = minimal_test_esM
+    fn.optimizeTSAadaptive(
+        esM,
+        numberOfTypicalPeriods=1,
+        numberOfTimeStepsPerPeriod=1,
+        tolerance=1e-6,
+        fullResolutionCheck=True,
+        solver="glpk",
+    )
+
+    log = esM.refinementLog
+    assert list(log["numberOfTypicalPeriods"]) == [1, 2]
+    assert log["relativeChange"].iloc[-1] <= 1e-6
+    assert esM.objectiveValue == pytest.approx(
+        log["fullResolutionObjectiveValue"].iloc[-1]
+    )
+    assert not esM.solverSpecs["hasTSA"]
+
+
+def test_TSAwarmStart(minimal_test_esM):
+    """
+    Map the solution of the clustered model to the full temporal resolution and use it as start solution
+    """
+    esM = minimal_test_esM
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    objectiveValue = esM.objectiveValue
+
+    esM.aggregateTemporally(
+        numberOfTypicalPeriods=2,
+        numberOfTimeStepsPerPeriod=1,
+        segmentation=False,
+    )
+    esM.optimize(timeSeriesAggregation=True, solver="glpk")
+    warmStartValues = fn.getWarmStartValues(esM)
+
+    srcSnkModel = esM.componentModelingDict["SourceSinkModel"]
+    operation = srcSnkModel.operationVariablesOptimum
+    for (loc, comp, ip, p, t), value in warmStartValues["op_srcSnk"].items():
+        assert p == 0
+        assert value == pytest.approx(operation.loc[(comp, loc), t])
+    capacities = warmStartValues["cap_srcSnk"]
+    for (loc, comp, ip), value in capacities.items():
+        assert value == pytest.approx(
+            srcSnkModel.capacityVariablesOptimum.loc[comp, loc]
+        )
+
+    esM.declareOptimizationProblem(timeSeriesAggregation=False)
+    fn.setWarmStartValues(esM, warmStartValues)
+    esM.optimize(declaresOptimizationProblem=False, solver="glpk", warmstart=True)
+    assert esM.objectiveValue == pytest.approx(objectiveValue)
+
+    with pytest.raises(ValueError, match="time series aggregation"):
+        fn.getWarmStartValues(esM)
+
+
+def test_TSAadaptive_clusterHierarchy(minimal_test_esM, monkeypatch):
+    """
+    Cluster the periods only in the first stage and cut the cluster hierarchy in the following stages
+    """
+    esM = minimal_test_esM
+
+    # record the predefined clusters and the order of the typical periods of each stage
+    stages = []
+    aggregateTemporally = esM.aggregateTemporally
+
+    def recordStage(**kwargs):
+        aggregateTemporally(**kwargs)
+        stages.append(
+            (
+                kwargs["numberOfTypicalPeriods"],
+                "predefClusterOrder" in kwargs,
+                list(esM.periodsOrder[0]),
+            )
+        )
+
+    monkeypatch.setattr(esM, "aggregateTemporally", recordStage)
+    fn.optimizeTSAadaptive(
+        esM,
+        numberOfTypicalPeriods=1,
+        numberOfTimeStepsPerPeriod=1,
+        tolerance=1e-6,
+        solver="glpk",
+    )
+    assert [isPredefined for _, isPredefined, _ in stages] == [False, True, True]
+    assert esM.tsaInstance is None
+
+    # the clusters are the same as the clusters of the hierarchical clustering of the tsam package
+    for numberOfTypicalPeriods, _, periodsOrder in stages:
+        aggregateTemporally(
+            numberOfTypicalPeriods=numberOfTypicalPeriods,
+            numberOfTimeStepsPerPeriod=1,
+            sortValues=True,
+            rescaleClusterPeriods=True,
+            representationMethod=None,
+        )
+        pairs = set(zip(periodsOrder, esM.periodsOrder[0]))
+        assert len(pairs) == len(set(periodsOrder)) == numberOfTypicalPeriods
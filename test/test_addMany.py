@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import fine as fn
+
+
+def _createEsM():
+    return fn.EnergySystemModel(
+        locations={"RegionA", "RegionB"},
+        commodities={"electricity"},
+        numberOfTimeSteps=24,
+        commodityUnitsDict={"electricity": r"kW$_{el}$"},
+        hoursPerTimeStep=1,
+        costUnit="1 Euro",
+        lengthUnit="km",
+        verboseLogLevel=2,
+    )
+
+
+def test_addMany():
+    nComps = 20
+    names = ["PV" + str(i) for i in range(nComps)]
+    np.random.seed(0)
+
+    componentParameters = pd.DataFrame(
+        {
+            "commodity": "electricity",
+            "hasCapacityVariable": True,
+            "investPerCapacity": np.linspace(100, 200, nComps),
+            "opexPerCapacity": 5.0,
+            "interestRate": 0.05,
+            "economicLifetime": 20,
+        },
+        index=names,
+    )
+    timeSeriesData = pd.DataFrame(
+        np.random.rand(24, nComps * 2),
+        columns=pd.MultiIndex.from_product(
+            [names, ["operationRateMax"], ["RegionA", "RegionB"]]
+        ),
+    )
+
+    # bulk construction
+    esM = _createEsM()
+    esM.addMany(fn.Source, componentParameters, timeSeriesData)
+
+    # reference: one by one construction
+    esM_ref = _createEsM()
+    for name in names:
+        esM_ref.add(
+            fn.Source(
+                esM=esM_ref,
+                name=name,
+                commodity="electricity",
+                hasCapacityVariable=True,
+                operationRateMax=timeSeriesData[name]["operationRateMax"],
+                investPerCapacity=componentParameters.loc[name, "investPerCapacity"],
+                opexPerCapacity=5.0,
+                interestRate=0.05,
+                economicLifetime=20,
+            )
+        )
+
+    assert set(esM.componentNames) == set(names)
+    for name in names:
+        comp, comp_ref = esM.getComponent(name), esM_ref.getComponent(name)
+        pd.testing.assert_frame_equal(
+            comp.fullOperationRateMax[0], comp_ref.fullOperationRateMax[0]
+        )
+        for param in ["processedInvestPerCapacity", "processedOpexPerCapacity", "CCF"]:
+            pd.testing.assert_series_equal(
+                getattr(comp, param)[0], getattr(comp_ref, param)[0]
+            )
+        for param in ["interestRate", "economicLifetime", "technicalLifetime"]:
+            pd.testing.assert_series_equal(
+                getattr(comp, param), getattr(comp_ref, param)
+            )
+        # the time series share the index object and the underlying data block
+        assert comp.fullOperationRateMax[0].index is esM._timeSeriesIndex
+        # the raw time series data does not alias the processed time series data
+        assert not np.shares_memory(
+            comp.operationRateMax.values, comp.fullOperationRateMax[0].values
+        )
+    assert np.shares_memory(
+        esM.getComponent(names[0]).fullOperationRateMax[0].values,
+        esM.getComponent(names[-1]).fullOperationRateMax[0].values.base,
+    )
+    # the economic parameters are views into one block as well
+    assert np.shares_memory(
+        esM.getComponent(names[0]).processedInvestPerCapacity[0].values,
+        esM.getComponent(names[-1]).interestRate.values.base,
+    )
+    assert esM._preValidatedTimeSeries == {}
+    assert esM._preValidatedCostParameters == {}
+
+
+def test_addMany_missingLocation():
+    componentParameters = pd.DataFrame(
+        {"commodity": "electricity", "hasCapacityVariable": False},
+        index=["Demand"],
+    )
+    timeSeriesData = pd.DataFrame(
+        np.ones((24, 1)),
+        columns=pd.MultiIndex.from_tuples([("Demand", "operationRateFix", "RegionA")]),
+    )
+
+    # without locationalEligibility the locations have to match
+    esM = _createEsM()
+    with pytest.raises(ValueError, match="locationalEligibility"):
+        esM.addMany(fn.Sink, componentParameters, timeSeriesData)
+
+    # with locationalEligibility, the missing location is filled with zeros
+    componentParameters["locationalEligibility"] = [
+        pd.Series([1, 0], index=["RegionA", "RegionB"])
+    ]
+    esM.addMany(fn.Sink, componentParameters, timeSeriesData)
+    fullRate = esM.getComponent("Demand").fullOperationRateFix[0]
+    assert (fullRate["RegionB"] == 0).all()
+    assert (fullRate["RegionA"] == 1).all()
+
+
+def test_addMany_invalidValues():
+    componentParameters = pd.DataFrame(
+        {"commodity": "electricity", "hasCapacityVariable": True},
+        index=["PV"],
+    )
+    timeSeriesData = pd.DataFrame(
+        -np.ones((24, 2)),
+        columns=pd.MultiIndex.from_product(
+            [["PV"], ["operationRateMax"], ["RegionA", "RegionB"]]
+        ),
+    )
+    esM = _createEsM()
+    with pytest.raises(ValueError, match="positive"):
+        esM.addMany(fn.Source, componentParameters, timeSeriesData)
+
+    componentParameters["investPerCapacity"] = -1.0
+    with pytest.raises(ValueError, match="investPerCapacity"):
+        esM.addMany(fn.Source, componentParameters)
+
+    componentParameters["investPerCapacity"] = 1.0
+    componentParameters["economicLifetime"] = 20
+    componentParameters["technicalLifetime"] = 10
+    with pytest.raises(ValueError, match="technical Lifetime"):
+        esM.addMany(fn.Source, componentParameters)
+
+    # components connecting locations are not supported
+    componentParameters = pd.DataFrame(
+        {"commodity": "electricity", "hasCapacityVariable": True}, index=["Cable"]
+    )
+    with pytest.raises(ValueError, match="1dim"):
+        esM.addMany(fn.Transmission, componentParameters)
+    assert "Cable" not in esM.componentNames
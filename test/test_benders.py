@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import fine as fn
+
+
+def _getCapacities(esM):
+    return {
+        ip: esM.componentModelingDict["SourceSinkModel"]
+        .getOptimalValues("capacityVariablesOptimum", ip=ip)["values"]
+        .fillna(0)
+        for ip in esM.investmentPeriodNames
+    }
+
+
+def test_optimizeBenders_perfectForesight(perfectForesight_test_esM):
+    esM = perfectForesight_test_esM
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    objectiveValue = esM.objectiveValue
+    capacities = _getCapacities(esM)
+    operation = esM.componentModelingDict["SourceSinkModel"].getOptimalValues(
+        "operationVariablesOptimum", ip=2030
+    )["values"]
+
+    fn.optimizeBenders(esM, solver="glpk", gap=1e-6)
+
+    # the decomposition converges to the monolithic optimum and fills the same result structures
+    assert esM.gap <= 1e-6
+    assert esM.objectiveValue == pytest.approx(objectiveValue, rel=1e-5)
+    for ip, capacity in _getCapacities(esM).items():
+        pd.testing.assert_frame_equal(capacity, capacities[ip], atol=1e-3)
+    pd.testing.assert_frame_equal(
+        esM.componentModelingDict["SourceSinkModel"].getOptimalValues(
+            "operationVariablesOptimum", ip=2030
+        )["values"],
+        operation,
+        atol=1e-3,
+    )
+    lowerBounds, upperBounds = np.array(esM.bendersIterations).T
+    upperBounds = upperBounds[np.isfinite(upperBounds)]
+    assert all(np.diff(lowerBounds) >= -1e-6)
+    assert len(upperBounds) > 0 and all(np.diff(upperBounds) <= 1e-6)
+
+
+def test_optimizeBenders_stochastic(stochastic_test_esM):
+    esM = stochastic_test_esM
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    objectiveValue = esM.objectiveValue
+
+    # the subproblems of the scenarios are solved in parallel worker processes
+    fn.optimizeBenders(esM, solver="glpk", gap=1e-6, processes=2)
+    assert esM.objectiveValue == pytest.approx(objectiveValue, rel=1e-5)
+
+
+def test_optimizeBenders_binaryOperation():
+    esM = fn.EnergySystemModel(
+        locations={"RegionA"},
+        commodities={"electricity", "methane"},
+        numberOfTimeSteps=4,
+        commodityUnitsDict={"electricity": r"GW$_{el}$", "methane": r"GW$_{CH_{4}}$"},
+        hoursPerTimeStep=1,
+        costUnit="1e9 Euro",
+        lengthUnit="km",
+        verboseLogLevel=2,
+    )
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Natural gas purchase",
+            commodity="methane",
+            hasCapacityVariable=False,
+        )
+    )
+    esM.add(
+        fn.ConversionDynamic(
+            esM=esM,
+            name="CCGT",
+            physicalUnit=r"GW$_{el}$",
+            commodityConversionFactors={"electricity": 1, "methane": -1 / 0.625},
+            partLoadMin=0.3,
+            bigM=100,
+            investPerCapacity=0.5,
+            interestRate=0.08,
+            economicLifetime=33,
+        )
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Electricity demand",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            operationRateFix=pd.DataFrame({"RegionA": [1, 2, 3, 4]}),
+        )
+    )
+    with pytest.raises(ValueError, match="continuous operation variables"):
+        fn.optimizeBenders(esM, solver="glpk")
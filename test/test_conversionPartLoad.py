@@ -605,5 +605,55 @@ def test_conversionPartLoad():
     np.testing.assert_allclose(opVarOptPartLoad, opVarOptConstLoad, rtol=0.01)
 
 
+def test_pieceWiseLinearizationCache(tmp_path):
+    from fine.subclasses import conversionPartLoad
+
+    partLoadData = pd.DataFrame(
+        {
+            "x": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95],
+            "y": [0.1, 0.15, 0.5, 0.7, 0.7, 0.65, 0.63, 0.62, 0.61, 0.60],
+        }
+    )
+    conversionPartLoad.clearPieceWiseLinearizationCache()
+
+    # The fit is stochastic, identical results show that the linearization is taken from the cache
+    linearization1 = conversionPartLoad.pieceWiseLinearization(
+        partLoadData, 0, 1, 3, cacheDirectory=str(tmp_path)
+    )
+    linearization1["xSegments"][0] = -1  # the cached linearization is not affected
+    conversionPartLoad.clearPieceWiseLinearizationCache()
+    linearization2 = conversionPartLoad.pieceWiseLinearization(
+        partLoadData, 0, 1, 3, cacheDirectory=str(tmp_path)
+    )
+    assert len(list(tmp_path.iterdir())) == 1
+    assert linearization2["nSegments"] == 3
+    assert linearization2["xSegments"][0] != -1
+    np.testing.assert_array_equal(
+        linearization2["xSegments"][1:], linearization1["xSegments"][1:]
+    )
+    np.testing.assert_array_equal(
+        linearization2["R2values"], linearization1["R2values"]
+    )
+
+    # Different curves are fitted in parallel and cached, the construction of the components reuses the fits
+    conversionPartLoad.clearPieceWiseLinearizationCache()
+    partLoadFunction = lambda x: 0.5 + 0.2 * x - 0.1 * x**2
+    conversionPartLoad.precomputePieceWiseLinearizations(
+        [partLoadData, partLoadFunction, partLoadData], nSegments=3, processes=2
+    )
+    assert len(conversionPartLoad._pieceWiseLinearizationCache) == 2
+    linearization3 = conversionPartLoad.pieceWiseLinearization(
+        partLoadFunction, 0, 1, 3
+    )
+    linearization4 = conversionPartLoad.pieceWiseLinearization(
+        partLoadFunction, 0, 1, 3
+    )
+    np.testing.assert_array_equal(
+        linearization3["ySegments"], linearization4["ySegments"]
+    )
+    assert len(conversionPartLoad._pieceWiseLinearizationCache) == 2
+    conversionPartLoad.clearPieceWiseLinearizationCache()
+
+
 if __name__ == "__main__":
     test_conversionPartLoad()
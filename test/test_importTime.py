@@ -0,0 +1,88 @@
+import subprocess
+import sys
+import types
+
+import pytest
+
+import fine as fn
+
+# Packages which must not be imported by 'import fine' (cf. the lazy subpackages in fine/__init__.py)
+HEAVY_PACKAGES = [
+    "matplotlib",
+    "geopandas",
+    "xarray",
+    "netCDF4",
+    "sklearn",
+    "rasterio",
+    "shapely",
+    "tsam",
+    "pwlf",
+    "gurobi_logtools",
+    "fine.IOManagement",
+    "fine.expansionModules",
+    "fine.aggregations",
+]
+
+
+def _runPython(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_importTime():
+    # import fine in a fresh interpreter and measure the cumulative import time of all (sub)modules
+    output = _runPython(
+        "import sys, time\n"
+        + "t = time.perf_counter()\n"
+        + "import fine\n"
+        + "print(time.perf_counter() - t)\n"
+        + "print(' '.join(sys.modules))\n"
+    )
+    importTime, modules = output.splitlines()
+    print("Import time of fine: " + importTime + " sec.")
+
+    importedHeavyPackages = [
+        package
+        for package in HEAVY_PACKAGES
+        if any(
+            module == package or module.startswith(package + ".")
+            for module in modules.split()
+        )
+    ]
+    assert importedHeavyPackages == []
+
+
+def test_lazySubpackages():
+    output = _runPython(
+        "import sys\n"
+        + "import fine as fn\n"
+        + "fn.optimizeSimpleMyopic\n"
+        + "print('fine.expansionModules' in sys.modules, 'fine.aggregations' in sys.modules)\n"
+    )
+    # only the subpackage of the accessed attribute is imported
+    assert output.split() == ["True", "False"]
+
+    # the public API is unchanged
+    assert fn.optimizeSimpleMyopic is fn.expansionModules.optimizeSimpleMyopic
+    assert fn.ResultSnapshot is fn.IOManagement.resultSnapshot.ResultSnapshot
+    assert fn.xarrayIO is fn.IOManagement.xarrayIO
+    assert "writeOptimizationOutputToExcel" in dir(fn)
+    with pytest.raises(AttributeError):
+        getattr(fn, "notAnAttribute")
+
+
+@pytest.mark.parametrize(
+    "subpackage", ["IOManagement", "expansionModules", "aggregations"]
+)
+def test_lazyAttributesComplete(subpackage):
+    # all functions and classes of the subpackages are listed in the lazy attributes of fine
+    module = getattr(fn, subpackage)
+    names = {
+        name
+        for name, value in vars(module).items()
+        if not name.startswith("_")
+        and not isinstance(value, types.ModuleType)
+        and (getattr(value, "__module__", None) or "").startswith("fine")
+    }
+    assert names <= set(fn._lazyAttributes)
@@ -1,6 +1,8 @@
 import fine as fn
 import pandas as pd
 import numpy as np
+import pytest
+from pyomo.repn import generate_standard_repn
 
 
 def test_initializeTransmission():
@@ -178,3 +180,57 @@ def test_initializeTransmission_withSeries():
             opexPerOperation=opexPerOp,
         )
     )
+
+
+def test_transmissionConnectionTable():
+    """
+    Tests if the connection table of the TransmissionModel lists the connections with their loss coefficients
+    and if the commodity balance contributions are obtained from it.
+    """
+    locations = ["cluster_1", "cluster_2", "cluster_3"]
+    esM = fn.EnergySystemModel(
+        locations=set(locations),
+        commodities={"commodity1"},
+        numberOfTimeSteps=4,
+        commodityUnitsDict={"commodity1": "commodity_unit"},
+        hoursPerTimeStep=1,
+        costUnit="cost_unit",
+        lengthUnit="length_unit",
+        verboseLogLevel=2,
+    )
+    distances = pd.DataFrame(
+        [[0, 10, 20], [10, 0, 30], [20, 30, 0]], index=locations, columns=locations
+    )
+    esM.add(
+        fn.Transmission(
+            esM=esM,
+            name="Transmission_1",
+            commodity="commodity1",
+            hasCapacityVariable=True,
+            distances=distances,
+            losses=0.001,
+        )
+    )
+    esM.declareOptimizationProblem()
+
+    mdl = esM.componentModelingDict["TransmissionModel"]
+    table = mdl.connectionTable.set_index(["locationFrom", "locationTo"])
+    assert len(table) == 6
+    np.testing.assert_allclose(
+        table.loc[("cluster_1", "cluster_2"), "lossCoefficient"], 1 - 0.001 * 10
+    )
+    assert table.loc[("cluster_1", "cluster_2"), "connection"] == "cluster_1_cluster_2"
+
+    # Incoming flows are reduced by the losses, outgoing flows are subtracted
+    repn = generate_standard_repn(
+        mdl.getCommodityBalanceContribution(esM.pyM, "commodity1", "cluster_2", 0, 0, 0)
+    )
+    coefficients = {
+        var.index()[0]: coef for var, coef in zip(repn.linear_vars, repn.linear_coefs)
+    }
+    assert coefficients == {
+        "cluster_1_cluster_2": pytest.approx(1 - 0.001 * 10),
+        "cluster_3_cluster_2": pytest.approx(1 - 0.001 * 30),
+        "cluster_2_cluster_1": -1,
+        "cluster_2_cluster_3": -1,
+    }
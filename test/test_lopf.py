@@ -0,0 +1,83 @@
+import copy
+
+import pytest
+
+import fine as fn
+from fine.subclasses.lopf import getCycleBasis
+
+
+def test_getCycleBasis():
+    nodes = ["a", "b", "c", "d", "e"]
+    edges = [
+        ("a_b", "a", "b"),
+        ("b_c", "b", "c"),
+        ("a_c", "a", "c"),
+        ("c_d", "c", "d"),
+        ("b_d", "b", "d"),
+    ]
+    cycles = getCycleBasis(nodes, edges)
+
+    # number of independent cycles = edges - nodes + connected components ("e" is isolated)
+    assert len(cycles) == len(edges) - len(nodes) + 2
+    edgeNodes = {edge: (node1, node2) for edge, node1, node2 in edges}
+    for cycle in cycles:
+        # each cycle is a closed walk
+        walk = [
+            edgeNodes[edge] if direction == 1 else edgeNodes[edge][::-1]
+            for edge, direction in cycle
+        ]
+        for (_, end), (start, _) in zip(walk, walk[1:] + walk[:1]):
+            assert end == start
+
+
+def test_lopfCycleBasisFormulation(multi_node_test_esM_init):
+    esM = copy.deepcopy(multi_node_test_esM_init)
+    esM.aggregateTemporally(numberOfTypicalPeriods=2)
+    esM_cycles = copy.deepcopy(esM)
+    esM_cycles.getComponent("AC cables").cycleBasisFormulation = True
+
+    esM.optimize(timeSeriesAggregation=True, solver="glpk")
+    esM_cycles.optimize(timeSeriesAggregation=True, solver="glpk")
+
+    # the cycle basis formulation does not declare phase angle variables but yields the same optimal solution
+    assert len(esM_cycles.pyM.phaseAngle_lopf) == 0
+    assert len(esM_cycles.pyM.ConstrKirchhoffVoltageLaw_lopf) > 0
+    assert esM_cycles.objectiveValue == pytest.approx(esM.objectiveValue, rel=1e-6)
+
+    # the phase angles determined from the flows satisfy the linearized power flow equations
+    comp = esM_cycles.getComponent("AC cables")
+    mdl = esM_cycles.componentModelingDict["LOPFModel"]
+    operation = mdl.getOptimalValues("operationVariablesOptimum")["values"].loc[
+        "AC cables"
+    ]
+    phaseAngles = mdl.getOptimalValues("phaseAngleVariablesOptimum")["values"].loc[
+        "AC cables"
+    ]
+    for loc in comp.processedLocationalEligibility.index:
+        if comp.processedLocationalEligibility[loc] != 1:
+            continue
+        node1, node2 = comp._mapC[loc]
+        flow = operation.loc[loc].sum() if loc in operation.index else 0
+        flowBack = (
+            operation.loc[comp._mapI[loc]].sum()
+            if comp._mapI[loc] in operation.index
+            else 0
+        )
+        assert (phaseAngles.loc[node1] - phaseAngles.loc[node2]).sum() == pytest.approx(
+            (flow - flowBack) * comp.reactances[loc], abs=1e-4
+        )
+
+
+def test_lopfCycleBasisFormulationType(minimal_test_esM):
+    esM = copy.deepcopy(minimal_test_esM)
+    with pytest.raises(TypeError, match="cycleBasisFormulation"):
+        esM.add(
+            fn.LinearOptimalPowerFlow(
+                esM=esM,
+                name="AC cables",
+                commodity="electricity",
+                hasCapacityVariable=True,
+                reactances=0.1,
+                cycleBasisFormulation="yes",
+            )
+        )
@@ -7,6 +7,7 @@ import fine as fn
 import os
 import pandas as pd
 import numpy as np
+import pytest
 
 import sys
 
@@ -20,7 +21,8 @@ sys.path.append(
 )
 
 
-def test_minimumDownTime():
+@pytest.mark.parametrize("compactMinTimeFormulation", [False, True])
+def test_minimumDownTime(compactMinTimeFormulation):
     # read in original results
     results = [
         5.0,
@@ -152,6 +154,7 @@ def test_minimumDownTime():
             partLoadMin=0.4,
             bigM=100,
             downTimeMin=3,
+            compactMinTimeFormulation=compactMinTimeFormulation,
             investPerCapacity=0.5,
             opexPerCapacity=0.021,
             opexPerOperation=1,
@@ -201,4 +204,5 @@ def test_minimumDownTime():
 #
 
 if __name__ == "__main__":
-    test_minimumDownTime()
+    for compactMinTimeFormulation in (False, True):
+        test_minimumDownTime(compactMinTimeFormulation)
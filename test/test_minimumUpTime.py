@@ -7,6 +7,7 @@ import fine as fn
 import os
 import pandas as pd
 import numpy as np
+import pytest
 
 import sys
 
@@ -20,7 +21,8 @@ sys.path.append(
 )
 
 
-def test_minimumUpTime():
+@pytest.mark.parametrize("compactMinTimeFormulation", [False, True])
+def test_minimumUpTime(compactMinTimeFormulation):
     # read in original results
     results = [
         0.0,
@@ -152,6 +154,7 @@ def test_minimumUpTime():
             partLoadMin=0.3,
             bigM=100,
             upTimeMin=4,
+            compactMinTimeFormulation=compactMinTimeFormulation,
             investPerCapacity=0.5,
             opexPerCapacity=0.021,
             opexPerOperation=1,
@@ -201,4 +204,5 @@ def test_minimumUpTime():
 #
 
 if __name__ == "__main__":
-    test_minimumUpTime()
+    for compactMinTimeFormulation in (False, True):
+        test_minimumUpTime(compactMinTimeFormulation)
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import fine as fn
+
+
+def _createNetworkEsM(losses, opexPerOperation=0.01, sharedPotentialID=None):
+    # A line from a to b via n1 and n2, a parallel line from a to b and a dangling line from b to d
+    locations = ["a", "b", "n1", "n2", "d"]
+    esM = fn.EnergySystemModel(
+        locations=set(locations),
+        commodities={"electricity"},
+        numberOfTimeSteps=4,
+        commodityUnitsDict={"electricity": r"kW$_{el}$"},
+        hoursPerTimeStep=1,
+        costUnit="1 Euro",
+        lengthUnit="km",
+        verboseLogLevel=2,
+    )
+    eligibility = pd.DataFrame(0, index=locations, columns=locations)
+    distances = pd.DataFrame(0.0, index=locations, columns=locations)
+    for loc1, loc2, distance in [
+        ("a", "n1", 10),
+        ("n1", "n2", 5),
+        ("n2", "b", 5),
+        ("a", "b", 20),
+        ("b", "d", 3),
+    ]:
+        eligibility.loc[loc1, loc2] = eligibility.loc[loc2, loc1] = 1
+        distances.loc[loc1, loc2] = distances.loc[loc2, loc1] = distance
+    capacityMax = eligibility * 50.0
+    capacityMax.loc["a", "b"] = capacityMax.loc["b", "a"] = 30
+
+    esM.add(
+        fn.Transmission(
+            esM=esM,
+            name="Lines",
+            commodity="electricity",
+            hasCapacityVariable=True,
+            locationalEligibility=eligibility,
+            distances=distances,
+            losses=losses,
+            capacityMax=capacityMax,
+            investPerCapacity=2,
+            opexPerOperation=opexPerOperation,
+            sharedPotentialID=sharedPotentialID,
+        )
+    )
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Generator",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            locationalEligibility=pd.Series(
+                {loc: int(loc == "a") for loc in locations}
+            ),
+            commodityCost=0.1,
+        )
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Demand",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            operationRateFix=pd.DataFrame(
+                {
+                    loc: [10.0, 20.0, 40.0, 60.0] if loc == "b" else [0.0] * 4
+                    for loc in locations
+                }
+            ),
+        )
+    )
+    return esM
+
+
+def _checkOriginalNetworkBalance(esM, operation):
+    # The flows on the original network satisfy the commodity balance of the removed locations and the demand
+    comp = esM.getComponent("Lines")
+    inflow = {loc: 0 for loc in esM.locations}
+    for (_, loc1, loc2), flow in operation.iterrows():
+        line = comp._mapL[loc1][loc2]
+        inflow[loc2] = inflow[loc2] + flow * (
+            1 - comp.losses[line] * comp.distances[line]
+        )
+        inflow[loc1] = inflow[loc1] - flow
+    for loc in ["n1", "n2", "d"]:
+        np.testing.assert_allclose(inflow[loc], 0, atol=1e-6)
+    np.testing.assert_allclose(inflow["b"], [10.0, 20.0, 40.0, 60.0], atol=1e-6)
+
+
+def test_networkReductionLossless():
+    esM = _createNetworkEsM(losses=0, opexPerOperation=0)
+    reducedEsM = esM.reduceTransmissionNetwork()
+
+    # the series lines via n1 and n2 are merged with the parallel line (with equal costs per capacity and without
+    # losses and operation costs), the dangling line is dropped
+    assert reducedEsM.locations == {"a", "b"}
+    mapping = reducedEsM.transmissionNetworkMapping["Lines"]
+    assert mapping["b", "d"] is None
+    assert mapping["a", "n1"][0] == ("a", "b")
+    assert reducedEsM.getComponent("Lines").processedCapacityMax[0]["a_b"] == 80
+
+    esM.optimize(solver="glpk")
+    reducedEsM.optimize(solver="glpk")
+    assert reducedEsM.objectiveValue == pytest.approx(esM.objectiveValue)
+
+    operation = reducedEsM.getOriginalTransmissionOperation("Lines")
+    assert len(operation) == len(mapping)
+    _checkOriginalNetworkBalance(esM, operation)
+
+
+def test_networkReductionWithLosses():
+    esM = _createNetworkEsM(losses=0.001)
+    reducedEsM = esM.reduceTransmissionNetwork()
+
+    # the contracted line a-n2-b and the line a-b have different losses and operation costs and can not be merged
+    assert reducedEsM.locations == {"a", "b", "n2"}
+    comp = reducedEsM.getComponent("Lines")
+    assert comp.distances["a_n2"] == 15
+    assert comp.losses["a_n2"] * 15 == pytest.approx(1 - 0.99 * 0.995)
+
+    esM.optimize(solver="glpk")
+    reducedEsM.optimize(solver="glpk")
+    # the capacity of the second of two lines in series is designed for the inflow of the first line
+    assert reducedEsM.objectiveValue == pytest.approx(esM.objectiveValue, rel=1e-4)
+
+    _checkOriginalNetworkBalance(
+        esM, reducedEsM.getOriginalTransmissionOperation("Lines")
+    )
+
+
+def test_networkReductionNotReducible():
+    # the network of a component with a shared potential is not reduced
+    esM = _createNetworkEsM(losses=0, opexPerOperation=0, sharedPotentialID="Grid")
+    reducedEsM = esM.reduceTransmissionNetwork()
+
+    assert reducedEsM.locations == esM.locations
+    assert reducedEsM.transmissionNetworkMapping == {}
+    with pytest.raises(ValueError, match="was not reduced"):
+        reducedEsM.getOriginalTransmissionOperation("Lines")
@@ -0,0 +1,34 @@
+import pytest
+
+import fine as fn
+
+
+def test_optimizeProgressiveHedging(stochastic_test_esM):
+    esM = stochastic_test_esM
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    objectiveValue = esM.objectiveValue
+
+    # the scenario subproblems are solved in parallel worker processes, glpk requires linearized proximal terms
+    fn.optimizeProgressiveHedging(
+        esM,
+        solver="glpk",
+        tolerance=1e-5,
+        processes=2,
+        linearizeProximalTerms=True,
+    )
+    assert esM.progressiveHedgingIterations[-1] <= 1e-5
+    assert esM.objectiveValue == pytest.approx(objectiveValue, rel=1e-3)
+
+    # all scenarios share the same design
+    capacities = [
+        esM.componentModelingDict["SourceSinkModel"]
+        .getOptimalValues("capacityVariablesOptimum", ip=ip)["values"]
+        .loc["PV"]
+        for ip in esM.investmentPeriods
+    ]
+    assert capacities[0].values == pytest.approx(capacities[1].values)
+
+
+def test_optimizeProgressiveHedging_noStochasticModel(perfectForesight_test_esM):
+    with pytest.raises(ValueError, match="stochastic model"):
+        fn.optimizeProgressiveHedging(perfectForesight_test_esM, solver="glpk")
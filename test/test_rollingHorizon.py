@@ -0,0 +1,251 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import fine as fn
+
+
+def _createStorageEsM(numberOfTimeSteps=24):
+    esM = fn.EnergySystemModel(
+        locations={"RegionA"},
+        commodities={"electricity"},
+        numberOfTimeSteps=numberOfTimeSteps,
+        commodityUnitsDict={"electricity": r"kW$_{el}$"},
+        hoursPerTimeStep=1,
+        costUnit="1 Euro",
+        lengthUnit="km",
+        verboseLogLevel=2,
+    )
+    t = np.arange(numberOfTimeSteps)
+    pvProfile = pd.DataFrame(
+        {"RegionA": np.clip(np.sin((t % 24 - 6) / 12 * np.pi), 0, None)}
+    )
+    gridCost = pd.DataFrame({"RegionA": 0.2 + 0.1 * (t % 24 >= 17)})
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="PV",
+            commodity="electricity",
+            hasCapacityVariable=True,
+            operationRateMax=pvProfile,
+            capacityFix=pd.Series({"RegionA": 4.0}),
+            investPerCapacity=100,
+            interestRate=0.05,
+            economicLifetime=20,
+        )
+    )
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Grid",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            commodityCostTimeSeries=gridCost,
+        )
+    )
+    esM.add(
+        fn.Storage(
+            esM=esM,
+            name="Battery",
+            commodity="electricity",
+            hasCapacityVariable=True,
+            capacityFix=pd.Series({"RegionA": 3.0}),
+            chargeRate=0.5,
+            dischargeRate=0.5,
+            chargeEfficiency=0.95,
+            dischargeEfficiency=0.95,
+            selfDischarge=0.01,
+            investPerCapacity=50,
+            interestRate=0.05,
+            economicLifetime=15,
+        )
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Demand",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            operationRateFix=pd.DataFrame({"RegionA": 1.0 + 0.5 * (t % 24 >= 17)}),
+        )
+    )
+    return esM
+
+
+def test_rollingHorizon_singleWindow():
+    esM = _createStorageEsM()
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    srcSnk = esM.componentModelingDict["SourceSinkModel"].operationVariablesOptimum
+    grid = srcSnk.loc["Grid"].copy()
+    objectiveValue = esM.objectiveValue
+
+    # a window covering the whole time horizon yields the monolithic results
+    esM.optimize(mode="rollingHorizon", window=24, solver="glpk")
+    srcSnk = esM.componentModelingDict["SourceSinkModel"].operationVariablesOptimum
+    np.testing.assert_array_almost_equal(srcSnk.loc["Grid"].values, grid.values)
+    assert esM.objectiveValue == pytest.approx(objectiveValue)
+
+
+def test_rollingHorizon_storage():
+    esM = _createStorageEsM(numberOfTimeSteps=48)
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    storMdl = esM.componentModelingDict["StorageModel"]
+    gridCost = 0.2 + 0.1 * (np.arange(48) % 24 >= 17)
+    gridMonolithic = (
+        esM.componentModelingDict["SourceSinkModel"]
+        .operationVariablesOptimum.loc["Grid"]
+        .values[0]
+    )
+    objectiveValue = esM.objectiveValue
+
+    esM.optimize(mode="rollingHorizon", window=12, overlap=12, solver="glpk")
+
+    # the results of the windows are stitched to the full time horizon
+    srcSnk = esM.componentModelingDict["SourceSinkModel"].operationVariablesOptimum
+    SOC = storMdl.getOptimalValues("stateOfChargeOperationVariablesOptimum")[
+        "values"
+    ].loc["Battery"]
+    charge = storMdl.chargeOperationVariablesOptimum.loc["Battery"]
+    discharge = storMdl.dischargeOperationVariablesOptimum.loc["Battery"]
+    assert list(srcSnk.columns) == list(range(48))
+    assert list(SOC.columns) == list(range(48))
+
+    # the commodity balance holds in every time step
+    balance = (
+        srcSnk.loc["PV"].values
+        + srcSnk.loc["Grid"].values
+        - srcSnk.loc["Demand"].values
+        - charge.values
+        + discharge.values
+    )
+    np.testing.assert_array_almost_equal(balance, 0)
+
+    # the state of charge is carried over between the windows
+    soc, ch, dis = SOC.values[0], charge.values[0], discharge.values[0]
+    np.testing.assert_array_almost_equal(
+        soc[1:], soc[:-1] * 0.99 + ch[:-1] * 0.95 - dis[:-1] / 0.95, decimal=4
+    )
+
+    # the myopic dispatch is not better than the dispatch with perfect foresight
+    grid = srcSnk.loc["Grid"].values[0]
+    assert grid.sum() >= gridMonolithic.sum() - 1e-6
+
+    # the objective value is the sum of the costs of the kept time steps of the windows (the costs of the fixed
+    # capacities are the same)
+    assert esM.objectiveValue == pytest.approx(
+        objectiveValue + (grid - gridMonolithic) @ gridCost / esM.numberOfYears
+    )
+
+    # the time series data of the full time horizon is restored
+    comp = esM.getComponent("Demand")
+    assert len(comp.processedOperationRateFix[0]) == 48
+    assert comp.processedOperationRateFix[0] is comp.fullOperationRateFix[0]
+    assert esM.numberOfTimeSteps == 48
+
+
+def test_rollingHorizon_minimumUpTime():
+    esM = fn.EnergySystemModel(
+        locations={"RegionA"},
+        commodities={"electricity", "methane"},
+        numberOfTimeSteps=20,
+        commodityUnitsDict={"electricity": r"GW$_{el}$", "methane": r"GW$_{CH_{4}}$"},
+        hoursPerTimeStep=1,
+        costUnit="1e9 Euro",
+        lengthUnit="km",
+        verboseLogLevel=2,
+    )
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Natural gas purchase",
+            commodity="methane",
+            hasCapacityVariable=False,
+            commodityCost=0.01,
+        )
+    )
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Peaker",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            opexPerOperation=1,
+        )
+    )
+    esM.add(
+        fn.ConversionDynamic(
+            esM=esM,
+            name="restricted",
+            physicalUnit=r"GW$_{el}$",
+            commodityConversionFactors={"electricity": 1, "methane": -1 / 0.625},
+            capacityFix=pd.Series({"RegionA": 10}),
+            partLoadMin=0.3,
+            bigM=100,
+            upTimeMin=4,
+            operationRateMax=pd.DataFrame({"RegionA": [0] * 9 + [1] * 11}),
+            opexPerOperation=0.1,
+            investPerCapacity=0.5,
+            interestRate=0.08,
+            economicLifetime=33,
+        )
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Curtailment",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            opexPerOperation=0.05,
+        )
+    )
+    demand = [0] * 9 + [10] + [0] * 10
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Electricity demand",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            operationRateFix=pd.DataFrame({"RegionA": demand}),
+        )
+    )
+
+    # windows have to cover the minimum up time
+    with pytest.raises(ValueError, match="window"):
+        esM.optimize(mode="rollingHorizon", window=2, solver="glpk")
+
+    esM.optimize(mode="rollingHorizon", window=5, solver="glpk")
+
+    # the on/off states are carried over between the windows, i.e. each start up is followed by at least four
+    # time steps of operation (also for the start up in the last time step of the second window)
+    isOn = (
+        esM.componentModelingDict["ConversionDynamicModel"]
+        .operationVariablesOptimum.loc["restricted"]
+        .values[0]
+        > 1e-6
+    )
+    startUps = np.flatnonzero(isOn & ~np.roll(isOn, 1))
+    assert list(startUps) == [9]
+    for t in startUps:
+        assert isOn[t : t + 4].all()
+
+
+def test_rollingHorizon_invalidInput():
+    esM = _createStorageEsM()
+    with pytest.raises(ValueError, match="mode"):
+        esM.optimize(mode="rolling", window=6, solver="glpk")
+    with pytest.raises(ValueError, match="sparseOperation"):
+        esM.optimize(
+            mode="rollingHorizon", window=6, sparseOperation=True, solver="glpk"
+        )
+
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Wind",
+            commodity="electricity",
+            hasCapacityVariable=True,
+            operationRateMax=pd.DataFrame({"RegionA": np.full(24, 0.3)}),
+        )
+    )
+    with pytest.raises(ValueError, match="capacityFix"):
+        esM.optimize(mode="rollingHorizon", window=6, solver="glpk")
@@ -67,3 +67,38 @@ def test_segmentation(minimal_test_esM):
     # and thus size-determining constraints of the model are coincidentally not affected by the aggregation and the
     # optimal solutions of the third and fourth model are identical.
     assert esM3.pyM.Obj() == esM4.pyM.Obj()
+
+
+def test_segmentationTables(minimal_test_esM):
+    """
+    Check that the NumPy lookup tables of the segments match the segment durations and start times.
+    """
+    esM = minimal_test_esM
+    esM.aggregateTemporally(
+        numberOfTypicalPeriods=1,
+        numberOfTimeStepsPerPeriod=4,
+        storeTSAinstance=False,
+        segmentation=True,
+        numberOfSegmentsPerPeriod=3,
+        clusterMethod="hierarchical",
+        sortValues=False,
+        rescaleClusterPeriods=False,
+        representationMethod=None,
+    )
+    for ip in esM.investmentPeriods:
+        for table, series in [
+            (esM.timeStepsPerSegmentTable[ip], esM.timeStepsPerSegment[ip]),
+            (esM.hoursPerSegmentTable[ip], esM.hoursPerSegment[ip]),
+            (esM.segmentStartTimeTable[ip], esM.segmentStartTime[ip]),
+        ]:
+            for (p, t), value in series.items():
+                assert table[p, t] == value
+
+    # The self-discharge factors of the storage components are precomputed from the tables
+    esM.declareOptimizationProblem(timeSeriesAggregation=True)
+    mdl = esM.componentModelingDict["StorageModel"]
+    for compName, comp in mdl.componentsDict.items():
+        factors = mdl._selfDischargeFactors[compName, 0]
+        assert factors["step"][0, 1] == (1 - comp.selfDischarge) ** (
+            esM.hoursPerSegment[0][0, 1]
+        )
@@ -1,5 +1,7 @@
 import fine as fn
 import numpy as np
+import pyomo.environ as pyomo
+import pytest
 
 
 def test_shadowCostOutPut(minimal_test_esM):
@@ -43,3 +45,43 @@ def test_shadowCostOutPut(minimal_test_esM):
 
     assert np.round(SP.loc["hydrogen", "IndustryLocation"].sum(), 4) == 0.3296
     assert len(SP.loc["hydrogen", "IndustryLocation"]) == 4
+
+
+def test_shadowCostOutPut_highs(minimal_test_esM):
+    """
+    Get the shadow prices of the minimal test system solved in memory with HiGHS.
+    """
+    pytest.importorskip("highspy")
+    esM = minimal_test_esM
+
+    esM.optimize(solver="glpk")
+    objectiveValue = esM.objectiveValue
+
+    esM.optimize(solver="highs", optimizationSpecs="presolve=on")
+
+    assert esM.solverSpecs["terminationCondition"] == "optimal"
+    assert np.isclose(esM.objectiveValue, objectiveValue)
+
+    SP = fn.getShadowPrices(
+        esM,
+        esM.pyM.commodityBalanceConstraint,
+        dualValues=None,
+        hasTimeSeries=True,
+        periodOccurrences=esM.periodOccurrences,
+        periodsOrder=esM.periodsOrder,
+    )
+
+    assert len(SP.loc["hydrogen", "IndustryLocation"]) == 4
+
+    # The dual values are not unique (degenerate solution), hence the dual feasibility and the complementary
+    # slackness of the dual values of all constraints are checked (for the minimization problem)
+    for con in esM.pyM.component_data_objects(pyomo.Constraint, active=True):
+        dual, body = esM.pyM.dual[con], pyomo.value(con.body)
+        slackLower = body - pyomo.value(con.lower) if con.has_lb() else np.inf
+        slackUpper = pyomo.value(con.upper) - body if con.has_ub() else np.inf
+        if min(slackLower, slackUpper) > 1e-6:
+            assert dual == pytest.approx(0, abs=1e-6)
+        if not con.has_ub():
+            assert dual >= -1e-6
+        if not con.has_lb():
+            assert dual <= 1e-6
@@ -318,9 +318,7 @@ def test_CO2ReductionTargets():
     )
 
 
-@pytest.mark.skip()
-def test_exceededLifetime():
-    # load a minimal test system
+def _createElectrolyzerEsM():
     """Returns minimal instance of esM"""
 
     numberOfTimeSteps = 4
@@ -460,6 +458,14 @@ def test_exceededLifetime():
         pd.Series([7], index=["OneLocation"]),
     )
 
+    return esM
+
+
+@pytest.mark.skip()
+def test_exceededLifetime():
+    # load a minimal test system
+    esM = _createElectrolyzerEsM()
+
     results = fn.optimizeSimpleMyopic(
         esM,
         startYear=2020,
@@ -473,3 +479,57 @@ def test_exceededLifetime():
 
     # Check if electrolyzers which are installed in 2020 are not included in the system of 2030 due to the exceeded lifetime
     assert "Electrolyzers_stock_2020" not in results["ESM_2030"].componentNames.keys()
+
+
+def test_reuseOptimizationProblem():
+    results = fn.optimizeSimpleMyopic(
+        _createElectrolyzerEsM(),
+        startYear=2020,
+        endYear=2030,
+        nbOfRepresentedYears=5,
+        timeSeriesAggregation=False,
+        solver="glpk",
+        saveResults=False,
+        trackESMs=True,
+    )
+    esM = _createElectrolyzerEsM()
+    results_reused = fn.optimizeSimpleMyopic(
+        esM,
+        startYear=2020,
+        endYear=2030,
+        nbOfRepresentedYears=5,
+        timeSeriesAggregation=False,
+        solver="glpk",
+        saveResults=False,
+        trackESMs=True,
+        reuseOptimizationProblem=True,
+    )
+
+    # the stock components of all milestone years are declared once
+    assert {"Electrolyzers_stock_2020", "Electrolyzers_stock_2025"} <= set(
+        esM.componentNames
+    )
+    for mileStoneYear in [2020, 2025, 2030]:
+        outputs = results_reused["ESM_" + str(mileStoneYear)]["Results"][0]
+        # the optimization outputs are the same as when declaring the optimization problem for each run
+        TAC = sum(
+            float(ds["TAC"].sum())
+            for mdlOutputs in outputs.values()
+            for ds in mdlOutputs.values()
+            if "TAC" in ds
+        )
+        assert TAC == pytest.approx(results["ESM_" + str(mileStoneYear)].objectiveValue)
+
+    # the electrolyzers installed in 2020 are part of the stock in 2025 but not in 2030 due to the exceeded lifetime
+    capacity_2020 = results["ESM_2020"].getOptimizationSummary("ConversionModel")
+    capacity_2020 = capacity_2020.loc[("Electrolyzers", "capacity"), "OneLocation"]
+    assert capacity_2020.iloc[0] > 0
+    outputs = results_reused["ESM_2025"]["Results"][0]["ConversionModel"]
+    assert float(
+        outputs["Electrolyzers_stock_2020"]["capacity"].sum()
+    ) == pytest.approx(capacity_2020.iloc[0])
+    outputs = results_reused["ESM_2030"]["Results"][0]["ConversionModel"]
+    assert (
+        "Electrolyzers_stock_2020" not in outputs
+        or float(outputs["Electrolyzers_stock_2020"]["capacity"].sum()) == 0
+    )
@@ -0,0 +1,46 @@
+import pytest
+
+import fine as fn
+
+
+def test_optimizeSolverPortfolio(minimal_test_esM):
+    esM = minimal_test_esM
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    objectiveValue = esM.objectiveValue
+    operation = esM.componentModelingDict[
+        "SourceSinkModel"
+    ].operationVariablesOptimum.copy()
+
+    fn.optimizeSolverPortfolio(esM, ["glpk", ("glpk", "tmlim=100")], threads=2)
+
+    results = esM.solverPortfolioResults
+    assert results["selected"].sum() == 1
+    assert results.loc[results["selected"], "terminationCondition"].iloc[0] == "optimal"
+    assert esM.solverSpecs["terminationCondition"] == "optimal"
+    assert esM.objectiveValue == pytest.approx(objectiveValue)
+    assert esM.componentModelingDict[
+        "SourceSinkModel"
+    ].operationVariablesOptimum.values == pytest.approx(operation.values)
+
+
+def test_optimizeSolverPortfolio_wrongInput(minimal_test_esM):
+    with pytest.raises(TypeError, match="non-empty list"):
+        fn.optimizeSolverPortfolio(minimal_test_esM, [])
+    with pytest.raises(TypeError, match="file interface"):
+        fn.optimizeSolverPortfolio(minimal_test_esM, ["glpk", "appsi_highs"])
+
+
+def test_optimizeSolverPortfolio_failingSolver(minimal_test_esM):
+    esM = minimal_test_esM
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    objectiveValue = esM.objectiveValue
+
+    # the first solver fails due to an invalid time limit, with one thread the second solver is started afterwards
+    fn.optimizeSolverPortfolio(esM, [("glpk", "tmlim=abc"), "cbc"], threads=1)
+
+    results = esM.solverPortfolioResults
+    assert results["terminationCondition"].tolist() == [None, "optimal"]
+    assert results["selected"].tolist() == [False, True]
+    assert results["solvetime"].iloc[0] < results["solvetime"].iloc[1]
+    assert esM.solverSpecs["solver"] == "cbc"
+    assert esM.objectiveValue == pytest.approx(objectiveValue)
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyomo
+import pytest
+
+import fine as fn
+
+
+def _createSolarEsM():
+    esM = fn.EnergySystemModel(
+        locations={"RegionA"},
+        commodities={"electricity", "hydrogen"},
+        numberOfTimeSteps=24,
+        commodityUnitsDict={"electricity": r"kW$_{el}$", "hydrogen": r"kW$_{H_{2}}$"},
+        hoursPerTimeStep=1,
+        costUnit="1 Euro",
+        lengthUnit="km",
+        verboseLogLevel=2,
+    )
+    t = np.arange(24)
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="PV",
+            commodity="electricity",
+            hasCapacityVariable=True,
+            operationRateMax=pd.DataFrame(
+                {"RegionA": np.clip(np.sin((t % 6 - 1) / 4 * np.pi), 0, None)}
+            ),
+            investPerCapacity=100,
+            interestRate=0.05,
+            economicLifetime=20,
+        )
+    )
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Import",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            operationRateMax=pd.DataFrame({"RegionA": np.where(t % 2 == 0, 0.5, 0)}),
+            opexPerOperation=50,
+        )
+    )
+    esM.add(
+        fn.Storage(
+            esM=esM,
+            name="Battery",
+            commodity="electricity",
+            hasCapacityVariable=True,
+            investPerCapacity=10,
+            interestRate=0.05,
+            economicLifetime=15,
+        )
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Demand",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            operationRateFix=pd.DataFrame({"RegionA": np.full(24, 1.0)}),
+        )
+    )
+    return esM
+
+
+@pytest.mark.parametrize("relevanceThreshold", [None, 0.1])
+def test_sparseOperation(relevanceThreshold):
+    esM = _createSolarEsM()
+    esM.optimize(solver="glpk", relevanceThreshold=relevanceThreshold)
+    objectiveValue = esM.objectiveValue
+    operation = esM.componentModelingDict["SourceSinkModel"].operationVariablesOptimum
+
+    esM.optimize(
+        solver="glpk", relevanceThreshold=relevanceThreshold, sparseOperation=True
+    )
+
+    # The operation of the photovoltaics is zero in two time steps of each six hours, the import in every second
+    # time step
+    pvRate = esM.getComponent("PV").processedOperationRateMax[0]["RegionA"]
+    numberOfZeros = (pvRate <= (relevanceThreshold or 0)).sum() + 12
+    # These operation variables are not declared (3 components with 24 time steps)
+    assert len(esM.pyM.op_srcSnk.eliminatedIndices) == numberOfZeros
+    assert len(esM.pyM.op_srcSnk) == 72 - numberOfZeros
+    assert esM.pyM.op_srcSnk["RegionA", "Import", 0, 0, 1] is esM.pyM.zeroOperation
+    assert esM.objectiveValue == pytest.approx(objectiveValue)
+    pd.testing.assert_frame_equal(
+        esM.componentModelingDict["SourceSinkModel"].operationVariablesOptimum,
+        operation,
+    )
+    assert [
+        var.name for var in esM.pyM.component_data_objects(pyomo.Var) if var.fixed
+    ] == ["zeroOperation"]
+
+
+def test_sparseOperation_shadowPrices():
+    esM = _createSolarEsM()
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="Hydrogen import",
+            commodity="hydrogen",
+            hasCapacityVariable=False,
+            operationRateMax=pd.DataFrame({"RegionA": np.tile([0, 1.0], 12)}),
+            commodityCost=0.1,
+        )
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Hydrogen demand",
+            commodity="hydrogen",
+            hasCapacityVariable=False,
+            operationRateFix=pd.DataFrame({"RegionA": np.tile([0, 0.5], 12)}),
+        )
+    )
+    esM.optimize(solver="glpk", sparseOperation=True)
+    SP = fn.getShadowPrices(esM, esM.pyM.commodityBalanceConstraint)
+
+    # The hydrogen balance only contains eliminated variables in every second time step. These constraints are not
+    # passed to the solver and their shadow prices are zero.
+    SP = SP.loc["RegionA", "hydrogen", 0]
+    assert not SP.isna().any()
+    np.testing.assert_array_almost_equal(
+        SP.values, np.tile([0, 0.1 / esM.numberOfYears], 12)
+    )
+
+    # Only the missing dual values of the constraints which are not passed to the solver are set to zero
+    noDualValues = pd.Series(dtype=float)
+    SP = fn.getShadowPrices(
+        esM, esM.pyM.commodityBalanceConstraint, dualValues=noDualValues
+    )
+    assert list(SP.loc["RegionA", "hydrogen", 0].isna()) == [False, True] * 12
+
+    esM.optimize(solver="glpk", sparseOperation=False)
+    SP = fn.getShadowPrices(
+        esM, esM.pyM.commodityBalanceConstraint, dualValues=noDualValues
+    )
+    assert SP.isna().all()
@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import fine as fn
+
+
+def test_consolidateTimeSeries(minimal_test_esM):
+    esM = minimal_test_esM
+
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    objectiveValue = esM.objectiveValue
+    fullRate = esM.getComponent("Electricity market").fullOperationRateMax[0].copy()
+
+    esM.consolidateTimeSeries()
+
+    # the time series of the components are views into the store
+    comp = esM.getComponent("Electricity market")
+    pd.testing.assert_frame_equal(comp.fullOperationRateMax[0], fullRate)
+    assert np.shares_memory(comp.fullOperationRateMax[0].values, esM.timeSeriesStore)
+    assert comp.processedOperationRateMax[0] is comp.fullOperationRateMax[0]
+    row = esM.timeSeriesRegistry[
+        ("Electricity market", "operationRateMax", 0, "ElectrolyzerLocation")
+    ]
+    np.testing.assert_array_equal(
+        esM.timeSeriesStore[row], fullRate["ElectrolyzerLocation"].values
+    )
+
+    # the optimization results are not changed
+    esM.optimize(timeSeriesAggregation=False, solver="glpk")
+    assert esM.objectiveValue == pytest.approx(objectiveValue)
+
+    # adding components resets the store
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Additional demand",
+            commodity="hydrogen",
+            hasCapacityVariable=False,
+            operationRateFix=pd.DataFrame(
+                {"ElectrolyzerLocation": 0.0, "IndustryLocation": 1.0}, index=range(4)
+            ),
+        )
+    )
+    assert esM.timeSeriesStore is None and esM.timeSeriesRegistry == {}
+
+
+def test_consolidateTimeSeries_investmentPeriods(tmp_path):
+    esM = fn.EnergySystemModel(
+        locations={"RegionA", "RegionB"},
+        commodities={"electricity"},
+        numberOfTimeSteps=8,
+        commodityUnitsDict={"electricity": r"kW$_{el}$"},
+        hoursPerTimeStep=1,
+        costUnit="1 Euro",
+        lengthUnit="km",
+        startYear=2020,
+        numberOfInvestmentPeriods=2,
+        investmentPeriodInterval=5,
+        verboseLogLevel=2,
+    )
+    np.random.seed(0)
+    rate = pd.DataFrame(np.random.rand(8, 2), columns=["RegionA", "RegionB"])
+    esM.add(
+        fn.Source(
+            esM=esM,
+            name="PV",
+            commodity="electricity",
+            hasCapacityVariable=True,
+            operationRateMax=rate,
+        )
+    )
+    esM.add(
+        fn.Sink(
+            esM=esM,
+            name="Demand",
+            commodity="electricity",
+            hasCapacityVariable=False,
+            operationRateFix={2020: rate, 2025: rate * 0.5},
+        )
+    )
+
+    esM.consolidateTimeSeries(filePath=str(tmp_path / "timeSeries.dat"))
+
+    # identical time series of both investment periods share the same rows
+    assert isinstance(esM.timeSeriesStore, np.memmap)
+    assert esM.timeSeriesStore.shape == (6, 8)
+    registry = esM.timeSeriesRegistry
+    assert (
+        registry[("PV", "operationRateMax", 0, "RegionA")]
+        == registry[("PV", "operationRateMax", 1, "RegionA")]
+    )
+    assert (
+        registry[("Demand", "operationRateFix", 0, "RegionA")]
+        != registry[("Demand", "operationRateFix", 1, "RegionA")]
+    )
+    np.testing.assert_array_equal(
+        esM.getComponent("Demand").fullOperationRateFix[1].values, rate.values * 0.5
+    )
+
+
+def test_aggregateTemporally_views(minimal_test_esM):
+    esM = minimal_test_esM
+    esM.aggregateTemporally(
+        numberOfTypicalPeriods=2,
+        numberOfTimeStepsPerPeriod=1,
+        segmentation=False,
+        storeTSAinstance=True,
+    )
+
+    # the clustered time series are handed back to the components as views into one matrix
+    clusterPeriods = pd.DataFrame.from_dict(esM.tsaInstance.clusterPeriodDict)
+    market = esM.getComponent("Electricity market")
+    demand = esM.getComponent("Industry site")
+    for comp, rateName, rate in [
+        (market, "_operationRateMax_", market.aggregatedOperationRateMax[0]),
+        (demand, "_operationRateFix_", demand.aggregatedOperationRateFix[0]),
+    ]:
+        expected = clusterPeriods[[comp.name + rateName + loc for loc in rate.columns]]
+        np.testing.assert_array_equal(rate.values, expected.values)
+    assert np.shares_memory(
+        market.aggregatedOperationRateMax[0].values,
+        demand.aggregatedOperationRateFix[0].values.base,
+    )
+
+    # the views are read-only
+    with pytest.raises(ValueError, match="read-only"):
+        market.aggregatedOperationRateMax[0].values[0, 0] = 0
+
+
+def test_aggregateTemporally_dataFrameInput(minimal_test_esM):
+    esM = minimal_test_esM
+    esM.aggregateTemporally(numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=1)
+    market = esM.getComponent("Electricity market")
+    expected = market.aggregatedOperationRateMax[0].copy()
+
+    # components which return their time series data as one DataFrame are clustered as well
+    getData = market.getDataForTimeSeriesAggregation
+
+    def getDataFrame(ip):
+        data, weightDict = getData(ip)
+        return (
+            pd.concat([rate.set_axis(ids, axis=1) for ids, rate in data], axis=1),
+            weightDict,
+        )
+
+    market.getDataForTimeSeriesAggregation = getDataFrame
+    esM.aggregateTemporally(numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=1)
+    pd.testing.assert_frame_equal(market.aggregatedOperationRateMax[0], expected)
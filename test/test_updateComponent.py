@@ -1,3 +1,8 @@
+import warnings
+
+import pytest
+
+
 def test_updateComponent(minimal_test_esM):
     _invest_before = minimal_test_esM.getComponentAttribute(
         componentName="Electrolyzers", attributeName="investPerCapacity"
@@ -57,3 +62,82 @@ def test_updateComponent(minimal_test_esM):
         )
         == _new_name
     )
+
+
+def test_updateComponent_incremental(minimal_test_esM):
+    esM = minimal_test_esM
+    esM.aggregateTemporally(
+        numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=1, segmentation=False
+    )
+    electrolyzer = esM.getComponent("Electrolyzers")
+    pipelines = esM.getComponent("Pipelines")
+    _ccf_before = electrolyzer.CCF[0].copy()
+
+    # cost parameters are updated in place, the time series aggregation is kept
+    esM.updateComponent("Electrolyzers", {"investPerCapacity": 1000})
+    esM.updateComponent("Pipelines", {"investPerCapacity": 0.5})
+    assert esM.getComponent("Electrolyzers") is electrolyzer
+    assert esM.isTimeSeriesDataClustered
+    assert (electrolyzer.processedInvestPerCapacity[0] == 1000).all()
+    assert electrolyzer.CCF[0].equals(_ccf_before)
+
+    # the incrementally updated components equal reconstructed components
+    esM.updateComponent("Electrolyzers", {"interestRate": 0.05})
+    reference = esM.getComponent("Electrolyzers").__class__(
+        esM,
+        name="Electrolyzers",
+        physicalUnit=r"kW$_{el}$",
+        commodityConversionFactors={"electricity": -1, "hydrogen": 0.7},
+        hasCapacityVariable=True,
+        investPerCapacity=1000,
+        opexPerCapacity=500 * 0.025,
+        interestRate=0.05,
+        economicLifetime=10,
+    )
+    assert electrolyzer.CCF[0].equals(reference.CCF[0])
+    assert electrolyzer.interestRate.equals(reference.interestRate)
+    reference = pipelines.__class__(
+        esM,
+        name="Pipelines",
+        commodity="hydrogen",
+        hasCapacityVariable=True,
+        investPerCapacity=0.5,
+        interestRate=0.08,
+        economicLifetime=40,
+    )
+    assert pipelines.processedInvestPerCapacity[0].equals(
+        reference.processedInvestPerCapacity[0]
+    )
+
+    # invalid values do not change the component
+    with pytest.raises(ValueError):
+        esM.updateComponent("Electrolyzers", {"opexPerCapacity": -1})
+    assert electrolyzer.opexPerCapacity == 500 * 0.025
+    assert (electrolyzer.processedOpexPerCapacity[0] == 500 * 0.025).all()
+
+    # parameters without dependency group lead to a reconstruction of the component
+    esM.updateComponent("Electrolyzers", {"capacityMax": 5})
+    assert esM.getComponent("Electrolyzers") is not electrolyzer
+    assert not esM.isTimeSeriesDataClustered
+
+
+def test_updateComponent_declaredModelWarning(minimal_test_esM):
+    esM = minimal_test_esM
+    esM.declareOptimizationProblem()
+
+    # failed updates do not mark the component as modified
+    with pytest.raises(ValueError):
+        esM.updateComponent("Electrolyzers", {"opexPerCapacity": -1})
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        esM.optimize(declaresOptimizationProblem=False, solver="glpk")
+
+    # solving a model declared before an update warns about the outdated components
+    esM.updateComponent("Electrolyzers", {"investPerCapacity": 1000})
+    with pytest.warns(UserWarning, match=r"\['Electrolyzers'\] were updated"):
+        esM.optimize(declaresOptimizationProblem=False, solver="glpk")
+
+    # the warning is reset when the optimization problem is declared again
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        esM.optimize(solver="glpk")
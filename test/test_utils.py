@@ -173,3 +173,44 @@ def test_functionality_checkSimultaneousChargeDischarge():
     assert (
         simultaneousChargeDischarge
     ), "Check for simultaneous charge & discharge should have returned True"
+
+
+def test_buildFullTimeSeries(minimal_test_esM):
+    # without segmentation, the typical periods are concatenated according to the periods order
+    index = pd.MultiIndex.from_product([[0, 1], ["comp"], ["loc1", "loc2"]])
+    df = pd.DataFrame([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0]], index=index)
+    full = utils.buildFullTimeSeries(df, [1, 0, 1], 0)
+    expected = pd.DataFrame(
+        [[5.0, 6.0, 1.0, 2.0, 5.0, 6.0], [7.0, 8.0, 3.0, 4.0, 7.0, 8.0]],
+        index=pd.MultiIndex.from_product([["comp"], ["loc1", "loc2"]]),
+    )
+    pd.testing.assert_frame_equal(full, expected)
+
+    # with segmentation, each segment is repeated (and divided) by the number of time steps it represents
+    esM = minimal_test_esM
+    esM.aggregateTemporally(
+        numberOfTypicalPeriods=1,
+        numberOfTimeStepsPerPeriod=4,
+        segmentation=True,
+        numberOfSegmentsPerPeriod=3,
+    )
+    assert 0 in esM._fullTimeSeriesGatherIndex
+    timeStepsPerSegment = esM.timeStepsPerSegment[0].loc[0].tolist()
+    index = pd.MultiIndex.from_product([[0], ["comp"], ["loc1"]])
+    df = pd.DataFrame([[1.0, 2.0, 3.0]], index=index)
+    full = utils.buildFullTimeSeries(df, esM.periodsOrder[0], 0, esM=esM)
+    expectedValues = [
+        val / rep
+        for val, rep in zip([1.0, 2.0, 3.0], timeStepsPerSegment)
+        for _ in range(rep)
+    ]
+    assert full.loc[("comp", "loc1")].tolist() == expectedValues
+    full = utils.buildFullTimeSeries(
+        df, esM.periodsOrder[0], 0, esM=esM, divide=False
+    )
+    expectedValues = [
+        val
+        for val, rep in zip([1.0, 2.0, 3.0], timeStepsPerSegment)
+        for _ in range(rep)
+    ]
+    assert full.loc[("comp", "loc1")].tolist() == expectedValues